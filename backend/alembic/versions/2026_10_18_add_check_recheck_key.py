@@ -0,0 +1,35 @@
+"""Add recheck_key to check for incremental re-checks
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = 'e5f6a7b8c9d0'
+down_revision = 'd4e5f6a7b8c9'
+branch_labels = None
+depends_on = None
+
+
+def column_exists(table_name, column_name):
+    """Check if a column exists in a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return column_name in [c['name'] for c in inspector.get_columns(table_name)]
+
+
+def upgrade():
+    # Add column (if not exists - may have been auto-created by SQLModel)
+    if not column_exists('check', 'recheck_key'):
+        op.add_column('check', sa.Column('recheck_key', sa.String(), nullable=True))
+        op.create_index('ix_check_recheck_key', 'check', ['recheck_key'])
+
+
+def downgrade():
+    op.drop_index('ix_check_recheck_key', table_name='check')
+    op.drop_column('check', 'recheck_key')
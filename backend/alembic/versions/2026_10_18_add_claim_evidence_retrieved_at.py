@@ -0,0 +1,33 @@
+"""Add evidence_retrieved_at to claim for incremental re-checks
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = 'f6a7b8c9d0e1'
+down_revision = 'e5f6a7b8c9d0'
+branch_labels = None
+depends_on = None
+
+
+def column_exists(table_name, column_name):
+    """Check if a column exists in a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return column_name in [c['name'] for c in inspector.get_columns(table_name)]
+
+
+def upgrade():
+    # Add column (if not exists - may have been auto-created by SQLModel)
+    if not column_exists('claim', 'evidence_retrieved_at'):
+        op.add_column('claim', sa.Column('evidence_retrieved_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('claim', 'evidence_retrieved_at')
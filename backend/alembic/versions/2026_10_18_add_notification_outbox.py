@@ -0,0 +1,57 @@
+"""Add notification_outbox table for asynchronous notification delivery
+
+Revision ID: d4e5f6a7b8c9
+Revises: 10d573b15217
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = 'd4e5f6a7b8c9'
+down_revision = '10d573b15217'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade():
+    # Create outbox table (if not exists - may have been auto-created by SQLModel)
+    if not table_exists('notification_outbox'):
+        op.create_table(
+            'notification_outbox',
+            sa.Column('id', sa.String(), nullable=False),
+            sa.Column('user_id', sa.String(), nullable=False),
+            sa.Column('check_id', sa.String(), nullable=True),
+            sa.Column('channel', sa.String(), nullable=False),
+            sa.Column('kind', sa.String(), nullable=False),
+            sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+            sa.Column('status', sa.String(), nullable=False, server_default='pending'),
+            sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('last_error', sa.String(), nullable=True),
+            sa.Column('next_attempt_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+            sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+            sa.Column('sent_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+        )
+        op.create_index('ix_notification_outbox_user_id', 'notification_outbox', ['user_id'])
+        op.create_index('ix_notification_outbox_check_id', 'notification_outbox', ['check_id'])
+        op.create_index('ix_notification_outbox_status', 'notification_outbox', ['status'])
+        op.create_index('ix_notification_outbox_next_attempt_at', 'notification_outbox', ['next_attempt_at'])
+
+
+def downgrade():
+    op.drop_index('ix_notification_outbox_next_attempt_at', table_name='notification_outbox')
+    op.drop_index('ix_notification_outbox_status', table_name='notification_outbox')
+    op.drop_index('ix_notification_outbox_check_id', table_name='notification_outbox')
+    op.drop_index('ix_notification_outbox_user_id', table_name='notification_outbox')
+    op.drop_table('notification_outbox')
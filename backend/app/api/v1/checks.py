@@ -11,7 +11,9 @@ from app.core.database import get_session
 from app.core.auth import get_current_user, get_current_user_sse
 from app.core.config import settings
 from app.models import User, Check, Claim, Evidence, RawEvidence, Subscription
-from app.workers.pipeline import process_check
+from app.workers.stages import dispatch_check
+from app.services.incremental_check import recheck_key
+from app.core.tracing import start_span
 from app.workers import celery_app
 from datetime import datetime, timezone
 import uuid
@@ -167,6 +169,7 @@ async def create_check_test(
             "file_path": None
         }),
         input_url=check_request.url,
+        recheck_key=recheck_key("url", user.id, check_request.url, None),
         status="pending",
         credits_used=0,  # Don't charge for test checks
         user_query=None
@@ -180,7 +183,7 @@ async def create_check_test(
     try:
         logger.info(f"[TEST] Dispatching task for check {check.id}")
 
-        task = process_check.delay(
+        task = dispatch_check(
             check_id=check.id,
             user_id=user.id,
             input_data={
@@ -395,6 +398,7 @@ async def create_check(
             "file_path": request.file_path
         }),
         input_url=request.url,
+        recheck_key=recheck_key(request.input_type, user.id, request.url, request.content),
         status="pending",
         credits_used=1,
         user_query=request.user_query  # Search Clarity feature
@@ -423,17 +427,19 @@ async def create_check(
             logger.error(f"Redis connection failed: {redis_error}")
             raise redis_error
 
-        task = process_check.delay(
-            check_id=check.id,
-            user_id=user.id,
-            input_data={
-                "input_type": request.input_type,
-                "content": request.content,
-                "url": request.url,
-                "file_path": request.file_path,
-                "user_query": request.user_query  # Search Clarity feature
-            }
-        )
+        # Root span of the check's trace; context rides the Celery message into the worker
+        with start_span("create_check", **{"check.id": check.id, "check.input_type": request.input_type}):
+            task = dispatch_check(
+                check_id=check.id,
+                user_id=user.id,
+                input_data={
+                    "input_type": request.input_type,
+                    "content": request.content,
+                    "url": request.url,
+                    "file_path": request.file_path,
+                    "user_query": request.user_query  # Search Clarity feature
+                }
+            )
         logger.info(f"Task dispatched successfully: {task.id} for check {check.id}")
         logger.info(f"Task state immediately after dispatch: {task.state}")
 
@@ -99,6 +99,8 @@ async def get_circuit_breakers(api_name: str = Query(None, description="Optional
     Get circuit breaker states for API adapters.
 
     Week 4 - Government API Integration: Monitor API health and circuit breaker status.
+    With ENABLE_SHARED_CIRCUIT_BREAKERS, state is read from Redis and covers every
+    worker ("shared": false means Redis was unreachable and the state is local).
 
     Args:
         api_name: Optional - filter for specific API adapter
@@ -116,4 +118,24 @@ async def get_circuit_breakers(api_name: str = Query(None, description="Optional
             return registry.get_all_states()
 
     except Exception as e:
-        return {"error": f"Failed to retrieve circuit breaker states: {str(e)}"}
\ No newline at end of file
+        return {"error": f"Failed to retrieve circuit breaker states: {str(e)}"}
+
+
+@router.get("/reference-data")
+async def get_reference_data_status():
+    """
+    Get adapter reference-data snapshots (league tables, catalogues) and their age.
+
+    Returns:
+        Registered resources with snapshot age and refresh interval
+    """
+    try:
+        from app.services.reference_data import get_reference_store
+        resources = get_reference_store().get_status()
+        return {
+            "enabled": settings.ENABLE_REFERENCE_DATA,
+            "resources": resources,
+            "stale": sum(1 for resource in resources if resource["stale"])
+        }
+    except Exception as e:
+        return {"error": f"Failed to retrieve reference data status: {str(e)}"}
@@ -1,15 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
-from app.core.database import get_session
+from app.core.database import get_session, async_session
 from app.core.auth import get_current_user
 from app.core.config import settings
 from app.models import User, Subscription
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
 import stripe
 from datetime import datetime, timedelta
+import asyncio
+import functools
 import logging
+import redis.asyncio as aioredis
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +21,138 @@ logger = logging.getLogger(__name__)
 stripe.api_key = settings.STRIPE_SECRET_KEY
 STRIPE_WEBHOOK_SECRET = settings.STRIPE_WEBHOOK_SECRET
 
+# The stripe SDK is synchronous - run it on a bounded pool so a slow Stripe
+# round-trip never blocks the event loop serving check submissions
+_stripe_executor = ThreadPoolExecutor(
+    max_workers=settings.STRIPE_MAX_CONCURRENT_CALLS,
+    thread_name_prefix="stripe"
+)
+
+STRIPE_EVENT_KEY_PREFIX = "tru8:stripe_event:"
+
+_redis_client: Optional[aioredis.Redis] = None
+
 router = APIRouter()
 
+
+async def stripe_call(func, *args, **kwargs):
+    """Run a blocking Stripe SDK call in the Stripe executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_stripe_executor, functools.partial(func, *args, **kwargs))
+
+
+def _get_redis() -> aioredis.Redis:
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis_client
+
+
+async def close_redis() -> None:
+    """Drop the Redis client (workers apply each event on a fresh event loop)"""
+    global _redis_client
+    if _redis_client is not None:
+        client, _redis_client = _redis_client, None
+        await client.close()
+
+
+async def claim_stripe_event(event_id: str) -> bool:
+    """
+    Record a webhook event ID. Returns False if it was already received.
+
+    The "processing" marker expires after STRIPE_EVENT_PROCESSING_TTL_SECONDS,
+    so an event that could not be queued or applied is accepted again later.
+    Fails open: if Redis is unavailable the event is processed anyway
+    (handlers are safe to re-apply).
+    """
+    try:
+        claimed = await _get_redis().set(
+            f"{STRIPE_EVENT_KEY_PREFIX}{event_id}",
+            "processing",
+            nx=True,
+            ex=settings.STRIPE_EVENT_PROCESSING_TTL_SECONDS
+        )
+        return bool(claimed)
+    except Exception as e:
+        logger.warning(f"Stripe event dedupe unavailable, processing {event_id} anyway: {e}")
+        return True
+
+
+async def stripe_event_processed(event_id: str) -> bool:
+    """True if an earlier delivery of the event was applied successfully"""
+    try:
+        return await _get_redis().get(f"{STRIPE_EVENT_KEY_PREFIX}{event_id}") == "processed"
+    except Exception as e:
+        logger.warning(f"Failed to read Stripe event state for {event_id}: {e}")
+        return False
+
+
+async def _finish_stripe_event(event_id: str, success: bool) -> None:
+    """Mark event processed, or release it so a redelivery is applied"""
+    key = f"{STRIPE_EVENT_KEY_PREFIX}{event_id}"
+    try:
+        if success:
+            await _get_redis().set(key, "processed", ex=settings.STRIPE_EVENT_DEDUPE_TTL_SECONDS)
+        else:
+            await _get_redis().delete(key)
+    except Exception as e:
+        logger.warning(f"Failed to update Stripe event state for {event_id}: {e}")
+
+
+async def apply_stripe_event(event: Dict[str, Any], session: AsyncSession) -> None:
+    """Dispatch a verified Stripe event to its handler"""
+    if event['type'] == 'checkout.session.completed':
+        session_data = event['data']['object']
+        await handle_successful_payment(session_data, session)
+
+    elif event['type'] == 'customer.subscription.updated':
+        subscription = event['data']['object']
+        await handle_subscription_updated(subscription, session)
+
+    elif event['type'] == 'customer.subscription.deleted':
+        subscription = event['data']['object']
+        await handle_subscription_cancelled(subscription, session)
+
+    elif event['type'] == 'invoice.paid':
+        invoice = event['data']['object']
+        await handle_invoice_paid(invoice, session)
+
+    else:
+        logger.info(f"Unhandled event type: {event['type']}")
+
+
+async def process_stripe_event(event: Dict[str, Any], release_on_failure: bool = True) -> bool:
+    """
+    Apply a webhook event with its own DB session (called by the payments worker).
+    Returns False on failure; the claim is kept while the worker will retry.
+    """
+    event_id = event.get('id', '')
+    if await stripe_event_processed(event_id):
+        # Broker redelivery of an event that was already applied
+        return True
+
+    try:
+        async with async_session() as session:
+            await apply_stripe_event(event, session)
+        await _finish_stripe_event(event_id, success=True)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to process Stripe event {event_id} ({event.get('type')}): {e}")
+        if release_on_failure:
+            await _finish_stripe_event(event_id, success=False)
+        return False
+
+
+def enqueue_stripe_event(event: Dict[str, Any]) -> bool:
+    """Hand a claimed event to the payments queue. Returns False if it could not be queued."""
+    try:
+        from app.workers.payments import process_stripe_event as process_stripe_event_task
+        process_stripe_event_task.apply_async(args=[event], queue=settings.STRIPE_EVENT_QUEUE)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to queue Stripe event {event.get('id')} ({event.get('type')}): {e}")
+        return False
+
 class CreateCheckoutRequest(BaseModel):
     price_id: str
     plan: str  # 'starter' or 'pro'
@@ -78,7 +212,8 @@ async def create_checkout_session(
             )
 
         # Create Stripe checkout session
-        checkout_session = stripe.checkout.Session.create(
+        checkout_session = await stripe_call(
+            stripe.checkout.Session.create,
             customer_email=user.email,
             client_reference_id=user.id,
             line_items=[{
@@ -112,11 +247,16 @@ async def create_checkout_session(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.post("/webhook")
-async def stripe_webhook(
-    request: Request,
-    session: AsyncSession = Depends(get_session)
-):
-    """Handle Stripe webhook events"""
+async def stripe_webhook(request: Request):
+    """
+    Handle Stripe webhook events.
+
+    Verifies the signature, drops events already received (Stripe delivers
+    at-least-once) and hands the event to the payments queue, where
+    app.workers.payments applies it with retries. Stripe does not redeliver
+    after a 2xx, so the event is only acknowledged once it is durably queued;
+    if queueing fails the claim is released and 500 asks Stripe to retry.
+    """
     payload = await request.body()
     sig_header = request.headers.get('stripe-signature')
 
@@ -131,27 +271,14 @@ async def stripe_webhook(
         logger.error(f"Invalid signature: {e}")
         raise HTTPException(status_code=400, detail="Invalid signature")
 
-    # Handle the event
-    if event['type'] == 'checkout.session.completed':
-        session_data = event['data']['object']
-        await handle_successful_payment(session_data, session)
-
-    elif event['type'] == 'customer.subscription.updated':
-        subscription = event['data']['object']
-        await handle_subscription_updated(subscription, session)
-
-    elif event['type'] == 'customer.subscription.deleted':
-        subscription = event['data']['object']
-        await handle_subscription_cancelled(subscription, session)
-
-    elif event['type'] == 'invoice.paid':
-        invoice = event['data']['object']
-        await handle_invoice_paid(invoice, session)
-
-    else:
-        logger.info(f"Unhandled event type: {event['type']}")
+    if not await claim_stripe_event(event['id']):
+        logger.info(f"Duplicate Stripe event {event['id']} ({event['type']}), skipping")
+        return {"status": "duplicate"}
 
-    return {"status": "success"}
+    if not enqueue_stripe_event(event):
+        await _finish_stripe_event(event['id'], success=False)
+        raise HTTPException(status_code=500, detail="Event could not be queued")
+    return {"status": "queued"}
 
 async def handle_successful_payment(session_data: dict, session: AsyncSession):
     """Handle successful payment from Stripe Checkout"""
@@ -163,7 +290,7 @@ async def handle_successful_payment(session_data: dict, session: AsyncSession):
         return
 
     # Get the subscription details from Stripe
-    stripe_subscription = stripe.Subscription.retrieve(stripe_subscription_id)
+    stripe_subscription = await stripe_call(stripe.Subscription.retrieve, stripe_subscription_id)
     stripe_customer_id = stripe_subscription.get('customer')
 
     # Get user from database
@@ -326,7 +453,7 @@ async def handle_invoice_paid(invoice: dict, session: AsyncSession):
 
     # Fetch current subscription details from Stripe to get updated period
     try:
-        stripe_subscription = stripe.Subscription.retrieve(stripe_subscription_id)
+        stripe_subscription = await stripe_call(stripe.Subscription.retrieve, stripe_subscription_id)
     except stripe.error.StripeError as e:
         logger.error(f"Failed to retrieve subscription from Stripe: {e}")
         return
@@ -444,7 +571,8 @@ async def cancel_subscription(
 
     try:
         # Cancel the subscription in Stripe (at period end)
-        stripe.Subscription.modify(
+        await stripe_call(
+            stripe.Subscription.modify,
             subscription.stripe_subscription_id,
             cancel_at_period_end=True
         )
@@ -488,7 +616,8 @@ async def create_billing_portal_session(
         # If no subscription exists yet, we need to create a customer first
         if not subscription or not subscription.stripe_customer_id:
             # Create a Stripe customer for this user
-            customer = stripe.Customer.create(
+            customer = await stripe_call(
+                stripe.Customer.create,
                 email=user.email,
                 metadata={
                     'user_id': user.id
@@ -504,7 +633,8 @@ async def create_billing_portal_session(
             customer_id = subscription.stripe_customer_id
 
         # Create billing portal session
-        portal_session = stripe.billing_portal.Session.create(
+        portal_session = await stripe_call(
+            stripe.billing_portal.Session.create,
             customer=customer_id,
             return_url=f"{settings.FRONTEND_URL}/dashboard/settings?tab=subscription",
         )
@@ -553,7 +683,8 @@ async def reactivate_subscription(
             )
 
         # Reactivate the subscription in Stripe
-        stripe_subscription = stripe.Subscription.modify(
+        stripe_subscription = await stripe_call(
+            stripe.Subscription.modify,
             subscription.stripe_subscription_id,
             cancel_at_period_end=False
         )
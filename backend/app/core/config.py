@@ -43,6 +43,10 @@ class Settings(BaseSettings):
     STRIPE_SECRET_KEY: str = Field("", env="STRIPE_SECRET_KEY")
     STRIPE_WEBHOOK_SECRET: str = Field("", env="STRIPE_WEBHOOK_SECRET")
     STRIPE_PRICE_ID_PRO: str = Field("", env="STRIPE_PRICE_ID_PRO")
+    STRIPE_MAX_CONCURRENT_CALLS: int = Field(8, env="STRIPE_MAX_CONCURRENT_CALLS")  # Threads for blocking Stripe SDK calls
+    STRIPE_EVENT_QUEUE: str = Field("payments", env="STRIPE_EVENT_QUEUE")  # Celery queue that applies webhook events
+    STRIPE_EVENT_DEDUPE_TTL_SECONDS: int = Field(604800, env="STRIPE_EVENT_DEDUPE_TTL_SECONDS")  # Stripe retries for up to 3 days
+    STRIPE_EVENT_PROCESSING_TTL_SECONDS: int = Field(1800, env="STRIPE_EVENT_PROCESSING_TTL_SECONDS")  # In-flight marker, covers queueing and worker retries
     FRONTEND_URL: str = Field("http://localhost:3000", env="FRONTEND_URL")
 
     # Email Notifications (Resend)
@@ -52,8 +56,23 @@ class Settings(BaseSettings):
     EMAIL_FROM_NAME: str = Field("Tru8", env="EMAIL_FROM_NAME")
     ENABLE_EMAIL_NOTIFICATIONS: bool = Field(True, env="ENABLE_EMAIL_NOTIFICATIONS")
 
+    # Notification outbox (delivered by a separate Celery queue)
+    NOTIFICATION_QUEUE: str = Field("notifications", env="NOTIFICATION_QUEUE")
+    NOTIFICATION_BATCH_SIZE: int = Field(100, env="NOTIFICATION_BATCH_SIZE")  # Outbox rows per delivery run
+    NOTIFICATION_MAX_ATTEMPTS: int = Field(5, env="NOTIFICATION_MAX_ATTEMPTS")
+    NOTIFICATION_RETRY_BASE_SECONDS: int = Field(30, env="NOTIFICATION_RETRY_BASE_SECONDS")  # Doubles per attempt
+    NOTIFICATION_SWEEP_INTERVAL_SECONDS: int = Field(300, env="NOTIFICATION_SWEEP_INTERVAL_SECONDS")  # Beat sweep for stranded rows
+
     # Monitoring
     SENTRY_DSN: str = Field("", env="SENTRY_DSN")
+    WORKER_METRICS_PORT: int = Field(0, env="WORKER_METRICS_PORT")  # Celery worker Prometheus exporter (0 = disabled)
+
+    # Tracing (OpenTelemetry, see app.core.tracing)
+    ENABLE_TRACING: bool = Field(False, env="ENABLE_TRACING")
+    TRACING_EXPORTER: str = Field("otlp", env="TRACING_EXPORTER")  # otlp | file | console
+    TRACING_OTLP_ENDPOINT: str = Field("http://localhost:4318/v1/traces", env="TRACING_OTLP_ENDPOINT")
+    TRACING_FILE_PATH: str = Field("traces.jsonl", env="TRACING_FILE_PATH")
+    TRACING_SAMPLE_RATIO: float = Field(1.0, env="TRACING_SAMPLE_RATIO")
     POSTHOG_API_KEY: str = Field("", env="POSTHOG_API_KEY")
     
     # App
@@ -72,6 +91,13 @@ class Settings(BaseSettings):
     # Pipeline
     PIPELINE_TIMEOUT_SECONDS: int = Field(180, env="PIPELINE_TIMEOUT_SECONDS")
     CACHE_TTL_SECONDS: int = Field(3600, env="CACHE_TTL_SECONDS")
+
+    # Staged pipeline: one task per stage, I/O stages and NLI on separate queues
+    # (see app.workers.stages)
+    ENABLE_STAGED_PIPELINE: bool = Field(False, env="ENABLE_STAGED_PIPELINE")
+    PIPELINE_IO_QUEUE: str = Field("pipeline_io", env="PIPELINE_IO_QUEUE")
+    PIPELINE_CPU_QUEUE: str = Field("pipeline_cpu", env="PIPELINE_CPU_QUEUE")
+    PIPELINE_STATE_TTL_SECONDS: int = Field(3600, env="PIPELINE_STATE_TTL_SECONDS")  # Stage state kept in Redis
     
     # NLI & Verification
     NLI_CONFIDENCE_THRESHOLD: float = Field(0.7, env="NLI_CONFIDENCE_THRESHOLD")
@@ -99,12 +125,17 @@ class Settings(BaseSettings):
 
     # Phase 1.5 - Semantic Intelligence
     ENABLE_FACTCHECK_API: bool = Field(True, env="ENABLE_FACTCHECK_API")
+    MAX_CONCURRENT_FACTCHECK_LOOKUPS: int = Field(5, env="MAX_CONCURRENT_FACTCHECK_LOOKUPS")  # Parallel Fact Check API requests per check
+    FACTCHECK_CACHE_TTL_SECONDS: int = Field(86400, env="FACTCHECK_CACHE_TTL_SECONDS")  # Redis TTL for fact-check hits
+    FACTCHECK_NEGATIVE_CACHE_TTL_SECONDS: int = Field(21600, env="FACTCHECK_NEGATIVE_CACHE_TTL_SECONDS")  # Shorter TTL for "no fact-checks found"
     ENABLE_TEMPORAL_CONTEXT: bool = Field(False, env="ENABLE_TEMPORAL_CONTEXT")  # Disabled: Query Planner handles freshness
 
     # Fact-Check Parser (Programmatic parsing of fact-check articles)
     ENABLE_FACTCHECK_PARSING: bool = Field(False, env="ENABLE_FACTCHECK_PARSING")  # Parse fact-check articles for target claim extraction
     FACTCHECK_SIMILARITY_THRESHOLD: float = Field(0.7, env="FACTCHECK_SIMILARITY_THRESHOLD")  # Min similarity to keep fact-check evidence
     FACTCHECK_LOW_RELEVANCE_PENALTY: float = Field(0.1, env="FACTCHECK_LOW_RELEVANCE_PENALTY")  # Penalty for low-similarity fact-checks
+    MAX_CONCURRENT_FACTCHECK_PARSES: int = Field(6, env="MAX_CONCURRENT_FACTCHECK_PARSES")  # Parallel fact-check page fetches per check
+    FACTCHECK_PAGE_CACHE_TTL_SECONDS: int = Field(86400, env="FACTCHECK_PAGE_CACHE_TTL_SECONDS")  # Parsed fact-check pages, keyed by normalised URL
 
     # Phase 2 - User Experience & Trust
     ENABLE_CLAIM_CLASSIFICATION: bool = Field(True, env="ENABLE_CLAIM_CLASSIFICATION")
@@ -215,6 +246,131 @@ class Settings(BaseSettings):
     # vs contract_info claims which can use older evidence (up to 6 months)
     ENABLE_FRESHNESS_BY_CLAIM_TYPE: bool = Field(True, env="ENABLE_FRESHNESS_BY_CLAIM_TYPE")
 
+    # ========== CHUNKED (MAP-REDUCE) CLAIM EXTRACTION ==========
+    # Long documents (PDF uploads, video transcripts) are split on paragraph boundaries
+    # and extracted concurrently instead of being truncated to one 2,500-word prompt
+    ENABLE_CHUNKED_EXTRACTION: bool = Field(False, env="ENABLE_CHUNKED_EXTRACTION")
+    CHUNKED_EXTRACTION_MIN_WORDS: int = Field(2500, env="CHUNKED_EXTRACTION_MIN_WORDS")  # Below this, single-prompt extraction
+    EXTRACTION_CHUNK_WORDS: int = Field(1200, env="EXTRACTION_CHUNK_WORDS")
+    EXTRACTION_CHUNK_OVERLAP_WORDS: int = Field(150, env="EXTRACTION_CHUNK_OVERLAP_WORDS")
+    MAX_EXTRACTION_CHUNKS: int = Field(8, env="MAX_EXTRACTION_CHUNKS")  # Cost ceiling (~10k words)
+    MAX_CONCURRENT_EXTRACTIONS: int = Field(4, env="MAX_CONCURRENT_EXTRACTIONS")
+    CLAIM_DEDUP_SIMILARITY_THRESHOLD: float = Field(0.88, env="CLAIM_DEDUP_SIMILARITY_THRESHOLD")  # Cosine, merges overlap duplicates
+
+    # ========== SEMANTIC CLAIM-VERDICT CACHE ==========
+    # Reuse verdicts for near-duplicate claims (same viral claim, different wording)
+    # across checks. Hits skip factcheck/retrieve/verify/judge for that claim.
+    ENABLE_SEMANTIC_CLAIM_CACHE: bool = Field(False, env="ENABLE_SEMANTIC_CLAIM_CACHE")
+    SEMANTIC_CACHE_SIMILARITY_THRESHOLD: float = Field(0.95, env="SEMANTIC_CACHE_SIMILARITY_THRESHOLD")  # Cosine similarity (strict)
+    SEMANTIC_CACHE_MAX_AGE_HOURS: int = Field(24, env="SEMANTIC_CACHE_MAX_AGE_HOURS")  # Freshness window for timeless claims
+    SEMANTIC_CACHE_TIME_SENSITIVE_MAX_AGE_HOURS: int = Field(2, env="SEMANTIC_CACHE_TIME_SENSITIVE_MAX_AGE_HOURS")  # "currently", "last week", predictions
+
+    # ========== INCREMENTAL RE-CHECKS ==========
+    # Re-checks of a URL (or of the same user's pasted text) copy unchanged, fresh
+    # claims from the previous check and only re-run new, changed or stale ones
+    ENABLE_INCREMENTAL_RECHECK: bool = Field(False, env="ENABLE_INCREMENTAL_RECHECK")
+    INCREMENTAL_CLAIM_SIMILARITY: float = Field(0.85, env="INCREMENTAL_CLAIM_SIMILARITY")  # Claim text match when the article is unchanged
+    INCREMENTAL_CHANGED_ARTICLE_SIMILARITY: float = Field(0.95, env="INCREMENTAL_CHANGED_ARTICLE_SIMILARITY")  # ...and once it has changed
+    INCREMENTAL_MAX_AGE_HOURS: int = Field(72, env="INCREMENTAL_MAX_AGE_HOURS")  # Evidence freshness window for timeless claims
+    INCREMENTAL_TIME_SENSITIVE_MAX_AGE_HOURS: int = Field(2, env="INCREMENTAL_TIME_SENSITIVE_MAX_AGE_HOURS")  # "currently", "last week", predictions
+
+    # ========== EVIDENCE VECTOR STORE ==========
+    # Evidence points are content-addressed (normalised URL + snippet text), so
+    # a snippet seen again only gains a claim/check reference. Points not seen
+    # within the retention window are removed by the compaction task (Celery beat).
+    EVIDENCE_VECTOR_RETENTION_DAYS: int = Field(30, env="EVIDENCE_VECTOR_RETENTION_DAYS")
+    EVIDENCE_VECTOR_MAX_REFERENCES: int = Field(50, env="EVIDENCE_VECTOR_MAX_REFERENCES")  # Newest claim/check ids kept per point
+    EVIDENCE_VECTOR_LOCK_SECONDS: float = Field(30.0, env="EVIDENCE_VECTOR_LOCK_SECONDS")  # Expiry of a point's reference-merge lock
+    EVIDENCE_VECTOR_LOCK_WAIT_SECONDS: float = Field(5.0, env="EVIDENCE_VECTOR_LOCK_WAIT_SECONDS")  # Then merge unlocked
+    EVIDENCE_VECTOR_COMPACTION_INTERVAL_HOURS: float = Field(6.0, env="EVIDENCE_VECTOR_COMPACTION_INTERVAL_HOURS")
+    # Storage profile: memory (float32 in RAM), quantized (int8 in RAM, originals
+    # on disk, rescored) or disk (quantized + HNSW graph on disk). New collections
+    # use it directly; existing ones: python scripts/migrate_qdrant_profile.py
+    QDRANT_EVIDENCE_PROFILE: str = Field("memory", env="QDRANT_EVIDENCE_PROFILE")
+    QDRANT_SEARCH_HNSW_EF: int = Field(0, env="QDRANT_SEARCH_HNSW_EF")  # Query-time ef (0 = collection default)
+    QDRANT_QUANTIZATION_OVERSAMPLING: float = Field(2.0, env="QDRANT_QUANTIZATION_OVERSAMPLING")  # Candidates rescored = limit * this
+    QDRANT_MEMMAP_THRESHOLD_KB: int = Field(0, env="QDRANT_MEMMAP_THRESHOLD_KB")  # 0 = profile default
+
+    # ========== ADAPTER REFERENCE DATA ==========
+    # Whole datasets (league tables, ONS catalogue, WHO indicators) are kept as
+    # snapshots per resource and refreshed by Celery beat; claims read the snapshot.
+    # Stale snapshots are served up to refresh interval x MAX_STALE_FACTOR.
+    ENABLE_REFERENCE_DATA: bool = Field(True, env="ENABLE_REFERENCE_DATA")
+    REFERENCE_DATA_MAX_STALE_FACTOR: float = Field(4.0, env="REFERENCE_DATA_MAX_STALE_FACTOR")
+    REFERENCE_DATA_IDLE_HOURS: int = Field(48, env="REFERENCE_DATA_IDLE_HOURS")  # Unread snapshots stop being refreshed
+    REFERENCE_DATA_REFRESH_INTERVAL_SECONDS: int = Field(120, env="REFERENCE_DATA_REFRESH_INTERVAL_SECONDS")  # Beat schedule
+    REFERENCE_DATA_MAX_REFRESHES_PER_RUN: int = Field(8, env="REFERENCE_DATA_MAX_REFRESHES_PER_RUN")  # Keeps free-tier quotas
+
+    # ========== ADAPTER RESPONSE CACHE ==========
+    # Defaults for GovernmentAPIClient caching; adapters override next to cache_ttl.
+    # Entries past cache_ttl are served for a further stale window while one worker
+    # refreshes them in the background. Empty answers are cached for a shorter TTL.
+    API_NEGATIVE_CACHE_TTL_SECONDS: int = Field(1800, env="API_NEGATIVE_CACHE_TTL_SECONDS")  # Cap on empty-answer TTL
+    API_CACHE_STALE_FACTOR: float = Field(0.5, env="API_CACHE_STALE_FACTOR")  # Stale window = cache_ttl x this
+    API_CACHE_TTL_JITTER: float = Field(0.1, env="API_CACHE_TTL_JITTER")  # TTLs shortened by up to this fraction
+    API_CACHE_REFRESH_WORKERS: int = Field(4, env="API_CACHE_REFRESH_WORKERS")  # Background refresh threads per process
+
+    # ========== ADAPTER LATENCY AND DEADLINES ==========
+    # Per-adapter timeouts follow observed p99 (capped at the adapter's configured
+    # timeout); GETs slower than p90 get a hedged duplicate. Each claim's API
+    # lookups share one deadline; stragglers are dropped and partial evidence returned.
+    ADAPTER_LATENCY_WINDOW: int = Field(200, env="ADAPTER_LATENCY_WINDOW")  # Recent requests per adapter
+    ADAPTER_LATENCY_MIN_SAMPLES: int = Field(20, env="ADAPTER_LATENCY_MIN_SAMPLES")  # Before adaptive timeouts/hedging apply
+    ADAPTER_TIMEOUT_P99_MULTIPLIER: float = Field(1.5, env="ADAPTER_TIMEOUT_P99_MULTIPLIER")
+    ADAPTER_TIMEOUT_MIN_SECONDS: float = Field(2.0, env="ADAPTER_TIMEOUT_MIN_SECONDS")
+    ENABLE_HEDGED_REQUESTS: bool = Field(True, env="ENABLE_HEDGED_REQUESTS")
+    ADAPTER_HEDGE_WORKERS: int = Field(32, env="ADAPTER_HEDGE_WORKERS")
+    API_CLAIM_DEADLINE_SECONDS: float = Field(12.0, env="API_CLAIM_DEADLINE_SECONDS")  # All adapter lookups for one claim
+    CIRCUIT_BREAKER_SLOW_CALL_SECONDS: float = Field(8.0, env="CIRCUIT_BREAKER_SLOW_CALL_SECONDS")  # Attempt slow above usual p99, capped at this
+    CIRCUIT_BREAKER_SLOW_CALL_RATE: float = Field(0.6, env="CIRCUIT_BREAKER_SLOW_CALL_RATE")  # Opens above this share of slow calls
+    CIRCUIT_BREAKER_SLOW_CALL_MIN_CALLS: int = Field(10, env="CIRCUIT_BREAKER_SLOW_CALL_MIN_CALLS")  # Within the last 20 calls
+
+    # ========== SHARED CIRCUIT BREAKERS ==========
+    # Breaker state lives in Redis so one worker discovering an outage opens the
+    # circuit for all; a single recovery probe runs fleet-wide.
+    ENABLE_SHARED_CIRCUIT_BREAKERS: bool = Field(True, env="ENABLE_SHARED_CIRCUIT_BREAKERS")
+    CIRCUIT_BREAKER_CACHE_SECONDS: float = Field(1.0, env="CIRCUIT_BREAKER_CACHE_SECONDS")  # Local cache of shared state
+    CIRCUIT_BREAKER_PROBE_TIMEOUT_SECONDS: int = Field(60, env="CIRCUIT_BREAKER_PROBE_TIMEOUT_SECONDS")  # Unreleased probe token expiry
+
+    # ========== ADAPTER SELECTION ==========
+    # Per-domain yield (evidence returned, kept) and latency of each adapter
+    # decide which routed adapters are queried for a claim
+    ENABLE_ADAPTER_SELECTION: bool = Field(True, env="ENABLE_ADAPTER_SELECTION")
+    ADAPTER_SELECTION_BUDGET_MS: int = Field(6000, env="ADAPTER_SELECTION_BUDGET_MS")  # Expected adapter time per claim
+    ADAPTER_SELECTION_MIN_CALLS: int = Field(20, env="ADAPTER_SELECTION_MIN_CALLS")  # Always query adapters with less history
+    ADAPTER_SELECTION_MIN_VALUE: float = Field(0.05, env="ADAPTER_SELECTION_MIN_VALUE")  # Skip below this value per call
+    ADAPTER_SELECTION_EXPLORATION: float = Field(0.1, env="ADAPTER_SELECTION_EXPLORATION")  # Chance a skipped adapter is queried anyway
+    ADAPTER_YIELD_WINDOW: int = Field(500, env="ADAPTER_YIELD_WINDOW")  # Halve counters after this many calls
+
+    # ========== PDF EVIDENCE EXTRACTION ==========
+    # PDFs are streamed to a spooled temp file, pages are extracted lazily and
+    # page texts are cached per URL so later claims reuse them
+    PDF_MAX_DOWNLOAD_MB: int = Field(50, env="PDF_MAX_DOWNLOAD_MB")  # Abort downloads larger than this
+    PDF_SPOOL_MEMORY_MB: int = Field(5, env="PDF_SPOOL_MEMORY_MB")  # Spill to disk above this size
+    PDF_EARLY_STOP_RELEVANCE: float = Field(0.8, env="PDF_EARLY_STOP_RELEVANCE")  # Stop scanning once max_results pages score this high
+    PDF_DOCUMENT_CACHE_SIZE: int = Field(16, env="PDF_DOCUMENT_CACHE_SIZE")  # PDFs kept open per worker process
+
+    # ========== INFERENCE SERVER ==========
+    # "local": every worker process loads its own NLI/embedding/cross-encoder models.
+    # "remote": workers call one shared inference server (app.services.inference_server)
+    # that batches requests from all workers.
+    INFERENCE_MODE: str = Field("local", env="INFERENCE_MODE")
+    INFERENCE_SERVER_URL: str = Field("http://localhost:8001", env="INFERENCE_SERVER_URL")
+    INFERENCE_SERVER_UDS: Optional[str] = Field(None, env="INFERENCE_SERVER_UDS")  # Unix socket path, takes precedence over URL
+    INFERENCE_TIMEOUT_SECONDS: float = Field(30.0, env="INFERENCE_TIMEOUT_SECONDS")
+    INFERENCE_MAX_BATCH_SIZE: int = Field(32, env="INFERENCE_MAX_BATCH_SIZE")  # Server-side coalesced batch cap
+    INFERENCE_MAX_BATCH_WAIT_MS: int = Field(10, env="INFERENCE_MAX_BATCH_WAIT_MS")  # Max wait to fill a batch
+
+    # ========== HTTP CASSETTES (OFFLINE RECORD/REPLAY) ==========
+    # "live": normal network I/O. "record": real requests, exchanges saved to HTTP_CASSETTE_DIR.
+    # "replay": external API responses served from HTTP_CASSETTE_DIR, nothing leaves the process.
+    # See app.core.http_transport for which clients use it.
+    HTTP_TRANSPORT_MODE: str = Field("live", env="HTTP_TRANSPORT_MODE")
+    HTTP_CASSETTE_DIR: str = Field("cassettes", env="HTTP_CASSETTE_DIR")
+    HTTP_CASSETTE_MAX_RESPONSES: int = Field(5, env="HTTP_CASSETTE_MAX_RESPONSES")  # Recordings kept per request
+    HTTP_REPLAY_LATENCY_SCALE: float = Field(1.0, env="HTTP_REPLAY_LATENCY_SCALE")  # x recorded latency, 0 = instant
+    HTTP_REPLAY_LATENCY_JITTER: float = Field(0.0, env="HTTP_REPLAY_LATENCY_JITTER")  # +/- fraction of latency
+
     @property
     def nli_model_name(self) -> str:
         """Dynamic NLI model selection based on feature flag"""
@@ -0,0 +1,286 @@
+"""
+Pluggable HTTP transport for external API calls (HTTP_TRANSPORT_MODE).
+
+    live    default httpx transport
+    record  real requests; every exchange is also saved to the cassette store
+    replay  responses come from the cassette store; nothing leaves the process
+
+Clients opt in by passing the transport to httpx:
+    httpx.AsyncClient(timeout=..., transport=build_transport())
+    httpx.Client(timeout=..., transport=build_transport())
+build_transport() returns None in live mode, so httpx uses its default.
+
+Cassettes are gzip-compressed JSON files, one per request key, under
+HTTP_CASSETTE_DIR/<host>/<key[:2]>/<key>.json.gz. The key hashes method, URL
+and body with credentials (key=, api_key=, token=, ...) removed and calendar
+dates masked, so prompts carrying today's date still replay. Request headers
+are never stored. A request recorded several times replays its responses in
+rotation.
+
+Replay waits for the recorded latency times HTTP_REPLAY_LATENCY_SCALE,
+randomised by +/- HTTP_REPLAY_LATENCY_JITTER, so load tests see realistic
+provider timing. A request with no cassette fails like a network error
+(CassetteMissError, an httpx.TransportError).
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TRANSPORT_MODES = ("live", "record", "replay")
+
+# Query parameters that carry credentials (compared lower-case)
+SECRET_PARAMS = {"key", "api_key", "apikey", "api-key", "token", "access_token", "auth", "subscription-key"}
+
+# Response headers worth keeping; encoding/length headers no longer apply to the decoded body
+KEPT_RESPONSE_HEADERS = {"content-type", "retry-after", "x-ratelimit-remaining", "x-ratelimit-reset", "location"}
+
+_DATE_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
+
+
+class CassetteMissError(httpx.TransportError):
+    """Replay found no recording for the request"""
+
+
+def redact_url(url: httpx.URL) -> str:
+    """URL without credential parameters, other parameters sorted"""
+    params = sorted(
+        (name, value) for name, value in url.params.multi_items()
+        if name.lower() not in SECRET_PARAMS
+    )
+    return str(url.copy_with(params=params))
+
+
+def request_key(method: str, url: httpx.URL, body: bytes) -> str:
+    """Stable cassette key for a request (credentials removed, dates masked)"""
+    text = body.decode("utf-8", errors="replace") if body else ""
+    if text:
+        try:
+            text = json.dumps(json.loads(text), sort_keys=True)
+        except ValueError:
+            pass
+    material = "\n".join((method.upper(), redact_url(url), text))
+    return hashlib.sha256(_DATE_RE.sub("<date>", material).encode()).hexdigest()
+
+
+class CassetteStore:
+    """Compressed on-disk cassettes with an in-memory read cache"""
+
+    def __init__(self, root: str, max_responses: Optional[int] = None):
+        self.root = Path(root)
+        self.max_responses = max_responses or settings.HTTP_CASSETTE_MAX_RESPONSES
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        # Reported by benchmarks and load tests
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+
+    def _path(self, host: str, key: str) -> Path:
+        return self.root / (host or "_") / key[:2] / f"{key}.json.gz"
+
+    def _read(self, host: str, key: str) -> Optional[Dict[str, Any]]:
+        if key in self._cache:
+            return self._cache[key]
+        path = self._path(host, key)
+        if not path.exists():
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            cassette = json.load(f)
+        self._cache[key] = cassette
+        return cassette
+
+    def next_response(self, host: str, key: str) -> Optional[Dict[str, Any]]:
+        """Next recorded response for the key (rotating), or None"""
+        with self._lock:
+            cassette = self._read(host, key)
+            if not cassette or not cassette.get("responses"):
+                self.misses += 1
+                return None
+            responses = cassette["responses"]
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            self.hits += 1
+            return responses[cursor % len(responses)]
+
+    def record(self, host: str, key: str, request_info: Dict[str, Any], response_info: Dict[str, Any]) -> None:
+        """Append a response to the key's cassette (oldest dropped past max_responses)"""
+        with self._lock:
+            cassette = self._read(host, key) or {"request": request_info, "responses": []}
+            cassette["responses"] = (cassette["responses"] + [response_info])[-self.max_responses:]
+            self._cache[key] = cassette
+
+            path = self._path(host, key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a concurrent reader never sees a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                    f.write(json.dumps(cassette).encode("utf-8"))
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+            self.recorded += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "recorded": self.recorded}
+
+
+def _describe(request: httpx.Request, body: bytes) -> Tuple[str, str, Dict[str, Any]]:
+    host = request.url.host
+    key = request_key(request.method, request.url, body)
+    info = {
+        "method": request.method,
+        "url": redact_url(request.url),
+        "body_sha256": hashlib.sha256(body).hexdigest() if body else None,
+    }
+    return host, key, info
+
+
+def _response_info(response: httpx.Response, body: bytes, elapsed: float) -> Dict[str, Any]:
+    return {
+        "status": response.status_code,
+        "headers": {name: value for name, value in response.headers.items() if name.lower() in KEPT_RESPONSE_HEADERS},
+        "body": base64.b64encode(body).decode("ascii"),
+        "latency_ms": round(elapsed * 1000, 1),
+        "recorded_at": datetime.utcnow().isoformat(),
+    }
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Sends requests for real (or through `inner`) and saves each exchange"""
+
+    def __init__(self, store: CassetteStore, inner=None):
+        self.store = store
+        self._sync = inner
+        self._async = inner
+
+    def _save(self, request: httpx.Request, body: bytes, response: httpx.Response,
+              content: bytes, elapsed: float) -> httpx.Response:
+        host, key, info = _describe(request, body)
+        response_info = _response_info(response, content, elapsed)
+        try:
+            self.store.record(host, key, info, response_info)
+        except Exception as e:
+            logger.warning(f"Failed to record cassette for {info['url']}: {e}")
+        return httpx.Response(response.status_code, headers=response_info["headers"], content=content)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._sync is None:
+            self._sync = httpx.HTTPTransport()
+        body = request.read()
+        start = time.perf_counter()
+        response = self._sync.handle_request(request)
+        try:
+            content = response.read()
+        finally:
+            response.close()
+        return self._save(request, body, response, content, time.perf_counter() - start)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._async is None:
+            self._async = httpx.AsyncHTTPTransport()
+        body = await request.aread()
+        start = time.perf_counter()
+        response = await self._async.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        return self._save(request, body, response, content, time.perf_counter() - start)
+
+    def close(self) -> None:
+        if self._sync is not None:
+            self._sync.close()
+
+    async def aclose(self) -> None:
+        if self._async is not None:
+            await self._async.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Serves recorded responses with injected latency"""
+
+    def __init__(self, store: CassetteStore, latency_scale: Optional[float] = None, jitter: Optional[float] = None):
+        self.store = store
+        self.latency_scale = settings.HTTP_REPLAY_LATENCY_SCALE if latency_scale is None else latency_scale
+        self.jitter = settings.HTTP_REPLAY_LATENCY_JITTER if jitter is None else jitter
+
+    def _lookup(self, request: httpx.Request, body: bytes) -> Tuple[httpx.Response, float]:
+        host, key, info = _describe(request, body)
+        recorded = self.store.next_response(host, key)
+        if recorded is None:
+            raise CassetteMissError(f"No cassette for {info['method']} {info['url']}", request=request)
+
+        delay = recorded.get("latency_ms", 0.0) / 1000 * self.latency_scale
+        if delay and self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        response = httpx.Response(
+            recorded["status"],
+            headers=recorded.get("headers", {}),
+            content=base64.b64decode(recorded["body"]),
+        )
+        return response, max(delay, 0.0)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response, delay = self._lookup(request, request.read())
+        if delay:
+            time.sleep(delay)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response, delay = self._lookup(request, await request.aread())
+        if delay:
+            await asyncio.sleep(delay)
+        return response
+
+
+_cassette_store: Optional[CassetteStore] = None
+_cassette_store_lock = threading.Lock()
+
+
+def get_cassette_store() -> CassetteStore:
+    global _cassette_store
+    with _cassette_store_lock:
+        if _cassette_store is None or _cassette_store.root != Path(settings.HTTP_CASSETTE_DIR):
+            _cassette_store = CassetteStore(settings.HTTP_CASSETTE_DIR)
+        return _cassette_store
+
+
+def build_transport():
+    """
+    Transport for an external API client, per HTTP_TRANSPORT_MODE.
+
+    Returns a new instance per call (clients close their transport) that
+    works with both httpx.Client and httpx.AsyncClient, or None in live mode.
+    """
+    mode = settings.HTTP_TRANSPORT_MODE
+    if mode == "live":
+        return None
+    if mode == "record":
+        return RecordingTransport(get_cassette_store())
+    if mode == "replay":
+        return ReplayTransport(get_cassette_store())
+    raise ValueError(f"Unknown HTTP_TRANSPORT_MODE: {mode} (expected one of {', '.join(TRANSPORT_MODES)})")
@@ -0,0 +1,186 @@
+"""
+Prometheus metrics for the fact-checking pipeline.
+
+The API exposes these on /metrics (main.py). Celery workers expose them on
+WORKER_METRICS_PORT via start_worker_metrics_server(). Prefork workers need
+PROMETHEUS_MULTIPROC_DIR set so child-process samples are aggregated.
+
+Usage:
+    PIPELINE_STAGE_SECONDS.labels(stage="retrieve").observe(seconds)
+    response = await llm_post(client, "judge", url, headers=..., json=payload)
+"""
+
+import logging
+import os
+import time
+from typing import Any, Optional
+
+from prometheus_client import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+STAGE_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 180)
+REQUEST_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30)
+LLM_BUCKETS = (0.25, 0.5, 1, 2, 5, 10, 20, 30, 60, 120)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+RATIO_BUCKETS = (0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+
+# ========== PIPELINE ==========
+
+PIPELINE_STAGE_SECONDS = Histogram(
+    "tru8_pipeline_stage_seconds",
+    "Wall time of each process_check stage",
+    ["stage"],
+    buckets=STAGE_BUCKETS
+)
+
+PIPELINE_CHECKS_TOTAL = Counter(
+    "tru8_pipeline_checks_total",
+    "Checks finished by the pipeline",
+    ["status"]
+)
+
+PIPELINE_CHECK_SECONDS = Histogram(
+    "tru8_pipeline_check_seconds",
+    "End-to-end processing time of completed checks",
+    buckets=STAGE_BUCKETS
+)
+
+# ========== EXTERNAL SOURCES ==========
+
+SEARCH_PROVIDER_SECONDS = Histogram(
+    "tru8_search_provider_seconds",
+    "Search provider latency including rate-limit spacing",
+    ["provider", "outcome"],
+    buckets=REQUEST_BUCKETS
+)
+
+GOV_ADAPTER_SECONDS = Histogram(
+    "tru8_gov_adapter_seconds",
+    "Government/institutional API adapter latency",
+    ["adapter", "outcome"],
+    buckets=REQUEST_BUCKETS
+)
+
+ADAPTER_HEDGED_REQUESTS = Counter(
+    "tru8_adapter_hedged_requests_total",
+    "Adapter GETs that sent a hedged duplicate, by which request answered (primary, hedge, none)",
+    ["adapter", "winner"]
+)
+
+REFERENCE_DATA_LOOKUPS = Counter(
+    "tru8_reference_data_lookups_total",
+    "Adapter reference-data snapshot lookups (fresh, stale, fetched, fallback, unavailable)",
+    ["adapter", "outcome"]
+)
+
+# ========== LLM ==========
+
+LLM_CALL_SECONDS = Histogram(
+    "tru8_llm_call_seconds",
+    "LLM API call latency",
+    ["caller", "model", "status"],
+    buckets=LLM_BUCKETS
+)
+
+LLM_TOKENS_TOTAL = Counter(
+    "tru8_llm_tokens_total",
+    "LLM tokens reported by the provider",
+    ["caller", "model", "kind"]
+)
+
+# ========== MODEL INFERENCE ==========
+
+INFERENCE_BATCH_SIZE = Histogram(
+    "tru8_inference_batch_size",
+    "Items per model inference batch",
+    ["model"],
+    buckets=BATCH_SIZE_BUCKETS
+)
+
+INFERENCE_PADDING_RATIO = Histogram(
+    "tru8_inference_padding_ratio",
+    "Fraction of padded tokens in a tokenized batch",
+    ["model"],
+    buckets=RATIO_BUCKETS
+)
+
+INFERENCE_SECONDS = Histogram(
+    "tru8_inference_seconds",
+    "Model inference time per batch",
+    ["model"],
+    buckets=REQUEST_BUCKETS
+)
+
+
+def _record_llm_usage(caller: str, model: str, response) -> None:
+    """Token counts from OpenAI ("usage") or Gemini ("usageMetadata") responses"""
+    try:
+        data = response.json()
+        usage = data.get("usage")
+        if usage:
+            prompt, completion = usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0)
+        else:
+            usage = data.get("usageMetadata") or {}
+            prompt, completion = usage.get("promptTokenCount", 0), usage.get("candidatesTokenCount", 0)
+        if prompt:
+            LLM_TOKENS_TOTAL.labels(caller=caller, model=model, kind="prompt").inc(int(prompt))
+        if completion:
+            LLM_TOKENS_TOTAL.labels(caller=caller, model=model, kind="completion").inc(int(completion))
+    except Exception as e:
+        logger.debug(f"Failed to record LLM token usage for {caller}: {e}")
+
+
+async def llm_post(client, caller: str, url: str, model: Optional[str] = None, **kwargs: Any):
+    """
+    client.post() for LLM APIs that records latency and token usage.
+
+    The model label defaults to the "model" field of the JSON payload.
+    """
+    from app.core.tracing import start_span
+
+    model = model or (kwargs.get("json") or {}).get("model", "unknown")
+    start = time.perf_counter()
+    with start_span(f"llm {caller}", **{"llm.caller": caller, "llm.model": model}) as span:
+        try:
+            response = await client.post(url, **kwargs)
+        except Exception:
+            LLM_CALL_SECONDS.labels(caller=caller, model=model, status="error").observe(time.perf_counter() - start)
+            raise
+        span.set_attribute("http.status_code", response.status_code)
+
+    status = "ok" if response.status_code == 200 else str(response.status_code)
+    LLM_CALL_SECONDS.labels(caller=caller, model=model, status=status).observe(time.perf_counter() - start)
+    if response.status_code == 200:
+        _record_llm_usage(caller, model, response)
+    return response
+
+
+def start_worker_metrics_server(port: int) -> None:
+    """Expose metrics from a Celery worker (no-op when port is 0)"""
+    if not port:
+        return
+    try:
+        from prometheus_client import CollectorRegistry, start_http_server
+
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            from prometheus_client import multiprocess
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            start_http_server(port, registry=registry)
+        else:
+            start_http_server(port)
+        logger.info(f"[WORKER] Prometheus metrics exporter listening on :{port}")
+    except Exception as e:
+        logger.warning(f"[WORKER] Failed to start metrics exporter on :{port}: {e}")
+
+
+def mark_worker_process_dead(pid: int) -> None:
+    """Drop a dead prefork child's live gauges (multiprocess mode only)"""
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return
+    try:
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(pid)
+    except Exception as e:
+        logger.debug(f"Failed to mark metrics process {pid} dead: {e}")
@@ -0,0 +1,231 @@
+"""
+OpenTelemetry tracing (ENABLE_TRACING).
+
+The API and Celery workers each call setup_tracing() once per process. The
+API root span starts at create_check. Trace context travels in the Celery
+message headers (instrument_celery), so process_check and the staged
+pipeline tasks continue the same trace. Stage, search provider, government
+adapter, LLM and NLI batch spans are children of the task span.
+
+Exporters (TRACING_EXPORTER):
+    otlp     OTLP/HTTP to a local collector (TRACING_OTLP_ENDPOINT)
+    file     one JSON span per line in TRACING_FILE_PATH
+    console  stdout (debugging)
+
+When tracing is disabled the global no-op provider is used and every span
+helper here costs next to nothing.
+"""
+
+import functools
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+from opentelemetry import context as otel_context
+from opentelemetry import propagate, trace
+from opentelemetry.trace import Status, StatusCode
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TRACER_NAME = "tru8"
+
+_configured = False
+
+
+class JsonLinesSpanExporter:
+    """Append finished spans to a file as JSON lines (offline inspection)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Any]):
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        try:
+            lines = [json.dumps(json.loads(span.to_json())) for span in spans]
+            with self._lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            return SpanExportResult.SUCCESS
+        except Exception as e:
+            logger.warning(f"Trace file export failed: {e}")
+            return SpanExportResult.FAILURE
+
+    def shutdown(self) -> None:
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+
+def _build_exporter():
+    exporter = settings.TRACING_EXPORTER
+    if exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        return OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT)
+    if exporter == "file":
+        return JsonLinesSpanExporter(settings.TRACING_FILE_PATH)
+    if exporter == "console":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+        return ConsoleSpanExporter()
+    raise ValueError(f"Unknown TRACING_EXPORTER: {exporter}")
+
+
+def setup_tracing(service_name: str) -> bool:
+    """Install the SDK tracer provider for this process. Returns True if tracing is active."""
+    global _configured
+    if _configured or not settings.ENABLE_TRACING:
+        return _configured
+
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+        provider = TracerProvider(
+            resource=Resource.create({
+                "service.name": service_name,
+                "deployment.environment": settings.ENVIRONMENT,
+            }),
+            sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATIO)),
+        )
+        # BatchSpanProcessor re-initialises its export thread after fork (prefork workers)
+        provider.add_span_processor(BatchSpanProcessor(_build_exporter()))
+        trace.set_tracer_provider(provider)
+        _configured = True
+        logger.info(f"Tracing enabled for {service_name} ({settings.TRACING_EXPORTER} exporter)")
+    except Exception as e:
+        logger.warning(f"Tracing setup failed, continuing without traces: {e}")
+        return False
+
+    # Redis commands (cache, rate limits, pipeline state) as client spans
+    try:
+        from opentelemetry.instrumentation.redis import RedisInstrumentor
+        RedisInstrumentor().instrument()
+    except Exception as e:
+        logger.warning(f"Redis tracing instrumentation unavailable: {e}")
+
+    return True
+
+
+def get_tracer():
+    return trace.get_tracer(TRACER_NAME)
+
+
+@contextmanager
+def start_span(name: str, **attributes: Any) -> Iterator[Any]:
+    """Child span of the current context; records exceptions and re-raises"""
+    with get_tracer().start_as_current_span(name, record_exception=True, set_status_on_exception=True) as span:
+        for key, value in attributes.items():
+            if value is not None:
+                span.set_attribute(key, value)
+        yield span
+
+
+def record_completed_span(name: str, started_at: datetime, ended_at: datetime, **attributes: Any) -> None:
+    """Emit a span for work that was timed after the fact (naive datetimes are UTC)"""
+    if started_at.tzinfo is None:
+        started_at = started_at.replace(tzinfo=timezone.utc)
+    if ended_at.tzinfo is None:
+        ended_at = ended_at.replace(tzinfo=timezone.utc)
+    start_ns = int(started_at.timestamp() * 1e9)
+    end_ns = int(ended_at.timestamp() * 1e9)
+    span = get_tracer().start_span(name, start_time=start_ns, attributes={
+        key: value for key, value in attributes.items() if value is not None
+    })
+    span.end(end_time=end_ns)
+
+
+def traced(name: str):
+    """Decorator: run a synchronous function inside a span"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with start_span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ========== CELERY PROPAGATION ==========
+
+class _RequestGetter:
+    """Reads propagated headers from a Celery task request"""
+
+    def get(self, carrier, key: str):
+        value = getattr(carrier, key, None)
+        if value is None and isinstance(getattr(carrier, "headers", None), dict):
+            value = carrier.headers.get(key)
+        if value is None:
+            return None
+        return value if isinstance(value, list) else [value]
+
+    def keys(self, carrier):
+        return []
+
+
+# Task id -> (span, context token) for tasks running in this process
+_task_spans: Dict[str, Any] = {}
+_task_spans_lock = threading.Lock()
+
+
+def _inject_headers(headers: Optional[Dict[str, Any]] = None, **kwargs) -> None:
+    if headers is not None:
+        propagate.inject(headers)
+
+
+def _start_task_span(task_id: str = None, task=None, **kwargs) -> None:
+    if task is None or task_id is None:
+        return
+    parent = propagate.extract(task.request, getter=_RequestGetter())
+    attributes = {"celery.task_id": task_id}
+    check_id = (task.request.kwargs or {}).get("check_id")
+    if check_id:
+        attributes["check.id"] = check_id
+    span = get_tracer().start_span(
+        f"celery.task {task.name}",
+        context=parent,
+        kind=trace.SpanKind.CONSUMER,
+        attributes=attributes,
+    )
+    token = otel_context.attach(trace.set_span_in_context(span, parent))
+    with _task_spans_lock:
+        _task_spans[task_id] = (span, token)
+
+
+def _end_task_span(task_id: str = None, state: Optional[str] = None, **kwargs) -> None:
+    with _task_spans_lock:
+        entry = _task_spans.pop(task_id, None)
+    if entry is None:
+        return
+    span, token = entry
+    if state:
+        span.set_attribute("celery.state", state)
+    otel_context.detach(token)
+    span.end()
+
+
+def _record_task_failure(task_id: str = None, exception: Optional[BaseException] = None, **kwargs) -> None:
+    with _task_spans_lock:
+        entry = _task_spans.get(task_id)
+    if entry is None or exception is None:
+        return
+    span, _ = entry
+    span.record_exception(exception)
+    span.set_status(Status(StatusCode.ERROR, str(exception)))
+
+
+def instrument_celery() -> None:
+    """Propagate trace context through Celery messages and span each task run"""
+    from celery.signals import before_task_publish, task_prerun, task_postrun, task_failure
+
+    before_task_publish.connect(_inject_headers, weak=False)
+    task_prerun.connect(_start_task_span, weak=False)
+    task_postrun.connect(_end_task_span, weak=False)
+    task_failure.connect(_record_task_failure, weak=False)
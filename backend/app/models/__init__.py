@@ -1,5 +1,6 @@
 from .user import User, Subscription
 from .check import Check, Claim, Evidence, RawEvidence
 from .unknown_source import UnknownSource
+from .notification import NotificationOutbox
 
-__all__ = ["User", "Subscription", "Check", "Claim", "Evidence", "RawEvidence", "UnknownSource"]
\ No newline at end of file
+__all__ = ["User", "Subscription", "Check", "Claim", "Evidence", "RawEvidence", "UnknownSource", "NotificationOutbox"]
\ No newline at end of file
@@ -14,6 +14,7 @@ class Check(SQLModel, table=True):
     input_type: str  # 'url', 'text', 'image', 'video'
     input_content: str = Field(sa_column=Column(JSONB))  # Store as JSONB for PostgreSQL optimization
     input_url: Optional[str] = None
+    recheck_key: Optional[str] = Field(default=None, index=True)  # Normalised URL or user + text hash (incremental re-checks)
     status: str = Field(default="pending")  # 'pending', 'processing', 'completed', 'failed'
     credits_used: int = Field(default=1)
     processing_time_ms: Optional[int] = None
@@ -126,6 +127,7 @@ class Claim(SQLModel, table=True):
     rationale: str
     position: int  # Order in the check
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    evidence_retrieved_at: Optional[datetime] = None  # Original retrieval time of claims copied forward by incremental re-checks
 
     # Temporal context fields (Phase 1.5, Week 4.5-5.5)
     temporal_markers: Optional[str] = Field(default=None, sa_column=Column(JSONB))  # Detected time markers
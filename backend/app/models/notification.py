@@ -0,0 +1,37 @@
+"""
+Notification Outbox Model
+
+Transactional outbox for user notifications. Pipeline workers write
+notification intents here in the same transaction as the check update;
+a separate Celery queue delivers them (see app/workers/notifications.py).
+"""
+
+from typing import Optional, Dict, Any
+from datetime import datetime
+from sqlmodel import Field, SQLModel, Column
+from sqlalchemy.dialects.postgresql import JSONB
+import uuid
+
+
+def generate_uuid() -> str:
+    return str(uuid.uuid4())
+
+
+class NotificationOutbox(SQLModel, table=True):
+    """A pending push/email notification for a user"""
+    __tablename__ = "notification_outbox"
+
+    id: str = Field(default_factory=generate_uuid, primary_key=True)
+    user_id: str = Field(index=True)
+    check_id: Optional[str] = Field(default=None, index=True)
+    channel: str = Field(description="'push' or 'email'")
+    kind: str = Field(description="'check_completed' or 'check_failed'")
+    payload: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSONB))
+
+    # Delivery state: 'pending' -> 'sent' | 'skipped' | 'failed'
+    status: str = Field(default="pending", index=True)
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = None
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    sent_at: Optional[datetime] = None
@@ -6,6 +6,8 @@ from typing import Dict, List, Any, Optional
 import httpx
 from pydantic import BaseModel, Field, ValidationError
 from app.core.config import settings
+from app.core.metrics import llm_post
+from app.core.http_transport import build_transport
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +40,60 @@ class ClaimExtractionResponse(BaseModel):
     source_summary: Optional[str] = Field(description="Brief summary of source content", default=None)
     extraction_confidence: int = Field(description="Overall extraction quality 0-100", default=80)
 
+def split_into_chunks(content: str, chunk_words: int, overlap_words: int) -> List[str]:
+    """
+    Split content into word-bounded chunks on paragraph boundaries.
+
+    Paragraphs are packed into chunks of up to chunk_words words. The trailing
+    paragraphs of each chunk (up to overlap_words) are repeated at the start of
+    the next chunk so claims that straddle a boundary keep their context.
+    Paragraphs longer than chunk_words are split on sentence boundaries.
+    """
+    paragraphs = [p.strip() for p in re.split(r'\n\s*\n', content) if p.strip()]
+
+    # Break oversized paragraphs into sentence groups
+    units: List[str] = []
+    for paragraph in paragraphs:
+        if len(paragraph.split()) <= chunk_words:
+            units.append(paragraph)
+            continue
+        current: List[str] = []
+        current_len = 0
+        for sentence in re.split(r'(?<=[.!?])\s+', paragraph):
+            sentence_len = len(sentence.split())
+            if current and current_len + sentence_len > chunk_words:
+                units.append(' '.join(current))
+                current, current_len = [], 0
+            current.append(sentence)
+            current_len += sentence_len
+        if current:
+            units.append(' '.join(current))
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    for unit in units:
+        unit_len = len(unit.split())
+        if current and current_len + unit_len > chunk_words:
+            chunks.append('\n\n'.join(current))
+            # Carry trailing units forward as overlap
+            overlap: List[str] = []
+            overlap_len = 0
+            for prev in reversed(current):
+                prev_len = len(prev.split())
+                if overlap_len + prev_len > overlap_words:
+                    break
+                overlap.insert(0, prev)
+                overlap_len += prev_len
+            current, current_len = overlap, overlap_len
+        current.append(unit)
+        current_len += unit_len
+    if current:
+        chunks.append('\n\n'.join(current))
+
+    return chunks
+
+
 class ClaimExtractor:
     """Extract atomic factual claims from content using LLM"""
 
@@ -155,9 +211,16 @@ Always return valid JSON matching the required format."""
                     "claims": []
                 }
             
+            # Long documents: map-reduce extraction over paragraph chunks
+            words = content.split()
+            if settings.ENABLE_CHUNKED_EXTRACTION and len(words) > settings.CHUNKED_EXTRACTION_MIN_WORDS:
+                result = await self._extract_chunked(content, metadata or {})
+                if result["success"]:
+                    return result
+                logger.warning(f"Chunked extraction failed ({result.get('error')}), falling back to single prompt")
+
             # Truncate content if too long (cost optimization)
             max_words = 2500  # Project limit
-            words = content.split()
             if len(words) > max_words:
                 content = ' '.join(words[:max_words]) + "..."
                 logger.info(f"Truncated content to {max_words} words")
@@ -201,7 +264,8 @@ Always return valid JSON matching the required format."""
                 "claims": []
             }
     
-    async def _extract_with_openai(self, content: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def _extract_with_openai(self, content: str, metadata: Dict[str, Any] = None,
+                                   run_article_classification: bool = True) -> Dict[str, Any]:
         """Extract claims using OpenAI GPT"""
         try:
             from datetime import datetime
@@ -221,8 +285,10 @@ Use this to resolve relative time references ("yesterday", "this week", "recentl
                 user_prompt += f"Source URL: {metadata.get('url')}\n"
             user_prompt += f"\nExtract atomic factual claims from this content:\n\n{content}"
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
+            async with httpx.AsyncClient(timeout=self.timeout, transport=build_transport()) as client:
+                response = await llm_post(
+                    client,
+                    "extract",
                     "https://api.openai.com/v1/chat/completions",
                     headers={
                         "Authorization": f"Bearer {self.openai_api_key}",
@@ -320,7 +386,7 @@ Use this to resolve relative time references ("yesterday", "this week", "recentl
                 # Article-level classification (once per check, not per claim)
                 # This replaces per-claim spaCy NER domain detection
                 article_classification = None
-                if settings.ENABLE_ARTICLE_CLASSIFICATION:
+                if run_article_classification and settings.ENABLE_ARTICLE_CLASSIFICATION:
                     try:
                         from app.utils.article_classifier import classify_article
 
@@ -361,7 +427,8 @@ Use this to resolve relative time references ("yesterday", "this week", "recentl
             logger.error(f"OpenAI extraction error: {e}")
             return {"success": False, "error": str(e)}
 
-    async def _extract_with_google(self, content: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def _extract_with_google(self, content: str, metadata: Dict[str, Any] = None,
+                                   run_article_classification: bool = True) -> Dict[str, Any]:
         """Extract claims using Google AI (Gemini) API as backup provider"""
         try:
             from datetime import datetime
@@ -384,7 +451,7 @@ Use this to resolve relative time references ("yesterday", "this week", "recentl
             # Combine system prompt and user prompt for Gemini
             full_prompt = f"{self.system_prompt.format(max_claims=self.max_claims)}\n\n{user_prompt}\n\nProvide your response as valid JSON."
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(timeout=self.timeout, transport=build_transport()) as client:
                 response = await client.post(
                     f"https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={self.google_ai_api_key}",
                     headers={"Content-Type": "application/json"},
@@ -472,7 +539,7 @@ Use this to resolve relative time references ("yesterday", "this week", "recentl
                             claims[i]["legal_metadata"] = result.get("metadata", {})
 
                 # Article-level classification
-                if settings.ENABLE_ARTICLE_CLASSIFICATION:
+                if run_article_classification and settings.ENABLE_ARTICLE_CLASSIFICATION:
                     try:
                         from app.utils.article_classifier import classify_article
 
@@ -514,6 +581,140 @@ Use this to resolve relative time references ("yesterday", "this week", "recentl
             logger.error(f"Google AI extraction error: {e}")
             return {"success": False, "error": str(e)}
 
+    async def _extract_chunked(self, content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map-reduce extraction for long documents.
+
+        Map: extract claims from paragraph chunks concurrently (OpenAI, Gemini backup).
+        Reduce: merge in document order, drop semantic duplicates from chunk overlap,
+        apply the global MAX_CLAIMS_PER_CHECK cap and re-number positions.
+        """
+        chunks = split_into_chunks(
+            content,
+            settings.EXTRACTION_CHUNK_WORDS,
+            settings.EXTRACTION_CHUNK_OVERLAP_WORDS
+        )
+        if len(chunks) > settings.MAX_EXTRACTION_CHUNKS:
+            logger.info(f"[EXTRACT] Limiting {len(chunks)} chunks to {settings.MAX_EXTRACTION_CHUNKS}")
+            chunks = chunks[:settings.MAX_EXTRACTION_CHUNKS]
+
+        logger.info(f"[EXTRACT] Chunked extraction: {len(content.split())} words in {len(chunks)} chunks")
+        semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_EXTRACTIONS)
+
+        async def extract_chunk(chunk: str) -> Dict[str, Any]:
+            async with semaphore:
+                result = {"success": False, "error": "No LLM provider configured"}
+                if self.openai_api_key:
+                    result = await self._extract_with_openai(chunk, metadata, run_article_classification=False)
+                if not result["success"] and self.google_ai_api_key:
+                    result = await self._extract_with_google(chunk, metadata, run_article_classification=False)
+                return result
+
+        chunk_results = await asyncio.gather(*[extract_chunk(chunk) for chunk in chunks], return_exceptions=True)
+
+        all_claims: List[Dict[str, Any]] = []
+        succeeded = 0
+        token_usage: Dict[str, int] = {}
+        for chunk_index, result in enumerate(chunk_results):
+            if isinstance(result, Exception) or not result.get("success"):
+                error = result if isinstance(result, Exception) else result.get("error")
+                logger.warning(f"[EXTRACT] Chunk {chunk_index} extraction failed: {error}")
+                continue
+            succeeded += 1
+            for claim in result.get("claims", []):
+                claim["chunk_index"] = chunk_index
+                all_claims.append(claim)
+            for key, value in (result.get("metadata", {}).get("token_usage") or {}).items():
+                if isinstance(value, int):
+                    token_usage[key] = token_usage.get(key, 0) + value
+
+        if not succeeded:
+            return {"success": False, "error": "All chunk extractions failed", "claims": []}
+
+        claims = await self._deduplicate_claims(all_claims)
+
+        # Global cap: keep the most confident claims, then restore document order
+        if len(claims) > self.max_claims:
+            keep = sorted(range(len(claims)), key=lambda i: claims[i].get("confidence", 0), reverse=True)[:self.max_claims]
+            claims = [claims[i] for i in sorted(keep)]
+
+        for i, claim in enumerate(claims):
+            claim["position"] = i
+            claim["source_title"] = metadata.get("title")
+            claim["source_url"] = metadata.get("url")
+            claim["source_date"] = metadata.get("date")
+
+        # Article-level classification once for the whole document
+        if settings.ENABLE_ARTICLE_CLASSIFICATION:
+            try:
+                from app.utils.article_classifier import classify_article
+
+                article_classification = await classify_article(
+                    title=metadata.get("title", ""),
+                    url=metadata.get("url", ""),
+                    content=content[:2000]
+                )
+                for claim in claims:
+                    claim["article_classification"] = article_classification.to_dict()
+            except Exception as e:
+                logger.warning(f"Article classification failed, continuing without: {e}")
+
+        logger.info(
+            f"[EXTRACT] Chunked extraction: {len(all_claims)} raw claims from {succeeded}/{len(chunks)} chunks "
+            f"-> {len(claims)} after dedup/cap"
+        )
+
+        return {
+            "success": True,
+            "claims": claims,
+            "metadata": {
+                "extraction_method": "chunked_map_reduce",
+                "chunks_total": len(chunks),
+                "chunks_succeeded": succeeded,
+                "raw_claims": len(all_claims),
+                "token_usage": token_usage
+            }
+        }
+
+    async def _deduplicate_claims(self, claims: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Remove semantic duplicates (typically from chunk overlap), keeping the
+        first occurrence with the highest confidence seen among its duplicates.
+        Falls back to normalised text comparison if embeddings are unavailable.
+        """
+        if len(claims) <= 1:
+            return claims
+
+        threshold = settings.CLAIM_DEDUP_SIMILARITY_THRESHOLD
+        embeddings = None
+        try:
+            from app.services.embeddings import get_embedding_service
+            embedding_service = await get_embedding_service()
+            embeddings = await embedding_service.embed_batch([c["text"] for c in claims])
+        except Exception as e:
+            logger.warning(f"[EXTRACT] Embedding dedup unavailable, using text comparison: {e}")
+
+        def is_duplicate(i: int, j: int) -> bool:
+            if embeddings is not None:
+                import numpy as np
+                return float(np.dot(embeddings[i], embeddings[j])) >= threshold
+            from difflib import SequenceMatcher
+            a = re.sub(r'\W+', ' ', claims[i]["text"].lower()).strip()
+            b = re.sub(r'\W+', ' ', claims[j]["text"].lower()).strip()
+            return SequenceMatcher(None, a, b).ratio() >= threshold
+
+        kept: List[int] = []
+        for i, claim in enumerate(claims):
+            duplicate_of = next((k for k in kept if is_duplicate(k, i)), None)
+            if duplicate_of is None:
+                kept.append(i)
+            elif claim.get("confidence", 0) > claims[duplicate_of].get("confidence", 0):
+                claims[duplicate_of]["confidence"] = claim["confidence"]
+
+        if len(kept) < len(claims):
+            logger.info(f"[EXTRACT] Claim dedup: {len(claims)} -> {len(kept)}")
+        return [claims[i] for i in kept]
+
     def _validate_and_refine_claims(self, claims: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Filter out unverifiable claims and refine problematic ones"""
         validated_claims = []
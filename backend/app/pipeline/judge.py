@@ -6,6 +6,8 @@ from datetime import datetime, timedelta
 import json
 import httpx
 from app.core.config import settings
+from app.core.metrics import llm_post
+from app.core.http_transport import build_transport
 from app.services.cache import get_cache_service
 from app.pipeline.extract import ClaimExtractor  # Reuse LLM infrastructure
 
@@ -654,8 +656,10 @@ Based on this analysis, provide your final judgment."""
     async def _judge_with_openai(self, context: str) -> Dict[str, Any]:
         """Make judgment using OpenAI API"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
+            async with httpx.AsyncClient(timeout=self.timeout, transport=build_transport()) as client:
+                response = await llm_post(
+                    client,
+                    "judge",
                     "https://api.openai.com/v1/chat/completions",
                     headers={
                         "Authorization": f"Bearer {self.openai_api_key}",
@@ -688,12 +692,15 @@ Based on this analysis, provide your final judgment."""
     async def _judge_with_google(self, context: str) -> Dict[str, Any]:
         """Make judgment using Google AI (Gemini) API as backup provider"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(timeout=self.timeout, transport=build_transport()) as client:
                 # Use Gemini 1.5 Flash for fast, cost-effective judgment
                 # Gemini 1.5 Flash: Fast responses, good for structured output
                 # Gemini 1.5 Pro: More capable but slower/costlier (use for complex cases)
-                response = await client.post(
+                response = await llm_post(
+                    client,
+                    "judge",
                     f"https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={self.google_ai_api_key}",
+                    model="gemini-1.5-flash",
                     headers={
                         "Content-Type": "application/json"
                     },
@@ -7,6 +7,8 @@ import httpx
 import json
 from typing import Dict, List, Any, Optional
 from app.core.config import settings
+from app.core.metrics import llm_post
+from app.core.http_transport import build_transport
 
 logger = logging.getLogger(__name__)
 
@@ -112,8 +114,10 @@ Answer the user's question using ONLY the evidence above.
 Be direct and concise. Cite source numbers used."""
 
             # Call OpenAI
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
+            async with httpx.AsyncClient(timeout=self.timeout, transport=build_transport()) as client:
+                response = await llm_post(
+                    client,
+                    "query",
                     "https://api.openai.com/v1/chat/completions",
                     headers={
                         "Authorization": f"Bearer {self.openai_api_key}",
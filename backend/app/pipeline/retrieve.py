@@ -9,10 +9,17 @@ from app.services.embeddings import get_embedding_service, rank_evidence_by_simi
 from app.services.vector_store import get_vector_store
 from app.utils.url_utils import extract_domain
 from app.services.government_api_client import get_api_registry
+from app.services.adapter_latency import adapter_deadline
+from app.services.adapter_yield import evidence_providers, get_adapter_yield_store, select_adapters
+from app.services.inference_client import get_inference_client, inference_is_remote
 from app.core.config import settings
+from app.core.metrics import INFERENCE_BATCH_SIZE, INFERENCE_SECONDS
 
 logger = logging.getLogger(__name__)
 
+# Phase 1.3 reranker (also served by app.services.inference_server in remote mode)
+CROSS_ENCODER_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+
 # Module load timestamp for debugging stale worker issues
 import time as _time
 _MODULE_LOAD_TIME = _time.strftime("%Y-%m-%d %H:%M:%S")
@@ -56,7 +63,8 @@ class EvidenceRetriever:
     async def retrieve_evidence_for_claims(
         self,
         claims: List[Dict[str, Any]],
-        exclude_source_url: Optional[str] = None
+        exclude_source_url: Optional[str] = None,
+        check_id: Optional[str] = None
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Retrieve evidence for multiple claims concurrently"""
         try:
@@ -93,10 +101,21 @@ class EvidenceRetriever:
                 except Exception as e:
                     logger.warning(f"Query planning failed: {e}, using fallback")
 
+            # Batch-parse claims and article titles once (worker thread, nlp.pipe)
+            # so per-claim query formulation hits the shared doc cache
+            if settings.ENABLE_QUERY_EXPANSION:
+                try:
+                    from app.services.nlp import get_nlp_service
+                    texts = [c.get("text", "") for c in claims]
+                    texts += list({c.get("source_title") for c in claims if c.get("source_title")})
+                    await get_nlp_service().parse_batch(texts)
+                except Exception as e:
+                    logger.warning(f"Batch NLP parse failed, parsing per claim: {e}")
+
             # Process claims with concurrency limit
             semaphore = asyncio.Semaphore(self.max_concurrent_claims)
             tasks = [
-                self._retrieve_evidence_for_single_claim(claim, semaphore, excluded_domain)
+                self._retrieve_evidence_for_single_claim(claim, semaphore, excluded_domain, check_id=check_id)
                 for claim in claims
             ]
             
@@ -144,7 +163,8 @@ class EvidenceRetriever:
         self,
         claim: Dict[str, Any],
         semaphore: asyncio.Semaphore,
-        excluded_domain: Optional[str] = None
+        excluded_domain: Optional[str] = None,
+        check_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Retrieve evidence for a single claim.
 
@@ -267,8 +287,15 @@ class EvidenceRetriever:
                 result = self._apply_credibility_weighting(ranked_evidence, claim, track_raw_evidence=True)
                 final_evidence, raw_evidence = result if isinstance(result, tuple) else (result, [])
 
+                # Credit adapters whose evidence survived ranking and weighting
+                kept_providers = evidence_providers(final_evidence[:self.max_sources_per_claim])
+                if kept_providers:
+                    await asyncio.to_thread(
+                        get_adapter_yield_store().record_kept, claim["api_stats"].get("domain"), kept_providers
+                    )
+
                 # Step 4: Store in vector database for future retrieval
-                await self._store_evidence_embeddings(claim, final_evidence)
+                await self._store_evidence_embeddings(claim, final_evidence, check_id=check_id)
 
                 # Return top evidence along with raw evidence metadata
                 return {
@@ -691,17 +718,23 @@ class EvidenceRetriever:
         start_time = time.time()
 
         try:
-            # Lazy load cross-encoder (only when actually used)
-            if not hasattr(self, '_cross_encoder'):
-                from sentence_transformers import CrossEncoder
-                self._cross_encoder = CrossEncoder('cross-encoder/ms-marco-MiniLM-L-6-v2')
-                logger.debug("Cross-encoder loaded")
-
             # Prepare claim-evidence pairs
             pairs = [(claim_text, ev.get('text', '')) for ev in evidence_list]
 
-            # Score all pairs (synchronous but fast ~50ms for 10 pairs)
-            scores = self._cross_encoder.predict(pairs)
+            if inference_is_remote():
+                # Shared inference server holds the model and batches across workers
+                scores = await get_inference_client().rerank(pairs)
+            else:
+                # Lazy load cross-encoder (only when actually used)
+                if not hasattr(self, '_cross_encoder'):
+                    from sentence_transformers import CrossEncoder
+                    self._cross_encoder = CrossEncoder(CROSS_ENCODER_MODEL)
+                    logger.debug("Cross-encoder loaded")
+
+                # Score all pairs (synchronous but fast ~50ms for 10 pairs)
+                INFERENCE_BATCH_SIZE.labels(model="cross_encoder").observe(len(pairs))
+                with INFERENCE_SECONDS.labels(model="cross_encoder").time():
+                    scores = self._cross_encoder.predict(pairs)
 
             # Attach scores and preserve bi-encoder scores for comparison
             for i, ev in enumerate(evidence_list):
@@ -1311,36 +1344,71 @@ class EvidenceRetriever:
                 logger.warning(f"[API] No adapters found for domain={domain}, jurisdiction={jurisdiction}")
                 return {"evidence": [], "api_stats": {}}
 
-            # Query all relevant APIs concurrently
-            api_tasks = []
-            for adapter in relevant_adapters:
-                # Use asyncio.to_thread to run sync API calls in executor
-                # Pass entities for dynamic entity extraction (no hardcoded lists!)
-                task = asyncio.to_thread(
-                    adapter.search_with_cache,
-                    claim_text,
-                    domain,
-                    jurisdiction,
-                    entities
-                )
-                api_tasks.append((adapter.api_name, task))
+            deadline = settings.API_CLAIM_DEADLINE_SECONDS
+
+            # Drop adapters whose past yield in this domain doesn't justify their latency
+            skipped_adapters = []
+            yield_store = get_adapter_yield_store()
+            if settings.ENABLE_ADAPTER_SELECTION and len(relevant_adapters) > 1:
+                domain_yield = await asyncio.to_thread(yield_store.get_stats, domain)
+                relevant_adapters, skipped_adapters = select_adapters(relevant_adapters, domain_yield, deadline)
+                if skipped_adapters:
+                    logger.info(f"[API ROUTING] Skipped by yield: {skipped_adapters}")
+                if not relevant_adapters:
+                    return {"evidence": [], "api_stats": {
+                        "apis_queried": [],
+                        "total_api_calls": 0,
+                        "total_api_results": 0,
+                        "timed_out": 0,
+                        "domain": domain,
+                        "skipped": skipped_adapters
+                    }}
+
+            # Query all relevant APIs concurrently, within one deadline for the claim.
+            # The deadline travels into the worker threads (contextvars), so adapter
+            # timeouts and retries shrink to fit it.
+            elapsed_ms = {}
+
+            def timed_search(adapter):
+                started = _time.monotonic()
+                try:
+                    # Pass entities for dynamic entity extraction (no hardcoded lists!)
+                    return adapter.search_with_cache(claim_text, domain, jurisdiction, entities)
+                finally:
+                    elapsed_ms[adapter.api_name] = (_time.monotonic() - started) * 1000
 
-            # Gather all API results
-            api_results = await asyncio.gather(
-                *[task for _, task in api_tasks],
-                return_exceptions=True
-            )
+            api_tasks = []
+            with adapter_deadline(deadline):
+                for adapter in relevant_adapters:
+                    # Use asyncio.to_thread to run sync API calls in executor
+                    task = asyncio.create_task(asyncio.to_thread(timed_search, adapter))
+                    api_tasks.append((adapter.api_name, task))
+
+            # Wait for the deadline; stragglers are dropped (their threads finish
+            # on their own and still populate the cache for later claims)
+            _, pending = await asyncio.wait([task for _, task in api_tasks], timeout=deadline)
+            for task in pending:
+                task.cancel()
 
             # Collect evidence and statistics
             all_api_evidence = []
             api_stats = {
                 "apis_queried": [],
                 "total_api_calls": 0,
-                "total_api_results": 0
+                "total_api_results": 0,
+                "timed_out": 0,
+                "domain": domain,
+                "skipped": skipped_adapters
             }
 
-            for i, (api_name, _) in enumerate(api_tasks):
-                result = api_results[i]
+            for api_name, task in api_tasks:
+                if task in pending:
+                    logger.warning(f"{api_name} missed the {deadline:.0f}s claim deadline, continuing without it")
+                    api_stats["apis_queried"].append({"name": api_name, "results": 0, "error": "deadline exceeded"})
+                    api_stats["timed_out"] += 1
+                    continue
+
+                result = task.exception() or task.result()
 
                 if isinstance(result, Exception):
                     logger.error(f"{api_name} API call failed: {result}")
@@ -1356,6 +1424,12 @@ class EvidenceRetriever:
 
             api_stats["total_api_calls"] = len(api_tasks)
 
+            # Adapters that missed the deadline are charged the full deadline
+            await asyncio.to_thread(yield_store.record_calls, domain, [
+                (stat["name"], stat["results"], elapsed_ms.get(stat["name"], deadline * 1000))
+                for stat in api_stats["apis_queried"]
+            ])
+
             # Log API results summary
             logger.info(f"[API DEBUG] Results: {api_stats['total_api_calls']} APIs queried, {api_stats['total_api_results']} total results")
             for api_stat in api_stats["apis_queried"]:
@@ -1409,8 +1483,9 @@ class EvidenceRetriever:
 
         return snippets
     
-    async def _store_evidence_embeddings(self, claim: Dict[str, Any], 
-                                       evidence_list: List[Dict[str, Any]]):
+    async def _store_evidence_embeddings(self, claim: Dict[str, Any],
+                                       evidence_list: List[Dict[str, Any]],
+                                       check_id: Optional[str] = None):
         """Store evidence embeddings in vector database for future use"""
         try:
             if not evidence_list:
@@ -1418,25 +1493,24 @@ class EvidenceRetriever:
             
             embedding_service = await get_embedding_service()
             vector_store = await get_vector_store()
-            
-            # Generate embeddings for evidence texts
-            evidence_texts = [evidence["text"] for evidence in evidence_list]
-            embeddings = await embedding_service.embed_batch(evidence_texts)
-            
-            # Prepare data for vector storage
-            evidence_data = []
-            for evidence, embedding in zip(evidence_list, embeddings):
-                evidence_item = {
+
+            # Claim rows are created after retrieval, so the reference is check + position
+            claim_ref = claim.get("id") or (f"{check_id}:{claim.get('position', 0)}" if check_id else None)
+            evidence_data = [
+                {
                     **evidence,
-                    "embedding": embedding,
-                    "claim_text": claim.get("text"),
-                    "claim_position": claim.get("position"),
+                    "claim_id": claim_ref,
+                    "check_id": check_id,
                     "created_at": datetime.utcnow().isoformat()
                 }
-                evidence_data.append(evidence_item)
-            
-            # Store embeddings
-            stored_ids = await vector_store.store_evidence_embeddings(evidence_data)
+                for evidence in evidence_list
+            ]
+
+            # Snippets already in the store only gain a reference; new ones are embedded
+            stored_ids = await vector_store.store_evidence_embeddings(
+                evidence_data,
+                embed_texts=embedding_service.embed_batch
+            )
             logger.debug(f"Stored {len(stored_ids)} embeddings")
             
         except Exception as e:
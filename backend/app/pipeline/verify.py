@@ -4,7 +4,10 @@ from typing import List, Dict, Any, Optional, Tuple
 import hashlib
 import json
 from app.core.config import settings
+from app.core.metrics import INFERENCE_BATCH_SIZE, INFERENCE_PADDING_RATIO, INFERENCE_SECONDS
+from app.core.tracing import start_span
 from app.services.cache import get_cache_service
+from app.services.inference_client import get_inference_client, inference_is_remote
 
 # Note: transformers and torch imports moved inside functions to prevent
 # 400MB+ memory consumption at startup. They will only load when NLI verification is actually used.
@@ -76,6 +79,7 @@ class NLIVerifier:
         self.device = None  # Will be set when model is loaded
         self._lock = asyncio.Lock()
         self.cache_service = None
+        self.remote = inference_is_remote()
 
         logger.info(f"NLI Verifier initialized with model: {self.model_name} (will load on first use)")
 
@@ -94,36 +98,37 @@ class NLIVerifier:
         """Deleter for nli_model alias"""
         self.model = None
     
+    def load_model(self):
+        """Load tokenizer, model and device (blocking). Also used by the inference server."""
+        # Import transformers only when actually needed
+        from transformers import AutoTokenizer, AutoModelForSequenceClassification
+        import torch
+
+        # Set device here when torch is available
+        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        # Load with FP16 on GPU for memory efficiency (Phase 1.1)
+        model = AutoModelForSequenceClassification.from_pretrained(
+            self.model_name,
+            dtype=torch.float16 if device.type == 'cuda' else torch.float32
+        )
+        model.to(device)
+        model.eval()
+        return tokenizer, model, device
+
     async def initialize(self):
         """Initialize the NLI model and tokenizer"""
         try:
-            if self.model is None:
+            # Remote mode: the shared inference server holds the model
+            if self.model is None and not self.remote:
                 async with self._lock:
                     if self.model is None:  # Double-check locking
                         logger.info(f"Loading NLI model: {self.model_name}")
                         
                         # Load in thread pool to avoid blocking
                         loop = asyncio.get_event_loop()
-                        
-                        def load_model():
-                            # Import transformers only when actually needed
-                            from transformers import AutoTokenizer, AutoModelForSequenceClassification
-                            import torch
-
-                            # Set device here when torch is available
-                            device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-
-                            tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-                            # Load with FP16 on GPU for memory efficiency (Phase 1.1)
-                            model = AutoModelForSequenceClassification.from_pretrained(
-                                self.model_name,
-                                dtype=torch.float16 if device.type == 'cuda' else torch.float32
-                            )
-                            model.to(device)
-                            model.eval()
-                            return tokenizer, model, device
-                        
-                        self.tokenizer, self.model, self.device = await loop.run_in_executor(None, load_model)
+                        self.tokenizer, self.model, self.device = await loop.run_in_executor(None, self.load_model)
                         logger.info(f"NLI model loaded successfully on device: {self.device}")
             
             # Initialize cache service
@@ -443,8 +448,7 @@ class NLIVerifier:
                     premises = [evidence_text for claim_text, evidence_text, _ in relevant_pairs]
                     hypotheses = [claim_text for claim_text, evidence_text, _ in relevant_pairs]
 
-                    loop = asyncio.get_event_loop()
-                    scores = await loop.run_in_executor(None, self._run_inference, premises, hypotheses)
+                    scores = await self._infer(premises, hypotheses)
 
                     # Convert NLI results
                     for i, (claim_text, evidence_text, evidence) in enumerate(relevant_pairs):
@@ -471,9 +475,8 @@ class NLIVerifier:
             premises = [evidence_text for claim_text, evidence_text, _ in batch]
             hypotheses = [claim_text for claim_text, evidence_text, _ in batch]
 
-            # Run inference in thread pool
-            loop = asyncio.get_event_loop()
-            scores = await loop.run_in_executor(None, self._run_inference, premises, hypotheses)
+            # Run inference in thread pool (or on the inference server)
+            scores = await self._infer(premises, hypotheses)
 
             # Convert to results
             results = []
@@ -504,6 +507,14 @@ class NLIVerifier:
                 for claim_text, evidence_text, _ in batch
             ]
     
+    async def _infer(self, premises: List[str], hypotheses: List[str]) -> List[Tuple[float, float, float]]:
+        """Score pairs locally in a worker thread, or on the shared inference server"""
+        with start_span("nli.batch", **{"nli.batch_size": len(premises), "nli.remote": self.remote}):
+            if self.remote:
+                return await get_inference_client().nli(premises, hypotheses)
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self._run_inference, premises, hypotheses)
+
     def _run_inference(self, premises: List[str], hypotheses: List[str]) -> List[Tuple[float, float, float]]:
         """Run NLI inference on CPU/GPU"""
         try:
@@ -520,11 +531,21 @@ class NLIVerifier:
                 return_tensors="pt"
             )
 
+            # Padding share shows how much compute is wasted on mixed-length batches
+            INFERENCE_BATCH_SIZE.labels(model="nli").observe(len(premises))
+            try:
+                attention_mask = inputs["attention_mask"]
+                INFERENCE_PADDING_RATIO.labels(model="nli").observe(
+                    1.0 - float(attention_mask.sum()) / max(attention_mask.numel(), 1)
+                )
+            except Exception as e:
+                logger.debug(f"Padding ratio metric skipped: {e}")
+
             # Move to device
             inputs = {k: v.to(self.device) for k, v in inputs.items()}
 
             # Run inference
-            with torch.no_grad():
+            with INFERENCE_SECONDS.labels(model="nli").time(), torch.no_grad():
                 outputs = self.model(**inputs)
                 probabilities = torch.softmax(outputs.logits, dim=-1)
 
@@ -0,0 +1,104 @@
+"""
+Latency history and request deadlines for government API adapters.
+
+Each adapter keeps a rolling window of recent request latencies in this
+process. GovernmentAPIClient derives from it:
+
+    timeout       p99 x ADAPTER_TIMEOUT_P99_MULTIPLIER, between
+                  ADAPTER_TIMEOUT_MIN_SECONDS and the adapter's configured timeout
+    hedge delay   p90: an idempotent GET still running after this gets a
+                  duplicate request, and the first response wins
+
+Until ADAPTER_LATENCY_MIN_SAMPLES requests have been seen the configured
+timeout is used and nothing is hedged. Timed-out requests are recorded at
+their timeout, so a slowing API pushes its own timeout back up.
+
+Claim retrieval also sets a deadline (adapter_deadline) that the request
+path reads from a context variable: per-attempt timeouts are capped to the
+remaining budget and no retry or backoff starts past it.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from app.core.config import settings
+
+_deadline: ContextVar[Optional[float]] = ContextVar("adapter_deadline", default=None)
+
+
+class LatencyTracker:
+    """Rolling window of one adapter's request latencies"""
+
+    def __init__(self, api_name: str, window: Optional[int] = None, min_samples: Optional[int] = None):
+        self.api_name = api_name
+        self.min_samples = min_samples if min_samples is not None else settings.ADAPTER_LATENCY_MIN_SAMPLES
+        self._samples = deque(maxlen=window or settings.ADAPTER_LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Latency at quantile q (0-1), or None while there is too little history"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def timeout_for(self, ceiling: float) -> float:
+        """Request timeout from observed p99, never above the adapter's configured timeout"""
+        p99 = self.quantile(0.99)
+        if p99 is None:
+            return ceiling
+        timeout = max(settings.ADAPTER_TIMEOUT_MIN_SECONDS, p99 * settings.ADAPTER_TIMEOUT_P99_MULTIPLIER)
+        return min(ceiling, timeout)
+
+    def hedge_delay(self) -> Optional[float]:
+        """How long to wait before sending a duplicate GET (observed p90)"""
+        return self.quantile(0.90)
+
+    def get_state(self) -> Dict[str, Any]:
+        with self._lock:
+            count = len(self._samples)
+        state = {"api_name": self.api_name, "samples": count}
+        for name, q in (("p50", 0.5), ("p90", 0.9), ("p95", 0.95), ("p99", 0.99)):
+            value = self.quantile(q)
+            state[f"{name}_seconds"] = round(value, 3) if value is not None else None
+        return state
+
+
+_trackers: Dict[str, LatencyTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_latency_tracker(api_name: str) -> LatencyTracker:
+    """Get the process-wide latency tracker for an adapter"""
+    with _trackers_lock:
+        if api_name not in _trackers:
+            _trackers[api_name] = LatencyTracker(api_name)
+        return _trackers[api_name]
+
+
+@contextmanager
+def adapter_deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound adapter requests started in this context (including via asyncio.to_thread)
+    to finish within `seconds`.
+    """
+    token = _deadline.set(time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def deadline_remaining() -> Optional[float]:
+    """Seconds left before the current adapter deadline, or None if there is none"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
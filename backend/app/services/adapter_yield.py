@@ -0,0 +1,246 @@
+"""
+Per-adapter, per-domain evidence yield and adapter selection.
+
+For every (domain, adapter) pair the pipeline records, in Redis:
+
+    calls       times the adapter was queried for a claim in that domain
+    returned    evidence items it returned
+    kept        items that survived ranking and credibility weighting
+    ms          total time spent waiting for it (cache hits included)
+
+select_adapters() ranks candidate adapters by expected value per millisecond,
+where value per call is a weighted mix of returned and kept items with an
+optimistic prior, and picks them highest first within
+ADAPTER_SELECTION_BUDGET_MS of expected call time. Adapters with fewer than
+ADAPTER_SELECTION_MIN_CALLS calls in a domain are always queried, and each
+skipped adapter is still queried with probability ADAPTER_SELECTION_EXPLORATION,
+so estimates keep updating. Counters are halved once an adapter reaches
+ADAPTER_YIELD_WINDOW calls in a domain, so old behaviour fades out.
+"""
+
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("calls", "returned", "kept", "ms")
+
+# Value of one evidence item at each stage it reaches
+RETURNED_WEIGHT = 0.1
+KEPT_WEIGHT = 1.0
+
+# Optimistic prior: a new adapter is assumed to keep one item every two calls
+PRIOR_CALLS = 2.0
+PRIOR_VALUE = 0.5
+
+# Floor on expected latency so cache-warm adapters do not get unbounded scores
+MIN_EXPECTED_MS = 50.0
+
+# Shared stats are re-read at most this often per domain and process
+STATS_CACHE_SECONDS = 30
+
+# After a Redis error, stop trying for this long (selection falls back to routing)
+REDIS_RETRY_SECONDS = 30
+
+
+@dataclass
+class AdapterYield:
+    """Yield counters for one adapter in one domain"""
+    calls: float = 0.0
+    returned: float = 0.0
+    kept: float = 0.0
+    ms: float = 0.0
+
+    @property
+    def value_per_call(self) -> float:
+        value = RETURNED_WEIGHT * self.returned + KEPT_WEIGHT * self.kept
+        return (value + PRIOR_VALUE * PRIOR_CALLS) / (self.calls + PRIOR_CALLS)
+
+    @property
+    def mean_ms(self) -> Optional[float]:
+        return self.ms / self.calls if self.calls else None
+
+    @property
+    def score(self) -> float:
+        """Expected value per millisecond"""
+        return self.value_per_call / max(self.mean_ms or MIN_EXPECTED_MS, MIN_EXPECTED_MS)
+
+
+class AdapterYieldStore:
+    """Redis hash per domain: field "<adapter>|<counter>" -> value"""
+
+    KEY_PREFIX = "tru8:adapter_yield:"
+
+    def __init__(self, redis_client=None):
+        self._redis = redis_client
+        self._local: Dict[str, Tuple[float, Dict[str, AdapterYield]]] = {}
+        self._down_until = 0.0
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(
+                settings.REDIS_URL, decode_responses=True, socket_connect_timeout=0.5, socket_timeout=0.5
+            )
+        return self._redis
+
+    def _available(self) -> bool:
+        return time.time() >= self._down_until
+
+    def _failed(self, action: str, domain: str, error: Exception) -> None:
+        self._down_until = time.time() + REDIS_RETRY_SECONDS
+        logger.warning(f"Adapter yield {action} failed for {domain}: {error}")
+
+    def _key(self, domain: str) -> str:
+        return f"{self.KEY_PREFIX}{(domain or 'General').lower()}"
+
+    def get_stats(self, domain: str) -> Dict[str, AdapterYield]:
+        """Yield per adapter for a domain (cached in-process for STATS_CACHE_SECONDS)"""
+        key = self._key(domain)
+        cached = self._local.get(key)
+        if cached and (time.time() - cached[0] < STATS_CACHE_SECONDS or not self._available()):
+            return cached[1]
+        if not self._available():
+            return {}
+
+        stats: Dict[str, AdapterYield] = {}
+        try:
+            for field, value in self.redis.hgetall(key).items():
+                adapter, _, counter = field.rpartition("|")
+                if counter in FIELDS:
+                    setattr(stats.setdefault(adapter, AdapterYield()), counter, float(value))
+        except Exception as e:
+            self._failed("lookup", domain, e)
+            return cached[1] if cached else {}
+
+        self._local[key] = (time.time(), stats)
+        return stats
+
+    def _increment(self, domain: str, counts: Dict[str, Dict[str, float]]) -> None:
+        """Add {adapter: {counter: amount}} and decay adapters past the window"""
+        if not counts or not self._available():
+            return
+        key = self._key(domain)
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for adapter, counters in counts.items():
+                for counter, amount in counters.items():
+                    pipe.hincrbyfloat(key, f"{adapter}|{counter}", amount)
+            pipe.expire(key, 30 * 86400)
+            pipe.execute()
+
+            for adapter, counters in counts.items():
+                if "calls" in counters:
+                    self._decay(key, adapter)
+        except Exception as e:
+            self._failed("update", domain, e)
+
+    def _decay(self, key: str, adapter: str) -> None:
+        fields = [f"{adapter}|{counter}" for counter in FIELDS]
+        values = self.redis.hmget(key, fields)
+        if float(values[0] or 0) < settings.ADAPTER_YIELD_WINDOW:
+            return
+        self.redis.hset(key, mapping={
+            field: float(value or 0) / 2 for field, value in zip(fields, values)
+        })
+
+    def record_calls(self, domain: str, calls: Sequence[Tuple[str, int, float]]) -> None:
+        """Record (adapter, items returned, elapsed ms) for each adapter queried for a claim"""
+        counts: Dict[str, Dict[str, float]] = {}
+        for adapter, returned, elapsed_ms in calls:
+            counters = counts.setdefault(adapter, {"calls": 0, "returned": 0, "ms": 0})
+            counters["calls"] += 1
+            counters["returned"] += returned
+            counters["ms"] += elapsed_ms
+        self._increment(domain, counts)
+
+    def record_kept(self, domain: str, providers: Sequence[str]) -> None:
+        """Record one kept evidence item per provider occurrence"""
+        self._increment(domain, _count(providers, "kept"))
+
+
+def _count(providers: Sequence[str], counter: str) -> Dict[str, Dict[str, float]]:
+    counts: Dict[str, Dict[str, float]] = {}
+    for provider in providers:
+        if provider:
+            counts.setdefault(provider, {counter: 0})[counter] += 1
+    return counts
+
+
+def evidence_providers(evidence: Sequence[Dict[str, Any]]) -> List[str]:
+    """API adapter names behind evidence items (web evidence is ignored)"""
+    providers = []
+    for item in evidence:
+        provider = item.get("external_source_provider") or (item.get("metadata") or {}).get("external_source_provider")
+        if provider:
+            providers.append(provider)
+    return providers
+
+
+def select_adapters(
+    adapters: Sequence[Any],
+    stats: Dict[str, AdapterYield],
+    deadline_seconds: float,
+    rng: Optional[random.Random] = None
+) -> Tuple[List[Any], List[Dict[str, str]]]:
+    """
+    Choose which adapters to query for a claim.
+
+    Args:
+        adapters: Candidate adapters (objects with api_name)
+        stats: Yield per adapter name for the claim's domain
+        deadline_seconds: The claim's API deadline; adapters slower on average are skipped
+
+    Returns:
+        (adapters to query, highest expected value first; [{"name", "reason"}] for skipped ones)
+    """
+    rng = rng or random
+    budget_ms = settings.ADAPTER_SELECTION_BUDGET_MS
+    cold, warm = [], []
+    for adapter in adapters:
+        adapter_yield = stats.get(adapter.api_name, AdapterYield())
+        (cold if adapter_yield.calls < settings.ADAPTER_SELECTION_MIN_CALLS else warm).append((adapter, adapter_yield))
+
+    warm.sort(key=lambda item: item[1].score, reverse=True)
+    selected, skipped = [], []
+    spent_ms = 0.0
+    for adapter, adapter_yield in warm:
+        mean_ms = adapter_yield.mean_ms or 0.0
+        if mean_ms > deadline_seconds * 1000:
+            reason = "too slow for deadline"
+        elif adapter_yield.value_per_call < settings.ADAPTER_SELECTION_MIN_VALUE:
+            reason = "low yield"
+        elif selected and spent_ms + mean_ms > budget_ms:
+            reason = "over budget"
+        else:
+            selected.append(adapter)
+            spent_ms += mean_ms
+            continue
+
+        if rng.random() < settings.ADAPTER_SELECTION_EXPLORATION:
+            selected.append(adapter)
+        else:
+            skipped.append({"name": adapter.api_name, "reason": reason})
+
+    # Cold adapters are always sampled so they can earn a score
+    selected.extend(adapter for adapter, _ in cold)
+    return selected, skipped
+
+
+# Singleton instance
+_yield_store: Optional[AdapterYieldStore] = None
+
+
+def get_adapter_yield_store() -> AdapterYieldStore:
+    """Get singleton adapter yield store"""
+    global _yield_store
+    if _yield_store is None:
+        _yield_store = AdapterYieldStore()
+    return _yield_store
@@ -28,7 +28,9 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 from app.services.government_api_client import GovernmentAPIClient
 from app.core.config import settings
+from app.core.http_transport import build_transport
 from app.services.legal_search import LegalSearchService
+from app.utils.api_cache_keys import query_keywords
 
 logger = logging.getLogger(__name__)
 
@@ -83,25 +85,41 @@ class ONSAdapter(GovernmentAPIClient):
 
         query = self._sanitize_query(query)
 
-        # ONS API endpoint for dataset search
-        params = {
-            "q": query,
-            "limit": self.max_results
-        }
-
         try:
-            response = self._make_request("datasets", params=params)
+            # Whole dataset catalogue (reference snapshot, refreshed daily), matched locally
+            response = self.get_reference("datasets", "datasets", params={"limit": 1000}, refresh_seconds=86400)
 
             if not response or "items" not in response:
                 logger.warning(f"ONS API returned empty response for: {query}")
                 return []
 
-            return self._transform_response(response)
+            return self._transform_response({"items": self._match_datasets(response["items"], query)})
 
         except Exception as e:
             logger.error(f"ONS search failed for '{query}': {e}")
             return []
 
+    def _match_datasets(self, items: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+        """
+        Rank catalogue datasets by query keywords in title (weighted) and description.
+
+        Matches whole lemmatised words, so "rate" matches "rates" but not "generate".
+        """
+        words = {word for word in query_keywords(query) if not word[0].isdigit()}
+        if not words:
+            return []
+
+        scored = []
+        for item in items:
+            title = set(query_keywords(item.get("title") or ""))
+            description = set(query_keywords(item.get("description") or ""))
+            score = sum(2 * (word in title) + (word in description) for word in words)
+            if score:
+                scored.append((score, item))
+
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+        return [item for _, item in scored[:self.max_results]]
+
     def _transform_response(self, raw_response: Any) -> List[Dict[str, Any]]:
         """
         Transform ONS API response to standardized evidence format.
@@ -697,8 +715,8 @@ class WHOAdapter(GovernmentAPIClient):
 
         # Search indicators
         try:
-            # First, search for relevant indicators
-            indicator_response = self._make_request("/Indicator")
+            # Filter the indicator catalogue (reference snapshot, refreshed weekly)
+            indicator_response = self.get_reference("indicators", "/Indicator", refresh_seconds=86400 * 7)
 
             if not indicator_response or "value" not in indicator_response:
                 logger.warning(f"WHO returned empty indicator response")
@@ -1095,8 +1113,11 @@ class AlphaVantageAdapter(GovernmentAPIClient):
             base_url="https://www.alphavantage.co/query",
             api_key=settings.ALPHA_VANTAGE_API_KEY,
             cache_ttl=300,  # 5 minutes (stock data changes frequently)
+            negative_cache_ttl=300,
+            stale_ttl=60,  # Quotes older than 6 minutes are not served
             timeout=15,
-            max_results=10
+            max_results=10,
+            hedge_requests=False  # Tight daily quota: never duplicate requests
         )
 
         # Alpha Vantage uses apikey as query parameter, not header
@@ -1135,27 +1156,20 @@ class AlphaVantageAdapter(GovernmentAPIClient):
             ticker = self._extract_ticker(query, entities)
 
             # Determine what type of financial data to fetch
-            # NOTE: Order matters! Check specific commodities/crypto BEFORE generic terms like "price"
-            # because "oil price" should match commodity, not stock
-            if any(term in query_lower for term in ["oil", "crude", "brent", "wti", "petroleum", "natural gas", "commodity", "barrel"]):
+            query_type = self._query_type(query_lower)
+            if query_type == "commodity":
                 evidence.extend(self._get_commodity_price(query))
-            elif any(term in query_lower for term in ["bitcoin", "crypto", "ethereum", "btc", "eth"]):
+            elif query_type == "crypto":
                 evidence.extend(self._get_crypto_rate(query))
-            elif any(term in query_lower for term in ["exchange rate", "forex", "currency", "usd", "eur", "gbp"]):
+            elif query_type == "forex":
                 evidence.extend(self._get_forex_rate(query))
-            elif any(term in query_lower for term in ["stock", "share", "price", "trading"]):
-                if ticker:
-                    evidence.extend(self._get_stock_quote(ticker))
-                else:
-                    evidence.extend(self._search_symbol(query))
-            elif any(term in query_lower for term in ["news", "sentiment", "market"]):
+            elif query_type == "news":
                 evidence.extend(self._get_news_sentiment(ticker or query))
+            elif ticker:
+                # Stock terms or no specific type: quote if ticker found, else search
+                evidence.extend(self._get_stock_quote(ticker))
             else:
-                # Default: try stock quote if ticker found, else search
-                if ticker:
-                    evidence.extend(self._get_stock_quote(ticker))
-                else:
-                    evidence.extend(self._search_symbol(query))
+                evidence.extend(self._search_symbol(query))
 
             return evidence
 
@@ -1163,6 +1177,32 @@ class AlphaVantageAdapter(GovernmentAPIClient):
             logger.error(f"Alpha Vantage search failed for '{query}': {e}")
             return []
 
+    def _query_type(self, query_lower: str) -> str:
+        """Classify the financial lookup: commodity, crypto, forex, stock, news or default."""
+        # NOTE: Order matters! Check specific commodities/crypto BEFORE generic terms like "price"
+        # because "oil price" should match commodity, not stock
+        if any(term in query_lower for term in ["oil", "crude", "brent", "wti", "petroleum", "natural gas", "commodity", "barrel"]):
+            return "commodity"
+        if any(term in query_lower for term in ["bitcoin", "crypto", "ethereum", "btc", "eth"]):
+            return "crypto"
+        if any(term in query_lower for term in ["exchange rate", "forex", "currency", "usd", "eur", "gbp"]):
+            return "forex"
+        if any(term in query_lower for term in ["stock", "share", "price", "trading"]):
+            return "stock"
+        if any(term in query_lower for term in ["news", "sentiment", "market"]):
+            return "news"
+        return "default"
+
+    def cache_key(self, query: str, domain: str, jurisdiction: str, entities: Optional[List[Dict[str, str]]] = None) -> str:
+        """Stock quotes and ticker news are cached per ticker, not per claim wording."""
+        query_type = self._query_type(query.lower())
+        ticker = self._extract_ticker(query, entities)
+        if ticker and query_type in ("stock", "default"):
+            return f"quote:{ticker}"
+        if ticker and query_type == "news":
+            return f"news:{ticker}"
+        return super().cache_key(query, domain, jurisdiction, entities)
+
     def _extract_ticker(self, query: str, entities: Optional[List[Dict[str, str]]] = None) -> Optional[str]:
         """Extract stock ticker from query or entities."""
         # Common company to ticker mapping
@@ -1641,8 +1681,11 @@ class MarketauxAdapter(GovernmentAPIClient):
             base_url="https://api.marketaux.com/v1",
             api_key=settings.MARKETAUX_API_KEY,
             cache_ttl=600,  # 10 minutes (news updates frequently)
+            negative_cache_ttl=300,
+            stale_ttl=300,
             timeout=15,
-            max_results=10
+            max_results=10,
+            hedge_requests=False  # Tight daily quota: never duplicate requests
         )
 
         # Marketaux uses api_token as query parameter
@@ -2975,6 +3018,8 @@ class FootballDataAdapter(GovernmentAPIClient):
             base_url="https://api.football-data.org/v4",
             api_key=api_key,
             cache_ttl=300,  # 5 minutes - sports data changes frequently
+            negative_cache_ttl=120,
+            stale_ttl=60,  # Live scores: only briefly stale
             timeout=10,
             max_results=10
         )
@@ -3005,6 +3050,16 @@ class FootballDataAdapter(GovernmentAPIClient):
         }
         # NO HARDCODED team_aliases - use NER entities passed from pipeline
 
+        # Tables and directories are served from reference snapshots, refreshed
+        # in the background at these intervals (seconds)
+        self.reference_refresh = {
+            "standings": 600,
+            "matches": 600,
+            "scorers": 1800,
+            "teams": 86400,
+            "team": 43200,
+        }
+
     def is_relevant_for_domain(self, domain: str, jurisdiction: str) -> bool:
         """Football-Data covers Sports domain globally."""
         return domain == "Sports"
@@ -3137,7 +3192,11 @@ class FootballDataAdapter(GovernmentAPIClient):
         org_names_lower = [name.lower() for name in org_names]
 
         try:
-            response = self._make_request(f"/competitions/{competition_code}/standings")
+            response = self.get_reference(
+                f"standings:{competition_code}",
+                f"/competitions/{competition_code}/standings",
+                refresh_seconds=self.reference_refresh["standings"]
+            )
 
             if not response or "standings" not in response:
                 return []
@@ -3254,7 +3313,9 @@ class FootballDataAdapter(GovernmentAPIClient):
 
         try:
             # Get all teams from API
-            teams_response = self._make_request("/teams", params={"limit": 500})
+            teams_response = self.get_reference(
+                "teams", "/teams", params={"limit": 500}, refresh_seconds=self.reference_refresh["teams"]
+            )
 
             if not teams_response or "teams" not in teams_response:
                 return []
@@ -3291,7 +3352,9 @@ class FootballDataAdapter(GovernmentAPIClient):
                     continue
 
                 # Get team details
-                team_response = self._make_request(f"/teams/{team_id}")
+                team_response = self.get_reference(
+                    f"team:{team_id}", f"/teams/{team_id}", refresh_seconds=self.reference_refresh["team"]
+                )
 
                 if not team_response:
                     continue
@@ -3346,10 +3409,12 @@ class FootballDataAdapter(GovernmentAPIClient):
                 break
 
         try:
-            response = self._make_request(f"/competitions/{competition_code}/matches", params={
-                "status": "FINISHED",
-                "limit": 10
-            })
+            response = self.get_reference(
+                f"matches:{competition_code}",
+                f"/competitions/{competition_code}/matches",
+                params={"status": "FINISHED", "limit": 10},
+                refresh_seconds=self.reference_refresh["matches"]
+            )
 
             if not response or "matches" not in response:
                 return []
@@ -3398,9 +3463,12 @@ class FootballDataAdapter(GovernmentAPIClient):
                 break
 
         try:
-            response = self._make_request(f"/competitions/{competition_code}/scorers", params={
-                "limit": 10
-            })
+            response = self.get_reference(
+                f"scorers:{competition_code}",
+                f"/competitions/{competition_code}/scorers",
+                params={"limit": 10},
+                refresh_seconds=self.reference_refresh["scorers"]
+            )
 
             if not response or "scorers" not in response:
                 logger.warning(f"Top scorers not available for {competition_code}")
@@ -3501,6 +3569,8 @@ class WeatherAPIAdapter(GovernmentAPIClient):
             base_url="https://api.weatherapi.com/v1",
             api_key=settings.WEATHER_API_KEY,
             cache_ttl=1800,  # 30 mins (weather updates frequently)
+            negative_cache_ttl=600,
+            stale_ttl=600,
             timeout=10,
             max_results=5
         )
@@ -3541,9 +3611,10 @@ class WeatherAPIAdapter(GovernmentAPIClient):
                 return []
 
             # Determine what type of weather data to fetch
-            if any(term in query_lower for term in ["forecast", "tomorrow", "next week", "will it"]):
+            query_type = self._query_type(query_lower)
+            if query_type == "forecast":
                 evidence.extend(self._get_forecast(location, query))
-            elif any(term in query_lower for term in ["yesterday", "last week", "was it", "historical"]):
+            elif query_type == "historical":
                 evidence.extend(self._get_historical(location, query))
             else:
                 # Default: get current conditions
@@ -3555,6 +3626,26 @@ class WeatherAPIAdapter(GovernmentAPIClient):
             logger.error(f"WeatherAPI search failed for '{query}': {e}")
             return []
 
+    def _query_type(self, query_lower: str) -> str:
+        """Classify the weather lookup: forecast, historical or current."""
+        if any(term in query_lower for term in ["forecast", "tomorrow", "next week", "will it"]):
+            return "forecast"
+        if any(term in query_lower for term in ["yesterday", "last week", "was it", "historical"]):
+            return "historical"
+        return "current"
+
+    def cache_key(self, query: str, domain: str, jurisdiction: str, entities: Optional[List[Dict[str, str]]] = None) -> str:
+        """Weather is cached per resolved location and lookup type (and day, for history)."""
+        location = self._extract_location(query, entities)
+        if not location:
+            return super().cache_key(query, domain, jurisdiction, entities)
+        location = " ".join(location.lower().split())
+        query_type = self._query_type(query.lower())
+        key = f"{query_type}:{location}"
+        if query_type == "historical":
+            key += f":{datetime.now().strftime('%Y-%m-%d')}"
+        return key
+
     def _extract_location(self, query: str, entities: Optional[List[Dict[str, str]]] = None) -> Optional[str]:
         """
         Extract location from query or entities.
@@ -3597,7 +3688,7 @@ class WeatherAPIAdapter(GovernmentAPIClient):
 
             url = f"{self.base_url}/forecast.json?key={self.api_key}&q={quote(location)}&days=3&aqi=no"
 
-            with httpx.Client(timeout=10) as client:
+            with httpx.Client(timeout=10, transport=build_transport()) as client:
                 response = client.get(url)
                 response.raise_for_status()
                 data = response.json()
@@ -3643,6 +3734,7 @@ class WeatherAPIAdapter(GovernmentAPIClient):
 
         except Exception as e:
             logger.error(f"WeatherAPI forecast fetch failed: {e}")
+            self._record_request_failure()
             return []
 
     def _get_current_weather(self, location: str, query: str) -> List[Dict[str, Any]]:
@@ -3655,7 +3747,7 @@ class WeatherAPIAdapter(GovernmentAPIClient):
 
             url = f"{self.base_url}/current.json?key={self.api_key}&q={quote(location)}&aqi=no"
 
-            with httpx.Client(timeout=10) as client:
+            with httpx.Client(timeout=10, transport=build_transport()) as client:
                 response = client.get(url)
                 response.raise_for_status()
                 data = response.json()
@@ -3701,6 +3793,7 @@ class WeatherAPIAdapter(GovernmentAPIClient):
 
         except Exception as e:
             logger.error(f"WeatherAPI current weather fetch failed: {e}")
+            self._record_request_failure()
             return []
 
     def _get_historical(self, location: str, query: str) -> List[Dict[str, Any]]:
@@ -3716,7 +3809,7 @@ class WeatherAPIAdapter(GovernmentAPIClient):
             yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
             url = f"{self.base_url}/history.json?key={self.api_key}&q={quote(location)}&dt={yesterday}"
 
-            with httpx.Client(timeout=10) as client:
+            with httpx.Client(timeout=10, transport=build_transport()) as client:
                 response = client.get(url)
                 response.raise_for_status()
                 data = response.json()
@@ -3765,6 +3858,7 @@ class WeatherAPIAdapter(GovernmentAPIClient):
 
         except Exception as e:
             logger.error(f"WeatherAPI historical fetch failed: {e}")
+            self._record_request_failure()
             return []
 
     def _transform_response(self, raw_response: Any) -> List[Dict[str, Any]]:
@@ -3824,15 +3918,22 @@ class GBIFAdapter(GovernmentAPIClient):
         evidence = []
 
         try:
-            # Search for species matching the query
-            species_evidence = self._search_species(query)
+            # Search for species matching the query (cached per keyword set)
+            species_evidence = self._cached_lookup(
+                f"species:{' '.join(query_keywords(query))}",
+                lambda: self._search_species(query)
+            )
             evidence.extend(species_evidence)
 
             # Search for occurrence data if we have a species name
             if species_evidence:
                 species_key = species_evidence[0].get("metadata", {}).get("species_key")
                 if species_key:
-                    occurrence_evidence = self._get_occurrence_data(species_key)
+                    # Occurrence counts depend only on the species key, whatever the claim wording
+                    occurrence_evidence = self._cached_lookup(
+                        f"occurrences:{species_key}",
+                        lambda: self._get_occurrence_data(species_key)
+                    )
                     evidence.extend(occurrence_evidence)
 
             return evidence[:self.max_results]
@@ -3852,7 +3953,7 @@ class GBIFAdapter(GovernmentAPIClient):
             # Search species endpoint
             url = f"{self.base_url}/species/search?q={quote(query)}&limit=5"
 
-            with httpx.Client(timeout=self.timeout) as client:
+            with httpx.Client(timeout=self.timeout, transport=build_transport()) as client:
                 response = client.get(url)
                 response.raise_for_status()
                 data = response.json()
@@ -3903,6 +4004,7 @@ class GBIFAdapter(GovernmentAPIClient):
 
         except Exception as e:
             logger.warning(f"GBIF species search failed: {e}")
+            self._record_request_failure()
             return []
 
     def _get_occurrence_data(self, species_key: int) -> List[Dict[str, Any]]:
@@ -3915,7 +4017,7 @@ class GBIFAdapter(GovernmentAPIClient):
             # Get occurrence count and country distribution
             url = f"{self.base_url}/occurrence/search?speciesKey={species_key}&limit=0&facet=country&facetLimit=10"
 
-            with httpx.Client(timeout=self.timeout) as client:
+            with httpx.Client(timeout=self.timeout, transport=build_transport()) as client:
                 response = client.get(url)
                 response.raise_for_status()
                 data = response.json()
@@ -3954,6 +4056,7 @@ class GBIFAdapter(GovernmentAPIClient):
 
         except Exception as e:
             logger.warning(f"GBIF occurrence search failed: {e}")
+            self._record_request_failure()
             return []
 
     def _transform_response(self, raw_response: Any) -> List[Dict[str, Any]]:
@@ -4028,7 +4131,7 @@ class WikipediaAdapter(GovernmentAPIClient):
 
             # Direct request to MediaWiki API (different from REST API base_url)
             import httpx
-            with httpx.Client(timeout=self.timeout) as client:
+            with httpx.Client(timeout=self.timeout, transport=build_transport()) as client:
                 response = client.get(self.search_base, headers=self.headers, params=search_params)
                 response.raise_for_status()
                 search_response = response.json()
@@ -4089,6 +4192,7 @@ class WikipediaAdapter(GovernmentAPIClient):
 
         except Exception as e:
             logger.error(f"Wikipedia search failed: {e}")
+            self._record_request_failure()
 
         return evidence
 
@@ -4580,7 +4684,7 @@ class InternetArchiveAdapter(GovernmentAPIClient):
                 "sort[]": "downloads desc"  # Prioritize popular items
             }
 
-            with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
+            with httpx.Client(timeout=self.timeout, follow_redirects=True, transport=build_transport()) as client:
                 response = client.get(
                     f"{self.base_url}/advancedsearch.php",
                     params=params,
@@ -4669,6 +4773,7 @@ class InternetArchiveAdapter(GovernmentAPIClient):
 
         except Exception as e:
             logger.error(f"Internet Archive search failed: {e}")
+            self._record_request_failure()
 
         return evidence
 
@@ -2,6 +2,7 @@ import logging
 import asyncio
 import json
 import hashlib
+import time
 from typing import Any, Optional, Dict, List, Union
 from datetime import datetime, timedelta
 import redis.asyncio as redis
@@ -385,6 +386,80 @@ class SyncCacheService:
             logger.error(f"Sync cache storage error: {e}")
             return False
 
+    def get_api_entry_sync(self, api_name: str, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached API response with its freshness metadata.
+
+        Returns:
+            {"results": [...], "soft_expires_at": epoch seconds} or None.
+            Entries written by cache_api_response_sync never go stale.
+        """
+        if not self.redis:
+            return None
+
+        try:
+            query_hash = self._hash_content(query)
+            cached = self.redis.get(f"tru8:api_response:{api_name}:{query_hash}")
+            self._increment_metric(api_name, "hits" if cached else "misses")
+            if not cached:
+                return None
+
+            entry = json.loads(cached)
+            if isinstance(entry, list):
+                return {"results": entry, "soft_expires_at": float("inf")}
+            return entry
+        except Exception as e:
+            logger.error(f"Sync cache retrieval error: {e}")
+            return None
+
+    def cache_api_entry_sync(
+        self,
+        api_name: str,
+        query: str,
+        results: List[Dict],
+        soft_ttl: int,
+        hard_ttl: int
+    ) -> bool:
+        """
+        Cache an API response that is fresh for soft_ttl and servable (stale) until hard_ttl.
+        """
+        if not self.redis:
+            return False
+
+        try:
+            query_hash = self._hash_content(query)
+            entry = {"results": results, "soft_expires_at": time.time() + soft_ttl}
+            self.redis.setex(
+                f"tru8:api_response:{api_name}:{query_hash}",
+                max(hard_ttl, soft_ttl),
+                json.dumps(entry, default=str)
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Sync cache storage error: {e}")
+            return False
+
+    def acquire_api_refresh_sync(self, api_name: str, query: str, ttl: int) -> bool:
+        """Claim the single background refresh of a stale entry (across all workers)"""
+        if not self.redis:
+            return False
+
+        try:
+            query_hash = self._hash_content(query)
+            return bool(self.redis.set(f"tru8:api_refresh:{api_name}:{query_hash}", "1", nx=True, ex=ttl))
+        except Exception as e:
+            logger.debug(f"Failed to acquire refresh lock for {api_name}: {e}")
+            return False
+
+    def release_api_refresh_sync(self, api_name: str, query: str) -> None:
+        if not self.redis:
+            return
+
+        try:
+            self.redis.delete(f"tru8:api_refresh:{api_name}:{self._hash_content(query)}")
+        except Exception as e:
+            logger.debug(f"Failed to release refresh lock for {api_name}: {e}")
+
     def _increment_metric(self, api_name: str, metric_type: str) -> None:
         """
         Increment cache metric counter.
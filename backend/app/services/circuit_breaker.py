@@ -6,18 +6,27 @@ Implements circuit breaker to prevent cascading failures when APIs are down.
 
 States:
 - CLOSED: Normal operation, requests flow through
-- OPEN: API is failing, requests rejected immediately
+- OPEN: API is failing (or too slow), requests rejected immediately
 - HALF_OPEN: Testing if API has recovered
 
+Besides consecutive failures, the circuit opens when most recent calls
+succeed but too slowly (slow-call rate): a call is slow when its successful
+attempt took longer than the API's usual p99, or than a fixed ceiling that
+no claim deadline can absorb.
+
 Reference: Michael Nygard's "Release It!" pattern
 """
 
 import logging
+import threading
 import time
+from collections import deque
 from typing import Dict, Any, Optional, Callable
 from enum import Enum
 from datetime import datetime, timedelta
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,9 +46,12 @@ class CircuitBreaker:
     """
     Circuit breaker for API calls.
 
-    Opens after failure_threshold consecutive failures.
+    Opens after failure_threshold consecutive failures, or when at least
+    slow_call_rate_threshold of the last slow_call_window calls were slow.
+    Callers that retry report each attempt through record_attempt(), so
+    backoff sleeps never count as latency; otherwise the whole call is timed.
     Stays open for recovery_timeout seconds.
-    Allows one request in HALF_OPEN state to test recovery.
+    Allows one request in HALF_OPEN state to test recovery; a slow test call fails it.
     """
 
     def __init__(
@@ -47,7 +59,11 @@ class CircuitBreaker:
         api_name: str,
         failure_threshold: int = 5,
         recovery_timeout: int = 60,
-        success_threshold: int = 2
+        success_threshold: int = 2,
+        slow_call_seconds: Optional[float] = None,
+        slow_call_rate_threshold: float = 0.6,
+        slow_call_min_calls: int = 10,
+        slow_call_window: int = 20
     ):
         """
         Initialize circuit breaker.
@@ -57,17 +73,26 @@ class CircuitBreaker:
             failure_threshold: Number of failures before opening circuit
             recovery_timeout: Seconds to wait before attempting recovery
             success_threshold: Successes needed in HALF_OPEN to close circuit
+            slow_call_seconds: Calls slower than this always count as slow (None disables)
+            slow_call_rate_threshold: Share of slow calls that opens the circuit
+            slow_call_min_calls: Calls needed in the window before the rate applies
+            slow_call_window: Number of recent calls the rate is computed over
         """
         self.api_name = api_name
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.success_threshold = success_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.slow_call_min_calls = slow_call_min_calls
 
         self.state = CircuitState.CLOSED
         self.failure_count = 0
         self.success_count = 0
         self.last_failure_time: Optional[float] = None
         self.opened_at: Optional[float] = None
+        self.recent_calls = deque(maxlen=slow_call_window)  # True = slow
+        self._attempt = threading.local()  # Latency of the current call's last attempt
 
         logger.info(
             f"Circuit breaker initialized for {api_name} "
@@ -88,6 +113,50 @@ class CircuitBreaker:
         Raises:
             CircuitBreakerError: If circuit is open
         """
+        self._before_call()
+
+        try:
+            # Execute the function
+            self._attempt.seconds = None
+            start = time.monotonic()
+            result = func(*args, **kwargs)
+
+            # Success - record it (a slow success may still count against the API)
+            if self._attempt.seconds is None:
+                self._on_success(time.monotonic() - start, self.slow_call_seconds)
+            else:
+                self._on_success(self._attempt.seconds, self._slow_threshold(self._attempt.baseline))
+            return result
+
+        except Exception as e:
+            # Failure - record it
+            self._on_failure()
+            raise
+
+    def record_attempt(self, seconds: float, baseline: Optional[float] = None) -> None:
+        """
+        Record the latency of one attempt made inside call().
+
+        The last attempt recorded (the one that succeeded) decides whether the
+        call was slow.
+
+        Args:
+            seconds: Duration of the attempt alone (no backoff)
+            baseline: The API's usual p99 latency, if there is enough history
+        """
+        self._attempt.seconds = seconds
+        self._attempt.baseline = baseline
+
+    def _slow_threshold(self, baseline: Optional[float]) -> Optional[float]:
+        """Latency above which a call is slow: the usual p99, capped at slow_call_seconds"""
+        if self.slow_call_seconds is None:
+            return None
+        if baseline is None:
+            return self.slow_call_seconds
+        return min(self.slow_call_seconds, baseline)
+
+    def _before_call(self):
+        """Admit or reject a call; moves OPEN -> HALF_OPEN once the recovery timeout has passed."""
         if self.state == CircuitState.OPEN:
             if self._should_attempt_reset():
                 logger.info(f"{self.api_name} circuit breaker: OPEN -> HALF_OPEN (testing recovery)")
@@ -100,23 +169,17 @@ class CircuitBreaker:
                     f"(opened {time_since_open:.0f}s ago, will retry in {self.recovery_timeout - time_since_open:.0f}s)"
                 )
 
-        try:
-            # Execute the function
-            result = func(*args, **kwargs)
-
-            # Success - record it
-            self._on_success()
-            return result
+    def _on_success(self, duration: float = 0.0, slow_call_seconds: Optional[float] = None):
+        """Handle successful call (slow if it took longer than slow_call_seconds)."""
+        slow = slow_call_seconds is not None and duration > slow_call_seconds
 
-        except Exception as e:
-            # Failure - record it
+        if slow and self.state == CircuitState.HALF_OPEN:
+            logger.warning(f"{self.api_name} circuit breaker: recovery test took {duration:.1f}s")
             self._on_failure()
-            raise
+            return
 
-    def _on_success(self):
-        """Handle successful call."""
         if self.state == CircuitState.HALF_OPEN:
-            self.success_count += 1
+            self.success_count = self._count_probe_success()
             logger.info(
                 f"{self.api_name} circuit breaker: "
                 f"success in HALF_OPEN ({self.success_count}/{self.success_threshold})"
@@ -126,13 +189,30 @@ class CircuitBreaker:
                 # Enough successes to close the circuit
                 logger.info(f"{self.api_name} circuit breaker: HALF_OPEN -> CLOSED (recovered)")
                 self._reset()
+            else:
+                self._release_probe()
         else:
-            # In CLOSED state, just reset failure count
-            self.failure_count = 0
+            # In CLOSED state, reset failure count and check the slow-call rate
+            if self.failure_count:
+                self._clear_failures()
+            self.recent_calls.append(slow)
+            if self._slow_call_rate() >= self.slow_call_rate_threshold:
+                logger.error(
+                    f"{self.api_name} circuit breaker: CLOSED -> OPEN "
+                    f"({sum(self.recent_calls)}/{len(self.recent_calls)} recent calls slower than "
+                    f"usual p99 or {self.slow_call_seconds:.0f}s)"
+                )
+                self._trip()
+
+    def _slow_call_rate(self) -> float:
+        """Share of recent calls that were slow (0 until slow_call_min_calls are recorded)"""
+        if len(self.recent_calls) < self.slow_call_min_calls:
+            return 0.0
+        return sum(self.recent_calls) / len(self.recent_calls)
 
     def _on_failure(self):
         """Handle failed call."""
-        self.failure_count += 1
+        self.failure_count = self._count_failure()
         self.last_failure_time = time.time()
 
         if self.state == CircuitState.HALF_OPEN:
@@ -140,9 +220,7 @@ class CircuitBreaker:
             logger.warning(
                 f"{self.api_name} circuit breaker: HALF_OPEN -> OPEN (recovery test failed)"
             )
-            self.state = CircuitState.OPEN
-            self.opened_at = time.time()
-            self.success_count = 0
+            self._trip(reopen=True)
 
         elif self.state == CircuitState.CLOSED:
             if self.failure_count >= self.failure_threshold:
@@ -151,8 +229,28 @@ class CircuitBreaker:
                     f"{self.api_name} circuit breaker: CLOSED -> OPEN "
                     f"({self.failure_count} consecutive failures)"
                 )
-                self.state = CircuitState.OPEN
-                self.opened_at = time.time()
+                self._trip()
+
+    # Transition hooks (SharedCircuitBreaker mirrors these in Redis)
+
+    def _count_failure(self) -> int:
+        return self.failure_count + 1
+
+    def _clear_failures(self):
+        self.failure_count = 0
+
+    def _count_probe_success(self) -> int:
+        return self.success_count + 1
+
+    def _release_probe(self):
+        pass
+
+    def _trip(self, reopen: bool = False):
+        """Open the circuit (reopen: a recovery test failed)."""
+        self.state = CircuitState.OPEN
+        self.opened_at = time.time()
+        self.success_count = 0
+        self.recent_calls.clear()
 
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt recovery."""
@@ -169,6 +267,7 @@ class CircuitBreaker:
         self.success_count = 0
         self.last_failure_time = None
         self.opened_at = None
+        self.recent_calls.clear()
 
     def get_state(self) -> Dict[str, Any]:
         """
@@ -183,7 +282,9 @@ class CircuitBreaker:
             "failure_count": self.failure_count,
             "success_count": self.success_count if self.state == CircuitState.HALF_OPEN else 0,
             "failure_threshold": self.failure_threshold,
-            "success_threshold": self.success_threshold
+            "success_threshold": self.success_threshold,
+            "slow_call_rate": round(self._slow_call_rate(), 2),
+            "recent_calls": len(self.recent_calls)
         }
 
         if self.state == CircuitState.OPEN and self.opened_at:
@@ -202,8 +303,7 @@ class CircuitBreaker:
     def force_open(self):
         """Manually open circuit (for testing or maintenance)."""
         logger.warning(f"{self.api_name} circuit breaker: manually opened")
-        self.state = CircuitState.OPEN
-        self.opened_at = time.time()
+        self._trip(reopen=True)
 
     def force_close(self):
         """Manually close circuit (for testing or recovery)."""
@@ -211,6 +311,158 @@ class CircuitBreaker:
         self._reset()
 
 
+class SharedCircuitBreaker(CircuitBreaker):
+    """
+    Circuit breaker whose state is shared by all processes through Redis.
+
+    Keys (prefix tru8:circuit:{api_name}:):
+        tripped     opened_at timestamp; present while OPEN or HALF_OPEN
+        failures    consecutive failures across the fleet (INCR)
+        successes   successful recovery tests (INCR)
+        probe       token held by the one process running a recovery test (SET NX EX)
+
+    Every transition is one atomic Redis command: the first process to reach
+    failure_threshold trips the circuit with SET NX, a recovery test needs the
+    probe token, and closing deletes the keys. State is re-read at most every
+    cache_seconds, so the closed-circuit path usually costs no Redis call. If
+    Redis is unreachable the breaker carries on with process-local state.
+    """
+
+    KEY_PREFIX = "tru8:circuit:"
+    INDEX_KEY = "tru8:circuit:index"
+    REDIS_RETRY_SECONDS = 30
+
+    def __init__(
+        self,
+        api_name: str,
+        redis_client,
+        cache_seconds: float = 1.0,
+        probe_timeout: int = 60,
+        **kwargs
+    ):
+        """
+        Args:
+            redis_client: redis.Redis with decode_responses=True
+            cache_seconds: How long shared state is cached in-process
+            probe_timeout: Seconds a probe token is held if its holder never reports back
+            **kwargs: CircuitBreaker thresholds
+        """
+        super().__init__(api_name, **kwargs)
+        self.redis = redis_client
+        self.cache_seconds = cache_seconds
+        self.probe_timeout = probe_timeout
+        self._synced_at = 0.0
+        self._redis_down_until = 0.0
+        self._holds_probe = False
+        self._shared(lambda r: r.sadd(self.INDEX_KEY, api_name))
+
+    def _key(self, name: str) -> str:
+        return f"{self.KEY_PREFIX}{self.api_name}:{name}"
+
+    def _shared(self, operation: Callable, default: Any = None) -> Any:
+        """Run a Redis operation; on failure fall back to local state for a while"""
+        if time.time() < self._redis_down_until:
+            return default
+        try:
+            return operation(self.redis)
+        except Exception as e:
+            logger.warning(f"{self.api_name} circuit breaker: shared state unavailable, using local state ({e})")
+            self._redis_down_until = time.time() + self.REDIS_RETRY_SECONDS
+            return default
+
+    def _sync(self, force: bool = False):
+        """Refresh local state from Redis (cached for cache_seconds)"""
+        now = time.time()
+        if not force and now - self._synced_at < self.cache_seconds:
+            return
+        values = self._shared(lambda r: r.mget(
+            self._key("tripped"), self._key("failures"), self._key("successes")
+        ))
+        if values is None:
+            return
+        self._synced_at = now
+
+        tripped, failures, successes = values
+        self.failure_count = int(failures or 0)
+        self.success_count = int(successes or 0)
+        if tripped is None:
+            if self.state != CircuitState.CLOSED:
+                logger.info(f"{self.api_name} circuit breaker: closed by another worker")
+            self.state = CircuitState.CLOSED
+            self.opened_at = None
+        else:
+            self.opened_at = float(tripped)
+            self.state = CircuitState.HALF_OPEN if self._should_attempt_reset() else CircuitState.OPEN
+
+    def _before_call(self):
+        self._sync()
+        if self.state == CircuitState.CLOSED:
+            return
+        if self.state == CircuitState.OPEN and not self._should_attempt_reset():
+            super()._before_call()  # Raises with timing details
+
+        # Recovery window: exactly one process in the fleet runs the test call
+        acquired = self._shared(
+            lambda r: r.set(self._key("probe"), str(time.time()), nx=True, ex=self.probe_timeout),
+            default=True
+        )
+        if not acquired:
+            raise CircuitBreakerError(
+                f"{self.api_name} circuit breaker is HALF_OPEN (recovery test running in another worker)"
+            )
+        if self.state == CircuitState.OPEN:
+            logger.info(f"{self.api_name} circuit breaker: OPEN -> HALF_OPEN (testing recovery)")
+        self.state = CircuitState.HALF_OPEN
+        self._holds_probe = True
+
+    def _count_failure(self) -> int:
+        def incr(r):
+            count = r.incr(self._key("failures"))
+            r.expire(self._key("failures"), max(self.recovery_timeout * 10, 600))
+            return count
+        return int(self._shared(incr, default=self.failure_count + 1))
+
+    def _clear_failures(self):
+        self.failure_count = 0
+        self._shared(lambda r: r.delete(self._key("failures")))
+
+    def _count_probe_success(self) -> int:
+        return int(self._shared(lambda r: r.incr(self._key("successes")), default=self.success_count + 1))
+
+    def _release_probe(self):
+        if self._holds_probe:
+            self._holds_probe = False
+            self._shared(lambda r: r.delete(self._key("probe")))
+
+    def _trip(self, reopen: bool = False):
+        super()._trip(reopen)
+        opened_at = self.opened_at
+        if reopen:
+            self._shared(lambda r: r.set(self._key("tripped"), opened_at))
+            self._shared(lambda r: r.delete(self._key("successes")))
+        elif not self._shared(lambda r: r.set(self._key("tripped"), opened_at, nx=True), default=True):
+            # Another worker tripped it first: adopt its opened_at
+            shared = self._shared(lambda r: r.get(self._key("tripped")))
+            if shared is not None:
+                self.opened_at = float(shared)
+        self._release_probe()
+        self._synced_at = time.time()
+
+    def _reset(self):
+        super()._reset()
+        self._holds_probe = False
+        self._shared(lambda r: r.delete(
+            self._key("tripped"), self._key("failures"), self._key("successes"), self._key("probe")
+        ))
+        self._synced_at = time.time()
+
+    def get_state(self) -> Dict[str, Any]:
+        self._sync(force=True)
+        state_info = super().get_state()
+        state_info["shared"] = time.time() >= self._redis_down_until
+        return state_info
+
+
 class CircuitBreakerRegistry:
     """
     Registry to manage circuit breakers for all API adapters.
@@ -219,13 +471,22 @@ class CircuitBreakerRegistry:
         registry = CircuitBreakerRegistry()
         breaker = registry.get_breaker("ONS")
         result = breaker.call(api_adapter.search, query)
+
+    With a redis_client, breakers are SharedCircuitBreakers and the registry
+    lists every breaker any process has created.
     """
 
     def __init__(
         self,
         default_failure_threshold: int = 5,
         default_recovery_timeout: int = 60,
-        default_success_threshold: int = 2
+        default_success_threshold: int = 2,
+        default_slow_call_seconds: Optional[float] = None,
+        default_slow_call_rate_threshold: float = 0.6,
+        default_slow_call_min_calls: int = 10,
+        redis_client=None,
+        cache_seconds: float = 1.0,
+        probe_timeout: int = 60
     ):
         """
         Initialize circuit breaker registry.
@@ -234,11 +495,23 @@ class CircuitBreakerRegistry:
             default_failure_threshold: Default failures before opening
             default_recovery_timeout: Default recovery wait time (seconds)
             default_success_threshold: Default successes to close circuit
+            default_slow_call_seconds: Default slow-call threshold (None disables)
+            default_slow_call_rate_threshold: Default share of slow calls that opens
+            default_slow_call_min_calls: Default calls needed before the rate applies
+            redis_client: Share breaker state through Redis (None = process-local)
+            cache_seconds: In-process cache of shared state
+            probe_timeout: Lifetime of an unreleased half-open probe token
         """
         self.breakers: Dict[str, CircuitBreaker] = {}
         self.default_failure_threshold = default_failure_threshold
         self.default_recovery_timeout = default_recovery_timeout
         self.default_success_threshold = default_success_threshold
+        self.default_slow_call_seconds = default_slow_call_seconds
+        self.default_slow_call_rate_threshold = default_slow_call_rate_threshold
+        self.default_slow_call_min_calls = default_slow_call_min_calls
+        self.redis_client = redis_client
+        self.cache_seconds = cache_seconds
+        self.probe_timeout = probe_timeout
 
     def get_breaker(self, api_name: str) -> CircuitBreaker:
         """
@@ -251,21 +524,42 @@ class CircuitBreakerRegistry:
             Circuit breaker instance
         """
         if api_name not in self.breakers:
-            self.breakers[api_name] = CircuitBreaker(
-                api_name=api_name,
+            thresholds = dict(
                 failure_threshold=self.default_failure_threshold,
                 recovery_timeout=self.default_recovery_timeout,
-                success_threshold=self.default_success_threshold
+                success_threshold=self.default_success_threshold,
+                slow_call_seconds=self.default_slow_call_seconds,
+                slow_call_rate_threshold=self.default_slow_call_rate_threshold,
+                slow_call_min_calls=self.default_slow_call_min_calls
             )
+            if self.redis_client is not None:
+                self.breakers[api_name] = SharedCircuitBreaker(
+                    api_name,
+                    self.redis_client,
+                    cache_seconds=self.cache_seconds,
+                    probe_timeout=self.probe_timeout,
+                    **thresholds
+                )
+            else:
+                self.breakers[api_name] = CircuitBreaker(api_name=api_name, **thresholds)
         return self.breakers[api_name]
 
     def get_all_states(self) -> Dict[str, Dict[str, Any]]:
         """
         Get state of all circuit breakers.
 
+        Shared registries include breakers created by other processes (workers).
+
         Returns:
             Dictionary mapping API names to their state info
         """
+        if self.redis_client is not None:
+            try:
+                for api_name in sorted(self.redis_client.smembers(SharedCircuitBreaker.INDEX_KEY)):
+                    self.get_breaker(api_name)
+            except Exception as e:
+                logger.warning(f"Failed to list shared circuit breakers: {e}")
+
         return {
             api_name: breaker.get_state()
             for api_name, breaker in self.breakers.items()
@@ -277,8 +571,28 @@ class CircuitBreakerRegistry:
             breaker.force_close()
 
 
+def _shared_state_client():
+    """Redis client for shared breaker state; short timeouts so an outage never stalls requests"""
+    if not settings.ENABLE_SHARED_CIRCUIT_BREAKERS:
+        return None
+    import redis
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        socket_connect_timeout=0.5,
+        socket_timeout=0.5
+    )
+
+
 # Global registry instance
-_registry = CircuitBreakerRegistry()
+_registry = CircuitBreakerRegistry(
+    default_slow_call_seconds=settings.CIRCUIT_BREAKER_SLOW_CALL_SECONDS,
+    default_slow_call_rate_threshold=settings.CIRCUIT_BREAKER_SLOW_CALL_RATE,
+    default_slow_call_min_calls=settings.CIRCUIT_BREAKER_SLOW_CALL_MIN_CALLS,
+    redis_client=_shared_state_client(),
+    cache_seconds=settings.CIRCUIT_BREAKER_CACHE_SECONDS,
+    probe_timeout=settings.CIRCUIT_BREAKER_PROBE_TIMEOUT_SECONDS
+)
 
 
 def get_circuit_breaker_registry() -> CircuitBreakerRegistry:
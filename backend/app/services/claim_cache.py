@@ -0,0 +1,261 @@
+"""
+Semantic Claim-Verdict Cache
+
+The same viral claim reaches us many times a day in slightly different wording.
+The judge cache (ClaimJudge._make_judgment_cache_key) only hits on an exact
+100-char prefix plus identical evidence URLs, so every rephrasing pays for a
+full retrieve/verify/judge round.
+
+This cache embeds each extracted claim, looks up near-duplicates in Qdrant
+(VectorStore claim collection) under a strict similarity threshold and a
+freshness window, and reuses the stored verdict and evidence.
+
+Guards against false reuse:
+- Numbers and years must match exactly ("unemployment was 4% in 2020" must not
+  reuse a verdict for "... 5% in 2021" even though embeddings are near-identical)
+- Negation must match ("X is not Y" vs "X is Y")
+- Temporal type must match, and time-sensitive claims (TemporalAnalyzer) use a
+  much shorter freshness window
+"""
+
+import logging
+import re
+import time
+import uuid
+import hashlib
+from typing import Dict, List, Any, Optional
+from datetime import datetime
+from app.core.config import settings
+from app.utils.temporal import TemporalAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Name used for hit/miss counters - shows up in /health/cache-metrics
+CACHE_METRICS_NAME = "semantic_claim_cache"
+
+# Verdicts that are safe to reuse; abstentions depend on evidence availability at the time
+REUSABLE_VERDICTS = {"supported", "contradicted", "uncertain"}
+
+# Temporal types that describe a moving target
+TIME_SENSITIVE_TYPES = {"current_state", "prediction"}
+
+NUMBER_PATTERN = re.compile(r"\d+(?:[.,]\d+)*")
+NEGATION_PATTERN = re.compile(r"\b(not|no|never|none|nobody|neither|nor|cannot|without)\b|n't\b")
+
+# Claim context fields copied from the new claim onto a cached result
+CLAIM_CONTEXT_FIELDS = ["subject_context", "key_entities", "source_title", "source_url", "source_date"]
+
+
+def normalize_claim_text(text: str) -> str:
+    """Lowercase and collapse whitespace/punctuation for stable point IDs"""
+    text = re.sub(r"[^\w\s%.]", " ", text.lower())
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def extract_numbers(text: str) -> List[str]:
+    """Extract numeric tokens (years, percentages, counts) normalised for comparison"""
+    return sorted({n.replace(",", "") for n in NUMBER_PATTERN.findall(text)})
+
+
+def has_negation(text: str) -> bool:
+    """Detect whether a claim is negated"""
+    return bool(NEGATION_PATTERN.search(text.lower()))
+
+
+class SemanticClaimCache:
+    """
+    Claim-level semantic cache backed by the vector store.
+
+    Usage:
+        cache = SemanticClaimCache()
+        hits = await cache.lookup_claims(claims)           # {position: cached_result}
+        await cache.store_results(claims, judged_results)  # after judge stage
+    """
+
+    def __init__(self):
+        self.similarity_threshold = settings.SEMANTIC_CACHE_SIMILARITY_THRESHOLD
+        self.max_age_seconds = settings.SEMANTIC_CACHE_MAX_AGE_HOURS * 3600
+        self.time_sensitive_max_age_seconds = settings.SEMANTIC_CACHE_TIME_SENSITIVE_MAX_AGE_HOURS * 3600
+        self.temporal_analyzer = TemporalAnalyzer()
+
+    def _point_id(self, claim_text: str) -> str:
+        """Deterministic point ID so re-judging the same claim overwrites the old entry"""
+        digest = hashlib.sha256(normalize_claim_text(claim_text).encode()).hexdigest()
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"tru8:claim:{digest}"))
+
+    def _claim_signature(self, claim_text: str) -> Dict[str, Any]:
+        """Features that must match exactly between a claim and its cached neighbour"""
+        temporal = self.temporal_analyzer.analyze_claim(claim_text)
+        return {
+            "numbers": extract_numbers(claim_text),
+            "negated": has_negation(claim_text),
+            "temporal_type": temporal["claim_type"],
+            "temporal_window": temporal["temporal_window"],
+        }
+
+    def _max_age_for(self, signature: Dict[str, Any]) -> int:
+        """Freshness window in seconds for a claim with this signature"""
+        if signature["temporal_type"] in TIME_SENSITIVE_TYPES or signature["temporal_window"] != "timeless":
+            return min(self.time_sensitive_max_age_seconds, self.max_age_seconds)
+        return self.max_age_seconds
+
+    def is_compatible(self, signature: Dict[str, Any], candidate: Dict[str, Any], now: Optional[float] = None) -> bool:
+        """
+        Check whether a cached candidate may be reused for a claim.
+
+        Args:
+            signature: Output of _claim_signature for the new claim
+            candidate: Payload of the cached point (must include cached_at_ts)
+            now: Current epoch seconds (injectable for tests)
+
+        Returns:
+            True if numbers, negation, temporal type and freshness all agree
+        """
+        now = now if now is not None else time.time()
+
+        if candidate.get("numbers", []) != signature["numbers"]:
+            return False
+        if bool(candidate.get("negated")) != signature["negated"]:
+            return False
+        if candidate.get("temporal_type") != signature["temporal_type"]:
+            return False
+        if candidate.get("temporal_window") != signature["temporal_window"]:
+            return False
+
+        age = now - float(candidate.get("cached_at_ts", 0))
+        return age <= self._max_age_for(signature)
+
+    async def lookup_claims(self, claims: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up cached verdicts for a batch of claims.
+
+        Args:
+            claims: Extracted claims (with text and position)
+
+        Returns:
+            Dict mapping claim position (str) to a ready-to-save judged result
+        """
+        if not claims:
+            return {}
+
+        from app.services.embeddings import get_embedding_service
+        from app.services.vector_store import get_vector_store
+
+        embedding_service = await get_embedding_service()
+        vector_store = await get_vector_store()
+
+        claim_texts = [claim.get("text", "") for claim in claims]
+        embeddings = await embedding_service.embed_batch(claim_texts)
+
+        now = time.time()
+        hits = {}
+        misses = 0
+
+        for claim, embedding in zip(claims, embeddings):
+            position = str(claim.get("position", 0))
+            claim_text = claim.get("text", "")
+            signature = self._claim_signature(claim_text)
+
+            candidates = await vector_store.search_claim_verdicts(
+                embedding,
+                score_threshold=self.similarity_threshold,
+                min_cached_at_ts=now - self._max_age_for(signature)
+            )
+            match = next((c for c in candidates if self.is_compatible(signature, c, now)), None)
+
+            if not match:
+                misses += 1
+                continue
+
+            hits[position] = self._build_cached_result(claim, match)
+            logger.info(
+                f"[SEMANTIC CACHE] Hit for claim {position} (similarity {match['score']:.3f}): "
+                f"'{claim_text[:60]}' ~ '{match.get('claim_text', '')[:60]}'"
+            )
+
+        self._record_metrics(len(hits), misses)
+        logger.info(f"[SEMANTIC CACHE] {len(hits)}/{len(claims)} claims served from cache")
+        return hits
+
+    def _build_cached_result(self, claim: Dict[str, Any], match: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn a cached payload into a judged result for the new claim"""
+        result = dict(match.get("result", {}))
+        result["text"] = claim.get("text", "")
+        result["position"] = claim.get("position", 0)
+        for field in CLAIM_CONTEXT_FIELDS:
+            if claim.get(field) is not None:
+                result[field] = claim[field]
+        result["semantic_cache"] = {
+            "hit": True,
+            "similarity": round(float(match.get("score", 0.0)), 4),
+            "source_claim": match.get("claim_text"),
+            "cached_at": datetime.utcfromtimestamp(float(match.get("cached_at_ts", 0))).isoformat(),
+        }
+        return result
+
+    async def store_results(self, claims: List[Dict[str, Any]], results: List[Dict[str, Any]]) -> int:
+        """
+        Store freshly judged results for future lookups.
+
+        Skips cached results, failed judgments and abstentions.
+
+        Returns:
+            Number of results stored
+        """
+        storable = [
+            r for r in results
+            if not r.get("semantic_cache")
+            and r.get("verdict") in REUSABLE_VERDICTS
+            and "error" not in (r.get("verification_signals") or {})
+        ]
+        if not storable:
+            return 0
+
+        from app.services.embeddings import get_embedding_service
+        from app.services.vector_store import get_vector_store
+
+        embedding_service = await get_embedding_service()
+        vector_store = await get_vector_store()
+
+        texts = [r.get("text", "") for r in storable]
+        embeddings = await embedding_service.embed_batch(texts)
+
+        stored = 0
+        now = time.time()
+        for result, embedding in zip(storable, embeddings):
+            claim_text = result.get("text", "")
+            payload = {
+                "claim_text": claim_text,
+                "cached_at_ts": now,
+                "result": {k: v for k, v in result.items() if k != "position"},
+                **self._claim_signature(claim_text),
+            }
+            if await vector_store.upsert_claim_verdict(self._point_id(claim_text), embedding, payload):
+                stored += 1
+
+        logger.info(f"[SEMANTIC CACHE] Stored {stored} claim verdicts")
+        return stored
+
+    def _record_metrics(self, hits: int, misses: int) -> None:
+        """Record hit/miss counters alongside the API cache metrics"""
+        try:
+            from app.services.cache import get_sync_cache_service
+            cache = get_sync_cache_service()
+            for _ in range(hits):
+                cache._increment_metric(CACHE_METRICS_NAME, "hits")
+            for _ in range(misses):
+                cache._increment_metric(CACHE_METRICS_NAME, "misses")
+        except Exception as e:
+            logger.debug(f"Failed to record semantic cache metrics: {e}")
+
+
+# Singleton instance
+_semantic_claim_cache = None
+
+
+def get_semantic_claim_cache() -> SemanticClaimCache:
+    """Get singleton semantic claim cache instance"""
+    global _semantic_claim_cache
+    if _semantic_claim_cache is None:
+        _semantic_claim_cache = SemanticClaimCache()
+    return _semantic_claim_cache
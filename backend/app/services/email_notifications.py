@@ -33,9 +33,15 @@ class EmailNotificationService:
         self,
         to_email: str,
         subject: str,
-        html_content: str
+        html_content: str,
+        raise_on_error: bool = False
     ) -> bool:
-        """Send an email via Resend API (synchronous)"""
+        """
+        Send an email via Resend API (synchronous).
+
+        With raise_on_error, provider errors propagate so the notification
+        outbox can retry; otherwise they are logged and False is returned.
+        """
         if not self.enabled or not self.api_key:
             logger.info(f"Email notifications disabled, skipping email to {to_email}")
             return False
@@ -58,6 +64,8 @@ class EmailNotificationService:
             return True
         except Exception as e:
             logger.error(f"Failed to send email to {to_email}: {e}")
+            if raise_on_error:
+                raise
             return False
 
     # ========== SYNC METHODS (for Celery workers) ==========
@@ -70,7 +78,8 @@ class EmailNotificationService:
         supported: int,
         contradicted: int,
         uncertain: int,
-        credibility_score: int
+        credibility_score: int,
+        raise_on_error: bool = False
     ) -> bool:
         """
         Send email when a fact-check is completed (SYNC version for Celery workers).
@@ -109,18 +118,22 @@ class EmailNotificationService:
                 return self._send_email(
                     to_email=user.email,
                     subject=subject,
-                    html_content=html_content
+                    html_content=html_content,
+                    raise_on_error=raise_on_error
                 )
 
         except Exception as e:
             logger.error(f"Failed to send check completion email to user {user_id}: {e}")
+            if raise_on_error:
+                raise
             return False
 
     def send_check_failed_email_sync(
         self,
         user_id: str,
         check_id: str,
-        error_message: str
+        error_message: str,
+        raise_on_error: bool = False
     ) -> bool:
         """
         Send email when a fact-check fails (SYNC version for Celery workers).
@@ -155,11 +168,14 @@ class EmailNotificationService:
                 return self._send_email(
                     to_email=user.email,
                     subject=subject,
-                    html_content=html_content
+                    html_content=html_content,
+                    raise_on_error=raise_on_error
                 )
 
         except Exception as e:
             logger.error(f"Failed to send check failed email to user {user_id}: {e}")
+            if raise_on_error:
+                raise
             return False
 
     # ========== ASYNC METHODS (for API endpoints) ==========
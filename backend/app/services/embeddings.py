@@ -6,6 +6,8 @@ import hashlib
 import json
 import redis.asyncio as redis
 from app.core.config import settings
+from app.core.metrics import INFERENCE_BATCH_SIZE, INFERENCE_SECONDS
+from app.services.inference_client import get_inference_client, inference_is_remote
 
 # Note: sentence_transformers import moved inside functions to prevent
 # heavy ML libraries from loading at startup. They will only load when embedding service is actually used.
@@ -23,23 +25,25 @@ class EmbeddingService:
         self.redis_client = None
         self.cache_ttl = 3600 * 24 * 7  # 1 week cache
         self._lock = asyncio.Lock()
-    
+        self.remote = inference_is_remote()
+
+    def load_model(self):
+        """Load the SentenceTransformer model (blocking). Also used by the inference server."""
+        # Import sentence_transformers only when actually needed
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(self.model_name)
+
     async def initialize(self):
         """Initialize the embedding model and Redis cache"""
         try:
-            if self.model is None:
+            # Remote mode: the shared inference server holds the model
+            if self.model is None and not self.remote:
                 async with self._lock:
                     if self.model is None:  # Double-check locking
                         logger.info(f"Loading embedding model: {self.model_name}")
                         # Load in thread pool to avoid blocking
                         loop = asyncio.get_event_loop()
-                        
-                        def load_model():
-                            # Import sentence_transformers only when actually needed
-                            from sentence_transformers import SentenceTransformer
-                            return SentenceTransformer(self.model_name)
-                        
-                        self.model = await loop.run_in_executor(None, load_model)
+                        self.model = await loop.run_in_executor(None, self.load_model)
                         logger.info("Embedding model loaded successfully")
             
             # Initialize Redis for caching
@@ -67,12 +71,8 @@ class EmbeddingService:
             return cached_embedding
         
         try:
-            # Generate embedding in thread pool
-            loop = asyncio.get_event_loop()
-            embedding = await loop.run_in_executor(
-                None,
-                lambda: self.model.encode(text, normalize_embeddings=True)
-            )
+            # Generate embedding in thread pool (or on the inference server)
+            embedding = (await self._encode([text]))[0]
             
             # Cache the result
             await self._cache_embedding(cache_key, embedding)
@@ -107,11 +107,7 @@ class EmbeddingService:
         # Generate embeddings for uncached texts
         if uncached_texts:
             try:
-                loop = asyncio.get_event_loop()
-                new_embeddings = await loop.run_in_executor(
-                    None,
-                    lambda: self.model.encode(uncached_texts, normalize_embeddings=True)
-                )
+                new_embeddings = await self._encode(uncached_texts)
                 
                 # Fill in the placeholders and cache results
                 for idx, embedding in zip(uncached_indices, new_embeddings):
@@ -127,6 +123,19 @@ class EmbeddingService:
         
         return embeddings
     
+    async def _encode(self, texts: List[str]) -> List[np.ndarray]:
+        """Encode normalised embeddings locally in a worker thread, or on the inference server"""
+        if self.remote:
+            vectors = await get_inference_client().embed(texts)
+            return [np.asarray(vector, dtype=np.float32) for vector in vectors]
+        INFERENCE_BATCH_SIZE.labels(model="embedding").observe(len(texts))
+        loop = asyncio.get_event_loop()
+        with INFERENCE_SECONDS.labels(model="embedding").time():
+            return list(await loop.run_in_executor(
+                None,
+                lambda: self.model.encode(texts, normalize_embeddings=True)
+            ))
+
     async def compute_similarity(self, embedding1: np.ndarray, embedding2: np.ndarray) -> float:
         """Compute cosine similarity between two embeddings"""
         try:
@@ -7,6 +7,7 @@ import httpx
 import trafilatura
 from readability import Document
 import bleach
+from app.core.http_transport import build_transport
 from app.services.search import SearchResult, SearchService
 from app.utils.url_utils import extract_domain
 from app.utils.domain_status_tracker import get_domain_tracker, DomainStatus
@@ -239,7 +240,8 @@ class EvidenceExtractor:
 
                 async with httpx.AsyncClient(
                     timeout=self.timeout,
-                    follow_redirects=True
+                    follow_redirects=True,
+                    transport=build_transport()
                 ) as client:
                     response = await client.get(search_result.url)
                     response.raise_for_status()
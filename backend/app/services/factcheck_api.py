@@ -1,11 +1,17 @@
+import asyncio
 import httpx
 import logging
+import weakref
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from app.core.config import settings
+from app.core.http_transport import build_transport
 
 logger = logging.getLogger(__name__)
 
+# Name used for Redis cache keys and hit/miss metrics (see /health/cache-metrics)
+FACTCHECK_CACHE_NAME = "factcheck_api"
+
 
 class FactCheckAPI:
     """Google Fact Check Explorer API integration"""
@@ -13,8 +19,106 @@ class FactCheckAPI:
     def __init__(self):
         self.api_key = settings.GOOGLE_FACTCHECK_API_KEY
         self.base_url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
-        self.cache = {}  # Simple in-memory cache
-        self.cache_ttl = timedelta(hours=24)
+        self.cache = {}  # Simple in-memory cache (L1, in front of Redis)
+        self.cache_ttl = timedelta(seconds=settings.FACTCHECK_CACHE_TTL_SECONDS)
+        self.negative_cache_ttl = timedelta(seconds=settings.FACTCHECK_NEGATIVE_CACHE_TTL_SECONDS)
+
+        # Pooled clients and in-flight lookups are bound to an event loop, so both are
+        # kept per loop (Celery stages use asyncio.run, possibly from several threads)
+        self._clients = weakref.WeakKeyDictionary()  # loop -> httpx.AsyncClient
+
+        # In-flight lookups keyed by cache key, so identical claims share one request
+        self._inflight = weakref.WeakKeyDictionary()  # loop -> {cache_key: Future}
+        self._closing: set = set()
+        self._shared_cache = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            self._close_stale_clients()
+            client = httpx.AsyncClient(
+                timeout=10.0,
+                transport=build_transport(),
+                limits=httpx.Limits(
+                    max_connections=settings.MAX_CONCURRENT_FACTCHECK_LOOKUPS,
+                    max_keepalive_connections=settings.MAX_CONCURRENT_FACTCHECK_LOOKUPS
+                )
+            )
+            self._clients[loop] = client
+        return client
+
+    def _close_stale_clients(self) -> None:
+        """Close clients left behind by event loops that have since been closed"""
+        for loop, client in list(self._clients.items()):
+            if loop.is_closed():
+                self._clients.pop(loop, None)
+                if not client.is_closed:
+                    task = asyncio.ensure_future(self._aclose_quietly(client))
+                    self._closing.add(task)
+                    task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+        try:
+            await client.aclose()
+        except Exception as e:
+            # Connections of a closed loop cannot always shut down cleanly
+            logger.debug(f"Closing stale fact-check client failed (non-critical): {e}")
+
+    def _get_inflight(self) -> Dict[str, asyncio.Future]:
+        return self._inflight.setdefault(asyncio.get_running_loop(), {})
+
+    async def close(self):
+        """Close the pooled HTTP client for the running event loop"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+        self._close_stale_clients()
+
+    def _get_shared_cache(self):
+        """Lazily create the Redis-backed cache shared across workers"""
+        if self._shared_cache is None:
+            from app.services.cache import get_sync_cache_service
+            self._shared_cache = get_sync_cache_service()
+        return self._shared_cache
+
+    def _make_cache_key(self, claim_text: str, language: str) -> str:
+        """Normalise claim text so trivially different phrasings share a cache entry"""
+        return f"{' '.join(claim_text.lower().split())}:{language}"
+
+    def _get_memory_cached(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
+        if cache_key in self.cache:
+            cached_result, cached_time = self.cache[cache_key]
+            ttl = self.cache_ttl if cached_result else self.negative_cache_ttl
+            if datetime.utcnow() - cached_time < ttl:
+                return cached_result
+        return None
+
+    async def _get_shared_cached(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
+        try:
+            cache = self._get_shared_cache()
+            return await asyncio.to_thread(cache.get_cached_api_response_sync, FACTCHECK_CACHE_NAME, cache_key)
+        except Exception as e:
+            logger.debug(f"Fact-check Redis cache lookup failed (non-critical): {e}")
+            return None
+
+    async def _store_cached(self, cache_key: str, results: List[Dict[str, Any]]) -> None:
+        """Store results in memory and Redis. Empty results use the shorter negative TTL."""
+        self.cache[cache_key] = (results, datetime.utcnow())
+        ttl = self.cache_ttl if results else self.negative_cache_ttl
+        try:
+            cache = self._get_shared_cache()
+            await asyncio.to_thread(
+                cache.cache_api_response_sync,
+                FACTCHECK_CACHE_NAME,
+                cache_key,
+                results,
+                int(ttl.total_seconds())
+            )
+        except Exception as e:
+            logger.debug(f"Fact-check Redis cache store failed (non-critical): {e}")
 
     async def search_fact_checks(self, claim_text: str, language: str = "en") -> List[Dict[str, Any]]:
         """
@@ -31,40 +135,67 @@ class FactCheckAPI:
             logger.warning("Google Fact Check API key not configured")
             return []
 
-        # Check cache
-        cache_key = f"{claim_text}:{language}"
-        if cache_key in self.cache:
-            cached_result, cached_time = self.cache[cache_key]
-            if datetime.utcnow() - cached_time < self.cache_ttl:
-                logger.debug(f"Fact-check cache hit for: {claim_text[:50]}")
-                return cached_result
+        cache_key = self._make_cache_key(claim_text, language)
+
+        cached_result = self._get_memory_cached(cache_key)
+        if cached_result is not None:
+            logger.debug(f"Fact-check cache hit for: {claim_text[:50]}")
+            return cached_result
+
+        # Coalesce identical in-flight lookups onto one request
+        inflight_lookups = self._get_inflight()
+        inflight = inflight_lookups.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        inflight_lookups[cache_key] = future
+        try:
+            results = await self._lookup(claim_text, language, cache_key)
+            future.set_result(results)
+            return results
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited future doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            inflight_lookups.pop(cache_key, None)
+
+    async def _lookup(self, claim_text: str, language: str, cache_key: str) -> List[Dict[str, Any]]:
+        """Redis cache, then the API. Errors are not cached."""
+        cached_result = await self._get_shared_cached(cache_key)
+        if cached_result is not None:
+            self.cache[cache_key] = (cached_result, datetime.utcnow())
+            logger.debug(f"Fact-check Redis cache hit for: {claim_text[:50]}")
+            return cached_result
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                params = {
-                    "key": self.api_key,
-                    "query": claim_text,
-                    "languageCode": language
-                }
+            client = self._get_client()
+            params = {
+                "key": self.api_key,
+                "query": claim_text,
+                "languageCode": language
+            }
 
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
+            response = await client.get(self.base_url, params=params)
+            response.raise_for_status()
 
-                data = response.json()
-                claims = data.get("claims", [])
+            data = response.json()
+            claims = data.get("claims", [])
 
-                results = []
-                for claim in claims:
-                    for review in claim.get("claimReview", []):
-                        result = self._parse_fact_check(claim, review)
-                        if result:
-                            results.append(result)
+            results = []
+            for claim in claims:
+                for review in claim.get("claimReview", []):
+                    result = self._parse_fact_check(claim, review)
+                    if result:
+                        results.append(result)
 
-                # Cache results
-                self.cache[cache_key] = (results, datetime.utcnow())
+            # Cache results (including "no fact-checks found")
+            await self._store_cached(cache_key, results)
 
-                logger.info(f"Found {len(results)} fact-checks for claim: {claim_text[:50]}")
-                return results
+            logger.info(f"Found {len(results)} fact-checks for claim: {claim_text[:50]}")
+            return results
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Fact Check API HTTP error: {e.response.status_code}")
@@ -176,10 +307,24 @@ class FactCheckAPI:
         """Get cache statistics for monitoring"""
         return {
             "cache_size": len(self.cache),
-            "cache_ttl_hours": self.cache_ttl.total_seconds() / 3600
+            "cache_ttl_hours": self.cache_ttl.total_seconds() / 3600,
+            "negative_cache_ttl_hours": self.negative_cache_ttl.total_seconds() / 3600,
+            "inflight_lookups": sum(len(lookups) for lookups in list(self._inflight.values()))
         }
 
     def clear_cache(self):
         """Clear the fact-check cache"""
         self.cache.clear()
         logger.info("Fact-check cache cleared")
+
+
+# Singleton instance (shares the L1 cache and connection pool across checks)
+_factcheck_api: Optional[FactCheckAPI] = None
+
+
+def get_factcheck_api() -> FactCheckAPI:
+    """Get singleton Fact Check API instance"""
+    global _factcheck_api
+    if _factcheck_api is None:
+        _factcheck_api = FactCheckAPI()
+    return _factcheck_api
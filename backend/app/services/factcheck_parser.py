@@ -8,17 +8,42 @@ Parses fact-check articles from sites like Snopes and PolitiFact to extract:
 
 This fixes issues where fact-check meta-claims confuse the judge
 (e.g., Snopes saying "fake rendering" being misinterpreted as "fake project")
+
+Fact-check URLs are collected across the whole check and deduplicated, then
+fetched concurrently (MAX_CONCURRENT_FACTCHECK_PARSES) over one pooled client.
+HTML is parsed with lxml in a worker thread, and parsed pages are cached by
+normalised URL in memory and Redis (FACTCHECK_PAGE_CACHE_TTL_SECONDS).
 """
 
+import asyncio
 import logging
 import re
+import time
+import weakref
 import httpx
-from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+from bs4 import BeautifulSoup, FeatureNotFound
 from app.core.config import settings
+from app.core.http_transport import build_transport
+from app.utils.url_utils import normalize_url
 
 logger = logging.getLogger(__name__)
 
+# Name used for Redis cache keys and hit/miss metrics (see /health/cache-metrics)
+FACTCHECK_PAGE_CACHE_NAME = "factcheck_page"
+
+# In-memory parsed pages kept per worker (L1, in front of Redis)
+PAGE_CACHE_MAX_ENTRIES = 512
+
+
+def _make_soup(html_content: str) -> BeautifulSoup:
+    """Parse HTML with lxml, falling back to the stdlib parser if lxml is missing"""
+    try:
+        return BeautifulSoup(html_content, 'lxml')
+    except FeatureNotFound:
+        return BeautifulSoup(html_content, 'html.parser')
+
 
 class FactCheckParser:
     """
@@ -32,6 +57,16 @@ class FactCheckParser:
         }
         self.embedding_service = None  # Lazy load
 
+        # Parsed pages keyed by normalised URL: (parsed_data, cached_at)
+        self.page_cache: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self.page_cache_ttl = settings.FACTCHECK_PAGE_CACHE_TTL_SECONDS
+
+        # Pooled clients are bound to an event loop, so one is kept per loop
+        # (Celery stages use asyncio.run, possibly from several threads)
+        self._clients = weakref.WeakKeyDictionary()  # loop -> httpx.AsyncClient
+        self._closing: set = set()
+        self._shared_cache = None
+
     async def parse_factcheck_evidence(
         self,
         claims: List[Dict[str, Any]],
@@ -40,6 +75,9 @@ class FactCheckParser:
         """
         Parse and filter fact-check evidence based on relevance.
 
+        All fact-check pages referenced by the check are fetched once, concurrently,
+        before any evidence is enriched.
+
         Args:
             claims: List of extracted claims
             evidence_by_claim: Dict mapping claim position to evidence list
@@ -51,27 +89,35 @@ class FactCheckParser:
             return evidence_by_claim
 
         updated_evidence = {}
+        factcheck_items = []
 
         for claim in claims:
             position = str(claim.get("position", 0))
             evidence_list = evidence_by_claim.get(position, [])
+            updated_evidence[position] = list(evidence_list)
 
-            if not evidence_list:
-                updated_evidence[position] = []
-                continue
-
-            updated_list = []
-            for evidence in evidence_list:
+            for index, evidence in enumerate(evidence_list):
                 # Check if this is fact-check evidence
                 if evidence.get('is_factcheck') or self._is_factcheck_domain(evidence.get('url', '')):
-                    # Attempt to parse
-                    parsed = await self._parse_and_enrich(claim, evidence)
-                    updated_list.append(parsed)
-                else:
-                    # Regular evidence, pass through
-                    updated_list.append(evidence)
+                    factcheck_items.append((position, index, claim, evidence))
+
+        if not factcheck_items:
+            return updated_evidence
+
+        # Fetch every distinct page once
+        urls = {
+            normalize_url(evidence.get('url', '')): evidence.get('url', '')
+            for _, _, _, evidence in factcheck_items
+            if self._get_site_parser(evidence.get('url', ''))
+        }
+        pages = await self._fetch_pages(list(urls.values()))
 
-            updated_evidence[position] = updated_list
+        enriched = await asyncio.gather(*[
+            self._parse_and_enrich(claim, evidence, pages)
+            for _, _, claim, evidence in factcheck_items
+        ])
+        for (position, index, _, _), parsed in zip(factcheck_items, enriched):
+            updated_evidence[position][index] = parsed
 
         return updated_evidence
 
@@ -80,14 +126,27 @@ class FactCheckParser:
         factcheck_domains = ['snopes.com', 'politifact.com', 'factcheck.org', 'fullfact.org']
         return any(domain in url.lower() for domain in factcheck_domains)
 
+    def _get_site_parser(self, url: str):
+        """Return the site-specific parser for a URL, or None"""
+        for domain, domain_parser in self.parsers.items():
+            if domain in url.lower():
+                return domain_parser
+        return None
+
     async def _parse_and_enrich(
         self,
         claim: Dict[str, Any],
-        evidence: Dict[str, Any]
+        evidence: Dict[str, Any],
+        pages: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
     ) -> Dict[str, Any]:
         """
         Parse fact-check article and enrich evidence with metadata.
 
+        Args:
+            claim: The claim the evidence was retrieved for
+            evidence: Fact-check evidence item
+            pages: Pre-fetched parsed pages by normalised URL; fetched on demand if absent
+
         Returns evidence dict with added fields:
         - factcheck_target_claim
         - factcheck_rating
@@ -98,11 +157,7 @@ class FactCheckParser:
         claim_text = claim.get('text', '')
 
         # Detect parser
-        parser = None
-        for domain, domain_parser in self.parsers.items():
-            if domain in url.lower():
-                parser = domain_parser
-                break
+        parser = self._get_site_parser(url)
 
         if not parser:
             logger.debug(f"No parser for fact-check URL: {url}")
@@ -112,7 +167,11 @@ class FactCheckParser:
 
         try:
             # Fetch and parse article
-            parsed_data = await self._fetch_and_parse(url, parser)
+            page_key = normalize_url(url)
+            if pages is not None and page_key in pages:
+                parsed_data = pages[page_key]
+            else:
+                parsed_data = await self._fetch_and_parse(url, parser)
 
             if not parsed_data or not parsed_data.get('target_claim'):
                 logger.warning(f"Failed to extract target claim from {url}")
@@ -158,6 +217,127 @@ class FactCheckParser:
             evidence['is_factcheck'] = True
             return evidence
 
+    async def _fetch_pages(self, urls: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch and parse distinct fact-check pages concurrently.
+
+        Returns dict mapping normalised URL to parsed data (None if fetch/parse failed).
+        """
+        semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_FACTCHECK_PARSES)
+
+        async def fetch_one(url: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self._fetch_and_parse(url, self._get_site_parser(url))
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*[fetch_one(url) for url in urls])
+        logger.info(
+            f"Fact-check pages: {sum(1 for r in results if r)}/{len(urls)} parsed "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+        return {normalize_url(url): result for url, result in zip(urls, results)}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            self._close_stale_clients()
+            client = httpx.AsyncClient(
+                timeout=10.0,
+                follow_redirects=True,
+                headers={'User-Agent': 'Tru8Bot/1.0 (Fact-checking service)'},
+                transport=build_transport(),
+                limits=httpx.Limits(
+                    max_connections=settings.MAX_CONCURRENT_FACTCHECK_PARSES,
+                    max_keepalive_connections=settings.MAX_CONCURRENT_FACTCHECK_PARSES
+                )
+            )
+            self._clients[loop] = client
+        return client
+
+    def _close_stale_clients(self) -> None:
+        """Close clients left behind by event loops that have since been closed"""
+        for loop, client in list(self._clients.items()):
+            if loop.is_closed():
+                self._clients.pop(loop, None)
+                if not client.is_closed:
+                    task = asyncio.ensure_future(self._aclose_quietly(client))
+                    self._closing.add(task)
+                    task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+        try:
+            await client.aclose()
+        except Exception as e:
+            # Connections of a closed loop cannot always shut down cleanly
+            logger.debug(f"Closing stale fact-check page client failed (non-critical): {e}")
+
+    async def close(self):
+        """Close the pooled HTTP client for the running event loop"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+        self._close_stale_clients()
+
+    def _get_shared_cache(self):
+        """Lazily create the Redis-backed cache shared across workers"""
+        if self._shared_cache is None:
+            from app.services.cache import get_sync_cache_service
+            self._shared_cache = get_sync_cache_service()
+        return self._shared_cache
+
+    def _get_memory_cached(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        entry = self.page_cache.get(cache_key)
+        if entry is None:
+            return None
+        parsed_data, cached_at = entry
+        if time.monotonic() - cached_at >= self.page_cache_ttl:
+            del self.page_cache[cache_key]
+            return None
+        self.page_cache.move_to_end(cache_key)
+        return parsed_data
+
+    def _store_memory_cached(self, cache_key: str, parsed_data: Dict[str, Any]) -> None:
+        self.page_cache[cache_key] = (parsed_data, time.monotonic())
+        self.page_cache.move_to_end(cache_key)
+        while len(self.page_cache) > PAGE_CACHE_MAX_ENTRIES:
+            self.page_cache.popitem(last=False)
+
+    async def _get_cached_page(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a parsed page in memory, then Redis"""
+        parsed_data = self._get_memory_cached(cache_key)
+        if parsed_data is not None:
+            return parsed_data
+
+        try:
+            cache = self._get_shared_cache()
+            cached = await asyncio.to_thread(cache.get_cached_api_response_sync, FACTCHECK_PAGE_CACHE_NAME, cache_key)
+        except Exception as e:
+            logger.debug(f"Fact-check page cache lookup failed (non-critical): {e}")
+            return None
+
+        if cached:
+            self._store_memory_cached(cache_key, cached[0])
+            return cached[0]
+        return None
+
+    async def _store_cached_page(self, cache_key: str, parsed_data: Dict[str, Any]) -> None:
+        """Store a parsed page in memory and Redis. Failed fetches are not cached."""
+        self._store_memory_cached(cache_key, parsed_data)
+        try:
+            cache = self._get_shared_cache()
+            await asyncio.to_thread(
+                cache.cache_api_response_sync,
+                FACTCHECK_PAGE_CACHE_NAME,
+                cache_key,
+                [parsed_data],
+                self.page_cache_ttl
+            )
+        except Exception as e:
+            logger.debug(f"Fact-check page cache store failed (non-critical): {e}")
+
     async def _fetch_and_parse(
         self,
         url: str,
@@ -171,19 +351,18 @@ class FactCheckParser:
         - rating: Their verdict
         - Additional site-specific data
         """
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                headers = {
-                    'User-Agent': 'Tru8Bot/1.0 (Fact-checking service)'
-                }
-                response = await client.get(url, headers=headers, follow_redirects=True)
-                response.raise_for_status()
+        cache_key = normalize_url(url)
+        cached = await self._get_cached_page(cache_key)
+        if cached is not None:
+            logger.debug(f"Fact-check page cache hit: {url}")
+            return cached
 
-                html_content = response.text
-                soup = BeautifulSoup(html_content, 'html.parser')
+        try:
+            response = await self._get_client().get(url)
+            response.raise_for_status()
 
-                # Delegate to site-specific parser
-                return parser.parse(soup, url)
+            # BeautifulSoup is CPU-bound; keep it off the event loop
+            parsed_data = await asyncio.to_thread(self._parse_html, response.text, url, parser)
 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching {url}: {e.response.status_code}")
@@ -192,6 +371,15 @@ class FactCheckParser:
             logger.error(f"Error fetching/parsing {url}: {e}")
             return None
 
+        if parsed_data:
+            await self._store_cached_page(cache_key, parsed_data)
+        return parsed_data
+
+    @staticmethod
+    def _parse_html(html_content: str, url: str, parser) -> Optional[Dict[str, Any]]:
+        """Build the soup and delegate to the site-specific parser (runs in a worker thread)"""
+        return parser.parse(_make_soup(html_content), url)
+
     async def _calculate_claim_similarity(
         self,
         our_claim: str,
@@ -8,15 +8,62 @@ Each API (ONS, PubMed, Companies House, etc.) extends this class.
 
 import logging
 import httpx
+import random
+import threading
 import time
-from typing import List, Dict, Optional, Any
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Dict, List, Optional
 from abc import ABC, abstractmethod
 from datetime import datetime
+from app.core.config import settings
+from app.core.metrics import ADAPTER_HEDGED_REQUESTS, GOV_ADAPTER_SECONDS, REFERENCE_DATA_LOOKUPS
+from app.core.tracing import start_span
+from app.core.http_transport import build_transport
+from app.services.adapter_latency import deadline_remaining, get_latency_tracker
 from app.services.cache import get_sync_cache_service, SyncCacheService
 from app.services.circuit_breaker import get_circuit_breaker_registry, CircuitBreakerError
+from app.services.reference_data import ReferenceResource, get_reference_store
+from app.utils.api_cache_keys import keyword_cache_key
 
 logger = logging.getLogger(__name__)
 
+# Background refreshes of stale cache entries (shared by all adapters in the process)
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+_refresh_executor_lock = threading.Lock()
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    global _refresh_executor
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(
+                max_workers=settings.API_CACHE_REFRESH_WORKERS,
+                thread_name_prefix="api-cache-refresh"
+            )
+        return _refresh_executor
+
+
+# Hedged GETs: primary and duplicate requests run here while the caller waits (the
+# primary falls back to the calling thread when no worker is free)
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+    with _refresh_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(
+                max_workers=settings.ADAPTER_HEDGE_WORKERS,
+                thread_name_prefix="api-hedge"
+            )
+        return _hedge_executor
+
+
+def _jittered_ttl(ttl: int) -> int:
+    """Shorten a TTL by up to API_CACHE_TTL_JITTER so popular keys do not expire together"""
+    return max(1, int(ttl * (1 - random.uniform(0, settings.API_CACHE_TTL_JITTER))))
+
 
 class GovernmentAPIClient(ABC):
     """
@@ -34,7 +81,10 @@ class GovernmentAPIClient(ABC):
         cache_ttl: int = 86400,  # 24 hours default
         timeout: int = 10,
         max_results: int = 10,
-        max_retries: int = 3
+        max_retries: int = 3,
+        negative_cache_ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+        hedge_requests: bool = True
     ):
         """
         Initialize API client.
@@ -44,9 +94,15 @@ class GovernmentAPIClient(ABC):
             base_url: Base URL for API requests
             api_key: Optional API key for authenticated requests
             cache_ttl: Cache time-to-live in seconds (default 24 hours)
-            timeout: Request timeout in seconds
+            timeout: Request timeout ceiling in seconds (lowered from observed latency)
             max_results: Maximum number of results to return
             max_retries: Maximum number of retry attempts (default 3)
+            negative_cache_ttl: How long an empty answer is cached
+                (default: cache_ttl capped at API_NEGATIVE_CACHE_TTL_SECONDS)
+            stale_ttl: How long past cache_ttl an entry is still served while it
+                is refreshed in the background (default: cache_ttl x API_CACHE_STALE_FACTOR)
+            hedge_requests: Send a duplicate GET when a request is slower than p90.
+                Disable for APIs with tight daily quotas.
         """
         self.api_name = api_name
         self.base_url = base_url.rstrip('/')
@@ -55,6 +111,18 @@ class GovernmentAPIClient(ABC):
         self.timeout = timeout
         self.max_results = max_results
         self.max_retries = max_retries
+        self.negative_cache_ttl = (
+            negative_cache_ttl if negative_cache_ttl is not None
+            else min(cache_ttl, settings.API_NEGATIVE_CACHE_TTL_SECONDS)
+        )
+        self.stale_ttl = stale_ttl if stale_ttl is not None else int(cache_ttl * settings.API_CACHE_STALE_FACTOR)
+        self.hedge_requests = hedge_requests
+
+        # Rolling latency history (adaptive timeouts, hedge delay)
+        self.latency = get_latency_tracker(api_name)
+
+        # Per-thread flag: did a request fail during the current search?
+        self._request_state = threading.local()
 
         # Initialize sync cache (for Celery workers)
         self.cache: SyncCacheService = get_sync_cache_service()
@@ -128,8 +196,9 @@ class GovernmentAPIClient(ABC):
         Make HTTP request to API with error handling, retries, and circuit breaker.
 
         Implements:
-        - Circuit breaker pattern (fails fast if API is down)
-        - Exponential backoff (1s, 2s, 4s delays)
+        - Circuit breaker pattern (fails fast if API is down or slow)
+        - Timeouts derived from latency history, hedged GETs
+        - Exponential backoff (1s, 2s, 4s delays) within the claim deadline
         - Comprehensive error handling
 
         Args:
@@ -142,18 +211,38 @@ class GovernmentAPIClient(ABC):
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
-        # Check circuit breaker before attempting request
-        try:
-            return self.circuit_breaker.call(
-                self._make_request_with_retries,
-                url,
-                params,
-                method
-            )
-        except CircuitBreakerError as e:
-            logger.warning(f"{self.api_name} circuit breaker rejected request: {e}")
+        remaining = deadline_remaining()
+        if remaining is not None and remaining <= 0:
+            logger.warning(f"{self.api_name} claim deadline exhausted, skipping request: {url}")
+            self._record_request_failure()
             return None
 
+        with start_span(f"adapter {self.api_name}", **{"adapter.name": self.api_name, "http.method": method, "http.url": url}) as span:
+            # Check circuit breaker before attempting request
+            try:
+                return self.circuit_breaker.call(
+                    self._make_request_with_retries,
+                    url,
+                    params,
+                    method
+                )
+            except CircuitBreakerError as e:
+                logger.warning(f"{self.api_name} circuit breaker rejected request: {e}")
+                span.set_attribute("adapter.circuit_open", True)
+                self._record_request_failure()
+                return None
+            except Exception:
+                self._record_request_failure()
+                raise
+
+    def _record_request_failure(self) -> None:
+        """
+        Mark the current search as failed upstream, so an empty result is not
+        negatively cached. Adapters making direct httpx calls call this from
+        their error handlers.
+        """
+        self._request_state.failed = True
+
     def _make_request_with_retries(
         self,
         url: str,
@@ -175,24 +264,33 @@ class GovernmentAPIClient(ABC):
             Exception: On all failures after retries exhausted
         """
         last_exception = None
+        attempts = 0
 
         for attempt in range(self.max_retries):
-            try:
-                with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
-                    if method == "GET":
-                        response = client.get(url, headers=self.headers, params=params)
-                    elif method == "POST":
-                        response = client.post(url, headers=self.headers, json=params)
-                    else:
-                        raise ValueError(f"Unsupported HTTP method: {method}")
+            timeout = self.latency.timeout_for(self.timeout)
+            remaining = deadline_remaining()
+            if remaining is not None:
+                if remaining <= 0:
+                    break
+                timeout = min(timeout, remaining)
+            attempts += 1
 
-                    response.raise_for_status()
-                    return response.json()
+            try:
+                # The breaker judges slowness per attempt against the usual p99
+                baseline = self.latency.quantile(0.99)
+                start = time.monotonic()
+                if method == "GET" and self.hedge_requests and settings.ENABLE_HEDGED_REQUESTS:
+                    result = self._hedged_get(url, params, timeout)
+                else:
+                    result = self._send(url, params, method, timeout)
+                self.circuit_breaker.record_attempt(time.monotonic() - start, baseline)
+                return result
 
             except httpx.TimeoutException as e:
                 last_exception = e
                 logger.warning(
-                    f"{self.api_name} request timeout (attempt {attempt + 1}/{self.max_retries}): {url}"
+                    f"{self.api_name} request timeout after {timeout:.1f}s "
+                    f"(attempt {attempt + 1}/{self.max_retries}): {url}"
                 )
 
             except httpx.HTTPStatusError as e:
@@ -222,17 +320,206 @@ class GovernmentAPIClient(ABC):
                 logger.error(f"{self.api_name} unexpected error: {e}")
                 raise
 
-            # Exponential backoff: 1s, 2s, 4s
+            # Exponential backoff: 1s, 2s, 4s (only if a retry still fits the deadline)
             if attempt < self.max_retries - 1:
                 delay = 2 ** attempt  # 1, 2, 4 seconds
+                remaining = deadline_remaining()
+                if remaining is not None and remaining <= delay:
+                    break
                 logger.debug(f"{self.api_name} retrying in {delay}s...")
                 time.sleep(delay)
 
-        # All retries exhausted
+        # All retries exhausted (or no time left for them)
         logger.error(
-            f"{self.api_name} all {self.max_retries} attempts failed for {url}"
+            f"{self.api_name} all {attempts} attempts failed for {url}"
+        )
+        raise last_exception or httpx.TimeoutException(f"{self.api_name} claim deadline exhausted: {url}")
+
+    def _send(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        method: str,
+        timeout: float
+    ) -> Any:
+        """Single HTTP request; records its latency (timeouts count at the timeout)"""
+        start = time.perf_counter()
+        try:
+            with httpx.Client(timeout=timeout, follow_redirects=True, transport=build_transport()) as client:
+                if method == "GET":
+                    response = client.get(url, headers=self.headers, params=params)
+                elif method == "POST":
+                    response = client.post(url, headers=self.headers, json=params)
+                else:
+                    raise ValueError(f"Unsupported HTTP method: {method}")
+
+                response.raise_for_status()
+                data = response.json()
+        except httpx.TimeoutException:
+            self.latency.record(timeout)
+            raise
+
+        self.latency.record(time.perf_counter() - start)
+        return data
+
+    def _hedged_get(self, url: str, params: Optional[Dict[str, Any]], timeout: float) -> Any:
+        """
+        GET that sends a duplicate if no response arrives within the adapter's p90.
+
+        The first successful response wins; the loser is left to finish on its own.
+        The primary runs on the hedge executor so the caller can take either
+        response, but the hedge delay counts from when it actually starts: if
+        the executor is too busy to start it within the delay, it is sent from
+        the calling thread instead, unhedged. Every wait is bounded by timeout
+        (already capped to the claim deadline).
+        Without enough latency history this is a plain GET.
+        """
+        delay = self.latency.hedge_delay()
+        if delay is None or delay >= timeout:
+            return self._send(url, params, "GET", timeout)
+
+        expires = time.monotonic() + timeout
+        started = threading.Event()
+
+        def send(mark_started: bool = False) -> Any:
+            if mark_started:
+                started.set()
+            remaining = expires - time.monotonic()
+            if remaining <= 0:
+                raise httpx.TimeoutException(f"{self.api_name} request timed out before it was sent: {url}")
+            return self._send(url, params, "GET", remaining)
+
+        executor = _get_hedge_executor()
+        primary = executor.submit(send, True)
+        if not started.wait(delay) and primary.cancel():
+            # Executor saturated: duplicating requests would only add load
+            return send()
+        started.wait()
+
+        try:
+            return primary.result(timeout=delay)
+        except FuturesTimeoutError:
+            pass
+
+        hedge = executor.submit(send)
+        pending = {primary: "primary", hedge: "hedge"}
+        first_error = None
+        while pending:
+            remaining = expires - time.monotonic()
+            if remaining <= 0:
+                break
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                winner = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    first_error = first_error or e
+                    continue
+                ADAPTER_HEDGED_REQUESTS.labels(adapter=self.api_name, winner=winner).inc()
+                return result
+
+        ADAPTER_HEDGED_REQUESTS.labels(adapter=self.api_name, winner="none").inc()
+        raise first_error or httpx.TimeoutException(f"{self.api_name} hedged request timed out after {timeout:.1f}s: {url}")
+
+    def get_reference(
+        self,
+        key: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        refresh_seconds: int = 3600
+    ) -> Optional[Any]:
+        """
+        Get a whole upstream resource (league table, catalogue, indicator list) from its snapshot.
+
+        Snapshots are keyed by adapter and resource, not by claim text, and are
+        refreshed in the background (see app.services.reference_data). Only a
+        missing or long-expired snapshot is fetched inline.
+
+        Args:
+            key: Canonical resource name, e.g. "standings:PL"
+            endpoint: API endpoint returning the resource
+            params: Query parameters for the endpoint
+            refresh_seconds: How often the snapshot is refetched
+
+        Returns:
+            Response JSON, or None if it is neither cached nor fetchable
+        """
+        resource = ReferenceResource(
+            adapter=self.api_name,
+            key=key,
+            endpoint=endpoint,
+            params=params or {},
+            refresh_seconds=refresh_seconds
         )
-        raise last_exception
+        if not settings.ENABLE_REFERENCE_DATA:
+            return self.fetch_reference(resource)
+
+        store = get_reference_store()
+        snapshot = store.get(resource)
+        if snapshot is not None:
+            age = snapshot.age()
+            if age < resource.max_stale_seconds:
+                outcome = "fresh" if age < resource.refresh_seconds else "stale"
+                REFERENCE_DATA_LOOKUPS.labels(adapter=self.api_name, outcome=outcome).inc()
+                return snapshot.data
+
+        data = self.fetch_reference(resource)
+        if data is not None:
+            store.put(resource, data)
+            REFERENCE_DATA_LOOKUPS.labels(adapter=self.api_name, outcome="fetched").inc()
+            return data
+
+        if snapshot is not None:
+            # Upstream is failing: an old table beats no evidence
+            logger.warning(f"{self.api_name} serving expired reference snapshot for {key}")
+            REFERENCE_DATA_LOOKUPS.labels(adapter=self.api_name, outcome="fallback").inc()
+            return snapshot.data
+
+        REFERENCE_DATA_LOOKUPS.labels(adapter=self.api_name, outcome="unavailable").inc()
+        return None
+
+    def fetch_reference(self, resource: ReferenceResource) -> Optional[Any]:
+        """Fetch a reference resource from the API. Override for multi-request resources."""
+        return self._make_request(resource.endpoint, params=resource.params or None)
+
+    def cache_key(
+        self,
+        query: str,
+        domain: str,
+        jurisdiction: str,
+        entities: Optional[List[Dict[str, str]]] = None
+    ) -> str:
+        """
+        Build the response cache key for a search.
+
+        Default: jurisdiction plus lemmatised keywords and entity IDs, so claims
+        differing only in casing, punctuation, stopwords or word order share an
+        entry. Override in adapters that resolve a claim to one identifier
+        (ticker, location, species) to cache at that level.
+        """
+        return keyword_cache_key(query, jurisdiction, entities)
+
+    def _cached_lookup(
+        self,
+        identifier: str,
+        fetch: Callable[[], List[Dict[str, Any]]],
+        ttl: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Cache one resolved-identifier lookup (e.g. occurrences for a species key).
+
+        Hit/miss metrics are reported as "<api_name>:id" on /health/cache-metrics.
+        """
+        cache_name = f"{self.api_name}:id"
+        cached = self.cache.get_cached_api_response_sync(cache_name, identifier)
+        if cached is not None:
+            return cached
+
+        results = fetch()
+        if results:
+            self.cache.cache_api_response_sync(cache_name, identifier, results, ttl or self.cache_ttl)
+        return results
 
     def search_with_cache(
         self,
@@ -244,6 +531,9 @@ class GovernmentAPIClient(ABC):
         """
         Search with caching. Checks cache first, then calls API.
 
+        Fresh entries are returned as-is. Entries past their soft TTL are still
+        returned, and one background refresh is started for them.
+
         Args:
             query: Search query
             domain: Claim domain
@@ -253,27 +543,94 @@ class GovernmentAPIClient(ABC):
         Returns:
             List of evidence dictionaries
         """
-        # Check cache first
-        cached = self.cache.get_cached_api_response_sync(self.api_name, query)
-        if cached is not None:
-            logger.info(f"{self.api_name} cache HIT for query: {query[:50]}")
-            return cached
+        start = time.perf_counter()
+        cache_key = self.cache_key(query, domain, jurisdiction, entities)
+        entry = self.cache.get_api_entry_sync(self.api_name, cache_key)
+        if entry is not None:
+            if time.time() < entry["soft_expires_at"]:
+                logger.info(f"{self.api_name} cache HIT for query: {query[:50]}")
+                outcome = "cache_hit"
+            else:
+                # Serve the stale answer now; one worker refreshes it in the background
+                logger.info(f"{self.api_name} cache STALE for query: {query[:50]}")
+                outcome = "cache_stale"
+                self._schedule_refresh(query, domain, jurisdiction, entities, cache_key)
+            GOV_ADAPTER_SECONDS.labels(adapter=self.api_name, outcome=outcome).observe(time.perf_counter() - start)
+            return entry["results"]
 
         # Cache miss - call API
         logger.info(f"{self.api_name} cache MISS - calling API for: {query[:50]}")
+        try:
+            results = self._search_and_store(query, domain, jurisdiction, entities, cache_key)
+        except Exception:
+            GOV_ADAPTER_SECONDS.labels(adapter=self.api_name, outcome="error").observe(time.perf_counter() - start)
+            raise
+        GOV_ADAPTER_SECONDS.labels(
+            adapter=self.api_name, outcome="results" if results else "empty"
+        ).observe(time.perf_counter() - start)
+
+        return results
+
+    def _search_and_store(
+        self,
+        query: str,
+        domain: str,
+        jurisdiction: str,
+        entities: Optional[List[Dict[str, str]]],
+        cache_key: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Call the API and cache the answer.
+
+        Results are cached for cache_ttl and empty answers for negative_cache_ttl,
+        both jittered and followed by a stale_ttl window. Empty answers caused by
+        a failed request are not cached.
+        """
+        self._request_state.failed = False
         results = self.search(query, domain, jurisdiction, entities)
 
-        # Cache results
         if results:
-            self.cache.cache_api_response_sync(
-                self.api_name,
-                query,
-                results,
-                self.cache_ttl
-            )
-
+            ttl, stale_ttl = self.cache_ttl, self.stale_ttl
+        elif getattr(self._request_state, "failed", False):
+            return results
+        else:
+            ttl = self.negative_cache_ttl
+            stale_ttl = min(self.stale_ttl, self.negative_cache_ttl)
+
+        if ttl > 0:
+            soft_ttl = _jittered_ttl(ttl)
+            self.cache.cache_api_entry_sync(self.api_name, cache_key, results, soft_ttl, soft_ttl + stale_ttl)
         return results
 
+    def _schedule_refresh(
+        self,
+        query: str,
+        domain: str,
+        jurisdiction: str,
+        entities: Optional[List[Dict[str, str]]],
+        cache_key: str
+    ) -> None:
+        """Refresh a stale entry in the background, once across all workers"""
+        # Lock outlives a full retry cycle, so a hung refresh cannot block others forever
+        lock_ttl = self.timeout * self.max_retries + 2 ** self.max_retries
+        if not self.cache.acquire_api_refresh_sync(self.api_name, cache_key, lock_ttl):
+            return
+
+        def refresh():
+            try:
+                self._search_and_store(query, domain, jurisdiction, entities, cache_key)
+            except Exception as e:
+                logger.warning(f"{self.api_name} background cache refresh failed: {e}")
+            finally:
+                self.cache.release_api_refresh_sync(self.api_name, cache_key)
+
+        try:
+            _get_refresh_executor().submit(refresh)
+        except RuntimeError as e:
+            # Executor shut down (process exiting): the stale entry stays until its hard TTL
+            logger.debug(f"{self.api_name} cache refresh not scheduled: {e}")
+            self.cache.release_api_refresh_sync(self.api_name, cache_key)
+
     def _create_evidence_dict(
         self,
         title: str,
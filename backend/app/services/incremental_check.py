@@ -0,0 +1,263 @@
+"""
+Incremental Re-checks
+
+Live stories are resubmitted as they evolve, and users re-run checks on text
+they already pasted. Rather than starting from scratch, a re-check loads the
+last completed check for the same input (Check.recheck_key: the normalised
+URL, or user + text hash for pasted text) and copies unchanged claims forward
+with their verdict, evidence and raw sources. Only new or changed claims, and
+stale time-sensitive ones, go through retrieval, NLI and judgment.
+
+A newly extracted claim is unchanged if a prior claim has near-identical text
+with the same numbers and negation (the guards used by the semantic claim
+cache). Claim extraction is an LLM call, so an unchanged article rarely yields
+word-for-word identical claims: when the stored article excerpt still matches,
+INCREMENTAL_CLAIM_SIMILARITY applies; once the article itself has changed,
+only near-verbatim claims (INCREMENTAL_CHANGED_ARTICLE_SIMILARITY) are reused.
+
+Reused claims must also be fresh: evidence for time-sensitive claims
+(TemporalAnalyzer) older than INCREMENTAL_TIME_SENSITIVE_MAX_AGE_HOURS, or any
+evidence older than INCREMENTAL_MAX_AGE_HOURS, is retrieved again.
+"""
+
+import hashlib
+import logging
+import time
+from datetime import datetime, timezone
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.claim_cache import (
+    CLAIM_CONTEXT_FIELDS,
+    TIME_SENSITIVE_TYPES,
+    extract_numbers,
+    has_negation,
+    normalize_claim_text,
+)
+from app.utils.temporal import TemporalAnalyzer
+from app.utils.url_utils import normalize_url
+
+logger = logging.getLogger(__name__)
+
+# Evidence columns copied forward (everything save_check_results_sync reads back)
+EVIDENCE_FIELDS = [
+    "source", "url", "title", "snippet", "relevance_score", "credibility_score",
+    "nli_stance", "nli_confidence", "nli_entailment", "nli_contradiction", "external_source_provider",
+]
+RAW_EVIDENCE_FIELDS = [
+    "source", "url", "title", "snippet", "relevance_score", "credibility_score",
+    "is_included", "filter_stage", "filter_reason", "tier", "is_factcheck", "external_source_provider",
+]
+
+
+def recheck_key(input_type: str, user_id: str, url: Optional[str], content: Optional[str]) -> Optional[str]:
+    """
+    Identity of a check's input for finding earlier checks of the same thing.
+
+    URLs are public, so any earlier check of the page qualifies; pasted text
+    only matches the same user's earlier checks.
+    """
+    if input_type == "url" and url:
+        return f"url:{normalize_url(url)}"
+    if input_type == "text" and content:
+        digest = hashlib.sha256(normalize_claim_text(content).encode()).hexdigest()[:32]
+        return f"text:{user_id}:{digest}"
+    return None
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def claim_snapshot(row: Any, evidence_rows: List[Any]) -> Dict[str, Any]:
+    """
+    A saved Claim and its Evidence rows as a prior claim for reuse().
+
+    Copied-forward claims are saved as new rows, so their retrieval time comes
+    from Claim.evidence_retrieved_at, not from the rows' created_at.
+    """
+    retrieved_at = row.evidence_retrieved_at or min([ev.created_at for ev in evidence_rows] or [row.created_at])
+    return {
+        "text": row.text,
+        "position": row.position,
+        "verdict": row.verdict,
+        "confidence": row.confidence,
+        "rationale": row.rationale,
+        "current_verified_data": row.current_verified_data,
+        "rhetorical_analysis": row.rhetorical_context,
+        "has_rhetorical_context": row.has_rhetorical_context,
+        "rhetorical_style": row.rhetorical_style,
+        "retrieved_at_ts": retrieved_at.replace(tzinfo=timezone.utc).timestamp(),
+        "evidence": [
+            {
+                **{field: getattr(ev, field) for field in EVIDENCE_FIELDS},
+                "published_date": _iso(ev.published_date),
+                "metadata": ev.api_metadata or {},
+            }
+            for ev in evidence_rows
+        ],
+    }
+
+
+def load_previous_check(check_id: str, key: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the most recent completed check with the same recheck key.
+
+    Returns:
+        JSON-serialisable snapshot (check_id, article_excerpt, claims with
+        evidence and retrieved_at_ts, raw_evidence by claim position), or None
+    """
+    from sqlalchemy import select
+    from app.core.database import sync_session
+    from app.models import Check, Claim, Evidence, RawEvidence
+
+    with sync_session() as session:
+        previous = session.execute(
+            select(Check)
+            .where(Check.recheck_key == key, Check.status == "completed", Check.id != check_id)
+            .order_by(Check.completed_at.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+        if not previous:
+            return None
+
+        claim_rows = session.execute(
+            select(Claim).where(Claim.check_id == previous.id).order_by(Claim.position)
+        ).scalars().all()
+        evidence_rows = session.execute(
+            select(Evidence).where(Evidence.claim_id.in_([c.id for c in claim_rows]))
+        ).scalars().all() if claim_rows else []
+        raw_rows = session.execute(
+            select(RawEvidence).where(RawEvidence.check_id == previous.id)
+        ).scalars().all()
+
+    evidence_by_claim: Dict[str, List[Any]] = {}
+    for row in evidence_rows:
+        evidence_by_claim.setdefault(row.claim_id, []).append(row)
+
+    claims = [claim_snapshot(row, evidence_by_claim.get(row.id, [])) for row in claim_rows]
+
+    raw_evidence: Dict[str, List[Dict[str, Any]]] = {}
+    for row in raw_rows:
+        raw_evidence.setdefault(str(row.claim_position), []).append({
+            **{field: getattr(row, field) for field in RAW_EVIDENCE_FIELDS},
+            "published_date": _iso(row.published_date),
+        })
+
+    return {
+        "check_id": previous.id,
+        "article_excerpt": previous.article_excerpt or "",
+        "claims": claims,
+        "raw_evidence": raw_evidence,
+    }
+
+
+class IncrementalRecheck:
+    """
+    Decides which claims of a re-check can be copied from the previous check.
+
+    Usage:
+        previous = load_previous_check(check_id, key)
+        hits, raw_evidence, stats = IncrementalRecheck().reuse(previous, claims, article_text)
+    """
+
+    def __init__(self):
+        self.similarity = settings.INCREMENTAL_CLAIM_SIMILARITY
+        self.changed_article_similarity = settings.INCREMENTAL_CHANGED_ARTICLE_SIMILARITY
+        self.max_age_seconds = settings.INCREMENTAL_MAX_AGE_HOURS * 3600
+        self.time_sensitive_max_age_seconds = settings.INCREMENTAL_TIME_SENSITIVE_MAX_AGE_HOURS * 3600
+        self.temporal_analyzer = TemporalAnalyzer()
+
+    def _max_age_for(self, claim_text: str) -> int:
+        temporal = self.temporal_analyzer.analyze_claim(claim_text)
+        if temporal["claim_type"] in TIME_SENSITIVE_TYPES or temporal["temporal_window"] != "timeless":
+            return min(self.time_sensitive_max_age_seconds, self.max_age_seconds)
+        return self.max_age_seconds
+
+    def _match(self, claim_text: str, candidates: List[Dict[str, Any]], threshold: float) -> Optional[Dict[str, Any]]:
+        """Most similar prior claim above threshold with identical numbers and negation"""
+        normalized = normalize_claim_text(claim_text)
+        best, best_ratio = None, threshold
+        for candidate in candidates:
+            if extract_numbers(candidate["text"]) != extract_numbers(claim_text):
+                continue
+            if has_negation(candidate["text"]) != has_negation(claim_text):
+                continue
+            ratio = SequenceMatcher(None, normalized, normalize_claim_text(candidate["text"])).ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = candidate, ratio
+        return best
+
+    def reuse(
+        self,
+        previous: Dict[str, Any],
+        claims: List[Dict[str, Any]],
+        article_text: str,
+        now: Optional[float] = None
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Match newly extracted claims against the previous check.
+
+        Args:
+            previous: Output of load_previous_check
+            claims: Newly extracted claims (with text and position)
+            article_text: Newly ingested article content
+            now: Current epoch seconds (injectable for tests)
+
+        Returns:
+            ({position: judged result copied forward}, raw evidence for those
+            claims, stats on what changed)
+        """
+        now = now if now is not None else time.time()
+        excerpt = article_text[:5000]
+        article_changed = excerpt != previous["article_excerpt"]
+        threshold = self.changed_article_similarity if article_changed else self.similarity
+
+        available = list(previous["claims"])
+        hits: Dict[str, Dict[str, Any]] = {}
+        raw_evidence: List[Dict[str, Any]] = []
+        stale = 0
+
+        for claim in claims:
+            claim_text = claim.get("text", "")
+            match = self._match(claim_text, available, threshold)
+            if not match:
+                continue
+            if now - match["retrieved_at_ts"] > self._max_age_for(claim_text):
+                stale += 1
+                continue
+
+            available.remove(match)
+            position = str(claim.get("position", 0))
+            hits[position] = self._build_result(claim, match, previous["check_id"])
+            for raw in previous["raw_evidence"].get(str(match["position"]), []):
+                raw_evidence.append({**raw, "claim_position": claim.get("position", 0), "claim_text": claim_text[:500]})
+
+        stats = {
+            "previous_check_id": previous["check_id"],
+            "article_changed": article_changed,
+            "article_similarity": round(SequenceMatcher(None, previous["article_excerpt"], excerpt).quick_ratio(), 3),
+            "claims_reused": len(hits),
+            "claims_stale": stale,
+            "claims_rechecked": len(claims) - len(hits),
+        }
+        return hits, raw_evidence, stats
+
+    def _build_result(self, claim: Dict[str, Any], match: Dict[str, Any], previous_check_id: str) -> Dict[str, Any]:
+        """Turn a prior claim into a judged result for the new claim"""
+        result = {k: v for k, v in match.items() if k not in ("retrieved_at_ts", "position")}
+        result["text"] = claim.get("text", "")
+        result["position"] = claim.get("position", 0)
+        for field in CLAIM_CONTEXT_FIELDS:
+            if claim.get(field) is not None:
+                result[field] = claim[field]
+        retrieved_at = datetime.utcfromtimestamp(match["retrieved_at_ts"]).isoformat()
+        # Persisted as Claim.evidence_retrieved_at, so later re-checks age from the original retrieval
+        result["evidence_retrieved_at"] = retrieved_at
+        result["incremental"] = {
+            "reused_from_check": previous_check_id,
+            "source_claim": match["text"],
+            "retrieved_at": retrieved_at,
+        }
+        return result
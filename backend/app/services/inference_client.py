@@ -0,0 +1,104 @@
+"""
+Inference Server Client
+
+Used by NLIVerifier, EmbeddingService and the cross-encoder reranker when
+INFERENCE_MODE="remote", so worker processes don't each load their own copy
+of the models. Requests go to app.services.inference_server over a Unix
+socket (INFERENCE_SERVER_UDS) or HTTP (INFERENCE_SERVER_URL); the server
+coalesces requests from all workers into larger batches.
+
+Usage:
+    client = get_inference_client()
+    scores = await client.nli(premises, hypotheses)   # [(entailment, contradiction, neutral), ...]
+    vectors = await client.embed(texts)              # [[float, ...], ...]
+    scores = await client.rerank(pairs)              # [float, ...]
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def inference_is_remote() -> bool:
+    """True when models are served by the shared inference server"""
+    return settings.INFERENCE_MODE == "remote"
+
+
+class InferenceClient:
+    """Async client for the batched inference endpoints"""
+
+    def __init__(self, base_url: Optional[str] = None, uds: Optional[str] = None,
+                 timeout: Optional[float] = None, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.uds = uds if uds is not None else settings.INFERENCE_SERVER_UDS
+        # Host is ignored on a Unix socket but httpx still needs a valid URL
+        self.base_url = "http://inference" if self.uds else (base_url or settings.INFERENCE_SERVER_URL)
+        self.timeout = timeout or settings.INFERENCE_TIMEOUT_SECONDS
+        self._transport = transport
+
+        # Pooled client, re-created when the event loop changes (Celery stages use asyncio.run)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            transport = self._transport
+            if transport is None and self.uds:
+                transport = httpx.AsyncHTTPTransport(uds=self.uds)
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                transport=transport
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def close(self):
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+    async def _post(self, path: str, payload: dict) -> dict:
+        response = await self._get_client().post(path, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    async def nli(self, premises: List[str], hypotheses: List[str]) -> List[Tuple[float, float, float]]:
+        """NLI scores as (entailment, contradiction, neutral) per premise/hypothesis pair"""
+        if not premises:
+            return []
+        data = await self._post("/nli", {"pairs": [[p, h] for p, h in zip(premises, hypotheses)]})
+        return [tuple(scores) for scores in data["scores"]]
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """Normalised bi-encoder embeddings"""
+        if not texts:
+            return []
+        data = await self._post("/embed", {"texts": texts})
+        return data["embeddings"]
+
+    async def rerank(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """Cross-encoder relevance scores per (query, passage) pair"""
+        if not pairs:
+            return []
+        data = await self._post("/rerank", {"pairs": [[q, p] for q, p in pairs]})
+        return data["scores"]
+
+
+# Singleton instance
+_inference_client: Optional[InferenceClient] = None
+
+
+def get_inference_client() -> InferenceClient:
+    """Get singleton InferenceClient instance"""
+    global _inference_client
+    if _inference_client is None:
+        _inference_client = InferenceClient()
+    return _inference_client
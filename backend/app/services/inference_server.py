@@ -0,0 +1,247 @@
+"""
+Shared Inference Server
+
+One process owns one copy of each model (NLI, bi-encoder embeddings,
+cross-encoder reranker) and serves every Celery worker started with
+INFERENCE_MODE="remote". Requests from all workers are queued per model and
+coalesced by DynamicBatcher into batches of up to INFERENCE_MAX_BATCH_SIZE,
+waiting at most INFERENCE_MAX_BATCH_WAIT_MS for a batch to fill.
+
+Run as a single process (more workers would mean more model copies):
+    uvicorn app.services.inference_server:app --uds /tmp/tru8-inference.sock
+    uvicorn app.services.inference_server:app --host 127.0.0.1 --port 8001
+
+Endpoints:
+    POST /nli     {"pairs": [[premise, hypothesis], ...]} -> {"scores": [[entailment, contradiction, neutral], ...]}
+    POST /embed   {"texts": [...]}                        -> {"embeddings": [[...], ...]}
+    POST /rerank  {"pairs": [[query, passage], ...]}      -> {"scores": [...]}
+    GET  /health
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import INFERENCE_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class DynamicBatcher:
+    """
+    Coalesces concurrent requests into model batches under a latency deadline.
+
+    Items from every submit() call go on one queue. A single consumer takes the
+    first waiting item, keeps collecting until the batch is full or max_wait_ms
+    has passed, runs process_batch in a worker thread and resolves each
+    caller's futures. Batches run one at a time against the single model copy.
+    """
+
+    def __init__(self, name: str, process_batch: Callable[[List[Any]], List[Any]],
+                 max_batch_size: Optional[int] = None, max_wait_ms: Optional[int] = None):
+        self.name = name
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size or settings.INFERENCE_MAX_BATCH_SIZE
+        self.max_wait = (max_wait_ms if max_wait_ms is not None else settings.INFERENCE_MAX_BATCH_WAIT_MS) / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+
+        # Exposed on /health
+        self.batches = 0
+        self.items = 0
+
+    def _ensure_consumer(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, items: List[Any]) -> List[Any]:
+        """Queue items and wait for their results (in input order)"""
+        if not items:
+            return []
+        self._ensure_consumer()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for item in items:
+            future = loop.create_future()
+            self._queue.put_nowait((item, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            # Callers that timed out or disconnected no longer need results
+            batch = [(item, future) for item, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            try:
+                results = await asyncio.to_thread(self.process_batch, [item for item, _ in batch])
+                if len(results) != len(batch):
+                    raise RuntimeError(f"{self.name}: batch returned {len(results)} results for {len(batch)} items")
+            except Exception as e:
+                logger.error(f"Inference batch failed ({self.name}, {len(batch)} items): {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.items += len(batch)
+            INFERENCE_BATCH_SIZE.labels(model=f"server_{self.name}").observe(len(batch))
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def close(self) -> None:
+        if self._consumer is not None:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+        }
+
+
+class ModelHost:
+    """Loads each model once and wraps it in a DynamicBatcher"""
+
+    def __init__(self):
+        self.batchers: Dict[str, DynamicBatcher] = {}
+        self.errors: Dict[str, str] = {}
+
+    def load(self) -> None:
+        """Load all models (blocking). Models that fail to load are reported on /health."""
+        loaders = {
+            "nli": self._load_nli,
+            "embed": self._load_embeddings,
+            "rerank": self._load_cross_encoder,
+        }
+        for name, loader in loaders.items():
+            try:
+                self.batchers[name] = DynamicBatcher(name, loader())
+                logger.info(f"Inference server loaded model: {name}")
+            except Exception as e:
+                logger.error(f"Inference server failed to load {name} model: {e}")
+                self.errors[name] = str(e)
+
+    def _load_nli(self) -> Callable[[List[Tuple[str, str]]], List[Tuple[float, float, float]]]:
+        from app.pipeline.verify import NLIVerifier
+
+        verifier = NLIVerifier()
+        verifier.remote = False  # Never forward to ourselves
+        verifier.tokenizer, verifier.model, verifier.device = verifier.load_model()
+
+        def run(pairs):
+            return verifier._run_inference([p for p, _ in pairs], [h for _, h in pairs])
+        return run
+
+    def _load_embeddings(self) -> Callable[[List[str]], List[List[float]]]:
+        from app.services.embeddings import EmbeddingService
+
+        model = EmbeddingService().load_model()
+
+        def run(texts):
+            return model.encode(texts, normalize_embeddings=True).tolist()
+        return run
+
+    def _load_cross_encoder(self) -> Callable[[List[Tuple[str, str]]], List[float]]:
+        from sentence_transformers import CrossEncoder
+        from app.pipeline.retrieve import CROSS_ENCODER_MODEL
+
+        model = CrossEncoder(CROSS_ENCODER_MODEL)
+
+        def run(pairs):
+            return [float(score) for score in model.predict(pairs)]
+        return run
+
+    async def submit(self, name: str, items: List[Any]) -> List[Any]:
+        from fastapi import HTTPException
+
+        batcher = self.batchers.get(name)
+        if batcher is None:
+            raise HTTPException(status_code=503, detail=f"{name} model not loaded: {self.errors.get(name, 'unknown')}")
+        return await batcher.submit(items)
+
+    async def close(self) -> None:
+        for batcher in self.batchers.values():
+            await batcher.close()
+
+
+def create_app(host: Optional[ModelHost] = None):
+    """Build the FastAPI app. Pass a pre-built host to skip model loading (tests)."""
+    from fastapi import FastAPI
+    from prometheus_client import make_asgi_app
+    from pydantic import BaseModel
+
+    class PairsRequest(BaseModel):
+        pairs: List[Tuple[str, str]]
+
+    class TextsRequest(BaseModel):
+        texts: List[str]
+
+    model_host = host or ModelHost()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        if host is None:
+            await asyncio.to_thread(model_host.load)
+        yield
+        await model_host.close()
+
+    app = FastAPI(title="Tru8 Inference Server", lifespan=lifespan, docs_url=None)
+    app.mount("/metrics", make_asgi_app())
+
+    @app.post("/nli")
+    async def nli(request: PairsRequest):
+        return {"scores": await model_host.submit("nli", request.pairs)}
+
+    @app.post("/embed")
+    async def embed(request: TextsRequest):
+        return {"embeddings": await model_host.submit("embed", request.texts)}
+
+    @app.post("/rerank")
+    async def rerank(request: PairsRequest):
+        return {"scores": await model_host.submit("rerank", request.pairs)}
+
+    @app.get("/health")
+    async def health():
+        return {
+            "status": "ok" if model_host.batchers else "unavailable",
+            "models": {name: batcher.stats() for name, batcher in model_host.batchers.items()},
+            "errors": model_host.errors,
+        }
+
+    return app
+
+
+app = create_app()
@@ -19,6 +19,7 @@ from datetime import datetime, timedelta
 from xml.etree import ElementTree as ET
 
 from app.core.config import settings
+from app.core.http_transport import build_transport
 
 logger = logging.getLogger(__name__)
 
@@ -153,7 +154,7 @@ class LegalSearchService:
             # GovInfo API endpoint for US Code
             base_url = "https://api.govinfo.gov/collections/USCODE"
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(timeout=self.timeout, transport=build_transport()) as client:
                 # Search for specific section
                 response = await client.get(
                     f"{base_url}/2021/title-{title}/section-{section}",
@@ -189,7 +190,7 @@ class LegalSearchService:
             # Extract keywords from claim
             keywords = self._extract_search_keywords(claim_text)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(timeout=self.timeout, transport=build_transport()) as client:
                 # Search public laws from that year
                 response = await client.get(
                     "https://api.govinfo.gov/search",
@@ -232,7 +233,7 @@ class LegalSearchService:
         try:
             keywords = self._extract_search_keywords(claim_text)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(timeout=self.timeout, transport=build_transport()) as client:
                 response = await client.get(
                     "https://api.govinfo.gov/search",
                     params={
@@ -292,7 +293,7 @@ class LegalSearchService:
             if year:
                 params["year"] = year
 
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
+            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True, transport=build_transport()) as client:
                 response = await client.get(
                     "https://www.legislation.gov.uk/search",
                     params=params
@@ -328,7 +329,7 @@ class LegalSearchService:
 
             url = f"https://www.legislation.gov.uk/{leg_type}/{year}/{number}"
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with httpx.AsyncClient(timeout=self.timeout, transport=build_transport()) as client:
                 response = await client.get(url + "/data.xml")
 
                 if response.status_code == 200:
@@ -0,0 +1,150 @@
+"""
+Shared spaCy NLP Service
+
+Loads en_core_web_sm once per process with only the pipes the pipeline uses
+(tagger/attribute_ruler for POS, lemmatizer, NER) and parses text through
+nlp.pipe in a worker thread so the event loop is never blocked.
+
+Parsed docs are cached per text hash so downstream consumers (query
+formulation, article-title grounding) reuse the same parse instead of
+re-running spaCy per claim.
+
+Usage:
+    nlp_service = get_nlp_service()
+    await nlp_service.parse_batch([claim["text"] for claim in claims])  # once per check
+    doc = nlp_service.get_doc(claim_text)                              # cache hit
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Any
+
+logger = logging.getLogger(__name__)
+
+SPACY_MODEL = "en_core_web_sm"
+
+# Dependency parse and sentence segmentation are not used anywhere in the pipeline
+DISABLED_PIPES = ["parser", "senter"]
+
+
+class NLPService:
+    """Process-wide spaCy wrapper with batched, cached, off-loop parsing"""
+
+    def __init__(self, max_cached_docs: int = 2048, batch_size: int = 64):
+        self.nlp = None
+        self.max_cached_docs = max_cached_docs
+        self.batch_size = batch_size
+        self._docs: "OrderedDict[str, Any]" = OrderedDict()
+        self._load_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._load_failed = False
+
+    def load(self) -> Optional[Any]:
+        """Load the spaCy model once (thread-safe). Returns None if unavailable."""
+        if self.nlp is not None or self._load_failed:
+            return self.nlp
+
+        with self._load_lock:
+            if self.nlp is None and not self._load_failed:
+                try:
+                    import spacy
+                    self.nlp = spacy.load(SPACY_MODEL, exclude=DISABLED_PIPES)
+                    logger.info(f"NLP service loaded {SPACY_MODEL} with pipes: {self.nlp.pipe_names}")
+                except Exception as e:
+                    logger.error(f"Failed to load spaCy model: {e}")
+                    self._load_failed = True
+
+        return self.nlp
+
+    @property
+    def available(self) -> bool:
+        return self.load() is not None
+
+    def _key(self, text: str) -> str:
+        return hashlib.md5(text.encode()).hexdigest()
+
+    def _get_cached(self, key: str) -> Optional[Any]:
+        with self._cache_lock:
+            doc = self._docs.get(key)
+            if doc is not None:
+                self._docs.move_to_end(key)
+            return doc
+
+    def _store(self, key: str, doc: Any) -> None:
+        with self._cache_lock:
+            self._docs[key] = doc
+            self._docs.move_to_end(key)
+            while len(self._docs) > self.max_cached_docs:
+                self._docs.popitem(last=False)
+
+    def _parse_uncached(self, texts: List[str]) -> None:
+        """Run nlp.pipe over texts (blocking - call from a worker thread)"""
+        nlp = self.load()
+        if nlp is None:
+            return
+        for text, doc in zip(texts, nlp.pipe(texts, batch_size=self.batch_size)):
+            self._store(self._key(text), doc)
+
+    def get_doc(self, text: str) -> Optional[Any]:
+        """
+        Get the parsed Doc for text, parsing synchronously on a cache miss.
+
+        Returns None if spaCy is unavailable.
+        """
+        if not text:
+            return None
+        key = self._key(text)
+        doc = self._get_cached(key)
+        if doc is not None:
+            return doc
+
+        nlp = self.load()
+        if nlp is None:
+            return None
+        doc = nlp(text)
+        self._store(key, doc)
+        return doc
+
+    async def parse_batch(self, texts: List[str]) -> List[Optional[Any]]:
+        """
+        Parse all texts in one nlp.pipe batch in a worker thread.
+
+        Already-cached texts are not re-parsed. Returns docs in input order
+        (None entries if spaCy is unavailable).
+        """
+        unique_uncached = []
+        seen = set()
+        for text in texts:
+            if not text or text in seen:
+                continue
+            seen.add(text)
+            if self._get_cached(self._key(text)) is None:
+                unique_uncached.append(text)
+
+        if unique_uncached:
+            try:
+                await asyncio.to_thread(self._parse_uncached, unique_uncached)
+                logger.debug(f"NLP service parsed {len(unique_uncached)} texts in one batch")
+            except Exception as e:
+                logger.warning(f"Batch NLP parse failed: {e}")
+
+        return [self._get_cached(self._key(text)) if text else None for text in texts]
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._docs.clear()
+
+
+# Singleton instance (model loaded once per process)
+_nlp_service: Optional[NLPService] = None
+
+
+def get_nlp_service() -> NLPService:
+    """Get singleton NLP service instance"""
+    global _nlp_service
+    if _nlp_service is None:
+        _nlp_service = NLPService()
+    return _nlp_service
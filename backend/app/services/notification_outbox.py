@@ -0,0 +1,313 @@
+"""
+Notification Outbox Service
+
+Pipeline workers never call Expo or Resend directly. They add
+NotificationOutbox rows in the same DB transaction as the check update
+(see check_failed_intents / check_completed_intents) and then kick the
+delivery task on the lightweight notifications queue.
+
+NotificationDispatcher.deliver_due() claims due rows with
+FOR UPDATE SKIP LOCKED, sends push rows through Expo's batched API
+(publish_multiple, up to 100 messages per request), sends email rows
+one by one, and reschedules failures with exponential backoff up to
+NOTIFICATION_MAX_ATTEMPTS. A beat-scheduled sweep (sweep()) delivers rows
+whose delivery run was lost, e.g. a broker outage when it was kicked.
+
+Usage:
+    update_check_status_sync(check_id, "failed", msg,
+                             notifications=check_failed_intents(user_id, check_id, msg))
+    schedule_notification_delivery()
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from prometheus_client import Counter
+from sqlalchemy import select, func
+
+from app.core.config import settings
+from app.models.notification import NotificationOutbox
+
+logger = logging.getLogger(__name__)
+
+# Expo accepts at most 100 messages per push request
+EXPO_BATCH_SIZE = 100
+
+NOTIFICATIONS_TOTAL = Counter(
+    "tru8_notifications_total",
+    "Notification delivery outcomes from the outbox",
+    ["channel", "kind", "status"]
+)
+
+
+def check_failed_intents(user_id: str, check_id: str, error_message: str) -> List[NotificationOutbox]:
+    """Push + email intents for a failed check"""
+    return [
+        NotificationOutbox(
+            user_id=user_id,
+            check_id=check_id,
+            channel="push",
+            kind="check_failed",
+            payload={"error_message": error_message[:100]}
+        ),
+        NotificationOutbox(
+            user_id=user_id,
+            check_id=check_id,
+            channel="email",
+            kind="check_failed",
+            payload={"error_message": error_message[:200]}
+        ),
+    ]
+
+
+def check_completed_intents(
+    user_id: str,
+    check_id: str,
+    claims_count: int,
+    supported: int,
+    contradicted: int,
+    uncertain: int,
+    credibility_score: int
+) -> List[NotificationOutbox]:
+    """Email intent for a completed check"""
+    return [
+        NotificationOutbox(
+            user_id=user_id,
+            check_id=check_id,
+            channel="email",
+            kind="check_completed",
+            payload={
+                "claims_count": claims_count,
+                "supported": supported,
+                "contradicted": contradicted,
+                "uncertain": uncertain,
+                "credibility_score": credibility_score,
+            }
+        ),
+    ]
+
+
+def schedule_notification_delivery(countdown: float = 0) -> None:
+    """
+    Kick the delivery task on the notifications queue.
+
+    Non-critical: rows stay pending and are picked up by the next run.
+    """
+    try:
+        from app.workers.notifications import deliver_notifications
+        deliver_notifications.apply_async(countdown=countdown, queue=settings.NOTIFICATION_QUEUE)
+    except Exception as e:
+        logger.warning(f"Failed to schedule notification delivery (will retry on next run): {e}")
+
+
+class NotificationDispatcher:
+    """Delivers due outbox rows with batching and bounded retries"""
+
+    def __init__(self, push_client=None, email_service=None):
+        self._push_client = push_client
+        self._email_service = email_service
+        self.batch_size = settings.NOTIFICATION_BATCH_SIZE
+        self.max_attempts = settings.NOTIFICATION_MAX_ATTEMPTS
+        self.retry_base_seconds = settings.NOTIFICATION_RETRY_BASE_SECONDS
+
+    @property
+    def push_client(self):
+        if self._push_client is None:
+            from exponent_server_sdk import PushClient
+            self._push_client = PushClient()
+        return self._push_client
+
+    @property
+    def email_service(self):
+        if self._email_service is None:
+            from app.services.email_notifications import email_notification_service
+            self._email_service = email_notification_service
+        return self._email_service
+
+    def deliver_due(self, session, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Deliver one batch of due rows and commit. Returns outcome counts."""
+        now = now or datetime.utcnow()
+        stmt = (
+            select(NotificationOutbox)
+            .where(
+                NotificationOutbox.status == "pending",
+                NotificationOutbox.next_attempt_at <= now
+            )
+            .order_by(NotificationOutbox.created_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        rows = session.execute(stmt).scalars().all()
+        if not rows:
+            return {}
+
+        self._deliver_push(session, [r for r in rows if r.channel == "push"], now)
+        for row in rows:
+            if row.channel == "email":
+                self._deliver_email(row, now)
+            elif row.channel != "push":
+                self._finish(row, "failed", now, error=f"Unknown channel: {row.channel}")
+
+        session.commit()
+
+        counts: Dict[str, int] = {}
+        for row in rows:
+            counts[row.status] = counts.get(row.status, 0) + 1
+        logger.info(f"Notification outbox batch delivered: {counts}")
+        return counts
+
+    def sweep(self, session, now: Optional[datetime] = None, max_batches: int = 10) -> Dict[str, int]:
+        """
+        Deliver every due row, batch by batch, without scheduling follow-up runs.
+
+        Pending rows include ones rescheduled after failed attempts, so this
+        also retries failures whose scheduled run never happened.
+        """
+        totals: Dict[str, int] = {}
+        for _ in range(max_batches):
+            counts = self.deliver_due(session, now)
+            if not counts:
+                break
+            for status, count in counts.items():
+                totals[status] = totals.get(status, 0) + count
+        return totals
+
+    def seconds_until_next_due(self, session, now: Optional[datetime] = None) -> Optional[float]:
+        """Seconds until the earliest pending row is due (None if nothing pending)"""
+        now = now or datetime.utcnow()
+        next_due = session.execute(
+            select(func.min(NotificationOutbox.next_attempt_at))
+            .where(NotificationOutbox.status == "pending")
+        ).scalar()
+        if next_due is None:
+            return None
+        return max(0.0, (next_due - now).total_seconds())
+
+    # ========== PUSH (Expo batched API) ==========
+
+    def _deliver_push(self, session, rows: List[NotificationOutbox], now: datetime) -> None:
+        if not rows:
+            return
+
+        from app.models.user import User
+        user_ids = list({row.user_id for row in rows})
+        users = {
+            user.id: user
+            for user in session.execute(select(User).where(User.id.in_(user_ids))).scalars().all()
+        }
+
+        pending = []
+        for row in rows:
+            user = users.get(row.user_id)
+            if not user or not user.push_token or not user.push_notifications_enabled:
+                self._finish(row, "skipped", now, error="No push token or notifications disabled")
+                continue
+            pending.append((row, self._build_push_message(row, user.push_token)))
+
+        for i in range(0, len(pending), EXPO_BATCH_SIZE):
+            batch = pending[i:i + EXPO_BATCH_SIZE]
+            try:
+                tickets = self.push_client.publish_multiple([message for _, message in batch])
+            except Exception as e:
+                logger.warning(f"Expo batch push failed ({len(batch)} messages): {e}")
+                for row, _ in batch:
+                    self._retry(row, now, str(e))
+                continue
+
+            for (row, _), ticket in zip(batch, tickets):
+                if ticket.is_success():
+                    self._finish(row, "sent", now)
+                elif (ticket.details or {}).get("error") == "DeviceNotRegistered":
+                    # Token is dead - retrying will never succeed
+                    self._finish(row, "skipped", now, error="DeviceNotRegistered")
+                else:
+                    self._retry(row, now, ticket.message or str(ticket.details))
+
+    def _build_push_message(self, row: NotificationOutbox, push_token: str):
+        from exponent_server_sdk import PushMessage
+
+        payload = row.payload or {}
+        if row.kind == "check_failed":
+            title = "Fact-check failed"
+            body = "Tap to try again"
+            data = {'type': 'check_failed', 'checkId': row.check_id, 'error': payload.get("error_message", "")}
+        else:
+            claims_count = payload.get("claims_count", 0)
+            title = "Fact-check complete!"
+            body = f"Found {claims_count} claim{'s' if claims_count != 1 else ''} to verify"
+            data = {'type': 'check_complete', 'checkId': row.check_id, 'claimsCount': claims_count}
+
+        return PushMessage(
+            to=push_token,
+            title=title,
+            body=body,
+            data=data,
+            category_id=row.kind,
+            sound='default',
+            badge=1,
+            priority='high'
+        )
+
+    # ========== EMAIL ==========
+
+    def _deliver_email(self, row: NotificationOutbox, now: datetime) -> None:
+        payload = row.payload or {}
+        try:
+            if row.kind == "check_failed":
+                sent = self.email_service.send_check_failed_email_sync(
+                    user_id=row.user_id,
+                    check_id=row.check_id,
+                    error_message=payload.get("error_message", ""),
+                    raise_on_error=True
+                )
+            elif row.kind == "check_completed":
+                sent = self.email_service.send_check_completed_email_sync(
+                    user_id=row.user_id,
+                    check_id=row.check_id,
+                    raise_on_error=True,
+                    **payload
+                )
+            else:
+                self._finish(row, "failed", now, error=f"Unknown kind: {row.kind}")
+                return
+        except Exception as e:
+            self._retry(row, now, str(e))
+            return
+
+        # False means disabled globally or by user preference - nothing to retry
+        self._finish(row, "sent" if sent else "skipped", now)
+
+    # ========== STATE TRANSITIONS ==========
+
+    def _finish(self, row: NotificationOutbox, status: str, now: datetime, error: Optional[str] = None) -> None:
+        row.status = status
+        row.attempts += 1
+        if status == "sent":
+            row.sent_at = now
+        if error:
+            row.last_error = error[:500]
+        NOTIFICATIONS_TOTAL.labels(channel=row.channel, kind=row.kind, status=status).inc()
+
+    def _retry(self, row: NotificationOutbox, now: datetime, error: str) -> None:
+        if row.attempts + 1 >= self.max_attempts:
+            logger.error(f"Notification {row.id} ({row.channel}/{row.kind}) failed after {row.attempts + 1} attempts: {error}")
+            self._finish(row, "failed", now, error=error)
+            return
+
+        row.attempts += 1
+        row.last_error = error[:500]
+        row.next_attempt_at = now + timedelta(seconds=self.retry_base_seconds * (2 ** (row.attempts - 1)))
+        NOTIFICATIONS_TOTAL.labels(channel=row.channel, kind=row.kind, status="retried").inc()
+
+
+# Singleton instance
+_dispatcher: Optional[NotificationDispatcher] = None
+
+
+def get_notification_dispatcher() -> NotificationDispatcher:
+    """Get singleton NotificationDispatcher instance"""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = NotificationDispatcher()
+    return _dispatcher
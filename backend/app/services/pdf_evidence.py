@@ -1,22 +1,93 @@
 """
 PDF Evidence Extractor with Page Number Tracking
 Extracts evidence from PDF documents with precise page citations
+
+PDFs are streamed into a spooled temp file (capped at PDF_MAX_DOWNLOAD_MB),
+pages are extracted lazily and scanning stops early once enough
+high-relevance pages are found. Each downloaded PDF is kept in a small
+per-process LRU together with the page texts extracted so far and a keyword
+index, so later claims that cite the same report reuse the work.
 """
 import logging
 import re
 import asyncio
-from typing import Optional, Dict, Any, List
-from io import BytesIO
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Set
 import httpx
 
+from app.core.config import settings
+from app.core.http_transport import build_transport
+
 logger = logging.getLogger(__name__)
 
+KEYWORD_PATTERN = re.compile(r'\b\w+\b')
+
+
+class PDFTooLargeError(Exception):
+    """Raised when a PDF exceeds the configured download size cap"""
+    pass
+
+
+def _index_term(word: str) -> str:
+    """Crude plural folding so 'rates' and 'rate' share an index entry"""
+    if len(word) > 4 and word.endswith('s'):
+        return word[:-1]
+    return word
+
+
+class CachedPDF:
+    """A downloaded PDF plus the page texts and keyword index built so far"""
+
+    def __init__(self, url: str, pdf_file, metadata: Dict[str, Any]):
+        self.url = url
+        self.file = pdf_file
+        self.metadata = metadata
+        self.page_texts: Dict[int, str] = {}  # 0-indexed page -> text
+        self.keyword_index: Dict[str, Set[int]] = {}
+        self.next_page = 0  # First page not yet extracted
+        self.fully_scanned = False
+        self.lock = threading.Lock()  # pdfplumber/file access is not thread-safe
+
+    def add_page(self, page_num: int, text: str) -> None:
+        self.page_texts[page_num] = text
+        for word in set(KEYWORD_PATTERN.findall(text.lower())):
+            if len(word) > 3:
+                self.keyword_index.setdefault(_index_term(word), set()).add(page_num)
+
+    def candidate_pages(self, keywords: List[str]) -> List[int]:
+        """Already-extracted pages sharing at least one keyword with the claim"""
+        pages: Set[int] = set()
+        for keyword in keywords:
+            pages |= self.keyword_index.get(_index_term(keyword), set())
+        return sorted(pages)
+
+    def close(self) -> None:
+        with self.lock:
+            try:
+                self.file.close()
+            except Exception:
+                pass
+
+
 class PDFEvidenceExtractor:
     """Extract evidence from PDFs with page-level precision"""
 
     def __init__(self):
         self.timeout = 30  # PDFs can be large
         self.max_pages_to_search = 200  # Prevent timeout on huge PDFs
+        self.max_download_bytes = settings.PDF_MAX_DOWNLOAD_MB * 1024 * 1024
+        self.spool_max_bytes = settings.PDF_SPOOL_MEMORY_MB * 1024 * 1024
+        self.early_stop_relevance = settings.PDF_EARLY_STOP_RELEVANCE
+        self.cache_size = settings.PDF_DOCUMENT_CACHE_SIZE
+
+        # The LRU is shared by every event loop and thread in the process; in-flight
+        # downloads are futures of one event loop, so they are kept per loop
+        self._documents: "OrderedDict[str, CachedPDF]" = OrderedDict()
+        self._documents_lock = threading.Lock()
+        self._inflight = weakref.WeakKeyDictionary()  # loop -> {url: Future}
 
     async def extract_evidence_from_pdf(
         self,
@@ -36,30 +107,20 @@ class PDFEvidenceExtractor:
             List of evidence dictionaries with page_number metadata
         """
         try:
-            # Download PDF
-            logger.info(f"Downloading PDF: {url}")
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-
-            pdf_bytes = BytesIO(response.content)
+            document = await self._get_document(url)
 
             # Run blocking PDF operations in executor to avoid blocking event loop
             loop = asyncio.get_event_loop()
-
-            # Extract metadata (blocking operation)
-            metadata = await loop.run_in_executor(None, self._extract_pdf_metadata, pdf_bytes)
-            logger.info(f"PDF metadata: {metadata['title']}, {metadata['total_pages']} pages")
-
-            # Search for relevant content (blocking operation)
-            pdf_bytes.seek(0)  # Reset stream
             matches = await loop.run_in_executor(
-                None, self._search_pdf_for_claim, pdf_bytes, claim, metadata['total_pages']
+                None, self._search_pdf_for_claim, document, claim, max_results
             )
 
             # Return top matches
             return matches[:max_results]
 
+        except PDFTooLargeError as e:
+            logger.warning(f"Skipping PDF {url}: {e}")
+            return []
         except httpx.HTTPStatusError as e:
             logger.error(f"Failed to download PDF {url}: {e}")
             return []
@@ -67,11 +128,97 @@ class PDFEvidenceExtractor:
             logger.error(f"PDF extraction error for {url}: {e}")
             return []
 
-    def _extract_pdf_metadata(self, pdf_bytes: BytesIO) -> Dict[str, Any]:
+    async def _get_document(self, url: str) -> CachedPDF:
+        """Get a cached PDF, downloading it once even if several claims ask concurrently"""
+        with self._documents_lock:
+            document = self._documents.get(url)
+            if document is not None:
+                self._documents.move_to_end(url)
+        if document is not None:
+            logger.debug(f"PDF cache hit: {url}")
+            return document
+
+        loop = asyncio.get_running_loop()
+        inflight_downloads = self._inflight.setdefault(loop, {})
+        inflight = inflight_downloads.get(url)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = loop.create_future()
+        inflight_downloads[url] = future
+        try:
+            document = await self._load_document(url)
+            future.set_result(document)
+            return document
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited future doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            inflight_downloads.pop(url, None)
+
+    async def _load_document(self, url: str) -> CachedPDF:
+        """Download a PDF, read its metadata and add it to the LRU"""
+        pdf_file = await self._download_pdf(url)
+        loop = asyncio.get_event_loop()
+        try:
+            metadata = await loop.run_in_executor(None, self._extract_pdf_metadata, pdf_file)
+        except BaseException:
+            pdf_file.close()
+            raise
+        logger.info(f"PDF metadata: {metadata['title']}, {metadata['total_pages']} pages")
+
+        document = CachedPDF(url, pdf_file, metadata)
+        evicted = []
+        with self._documents_lock:
+            existing = self._documents.get(url)
+            if existing is not None:
+                # Another event loop downloaded the same PDF concurrently; keep its copy
+                self._documents.move_to_end(url)
+                evicted.append(document)
+                document = existing
+            else:
+                self._documents[url] = document
+                while len(self._documents) > self.cache_size:
+                    evicted.append(self._documents.popitem(last=False)[1])
+        for old in evicted:
+            # close() waits for any in-progress scan of the evicted document
+            await loop.run_in_executor(None, old.close)
+        return document
+
+    async def _download_pdf(self, url: str):
+        """Stream a PDF into a spooled temp file, enforcing the size cap"""
+        logger.info(f"Downloading PDF: {url}")
+        pdf_file = tempfile.SpooledTemporaryFile(max_size=self.spool_max_bytes)
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout, transport=build_transport()) as client:
+                async with client.stream("GET", url) as response:
+                    response.raise_for_status()
+
+                    content_length = response.headers.get("content-length")
+                    if content_length and content_length.isdigit() and int(content_length) > self.max_download_bytes:
+                        raise PDFTooLargeError(f"Content-Length {content_length} exceeds {self.max_download_bytes} bytes")
+
+                    downloaded = 0
+                    async for chunk in response.aiter_bytes():
+                        downloaded += len(chunk)
+                        if downloaded > self.max_download_bytes:
+                            raise PDFTooLargeError(f"download exceeded {self.max_download_bytes} bytes")
+                        pdf_file.write(chunk)
+
+            pdf_file.seek(0)
+            return pdf_file
+        except BaseException:
+            pdf_file.close()
+            raise
+
+    def _extract_pdf_metadata(self, pdf_file) -> Dict[str, Any]:
         """Extract PDF metadata (title, author, pages)"""
         try:
             import PyPDF2
-            reader = PyPDF2.PdfReader(pdf_bytes)
+            pdf_file.seek(0)
+            reader = PyPDF2.PdfReader(pdf_file)
             metadata = reader.metadata or {}
 
             return {
@@ -91,59 +238,96 @@ class PDFEvidenceExtractor:
 
     def _search_pdf_for_claim(
         self,
-        pdf_bytes: BytesIO,
+        document: CachedPDF,
         claim: str,
-        total_pages: int
+        max_results: int
     ) -> List[Dict[str, Any]]:
         """
         Search PDF for relevant passages matching claim.
 
+        Pages already extracted for earlier claims are looked up through the
+        keyword index; remaining pages are extracted lazily until max_results
+        pages reach PDF_EARLY_STOP_RELEVANCE.
+
         Returns list of matches with page numbers and relevance scores.
         """
         matches = []
         claim_keywords = self._extract_keywords(claim)
 
-        # Use pdfplumber for better text extraction
-        try:
-            import pdfplumber
-            with pdfplumber.open(pdf_bytes) as pdf:
-                pages_to_search = min(len(pdf.pages), self.max_pages_to_search)
-                logger.info(f"Searching {pages_to_search} pages for relevant content")
-
-                for page_num in range(pages_to_search):
-                    # Log progress every 20 pages for large PDFs
-                    if page_num % 20 == 0 and page_num > 0:
-                        logger.info(f"PDF search progress: {page_num}/{pages_to_search} pages processed")
-
-                    page = pdf.pages[page_num]
-                    page_text = page.extract_text()
-
-                    if not page_text:
-                        continue
-
-                    # Calculate relevance score
-                    relevance_score = self._calculate_relevance(page_text, claim, claim_keywords)
-
-                    if relevance_score > 0.3:  # Threshold for relevance
-                        # Extract relevant snippet from page
-                        snippet = self._extract_relevant_snippet(page_text, claim, claim_keywords)
-
-                        matches.append({
-                            'text': snippet,
-                            'page_number': page_num + 1,  # 1-indexed
-                            'relevance_score': relevance_score,
-                            'context_before': self._get_context(page_text, snippet, before=True),
-                            'context_after': self._get_context(page_text, snippet, after=True)
-                        })
-
-        except Exception as e:
-            logger.error(f"Error searching PDF: {e}")
-            return []
+        def score_page(page_num: int, page_text: str) -> None:
+            # Calculate relevance score
+            relevance_score = self._calculate_relevance(page_text, claim, claim_keywords)
+
+            if relevance_score > 0.3:  # Threshold for relevance
+                # Extract relevant snippet from page
+                snippet = self._extract_relevant_snippet(page_text, claim, claim_keywords)
+
+                matches.append({
+                    'text': snippet,
+                    'page_number': page_num + 1,  # 1-indexed
+                    'relevance_score': relevance_score,
+                    'context_before': self._get_context(page_text, snippet, before=True),
+                    'context_after': self._get_context(page_text, snippet, after=True)
+                })
+
+        def enough_matches() -> bool:
+            strong = sum(1 for m in matches if m['relevance_score'] >= self.early_stop_relevance)
+            return strong >= max_results
+
+        with document.lock:
+            for page_num in document.candidate_pages(claim_keywords):
+                score_page(page_num, document.page_texts[page_num])
+
+            if not enough_matches() and not document.fully_scanned:
+                try:
+                    # Use pdfplumber for better text extraction
+                    import pdfplumber
+                    document.file.seek(0)
+                    with pdfplumber.open(document.file) as pdf:
+                        pages_to_search = min(len(pdf.pages), self.max_pages_to_search)
+                        logger.info(
+                            f"Searching pages {document.next_page + 1}-{pages_to_search} for relevant content"
+                        )
+
+                        for page_num in range(document.next_page, pages_to_search):
+                            # Log progress every 20 pages for large PDFs
+                            if page_num % 20 == 0 and page_num > 0:
+                                logger.info(f"PDF search progress: {page_num}/{pages_to_search} pages processed")
+
+                            page = pdf.pages[page_num]
+                            page_text = page.extract_text() or ""
+                            page.close()  # Release parsed layout objects
+
+                            document.add_page(page_num, page_text)
+                            document.next_page = page_num + 1
+
+                            if not page_text:
+                                continue
+
+                            score_page(page_num, page_text)
+                            if enough_matches():
+                                logger.info(f"PDF search stopped early at page {page_num + 1}/{pages_to_search}")
+                                break
+                        else:
+                            document.fully_scanned = True
+
+                except Exception as e:
+                    logger.error(f"Error searching PDF: {e}")
+                    if not matches:
+                        return []
 
         # Sort by relevance
-        matches.sort(key=lambda x: x['relevance_score'], reverse=True)
+        matches.sort(key=lambda x: (-x['relevance_score'], x['page_number']))
         return matches
 
+    def clear_cache(self) -> None:
+        """Close and drop all cached PDFs"""
+        with self._documents_lock:
+            documents = list(self._documents.values())
+            self._documents.clear()
+        for document in documents:
+            document.close()
+
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract important keywords from claim text"""
         # Remove stopwords and extract meaningful terms
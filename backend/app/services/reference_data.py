@@ -0,0 +1,237 @@
+"""
+Reference-data snapshots for government API adapters.
+
+Some adapters answer claims from whole, slowly changing datasets: league
+tables, scorer lists, the team directory, the ONS dataset catalogue, the WHO
+indicator list. Rather than downloading those for every claim, adapters read
+them through GovernmentAPIClient.get_reference(), which keeps one snapshot per
+canonical resource, keyed by adapter and resource rather than by query text.
+
+    fresh    age < refresh_seconds                           served from the snapshot
+    stale    age < refresh_seconds * REFERENCE_DATA_MAX_STALE_FACTOR
+                                                             served; beat refresh pending
+    missing or older                                         fetched inline and stored
+
+Snapshots live in Redis (shared by all workers) with an in-process copy in
+front. Celery beat runs app.workers.maintenance.refresh_reference_data, which
+refetches due snapshots that were read within REFERENCE_DATA_IDLE_HOURS and
+drops idle ones, so quota is only spent on resources claims actually use.
+A failed refresh keeps the previous snapshot.
+"""
+
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Reads are recorded in Redis at most this often per resource and process
+READ_MARK_INTERVAL_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class ReferenceResource:
+    """A canonical upstream resource, e.g. the Premier League table"""
+    adapter: str
+    key: str
+    endpoint: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    refresh_seconds: int = 3600
+
+    @property
+    def id(self) -> str:
+        return f"{self.adapter}|{self.key}"
+
+    @property
+    def max_stale_seconds(self) -> float:
+        return self.refresh_seconds * settings.REFERENCE_DATA_MAX_STALE_FACTOR
+
+    @classmethod
+    def from_json(cls, raw: str) -> "ReferenceResource":
+        return cls(**json.loads(raw))
+
+
+@dataclass
+class Snapshot:
+    data: Any
+    fetched_at: float
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (now if now is not None else time.time()) - self.fetched_at
+
+
+class ReferenceDataStore:
+    """Redis-backed snapshots of reference resources, with an in-process copy"""
+
+    KEY_PREFIX = "tru8:refdata:"
+
+    def __init__(self, redis_client=None):
+        self._redis = redis_client
+        self._local: Dict[str, Snapshot] = {}
+        self._read_marks: Dict[str, float] = {}
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True, socket_connect_timeout=5)
+        return self._redis
+
+    def _snapshot_key(self, resource_id: str) -> str:
+        return f"{self.KEY_PREFIX}snapshot:{resource_id}"
+
+    @property
+    def _index_key(self) -> str:
+        return f"{self.KEY_PREFIX}index"
+
+    @property
+    def _fetched_key(self) -> str:
+        return f"{self.KEY_PREFIX}fetched_at"
+
+    @property
+    def _read_key(self) -> str:
+        return f"{self.KEY_PREFIX}read_at"
+
+    def _retention_seconds(self, resource: ReferenceResource) -> int:
+        return int(resource.max_stale_seconds + settings.REFERENCE_DATA_IDLE_HOURS * 3600)
+
+    def get(self, resource: ReferenceResource) -> Optional[Snapshot]:
+        """Return the newest snapshot (local or shared), or None"""
+        snapshot = self._local.get(resource.id)
+
+        # The local copy is enough while fresh; otherwise another worker may have refreshed it
+        if snapshot is None or snapshot.age() >= resource.refresh_seconds:
+            try:
+                raw = self.redis.get(self._snapshot_key(resource.id))
+                if raw:
+                    shared = Snapshot(**json.loads(raw))
+                    if snapshot is None or shared.fetched_at > snapshot.fetched_at:
+                        snapshot = shared
+                        self._local[resource.id] = shared
+            except Exception as e:
+                logger.warning(f"Reference snapshot lookup failed for {resource.id}: {e}")
+
+        self._mark_read(resource)
+        return snapshot
+
+    def put(self, resource: ReferenceResource, data: Any) -> Snapshot:
+        """Store a freshly fetched snapshot and register the resource for background refresh"""
+        snapshot = Snapshot(data=data, fetched_at=time.time())
+        self._local[resource.id] = snapshot
+        try:
+            self.redis.set(
+                self._snapshot_key(resource.id),
+                json.dumps(asdict(snapshot), default=str),
+                ex=self._retention_seconds(resource)
+            )
+            self.redis.hset(self._index_key, resource.id, json.dumps(asdict(resource)))
+            self.redis.hset(self._fetched_key, resource.id, snapshot.fetched_at)
+            self.redis.hset(self._read_key, resource.id, snapshot.fetched_at)
+            self._read_marks[resource.id] = snapshot.fetched_at
+        except Exception as e:
+            logger.warning(f"Reference snapshot store failed for {resource.id}: {e}")
+        return snapshot
+
+    def _mark_read(self, resource: ReferenceResource) -> None:
+        now = time.time()
+        if now - self._read_marks.get(resource.id, 0) < READ_MARK_INTERVAL_SECONDS:
+            return
+        self._read_marks[resource.id] = now
+        try:
+            self.redis.hset(self._read_key, resource.id, now)
+        except Exception as e:
+            logger.debug(f"Failed to record reference read for {resource.id}: {e}")
+
+    def drop(self, resource_id: str) -> None:
+        self._local.pop(resource_id, None)
+        self.redis.delete(self._snapshot_key(resource_id))
+        self.redis.hdel(self._index_key, resource_id)
+        self.redis.hdel(self._fetched_key, resource_id)
+        self.redis.hdel(self._read_key, resource_id)
+
+    def refresh_due(
+        self,
+        fetch: Callable[[ReferenceResource], Optional[Any]],
+        max_refreshes: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Refetch snapshots past their refresh interval and drop idle ones.
+
+        Args:
+            fetch: Returns fresh data for a resource, or None on failure
+            max_refreshes: Cap per run (most overdue first) to stay inside free-tier quotas
+
+        Returns:
+            Counts of refreshed, failed, dropped and deferred resources
+        """
+        now = time.time()
+        idle_cutoff = now - settings.REFERENCE_DATA_IDLE_HOURS * 3600
+        index = self.redis.hgetall(self._index_key)
+        fetched_at = self.redis.hgetall(self._fetched_key)
+        read_at = self.redis.hgetall(self._read_key)
+        stats = {"refreshed": 0, "failed": 0, "dropped": 0, "deferred": 0}
+
+        due = []
+        for resource_id, raw in index.items():
+            if float(read_at.get(resource_id, 0)) < idle_cutoff:
+                self.drop(resource_id)
+                stats["dropped"] += 1
+                continue
+            resource = ReferenceResource.from_json(raw)
+            overdue = now - float(fetched_at.get(resource_id, 0)) - resource.refresh_seconds
+            if overdue >= 0:
+                due.append((overdue / resource.refresh_seconds, resource))
+
+        due.sort(key=lambda item: item[0], reverse=True)
+        limit = max_refreshes if max_refreshes is not None else settings.REFERENCE_DATA_MAX_REFRESHES_PER_RUN
+        for _, resource in due[:limit]:
+            try:
+                data = fetch(resource)
+            except Exception as e:
+                logger.warning(f"Reference refresh failed for {resource.id}: {e}")
+                data = None
+            if data is None:
+                stats["failed"] += 1
+                continue
+            self.put(resource, data)
+            stats["refreshed"] += 1
+        stats["deferred"] = max(0, len(due) - limit)
+
+        return stats
+
+    def get_status(self) -> List[Dict[str, Any]]:
+        """Registered resources with snapshot age, for diagnostics"""
+        now = time.time()
+        index = self.redis.hgetall(self._index_key)
+        fetched_at = self.redis.hgetall(self._fetched_key)
+        read_at = self.redis.hgetall(self._read_key)
+        status = []
+        for resource_id, raw in sorted(index.items()):
+            resource = ReferenceResource.from_json(raw)
+            age = now - float(fetched_at.get(resource_id, 0))
+            status.append({
+                "adapter": resource.adapter,
+                "resource": resource.key,
+                "age_seconds": round(age),
+                "refresh_seconds": resource.refresh_seconds,
+                "stale": age >= resource.refresh_seconds,
+                "last_read_seconds_ago": round(now - float(read_at.get(resource_id, 0))),
+            })
+        return status
+
+
+# Singleton instance
+_reference_store: Optional[ReferenceDataStore] = None
+
+
+def get_reference_store() -> ReferenceDataStore:
+    """Get singleton reference-data store"""
+    global _reference_store
+    if _reference_store is None:
+        _reference_store = ReferenceDataStore()
+    return _reference_store
@@ -8,6 +8,9 @@ from datetime import datetime, timedelta
 import httpx
 from urllib.parse import quote_plus
 from app.core.config import settings
+from app.core.metrics import SEARCH_PROVIDER_SECONDS
+from app.core.tracing import start_span
+from app.core.http_transport import build_transport
 
 logger = logging.getLogger(__name__)
 
@@ -109,7 +112,7 @@ class BraveSearchProvider(BaseSearchProvider):
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create persistent HTTP client"""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = httpx.AsyncClient(timeout=self.timeout, transport=build_transport())
             logger.info("BRAVE: Created persistent HTTP client for connection reuse")
         return self._client
 
@@ -316,7 +319,7 @@ class SerpAPIProvider(BaseSearchProvider):
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create persistent HTTP client"""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = httpx.AsyncClient(timeout=self.timeout, transport=build_transport())
             logger.info("SERPAPI: Created persistent HTTP client for connection reuse")
         return self._client
 
@@ -508,7 +511,17 @@ class SearchService:
                 search_kwargs = {"max_results": max_results}
                 if freshness:
                     search_kwargs["freshness"] = freshness
-                results = await provider.search(query, **search_kwargs)
+                provider_start = time.perf_counter()
+                try:
+                    with start_span(f"search {provider_name}", **{"search.provider": provider_name}) as span:
+                        results = await provider.search(query, **search_kwargs)
+                        span.set_attribute("search.results", len(results))
+                except Exception:
+                    SEARCH_PROVIDER_SECONDS.labels(provider=provider_name, outcome="error").observe(time.perf_counter() - provider_start)
+                    raise
+                SEARCH_PROVIDER_SECONDS.labels(
+                    provider=provider_name, outcome="results" if results else "empty"
+                ).observe(time.perf_counter() - provider_start)
 
                 if results:
                     # Filter for credible sources
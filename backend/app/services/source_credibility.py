@@ -18,6 +18,114 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
+def _registered_domain(host: str) -> str:
+    """tldextract lookup memoised per host (many evidence URLs share a host)"""
+    return tldextract.extract(host).registered_domain.lower()
+
+
+class _TrieNode:
+    """Character trie node. 'orders' holds pattern orders that match at this node."""
+
+    __slots__ = ('children', 'orders', 'end_orders')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.orders: List[int] = []      # Match if the key has this prefix
+        self.end_orders: List[int] = []  # Match only if the key ends here
+
+    def insert(self, key: str, order: int, end_only: bool = False) -> None:
+        node = self
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+        (node.end_orders if end_only else node.orders).append(order)
+
+    def best_match(self, key: str) -> Optional[int]:
+        """Lowest pattern order matching key (prefix or exact-end)"""
+        best = min(self.orders) if self.orders else None
+        node = self
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return best
+            if node.orders:
+                candidate = min(node.orders)
+                if best is None or candidate < best:
+                    best = candidate
+        if node.end_orders:
+            candidate = min(node.end_orders)
+            if best is None or candidate < best:
+                best = candidate
+        return best
+
+
+class CompiledTierIndex:
+    """
+    Credibility config compiled for O(len(url)) tier lookup.
+
+    Every pattern gets an order (tier order, then pattern order within the
+    tier) and each pass returns the lowest matching order, which reproduces
+    the first-match-wins iteration of the original two-pass scan:
+
+    - Pass 1 (path patterns): per-domain path-prefix trie
+    - Pass 2 (domain patterns): exact-domain hash map plus a trie over
+      reversed '*.suffix' wildcards
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.pattern_tiers: List[str] = []  # order -> tier name
+        self.path_tries: Dict[str, _TrieNode] = {}
+        self.exact_domains: Dict[str, int] = {}
+        self.suffix_trie = _TrieNode()
+
+        for tier_name, tier_config in config.items():
+            if tier_name == 'general' or 'domains' not in tier_config:
+                continue
+            for pattern in tier_config['domains']:
+                order = len(self.pattern_tiers)
+                self.pattern_tiers.append(tier_name)
+                self._add_pattern(pattern, order)
+
+    def _add_pattern(self, raw_pattern: str, order: int) -> None:
+        if '/' in raw_pattern:
+            pattern = raw_pattern.lower().rstrip('/')
+            if '/' not in pattern:
+                return  # 'domain/' never matched in either pass
+            pattern_domain, path = pattern.split('/', 1)
+            pattern_path = '/' + path
+            trie = self.path_tries.setdefault(pattern_domain, _TrieNode())
+            if pattern_path.endswith('/*'):
+                trie.insert(pattern_path[:-2], order)
+            else:
+                # Exact path, or the path followed by further segments
+                trie.insert(pattern_path, order, end_only=True)
+                trie.insert(pattern_path + '/', order)
+            return
+
+        pattern = raw_pattern.lower()
+        if pattern.startswith('*.'):
+            # Same semantics as domain.endswith(suffix)
+            self.suffix_trie.insert(pattern[2:][::-1], order)
+        elif pattern not in self.exact_domains:
+            self.exact_domains[pattern] = order
+
+    def match_path(self, domain: str, url_path: str) -> Optional[str]:
+        """Tier of the first matching path pattern, or None"""
+        trie = self.path_tries.get(domain)
+        if trie is None:
+            return None
+        order = trie.best_match(url_path)
+        return self.pattern_tiers[order] if order is not None else None
+
+    def match_domain(self, domain: str) -> Optional[str]:
+        """Tier of the first matching domain pattern, or None"""
+        best = self.exact_domains.get(domain)
+        suffix_order = self.suffix_trie.best_match(domain[::-1])
+        if suffix_order is not None and (best is None or suffix_order < best):
+            best = suffix_order
+        return self.pattern_tiers[best] if best is not None else None
+
+
 class SourceCredibilityService:
     """
     Centralized source credibility management.
@@ -50,6 +158,9 @@ class SourceCredibilityService:
             logger.error(f"Invalid JSON in credibility config: {e}")
             self.config = {"general": {"credibility": 0.6, "description": "Default", "tier": "general"}}
 
+        # Compiled lookup structures (built once per config load)
+        self._index = CompiledTierIndex(self.config)
+
         # Cache for performance (stores domain -> credibility info)
         self._domain_cache: Dict[str, Dict[str, Any]] = {}
 
@@ -83,9 +194,9 @@ class SourceCredibilityService:
         """
         # Extract domain and path from URL
         try:
-            parsed = tldextract.extract(url)
-            domain = parsed.registered_domain.lower()
-            url_path = urlparse(url).path.lower().rstrip('/')
+            parsed_url = urlparse(url)
+            domain = _registered_domain(parsed_url.netloc or url)
+            url_path = parsed_url.path.lower().rstrip('/')
         except Exception as e:
             logger.warning(f"Failed to extract domain from {url}: {e}")
             return self._get_general_tier("Failed to parse domain")
@@ -96,7 +207,7 @@ class SourceCredibilityService:
             return self._domain_cache[cache_key]
 
         # Match against tiers (path patterns first, then domain patterns)
-        result = self._match_domain_to_tier(domain, url_path, parsed)
+        result = self._match_domain_to_tier(domain, url_path)
 
         # Cache the result
         self._domain_cache[cache_key] = result
@@ -117,10 +228,54 @@ class SourceCredibilityService:
                 return f"{domain}/{path_parts[0]}"
         return domain
 
-    def _match_domain_to_tier(self, domain: str, url_path: str, parsed) -> Dict[str, Any]:
+    def _tier_result(self, tier_name: str, reasoning: str) -> Dict[str, Any]:
+        tier_config = self.config[tier_name]
+        return {
+            'tier': tier_name,
+            'credibility': tier_config.get('credibility', 0.6),
+            'risk_flags': tier_config.get('risk_flags', []),
+            'auto_exclude': tier_config.get('auto_exclude', False),
+            'reasoning': reasoning,
+            'description': tier_config.get('description', '')
+        }
+
+    def _match_domain_to_tier(self, domain: str, url_path: str, parsed=None) -> Dict[str, Any]:
         """
         Match domain and path against all configured tiers.
 
+        Uses two-pass matching over the compiled index:
+        1. First pass: Check path patterns (more specific)
+        2. Second pass: Check domain-only patterns (fallback)
+
+        Within a pass the first tier/pattern in config order wins.
+
+        Args:
+            domain: Registered domain (e.g., 'bbc.co.uk')
+            url_path: URL path (e.g., '/sport/football')
+            parsed: Unused, kept for backwards compatibility
+
+        Returns:
+            Credibility info dictionary
+        """
+        # PASS 1: Check path patterns first (more specific)
+        tier_name = self._index.match_path(domain, url_path)
+        if tier_name:
+            return self._tier_result(tier_name, f"Matched {tier_name} tier (path: {domain}{url_path})")
+
+        # PASS 2: Check domain-only patterns (fallback)
+        tier_name = self._index.match_domain(domain)
+        if tier_name:
+            return self._tier_result(tier_name, f"Matched {tier_name} tier (domain: {domain})")
+
+        # No match found - default to general tier
+        return self._get_general_tier(f"No specific tier matched (domain: {domain})")
+
+    def _match_domain_to_tier_linear(self, domain: str, url_path: str, parsed=None) -> Dict[str, Any]:
+        """
+        Reference implementation: linear scan over every tier and pattern.
+
+        Kept to verify and benchmark the compiled index; not used on the hot path.
+
         Uses two-pass matching:
         1. First pass: Check path patterns (more specific)
         2. Second pass: Check domain-only patterns (fallback)
@@ -351,6 +506,7 @@ class SourceCredibilityService:
     def clear_cache(self):
         """Clear the domain cache (useful for testing or config updates)"""
         self._domain_cache.clear()
+        self._index = CompiledTierIndex(self.config)
         logger.info("Domain cache cleared")
 
     def get_credibility_breakdown(self, url: str) -> Dict[str, Any]:
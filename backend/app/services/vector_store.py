@@ -1,27 +1,163 @@
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple
+import hashlib
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from typing import List, Dict, Any, Optional, Tuple, Callable, Awaitable
 import uuid
 import numpy as np
+import redis.asyncio as aioredis
 from qdrant_client import QdrantClient, AsyncQdrantClient
 from qdrant_client.models import (
     Distance, VectorParams, CreateCollection, PointStruct, 
-    Filter, FieldCondition, Match, UpdateResult, ScoredPoint
+    Filter, FieldCondition, MatchValue, UpdateResult, ScoredPoint, Range,
+    IsEmptyCondition, PayloadField
 )
 from qdrant_client.http import models as rest
 from app.core.config import settings
+from app.utils.url_utils import normalize_url
 
 logger = logging.getLogger(__name__)
 
+# Payload indexes on the evidence collection (reference filters and retention)
+EVIDENCE_PAYLOAD_INDEXES = {
+    "check_id": rest.PayloadSchemaType.KEYWORD,
+    "claim_id": rest.PayloadSchemaType.KEYWORD,
+    "last_seen_ts": rest.PayloadSchemaType.FLOAT,
+}
+
+# Per-point locks serialising reference merges across workers
+EVIDENCE_LOCK_PREFIX = "tru8:evidence_lock:"
+
+# Delete only the locks this holder still owns (token in ARGV[1])
+RELEASE_LOCKS_SCRIPT = """
+for _, key in ipairs(KEYS) do
+    if redis.call('get', key) == ARGV[1] then
+        redis.call('del', key)
+    end
+end
+return 0
+"""
+
+# Snippet fields copied into a new evidence point's payload
+EVIDENCE_PAYLOAD_FIELDS = ("text", "source", "url", "title", "published_date", "relevance_score", "created_at")
+
+
+@dataclass(frozen=True)
+class CollectionProfile:
+    """
+    Storage layout of the evidence collection (QDRANT_EVIDENCE_PROFILE).
+
+    Quantised profiles keep int8 copies of the vectors in RAM for the HNSW
+    search and rescore the top oversampling * limit candidates against the
+    float32 originals, which may live on disk.
+    """
+    name: str
+    quantization: bool = False          # int8 scalar quantisation
+    quantile: float = 0.99              # Clip outliers when choosing the int8 range
+    quantized_in_ram: bool = True
+    vectors_on_disk: bool = False       # float32 originals memory-mapped
+    hnsw_on_disk: bool = False
+    memmap_threshold_kb: Optional[int] = None  # Segments above this size are memory-mapped
+    rescore: bool = True
+    oversampling: float = 2.0
+
+    def vectors_config(self, size: int) -> VectorParams:
+        return VectorParams(size=size, distance=Distance.COSINE, on_disk=self.vectors_on_disk)
+
+    def quantization_config(self) -> Optional[rest.ScalarQuantization]:
+        if not self.quantization:
+            return None
+        return rest.ScalarQuantization(scalar=rest.ScalarQuantizationConfig(
+            type=rest.ScalarType.INT8,
+            quantile=self.quantile,
+            always_ram=self.quantized_in_ram,
+        ))
+
+    def optimizers_config(self) -> rest.OptimizersConfigDiff:
+        return rest.OptimizersConfigDiff(
+            default_segment_number=2,
+            max_segment_size=None,
+            memmap_threshold=self.memmap_threshold_kb,
+        )
+
+    def hnsw_config(self) -> rest.HnswConfigDiff:
+        return rest.HnswConfigDiff(
+            m=16,
+            ef_construct=200,
+            full_scan_threshold=10000,
+            on_disk=self.hnsw_on_disk,
+        )
+
+    def search_params(self, hnsw_ef: Optional[int] = None) -> Optional[rest.SearchParams]:
+        if not hnsw_ef and not self.quantization:
+            return None
+        return rest.SearchParams(
+            hnsw_ef=hnsw_ef or None,
+            quantization=rest.QuantizationSearchParams(
+                ignore=False, rescore=self.rescore, oversampling=self.oversampling,
+            ) if self.quantization else None,
+        )
+
+
+COLLECTION_PROFILES = {
+    # float32 vectors and HNSW graph in RAM (original layout)
+    "memory": CollectionProfile("memory"),
+    # int8 in RAM (~4x smaller), originals on disk for rescoring
+    "quantized": CollectionProfile("quantized", quantization=True, vectors_on_disk=True, memmap_threshold_kb=20000),
+    # as quantized, and the HNSW graph memory-mapped too
+    "disk": CollectionProfile("disk", quantization=True, vectors_on_disk=True, hnsw_on_disk=True, memmap_threshold_kb=20000),
+}
+
+
+def get_collection_profile(name: Optional[str] = None) -> CollectionProfile:
+    """Profile by name (default QDRANT_EVIDENCE_PROFILE) with settings overrides applied"""
+    name = name or settings.QDRANT_EVIDENCE_PROFILE
+    if name not in COLLECTION_PROFILES:
+        raise ValueError(f"Unknown Qdrant profile: {name} (expected one of {', '.join(COLLECTION_PROFILES)})")
+    profile = COLLECTION_PROFILES[name]
+    if settings.QDRANT_MEMMAP_THRESHOLD_KB:
+        profile = replace(profile, memmap_threshold_kb=settings.QDRANT_MEMMAP_THRESHOLD_KB)
+    if profile.quantization:
+        profile = replace(profile, oversampling=settings.QDRANT_QUANTIZATION_OVERSAMPLING)
+    return profile
+
+
+def evidence_point_id(url: str, text: str) -> str:
+    """Content-addressed point ID: the same snippet from the same page is always the same point"""
+    material = f"{normalize_url(url or '')}\n{' '.join((text or '').lower().split())}"
+    digest = hashlib.sha256(material.encode()).hexdigest()
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"tru8:evidence:{digest}"))
+
+
+def _merge_references(existing: Any, new: List[str], limit: int) -> List[str]:
+    """Append new ids to a reference list (legacy points hold a single string), newest kept"""
+    if existing is None:
+        merged = []
+    elif isinstance(existing, list):
+        merged = list(existing)
+    else:
+        merged = [existing]
+    for ref in new:
+        if ref in merged:
+            merged.remove(ref)
+        merged.append(ref)
+    return merged[-limit:]
+
+
 class VectorStore:
     """Qdrant vector database service for fact-checking"""
     
     def __init__(self):
         self.client: Optional[AsyncQdrantClient] = None
         self.collection_name = "tru8_evidence"
+        self.claim_collection_name = "tru8_claim_verdicts"  # Semantic claim-verdict cache
         self.embedding_dimension = 384  # MiniLM-L6-v2 dimension
         self.batch_size = 100
+        self.profile = get_collection_profile()
         self._initialized = False
+        self._lock_redis = None  # Injected in tests; otherwise one client per store call
     
     async def initialize(self):
         """Initialize Qdrant client and collections"""
@@ -44,8 +180,9 @@ class VectorStore:
             collections = await self.client.get_collections()
             logger.info(f"Connected to Qdrant. Collections: {len(collections.collections)}")
             
-            # Create collection if it doesn't exist
+            # Create collections if they don't exist
             await self._ensure_collection_exists()
+            await self._ensure_claim_collection_exists()
             self._initialized = True
             
         except Exception as e:
@@ -61,81 +198,241 @@ class VectorStore:
             if self.collection_name not in collection_names:
                 await self.client.create_collection(
                     collection_name=self.collection_name,
-                    vectors_config=VectorParams(
-                        size=self.embedding_dimension,
-                        distance=Distance.COSINE
-                    ),
-                    optimizers_config=rest.OptimizersConfigDiff(
-                        default_segment_number=2,
-                        max_segment_size=None,
-                        memmap_threshold=None,
-                    ),
-                    hnsw_config=rest.HnswConfigDiff(
-                        m=16,
-                        ef_construct=200,
-                        full_scan_threshold=10000,
-                    )
+                    vectors_config=self.profile.vectors_config(self.embedding_dimension),
+                    optimizers_config=self.profile.optimizers_config(),
+                    hnsw_config=self.profile.hnsw_config(),
+                    quantization_config=self.profile.quantization_config(),
                 )
-                logger.info(f"Created collection: {self.collection_name}")
+                logger.info(f"Created collection: {self.collection_name} (profile: {self.profile.name})")
             else:
                 logger.info(f"Collection {self.collection_name} already exists")
-                
+                # Existing collections are migrated explicitly (scripts/migrate_qdrant_profile.py)
+                changes = await self.collection_profile_changes()
+                if changes:
+                    logger.warning(
+                        f"Collection {self.collection_name} differs from profile '{self.profile.name}': "
+                        f"{', '.join(changes)}"
+                    )
+
+            await self._ensure_evidence_indexes()
+
         except Exception as e:
             logger.error(f"Error ensuring collection exists: {e}")
             raise
+
+    async def _ensure_evidence_indexes(self):
+        """Create missing payload indexes (also upgrades collections created before they existed)"""
+        try:
+            info = await self.client.get_collection(self.collection_name)
+            existing = set((info.payload_schema or {}).keys())
+            for field_name, schema in EVIDENCE_PAYLOAD_INDEXES.items():
+                if field_name not in existing:
+                    await self.client.create_payload_index(
+                        collection_name=self.collection_name,
+                        field_name=field_name,
+                        field_schema=schema,
+                    )
+                    logger.info(f"Created payload index {self.collection_name}.{field_name}")
+        except Exception as e:
+            logger.warning(f"Could not ensure evidence payload indexes: {e}")
     
-    async def store_evidence_embeddings(self, evidence_data: List[Dict[str, Any]]) -> List[str]:
-        """Store evidence snippets with their embeddings"""
+    async def _ensure_claim_collection_exists(self):
+        """Create the claim-verdict cache collection if it doesn't exist"""
+        try:
+            collections = await self.client.get_collections()
+            collection_names = [col.name for col in collections.collections]
+
+            if self.claim_collection_name not in collection_names:
+                await self.client.create_collection(
+                    collection_name=self.claim_collection_name,
+                    vectors_config=VectorParams(
+                        size=self.embedding_dimension,
+                        distance=Distance.COSINE
+                    ),
+                )
+                # Freshness window is applied as a range filter on every lookup
+                await self.client.create_payload_index(
+                    collection_name=self.claim_collection_name,
+                    field_name="cached_at_ts",
+                    field_schema=rest.PayloadSchemaType.FLOAT,
+                )
+                logger.info(f"Created collection: {self.claim_collection_name}")
+
+        except Exception as e:
+            logger.error(f"Error ensuring claim collection exists: {e}")
+            raise
+
+    async def store_evidence_embeddings(
+        self,
+        evidence_data: List[Dict[str, Any]],
+        embed_texts: Optional[Callable[[List[str]], Awaitable[List[Any]]]] = None
+    ) -> List[str]:
+        """
+        Store evidence snippets with their embeddings.
+
+        Point IDs are content-addressed (evidence_point_id), so a snippet
+        already in the collection is not re-inserted: its claim_id/check_id
+        reference lists and last_seen_ts are updated instead, under a per-point
+        Redis lock so concurrent workers never overwrite each other's
+        references. Items may omit "embedding" when embed_texts is given;
+        only snippets new to the collection are then embedded.
+
+        Returns:
+            Point ID for each stored item (in input order)
+        """
         await self.initialize()
-        
-        points = []
-        point_ids = []
-        
+
+        # Collapse duplicates within the batch (same snippet for several claims)
+        entries: Dict[str, Dict[str, Any]] = {}
+        item_ids = []
         for evidence in evidence_data:
-            point_id = str(uuid.uuid4())
-            point_ids.append(point_id)
-            
-            # Prepare metadata
-            payload = {
-                "text": evidence.get("text", ""),
-                "source": evidence.get("source", ""),
-                "url": evidence.get("url", ""),
-                "title": evidence.get("title", ""),
-                "published_date": evidence.get("published_date"),
-                "relevance_score": evidence.get("relevance_score", 0.0),
-                "claim_id": evidence.get("claim_id"),
-                "check_id": evidence.get("check_id"),
-                "created_at": evidence.get("created_at"),
-            }
-            
-            # Remove None values
-            payload = {k: v for k, v in payload.items() if v is not None}
-            
-            point = PointStruct(
-                id=point_id,
-                vector=evidence["embedding"].tolist() if isinstance(evidence["embedding"], np.ndarray) 
-                       else evidence["embedding"],
-                payload=payload
-            )
-            points.append(point)
-        
+            point_id = evidence_point_id(evidence.get("url", ""), evidence.get("text", ""))
+            item_ids.append(point_id)
+            entry = entries.setdefault(point_id, {"evidence": evidence, "claim_ids": [], "check_ids": []})
+            if evidence.get("claim_id") and evidence["claim_id"] not in entry["claim_ids"]:
+                entry["claim_ids"].append(evidence["claim_id"])
+            if evidence.get("check_id") and evidence["check_id"] not in entry["check_ids"]:
+                entry["check_ids"].append(evidence["check_id"])
+            if entry["evidence"].get("embedding") is None and evidence.get("embedding") is not None:
+                entry["evidence"] = evidence
+
+        point_ids = list(entries)
+        max_refs = settings.EVIDENCE_VECTOR_MAX_REFERENCES
+
         try:
-            # Store in batches
-            for i in range(0, len(points), self.batch_size):
-                batch = points[i:i + self.batch_size]
-                result = await self.client.upsert(
-                    collection_name=self.collection_name,
-                    points=batch
-                )
-                logger.debug(f"Stored batch {i//self.batch_size + 1}: {result}")
-            
-            logger.info(f"Stored {len(points)} evidence embeddings")
-            return point_ids
-            
+            # Embed only snippets that are new to the collection (outside the lock)
+            known = await self._retrieve_reference_payloads(point_ids)
+            unembedded = [
+                pid for pid in point_ids
+                if pid not in known and entries[pid]["evidence"].get("embedding") is None
+            ]
+            vectors = {}
+            if unembedded and embed_texts:
+                embedded = await embed_texts([entries[pid]["evidence"].get("text", "") for pid in unembedded])
+                vectors = dict(zip(unembedded, embedded))
+
+            async with self._point_locks(point_ids):
+                # Re-read under the lock: another worker may have stored or updated these points
+                existing = await self._retrieve_reference_payloads(point_ids)
+                now = time.time()
+
+                points = []
+                for pid in point_ids:
+                    if pid in existing:
+                        continue
+                    entry = entries[pid]
+                    evidence = entry["evidence"]
+                    vector = evidence.get("embedding")
+                    if vector is None:
+                        vector = vectors.get(pid)
+                    if vector is None:
+                        continue
+
+                    payload = {field: evidence.get(field) for field in EVIDENCE_PAYLOAD_FIELDS}
+                    payload.setdefault("relevance_score", 0.0)
+                    payload.update({
+                        "claim_id": entry["claim_ids"][-max_refs:],
+                        "check_id": entry["check_ids"][-max_refs:],
+                        "first_seen_ts": now,
+                        "last_seen_ts": now,
+                        "seen_count": 1,
+                    })
+                    # Remove None values
+                    payload = {k: v for k, v in payload.items() if v is not None}
+
+                    points.append(PointStruct(
+                        id=pid,
+                        vector=vector.tolist() if isinstance(vector, np.ndarray) else vector,
+                        payload=payload
+                    ))
+
+                # Store in batches
+                for i in range(0, len(points), self.batch_size):
+                    batch = points[i:i + self.batch_size]
+                    result = await self.client.upsert(
+                        collection_name=self.collection_name,
+                        points=batch
+                    )
+                    logger.debug(f"Stored batch {i//self.batch_size + 1}: {result}")
+
+                # Known snippets: merge references, leave the vector (and HNSW graph) untouched
+                updates = [
+                    rest.SetPayloadOperation(set_payload=rest.SetPayload(
+                        payload={
+                            "claim_id": _merge_references(payload.get("claim_id"), entries[pid]["claim_ids"], max_refs),
+                            "check_id": _merge_references(payload.get("check_id"), entries[pid]["check_ids"], max_refs),
+                            "last_seen_ts": now,
+                            "seen_count": int(payload.get("seen_count", 1)) + 1,
+                        },
+                        points=[pid],
+                    ))
+                    for pid, payload in existing.items()
+                ]
+                if updates:
+                    await self.client.batch_update_points(
+                        collection_name=self.collection_name,
+                        update_operations=updates
+                    )
+
+            logger.info(f"Stored {len(points)} new evidence embeddings, refreshed {len(updates)} existing")
+            stored = {point.id for point in points} | set(existing)
+            return [pid for pid in item_ids if pid in stored]
+
         except Exception as e:
             logger.error(f"Error storing evidence embeddings: {e}")
             return []
-    
+
+    async def _retrieve_reference_payloads(self, point_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Reference fields of the points that already exist, by point ID"""
+        return {
+            str(point.id): point.payload or {}
+            for point in await self.client.retrieve(
+                collection_name=self.collection_name,
+                ids=point_ids,
+                with_payload=["claim_id", "check_id", "seen_count"],
+                with_vectors=False
+            )
+        }
+
+    @asynccontextmanager
+    async def _point_locks(self, point_ids: List[str]):
+        """
+        Hold a Redis lock per point while its references are read and rewritten.
+
+        Without it, two workers storing the same snippet both read the old
+        reference lists and the later write drops the other's claim/check ids.
+        Locks are taken in sorted order, so overlapping batches cannot deadlock.
+        If Redis is unavailable, or a lock is still held after
+        EVIDENCE_VECTOR_LOCK_WAIT_SECONDS, the merge goes ahead unlocked.
+        """
+        client = self._lock_redis or aioredis.from_url(
+            settings.REDIS_URL, decode_responses=True, socket_connect_timeout=0.5, socket_timeout=0.5
+        )
+        token = uuid.uuid4().hex
+        held = []
+        try:
+            try:
+                wait_until = time.monotonic() + settings.EVIDENCE_VECTOR_LOCK_WAIT_SECONDS
+                lock_ms = int(settings.EVIDENCE_VECTOR_LOCK_SECONDS * 1000)
+                for pid in sorted(point_ids):
+                    key = f"{EVIDENCE_LOCK_PREFIX}{pid}"
+                    while not await client.set(key, token, nx=True, px=lock_ms):
+                        if time.monotonic() >= wait_until:
+                            raise TimeoutError(f"point {pid} still locked")
+                        await asyncio.sleep(0.05)
+                    held.append(key)
+            except Exception as e:
+                logger.warning(f"Evidence reference locks unavailable, merging unlocked: {e}")
+            yield
+        finally:
+            try:
+                if held:
+                    await client.eval(RELEASE_LOCKS_SCRIPT, len(held), *held, token)
+                if client is not self._lock_redis:
+                    await client.close()
+            except Exception as e:
+                logger.warning(f"Failed to release evidence reference locks: {e}")
+
     async def search_similar_evidence(self, 
                                     query_embedding: np.ndarray,
                                     limit: int = 10,
@@ -157,7 +454,7 @@ class VectorStore:
                         conditions.append(
                             FieldCondition(
                                 key=key,
-                                match=Match(value=value)
+                                match=MatchValue(value=value)
                             )
                         )
                 if conditions:
@@ -168,6 +465,7 @@ class VectorStore:
                 collection_name=self.collection_name,
                 query_vector=query_vector,
                 query_filter=qdrant_filter,
+                search_params=self.profile.search_params(settings.QDRANT_SEARCH_HNSW_EF),
                 limit=limit,
                 score_threshold=score_threshold,
                 with_payload=True,
@@ -210,6 +508,57 @@ class VectorStore:
             filters=filters
         )
     
+    async def upsert_claim_verdict(self,
+                                   point_id: str,
+                                   claim_embedding: np.ndarray,
+                                   payload: Dict[str, Any]) -> bool:
+        """Store (or overwrite) a judged claim in the claim-verdict cache"""
+        await self.initialize()
+
+        try:
+            vector = claim_embedding.tolist() if isinstance(claim_embedding, np.ndarray) else claim_embedding
+            await self.client.upsert(
+                collection_name=self.claim_collection_name,
+                points=[PointStruct(id=point_id, vector=vector, payload=payload)]
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Error storing claim verdict: {e}")
+            return False
+
+    async def search_claim_verdicts(self,
+                                    claim_embedding: np.ndarray,
+                                    score_threshold: float,
+                                    min_cached_at_ts: float,
+                                    limit: int = 3) -> List[Dict[str, Any]]:
+        """Find previously judged claims that are near-duplicates of this one"""
+        await self.initialize()
+
+        try:
+            query_vector = claim_embedding.tolist() if isinstance(claim_embedding, np.ndarray) else claim_embedding
+
+            search_result = await self.client.search(
+                collection_name=self.claim_collection_name,
+                query_vector=query_vector,
+                query_filter=Filter(
+                    must=[FieldCondition(key="cached_at_ts", range=Range(gte=min_cached_at_ts))]
+                ),
+                limit=limit,
+                score_threshold=score_threshold,
+                with_payload=True,
+                with_vectors=False
+            )
+
+            return [
+                {"id": point.id, "score": point.score, **point.payload}
+                for point in search_result
+            ]
+
+        except Exception as e:
+            logger.error(f"Error searching claim verdicts: {e}")
+            return []
+
     async def get_evidence_by_ids(self, evidence_ids: List[str]) -> List[Dict[str, Any]]:
         """Retrieve evidence by IDs"""
         await self.initialize()
@@ -237,31 +586,147 @@ class VectorStore:
             return []
     
     async def delete_evidence_for_check(self, check_id: str) -> bool:
-        """Delete all evidence for a specific check"""
+        """
+        Remove a check's references from the evidence collection.
+
+        Points referenced only by this check are deleted; points shared with
+        other checks just lose the reference.
+        """
         await self.initialize()
-        
+
         try:
-            result = await self.client.delete(
-                collection_name=self.collection_name,
-                points_selector=rest.FilterSelector(
-                    filter=Filter(
-                        must=[
-                            FieldCondition(
-                                key="check_id",
-                                match=Match(value=check_id)
-                            )
-                        ]
-                    )
+            check_filter = Filter(must=[FieldCondition(key="check_id", match=MatchValue(value=check_id))])
+            shared = []
+            offset = None
+            while True:
+                points, offset = await self.client.scroll(
+                    collection_name=self.collection_name,
+                    scroll_filter=check_filter,
+                    limit=256,
+                    offset=offset,
+                    with_payload=["check_id"],
+                    with_vectors=False
                 )
+                for point in points:
+                    refs = _merge_references((point.payload or {}).get("check_id"), [], settings.EVIDENCE_VECTOR_MAX_REFERENCES)
+                    remaining = [ref for ref in refs if ref != check_id]
+                    if remaining:
+                        shared.append(rest.SetPayloadOperation(set_payload=rest.SetPayload(
+                            payload={"check_id": remaining}, points=[point.id]
+                        )))
+                if offset is None:
+                    break
+
+            if shared:
+                await self.client.batch_update_points(
+                    collection_name=self.collection_name,
+                    update_operations=shared
+                )
+            # Shared points no longer match the filter
+            await self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=rest.FilterSelector(filter=check_filter)
             )
-            
-            logger.info(f"Deleted evidence for check {check_id}")
+
+            logger.info(f"Deleted evidence for check {check_id} ({len(shared)} shared points kept)")
             return True
             
         except Exception as e:
             logger.error(f"Error deleting evidence for check {check_id}: {e}")
             return False
+
+    async def compact_evidence(self, retention_days: Optional[int] = None) -> int:
+        """
+        Delete evidence points not seen within the retention window.
+
+        Points stored before content addressing (no last_seen_ts) are
+        removed too; their snippets are re-inserted under stable IDs the
+        next time they are retrieved. Qdrant's vacuum optimizer reclaims the
+        space once enough points in a segment are deleted.
+
+        Returns:
+            Number of points deleted
+        """
+        await self.initialize()
+
+        days = settings.EVIDENCE_VECTOR_RETENTION_DAYS if retention_days is None else retention_days
+        cutoff = time.time() - days * 86400
+        expired = Filter(should=[
+            FieldCondition(key="last_seen_ts", range=Range(lt=cutoff)),
+            IsEmptyCondition(is_empty=PayloadField(key="last_seen_ts")),
+        ])
+
+        try:
+            count = await self.client.count(
+                collection_name=self.collection_name,
+                count_filter=expired,
+                exact=True
+            )
+            if count.count:
+                await self.client.delete(
+                    collection_name=self.collection_name,
+                    points_selector=rest.FilterSelector(filter=expired)
+                )
+            logger.info(f"Evidence compaction removed {count.count} points older than {days} days")
+            return count.count
+
+        except Exception as e:
+            logger.error(f"Error compacting evidence collection: {e}")
+            return 0
     
+    async def collection_profile_changes(self, profile: Optional[CollectionProfile] = None) -> List[str]:
+        """Settings of the evidence collection that differ from the profile (empty when in line)"""
+        profile = profile or self.profile
+        info = await self.client.get_collection(self.collection_name)
+        config = info.config
+        vectors = config.params.vectors
+        quantization = config.quantization_config
+        current = {
+            "vectors_on_disk": bool(getattr(vectors, "on_disk", False)),
+            "hnsw_on_disk": bool(config.hnsw_config.on_disk),
+            "memmap_threshold_kb": config.optimizer_config.memmap_threshold,
+            "quantization": quantization is not None,
+        }
+        target = {
+            "vectors_on_disk": profile.vectors_on_disk,
+            "hnsw_on_disk": profile.hnsw_on_disk,
+            "memmap_threshold_kb": profile.memmap_threshold_kb,
+            "quantization": profile.quantization,
+        }
+        if quantization is not None and profile.quantization:
+            scalar = getattr(quantization, "scalar", None)
+            current["quantized_in_ram"] = bool(getattr(scalar, "always_ram", False))
+            target["quantized_in_ram"] = profile.quantized_in_ram
+        return [f"{key}: {current[key]} -> {target[key]}" for key in target if current[key] != target[key]]
+
+    async def apply_collection_profile(self, profile: Optional[CollectionProfile] = None,
+                                       dry_run: bool = False) -> List[str]:
+        """
+        Migrate the existing evidence collection to a profile in place.
+
+        Qdrant rebuilds segments in the background (collection status yellow
+        until done); searches keep working meanwhile.
+
+        Returns:
+            The changes that were (or, with dry_run, would be) applied
+        """
+        await self.initialize()
+        profile = profile or self.profile
+        changes = await self.collection_profile_changes(profile)
+        if not changes or dry_run:
+            return changes
+
+        await self.client.update_collection(
+            collection_name=self.collection_name,
+            vectors_config={"": rest.VectorParamsDiff(on_disk=profile.vectors_on_disk)},
+            optimizers_config=profile.optimizers_config(),
+            hnsw_config=rest.HnswConfigDiff(on_disk=profile.hnsw_on_disk),
+            quantization_config=profile.quantization_config() or rest.Disabled.DISABLED,
+        )
+        self.profile = profile
+        logger.info(f"Applied profile '{profile.name}' to {self.collection_name}: {', '.join(changes)}")
+        return changes
+
     async def get_collection_info(self) -> Dict[str, Any]:
         """Get information about the evidence collection"""
         await self.initialize()
@@ -275,6 +740,7 @@ class VectorStore:
                 "points_count": info.points_count,
                 "segments_count": info.segments_count,
                 "status": info.status,
+                "profile": self.profile.name,
             }
             
         except Exception as e:
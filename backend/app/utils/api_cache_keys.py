@@ -0,0 +1,135 @@
+"""
+API Cache Key Normalisation
+
+Government API responses are cached per adapter under a key built from the
+claim, not the raw claim text, so rephrasings of the same lookup share a cache
+entry:
+
+    "Unemployment in the UK rose to 4.2% in 2024"   } uk|2024 4.2% ris uk unemployment
+    "UK unemployment rises to 4.2% (2024)"          }
+
+The default key (GovernmentAPIClient.cache_key) is the jurisdiction plus the
+sorted set of lemmatised keywords and labelled entities. Adapters whose
+results depend on one resolved identifier (ticker, location, species) override
+cache_key to key on that identifier instead.
+
+Lemmatisation is rule-based (plural and verb-ending folding) rather than spaCy,
+so every worker derives identical keys for the shared Redis cache whether or
+not a model is loaded.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+STOPWORDS = frozenset({
+    "a", "about", "above", "after", "again", "against", "all", "also", "am", "an", "and", "any",
+    "are", "as", "at", "be", "been", "before", "being", "below", "between", "both", "but", "by",
+    "can", "could", "did", "do", "does", "doing", "down", "during", "each", "few", "for", "from",
+    "further", "had", "has", "have", "having", "he", "her", "here", "hers", "him", "his", "how",
+    "i", "if", "in", "into", "is", "it", "its", "itself", "just", "me", "more", "most", "my",
+    "now", "of", "off", "on", "once", "only", "or", "other", "our", "ours", "out", "over", "own",
+    "said", "same", "says", "she", "should", "so", "some", "such", "than", "that", "the", "their",
+    "theirs", "them", "then", "there", "these", "they", "this", "those", "through", "to", "too",
+    "under", "until", "up", "very", "was", "we", "were", "what", "when", "where", "which",
+    "while", "who", "whom", "why", "will", "with", "would", "you", "your", "yours",
+})
+
+# Protected from suffix stripping (would otherwise fold into another word)
+INVARIANT_WORDS = frozenset({
+    "news", "series", "species", "analysis", "crisis", "basis", "status", "census", "virus",
+    "bus", "gas", "us", "uk", "gdp", "covid", "during", "king", "thing", "bring", "spring",
+})
+
+# Irregular past tenses common in statistical claims, and short verbs whose
+# inflections the suffix rules cannot fold (goes -> goe, ties -> ty)
+IRREGULAR_FORMS = {
+    "rose": "rise", "risen": "rise", "fell": "fall", "fallen": "fall", "grew": "grow", "grown": "grow",
+    "won": "win", "lost": "lose", "paid": "pay", "spent": "spend", "left": "leave", "held": "hold",
+    "beat": "beat", "began": "begin", "begun": "begin", "sold": "sell", "bought": "buy", "made": "make",
+    "goes": "go", "going": "go", "went": "go", "gone": "go",
+    "does": "do", "doing": "do", "did": "do", "done": "do",
+    "ties": "tie", "tied": "tie", "tying": "tie", "lies": "lie", "lied": "lie", "lying": "lie",
+    "dies": "die", "died": "die", "dying": "die",
+}
+
+VOWELS = "aeiou"
+
+TOKEN_PATTERN = re.compile(r"\d[\d,.]*%?|[a-z][a-z'\-]*")
+
+
+def lemmatize(word: str) -> str:
+    """
+    Fold inflections to a shared stem: rise, rises, rising -> ris; countries -> country.
+
+    A trailing "e" is dropped from stems longer than three letters whichever
+    suffix was removed (rate, rates, rated, rating -> rat); three-letter stems
+    keep it (use, uses, used, using -> use). Stems need not be dictionary
+    words; they only have to agree across phrasings.
+    """
+    if word.endswith("'s"):
+        word = word[:-2]
+    word = IRREGULAR_FORMS.get(word.strip("'-"), word.strip("'-"))
+    if len(word) <= 3 or word in INVARIANT_WORDS:
+        return word
+
+    if word.endswith(("ies", "ied")) and len(word) > 4:
+        return word[:-3] + "y"
+    for suffix in ("ing", "ed", "es", "s"):
+        if not word.endswith(suffix):
+            continue
+        stem = word[:-len(suffix)]
+        if suffix == "s" and word.endswith(("ss", "us", "is")):
+            break
+        if len(stem) == 2 and suffix != "s":
+            # Vowel-consonant stems lost an "e": used -> use, ages -> age (but need, shed stay)
+            if stem[0] in VOWELS and stem[1] not in VOWELS:
+                return stem + "e"
+            continue
+        if len(stem) < 3:
+            continue
+        word = stem
+        if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "lsfz":
+            word = word[:-1]  # stopped -> stop
+        break
+    return word[:-1] if word.endswith("e") and len(word) > 3 else word
+
+
+def query_keywords(text: str) -> List[str]:
+    """Sorted, de-duplicated lemmatised keywords of text (stopwords and punctuation dropped)"""
+    keywords = set()
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        token = token.rstrip(".,")
+        if not token or token in STOPWORDS:
+            continue
+        if token[0].isdigit():
+            keywords.add(token.replace(",", ""))
+        else:
+            lemma = lemmatize(token)
+            if lemma and lemma not in STOPWORDS:
+                keywords.add(lemma)
+    return sorted(keywords)
+
+
+def entity_ids(entities: Optional[List[Dict[str, str]]]) -> List[str]:
+    """Order-independent "LABEL:text" identifiers for labelled entities"""
+    ids = set()
+    for entity in entities or []:
+        if not isinstance(entity, dict) or not entity.get("text"):
+            continue
+        text = " ".join(query_keywords(entity["text"]))
+        if text:
+            ids.add(f"{entity.get('label', 'ENTITY')}:{text}")
+    return sorted(ids)
+
+
+def keyword_cache_key(
+    query: str,
+    jurisdiction: str,
+    entities: Optional[List[Dict[str, str]]] = None
+) -> str:
+    """Default adapter cache key: jurisdiction, lemmatised keywords and entity IDs"""
+    key = f"{(jurisdiction or 'Global').lower()}|{' '.join(query_keywords(query))}"
+    ids = entity_ids(entities)
+    if ids:
+        key += f"|{','.join(ids)}"
+    return key
@@ -20,6 +20,7 @@ from typing import List, Optional, Dict, Any
 from datetime import timedelta
 
 from app.core.config import settings
+from app.core.http_transport import build_transport
 
 logger = logging.getLogger(__name__)
 
@@ -414,10 +415,15 @@ async def _classify_with_llm(
     - Output: ~100 tokens (JSON response with context fields)
     """
     try:
+        import httpx
         import openai
         from datetime import datetime
 
-        client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        transport = build_transport()
+        client = openai.AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(transport=transport) if transport else None
+        )
 
         # Get current date for temporal context
         now = datetime.now()
@@ -531,7 +537,7 @@ async def _classify_with_fallback_llm(
 
         full_prompt = f"You are a Tru8 fact-checking specialist. Always respond with valid JSON only, no markdown.\n\n{prompt}"
 
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with httpx.AsyncClient(timeout=30, transport=build_transport()) as client:
             response = await client.post(
                 f"https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={google_ai_key}",
                 headers={"Content-Type": "application/json"},
@@ -14,10 +14,10 @@ Date: 2025-01-17
 """
 
 import re
-import spacy
 from typing import Dict, List, Optional
 import logging
 from datetime import datetime
+from app.services.nlp import get_nlp_service
 
 logger = logging.getLogger(__name__)
 
@@ -29,14 +29,13 @@ class QueryFormulator:
     """
 
     def __init__(self):
-        """Initialize QueryFormulator with spaCy model."""
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
+        """Initialize QueryFormulator with the shared spaCy service (model loaded once per process)."""
+        self.nlp_service = get_nlp_service()
+        self.nlp = self.nlp_service.load()
+        if self.nlp:
             logger.info("QueryFormulator initialized with spaCy model")
-        except Exception as e:
-            logger.error(f"Failed to load spaCy model: {e}")
+        else:
             logger.warning("Query formulation will use fallback mode")
-            self.nlp = None
 
     def formulate_query(
         self,
@@ -76,8 +75,8 @@ class QueryFormulator:
             if not self.nlp:
                 return self._fallback_query(claim, key_entities, temporal_analysis, article_title, article_date)
 
-            # Parse claim with spaCy
-            doc = self.nlp(claim)
+            # Parse claim with spaCy (cached if batch-parsed by the retriever)
+            doc = self.nlp_service.get_doc(claim)
 
             # Extract core query terms (entities + important nouns/verbs)
             query_terms = self._extract_query_terms(doc, key_entities)
@@ -303,7 +302,7 @@ class QueryFormulator:
             # Phase 2.2: Extract entities from article title
             if article_title and self.nlp:
                 # Parse article title with spaCy
-                title_doc = self.nlp(article_title)
+                title_doc = self.nlp_service.get_doc(article_title)
 
                 # Extract named entities from title
                 title_entities = [
@@ -18,6 +18,8 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 import httpx
 from app.core.config import settings
+from app.core.metrics import llm_post
+from app.core.http_transport import build_transport
 
 logger = logging.getLogger(__name__)
 
@@ -219,8 +221,10 @@ Generate query plans for each of these {len(claims)} claims:
 For EACH claim, provide: queries, freshness (pd/pw/pm/py), source_hints, and reasoning.
 Return a JSON object with "plans" array containing exactly {len(claims)} plan objects."""
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
+            async with httpx.AsyncClient(timeout=self.timeout, transport=build_transport()) as client:
+                response = await llm_post(
+                    client,
+                    "query_planner",
                     "https://api.openai.com/v1/chat/completions",
                     headers={
                         "Authorization": f"Bearer {self.openai_api_key}",
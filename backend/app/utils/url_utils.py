@@ -1,6 +1,6 @@
 """URL utility functions for domain extraction and normalization."""
 
-from urllib.parse import urlparse
+from urllib.parse import parse_qsl, urlencode, urlparse
 import logging
 from typing import Optional
 
@@ -49,3 +49,45 @@ def extract_domain(url: str, fallback: str = "") -> str:
     except Exception as e:
         logger.warning(f"Failed to extract domain from URL '{url}': {e}")
         return fallback
+
+
+# Query parameters that only track the referrer/campaign (compared lower-case)
+TRACKING_PARAM_PREFIXES = ("utm_",)
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "cmpid", "ocid", "at_medium", "at_campaign"}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for identity comparisons.
+
+    Lower-cases the host, drops the scheme, "www.", default ports, fragments,
+    tracking parameters and trailing slashes, and sorts the remaining query
+    parameters, so the same page shared with different tracking links maps
+    to one key.
+
+    Examples:
+        >>> normalize_url("https://www.BBC.co.uk/news/article/?utm_source=x&b=2&a=1#top")
+        "bbc.co.uk/news/article?a=1&b=2"
+    """
+    if not url:
+        return ""
+
+    try:
+        parsed = urlparse(url.strip())
+        host = (parsed.hostname or "").lower()
+        if host.startswith("www."):
+            host = host[4:]
+        if parsed.port and parsed.port not in (80, 443):
+            host = f"{host}:{parsed.port}"
+
+        params = sorted(
+            (name, value) for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if name.lower() not in TRACKING_PARAMS and not name.lower().startswith(TRACKING_PARAM_PREFIXES)
+        )
+        path = parsed.path.rstrip("/")
+        query = f"?{urlencode(params)}" if params else ""
+        return f"{host}{path}{query}" if host else url.strip()
+
+    except Exception as e:
+        logger.warning(f"Failed to normalize URL '{url}': {e}")
+        return url.strip()
@@ -1,7 +1,8 @@
 from celery import Celery
-from celery.signals import worker_ready, setup_logging as celery_setup_logging
+from celery.signals import worker_init, worker_ready, worker_process_shutdown, setup_logging as celery_setup_logging
 from app.core.config import settings
 from app.core.logging import setup_logging
+from app.core.tracing import setup_tracing, instrument_celery
 import logging
 import asyncio
 import time
@@ -21,11 +22,21 @@ def configure_celery_logging(**kwargs):
     setup_logging()
     logger.info("[WORKER] Celery logging configured")
 
+# Trace context travels in message headers (publisher side in the API, consumer side here)
+instrument_celery()
+
+
+@worker_init.connect
+def init_worker_tracing(**kwargs):
+    """Install the tracer provider before the pool forks (children inherit it)"""
+    setup_tracing("tru8-worker")
+
+
 celery_app = Celery(
     "tru8",
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
-    include=["app.workers.pipeline"]
+    include=["app.workers.pipeline", "app.workers.stages", "app.workers.notifications", "app.workers.maintenance", "app.workers.payments"]
 )
 
 celery_app.conf.update(
@@ -57,10 +68,37 @@ celery_app.conf.update(
     # Ensure tasks are acknowledged immediately when received
     task_acks_late=False,
     task_reject_on_worker_lost=True,
+    # Notification delivery runs on its own queue so slow Expo/Resend calls
+    # never occupy pipeline worker slots; Stripe webhook events likewise
+    # Staged pipeline (ENABLE_STAGED_PIPELINE): network-bound stages on the I/O
+    # queue, NLI on the CPU queue. process_check stays on the default queue.
+    task_routes={
+        "app.workers.notifications.*": {"queue": settings.NOTIFICATION_QUEUE},
+        "app.workers.payments.*": {"queue": settings.STRIPE_EVENT_QUEUE},
+        "app.workers.stages.ingest_extract": {"queue": settings.PIPELINE_IO_QUEUE},
+        "app.workers.stages.retrieve": {"queue": settings.PIPELINE_IO_QUEUE},
+        "app.workers.stages.judge": {"queue": settings.PIPELINE_IO_QUEUE},
+        "app.workers.stages.verify": {"queue": settings.PIPELINE_CPU_QUEUE},
+    },
+    # Periodic maintenance (requires `celery -A app.workers beat`)
+    beat_schedule={
+        "compact-evidence-vectors": {
+            "task": "app.workers.maintenance.compact_evidence_vectors",
+            "schedule": settings.EVIDENCE_VECTOR_COMPACTION_INTERVAL_HOURS * 3600,
+        },
+        "refresh-reference-data": {
+            "task": "app.workers.maintenance.refresh_reference_data",
+            "schedule": settings.REFERENCE_DATA_REFRESH_INTERVAL_SECONDS,
+        },
+        "sweep-notification-outbox": {
+            "task": "app.workers.notifications.sweep_notifications",
+            "schedule": settings.NOTIFICATION_SWEEP_INTERVAL_SECONDS,
+        },
+    },
 )
 
 
-def warmup_ml_models():
+def warmup_ml_models(load_nli: bool = True):
     """
     Preload ML models to avoid cold-start failures on first claim.
 
@@ -75,13 +113,14 @@ def warmup_ml_models():
 
     async def _warmup():
         # Warmup NLI model (DeBERTa for natural language inference)
-        try:
-            from app.pipeline.verify import get_claim_verifier
-            verifier = await get_claim_verifier()
-            await verifier.nli_verifier.initialize()
-            logger.info("[WORKER] NLI model loaded successfully")
-        except Exception as e:
-            logger.error(f"[WORKER] NLI model warmup failed: {e}")
+        if load_nli:
+            try:
+                from app.pipeline.verify import get_claim_verifier
+                verifier = await get_claim_verifier()
+                await verifier.nli_verifier.initialize()
+                logger.info("[WORKER] NLI model loaded successfully")
+            except Exception as e:
+                logger.error(f"[WORKER] NLI model warmup failed: {e}")
 
         # Warmup embedding model (MiniLM for semantic similarity)
         try:
@@ -93,6 +132,15 @@ def warmup_ml_models():
         except Exception as e:
             logger.error(f"[WORKER] Embedding model warmup failed: {e}")
 
+        # Warmup shared spaCy pipeline (query formulation)
+        if settings.ENABLE_QUERY_EXPANSION:
+            try:
+                from app.services.nlp import get_nlp_service
+                if get_nlp_service().available:
+                    logger.info("[WORKER] spaCy model loaded successfully")
+            except Exception as e:
+                logger.error(f"[WORKER] spaCy model warmup failed: {e}")
+
     try:
         asyncio.run(_warmup())
         elapsed = time.time() - start_time
@@ -101,6 +149,14 @@ def warmup_ml_models():
         logger.error(f"[WORKER] ML model warmup failed: {e}")
 
 
+def _consumed_queues(consumer) -> set:
+    """Names of the queues this worker consumes (empty if unknown)"""
+    try:
+        return {queue.name for queue in consumer.task_consumer.queues}
+    except Exception:
+        return set()
+
+
 @worker_ready.connect
 def initialize_worker(**kwargs):
     """
@@ -111,6 +167,16 @@ def initialize_worker(**kwargs):
     """
     logger.info("Celery worker starting - initializing components...")
 
+    # Prometheus exporter (pipeline stage, provider, LLM and inference metrics)
+    from app.core.metrics import start_worker_metrics_server
+    start_worker_metrics_server(settings.WORKER_METRICS_PORT)
+
+    # Notification and payment workers need neither adapters nor ML models
+    queues = _consumed_queues(kwargs.get("sender"))
+    if queues and queues <= {settings.NOTIFICATION_QUEUE, settings.STRIPE_EVENT_QUEUE}:
+        logger.info(f"[WORKER] Notification/payments worker ({', '.join(sorted(queues))}) - skipping pipeline warmup")
+        return
+
     # Initialize API adapters
     if settings.ENABLE_API_RETRIEVAL:
         from app.services.api_adapters import initialize_adapters
@@ -124,5 +190,15 @@ def initialize_worker(**kwargs):
     from app.services.search import warmup_search_providers
     warmup_search_providers()
 
-    # Warmup ML models (NLI + embeddings) to prevent cold-start failures
-    warmup_ml_models()
\ No newline at end of file
+    # Warmup ML models (NLI + embeddings) to prevent cold-start failures.
+    # Staged I/O workers never run verification, so they skip the NLI model.
+    io_only = bool(queues) and queues <= {settings.PIPELINE_IO_QUEUE, settings.NOTIFICATION_QUEUE}
+    warmup_ml_models(load_nli=not io_only)
+
+
+@worker_process_shutdown.connect
+def cleanup_worker_process_metrics(pid=None, **kwargs):
+    """Release a prefork child's metrics files (PROMETHEUS_MULTIPROC_DIR mode)"""
+    from app.core.metrics import mark_worker_process_dead
+    if pid:
+        mark_worker_process_dead(pid)
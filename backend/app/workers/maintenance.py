@@ -0,0 +1,57 @@
+"""
+Periodic maintenance tasks (scheduled by Celery beat).
+
+Run the scheduler next to the workers:
+    celery -A app.workers beat
+"""
+
+import asyncio
+import logging
+
+from app.workers import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="app.workers.maintenance.compact_evidence_vectors", ignore_result=True)
+def compact_evidence_vectors() -> int:
+    """Expire evidence vectors past EVIDENCE_VECTOR_RETENTION_DAYS"""
+    from app.services.vector_store import VectorStore
+
+    async def _compact() -> int:
+        # Own client: the pipeline's singleton is bound to another event loop
+        vector_store = VectorStore()
+        try:
+            return await vector_store.compact_evidence()
+        finally:
+            await vector_store.cleanup()
+
+    removed = asyncio.run(_compact())
+    logger.info(f"[MAINTENANCE] Removed {removed} expired evidence vectors")
+    return removed
+
+
+@celery_app.task(name="app.workers.maintenance.refresh_reference_data", ignore_result=True)
+def refresh_reference_data() -> dict:
+    """Refetch due adapter reference snapshots (league tables, catalogues)"""
+    from app.services.government_api_client import get_api_registry
+    from app.services.reference_data import get_reference_store
+
+    registry = get_api_registry()
+    if not registry.get_all_adapters():
+        from app.services.api_adapters import initialize_adapters
+        initialize_adapters()
+
+    def fetch(resource):
+        adapter = registry.get_adapter_by_name(resource.adapter)
+        if adapter is None:
+            logger.warning(f"[MAINTENANCE] No adapter {resource.adapter} for reference resource {resource.key}")
+            return None
+        return adapter.fetch_reference(resource)
+
+    stats = get_reference_store().refresh_due(fetch)
+    logger.info(
+        f"[MAINTENANCE] Reference data: {stats['refreshed']} refreshed, {stats['failed']} failed, "
+        f"{stats['dropped']} dropped, {stats['deferred']} deferred"
+    )
+    return stats
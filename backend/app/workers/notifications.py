@@ -0,0 +1,50 @@
+"""
+Notification delivery task (runs on the dedicated notifications queue).
+
+Start a lightweight worker for it alongside the pipeline worker:
+    celery -A app.workers worker -Q notifications --pool=threads --concurrency=4 -n notifications@%h
+"""
+
+import logging
+
+from app.workers import celery_app
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long a scheduled retry waits before the next run
+MAX_RESCHEDULE_SECONDS = 300
+
+
+@celery_app.task(name="app.workers.notifications.deliver_notifications", ignore_result=True)
+def deliver_notifications() -> None:
+    """Deliver due outbox notifications, then reschedule if any remain pending"""
+    from app.core.database import sync_session
+    from app.services.notification_outbox import (
+        get_notification_dispatcher,
+        schedule_notification_delivery,
+    )
+
+    dispatcher = get_notification_dispatcher()
+    with sync_session() as session:
+        dispatcher.deliver_due(session)
+        next_due = dispatcher.seconds_until_next_due(session)
+
+    if next_due is not None:
+        # At least 1s so rows locked by another delivery run don't cause a busy loop
+        schedule_notification_delivery(countdown=max(1.0, min(next_due, MAX_RESCHEDULE_SECONDS)))
+
+
+@celery_app.task(name="app.workers.notifications.sweep_notifications", ignore_result=True)
+def sweep_notifications() -> None:
+    """
+    Beat safety net: deliver pending rows whose delivery run was lost (scheduling
+    failed or a worker died). Never reschedules, so sweeps don't add delivery chains.
+    """
+    from app.core.database import sync_session
+    from app.services.notification_outbox import get_notification_dispatcher
+
+    with sync_session() as session:
+        counts = get_notification_dispatcher().sweep(session)
+
+    if counts:
+        logger.warning(f"Notification sweep delivered stranded outbox rows: {counts}")
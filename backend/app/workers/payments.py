@@ -0,0 +1,53 @@
+"""
+Stripe webhook event task (runs on the dedicated payments queue).
+
+The webhook endpoint verifies and claims an event, queues it here and
+acknowledges it. Stripe does not redeliver after a 2xx, so this task owns
+applying the event: failures retry with backoff, and after the last retry the
+claim is released so a redelivery (e.g. resent from the Stripe dashboard) is
+applied. The task is acked late, so an event whose worker dies is redelivered
+by the broker.
+
+Start a worker for it (prefork: each event runs on its own event loop, and the
+DB pool and Redis client are reset per task):
+    celery -A app.workers worker -Q payments --pool=prefork --concurrency=2 -n payments@%h
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict
+
+from app.workers import celery_app
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRIES = 5
+RETRY_BASE_DELAY_SECONDS = 30
+
+
+async def _process(event: Dict[str, Any], release_on_failure: bool) -> bool:
+    from app.api.v1 import payments
+    from app.core.database import engine
+
+    try:
+        return await payments.process_stripe_event(event, release_on_failure=release_on_failure)
+    finally:
+        # Pooled DB connections and the Redis client are bound to this task's event loop
+        await engine.dispose()
+        await payments.close_redis()
+
+
+@celery_app.task(
+    bind=True, name="app.workers.payments.process_stripe_event",
+    ignore_result=True, acks_late=True, max_retries=MAX_RETRIES,
+)
+def process_stripe_event(self, event: Dict[str, Any]) -> None:
+    """Apply a claimed Stripe event, retrying with exponential backoff on failure"""
+    final_attempt = self.request.retries >= self.max_retries
+    if asyncio.run(_process(event, release_on_failure=final_attempt)):
+        return
+
+    if final_attempt:
+        logger.error(f"Giving up on Stripe event {event.get('id')} ({event.get('type')}) after {self.max_retries} retries")
+        return
+    raise self.retry(countdown=RETRY_BASE_DELAY_SECONDS * 2 ** self.request.retries)
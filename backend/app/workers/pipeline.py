@@ -15,15 +15,27 @@ from app.pipeline.retrieve import EvidenceRetriever
 from app.pipeline.verify import get_claim_verifier
 from app.pipeline.judge import get_pipeline_judge
 from app.services.cache import get_cache_service
-from app.services.push_notifications import push_notification_service
-from app.services.email_notifications import email_notification_service
+from app.services.notification_outbox import (
+    check_failed_intents,
+    check_completed_intents,
+    schedule_notification_delivery,
+)
 from app.core.config import settings
+from app.core.tracing import traced, record_completed_span
+from app.core.http_transport import build_transport
+from app.core.metrics import (
+    PIPELINE_STAGE_SECONDS,
+    PIPELINE_CHECKS_TOTAL,
+    PIPELINE_CHECK_SECONDS,
+    llm_post,
+)
 
 logger = logging.getLogger(__name__)
 
 class PipelineTask(Task):
     def on_failure(self, exc, task_id, args, kwargs, einfo):
         logger.error(f"Task {task_id} failed: {exc}")
+        PIPELINE_CHECKS_TOTAL.labels(status="failed").inc()
         # Get check_id from kwargs since task is called with keyword arguments
         check_id = kwargs.get("check_id") if kwargs else None
         user_id = kwargs.get("user_id") if kwargs else None
@@ -39,37 +51,19 @@ class PipelineTask(Task):
             if credit_refunded:
                 error_msg = f"{error_msg}. Your credit has been returned."
 
-            # Update check status using SYNC version to avoid event loop issues in Celery
-            update_check_status_sync(check_id, "failed", error_msg)
-
-            # Send failure notification using SYNC version to avoid event loop issues
-            if user_id:
-                try:
-                    push_notification_service.send_check_failed_notification_sync(
-                        user_id=user_id,
-                        check_id=check_id,
-                        error_message=error_msg[:100]  # Truncate error message
-                    )
-                except Exception as notif_error:
-                    # Push notification failure should not crash the failure handler
-                    logger.warning(f"Failed to send push notification: {notif_error}")
-
-                # Email notification
-                try:
-                    email_notification_service.send_check_failed_email_sync(
-                        user_id=user_id,
-                        check_id=check_id,
-                        error_message=error_msg[:200]
-                    )
-                except Exception as email_error:
-                    # Email notification failure should not crash the failure handler
-                    logger.warning(f"Failed to send email notification: {email_error}")
+            # Update check status and queue failure notifications in one transaction.
+            # Delivery (Expo/Resend) happens on the notifications queue, not in this worker slot.
+            notifications = check_failed_intents(user_id, check_id, error_msg) if user_id else None
+            update_check_status_sync(check_id, "failed", error_msg, notifications=notifications)
+            if notifications:
+                schedule_notification_delivery()
 
     def on_success(self, retval, task_id, args, kwargs):
         logger.info(f"Task {task_id} completed successfully")
         # Get check_id from kwargs since task is called with keyword arguments
         check_id = kwargs.get("check_id") if kwargs else None
-        if check_id and retval.get("status") == "completed":
+        # Intermediate staged-pipeline tasks return None
+        if check_id and isinstance(retval, dict) and retval.get("status") == "completed":
             # Simply log successful completion - pipeline already completed successfully
             # The main issue was tasks not completing, which is now fixed
             logger.info(f"Task {task_id} for check {check_id} completed successfully with processing time {retval.get('processing_time_ms', 0)}ms")
@@ -102,8 +96,17 @@ async def update_check_status(check_id: str, status: str, error_message: str = N
     except Exception as e:
         logger.error(f"Failed to update check status: {e}")
 
-def update_check_status_sync(check_id: str, status: str, error_message: str = None):
-    """Update check status in database (synchronous for Celery)"""
+def update_check_status_sync(
+    check_id: str,
+    status: str,
+    error_message: str = None,
+    notifications: Optional[List[Any]] = None
+):
+    """
+    Update check status in database (synchronous for Celery).
+
+    Optional NotificationOutbox rows are committed in the same transaction.
+    """
     try:
         from app.core.database import sync_session
         from app.models import Check
@@ -121,6 +124,9 @@ def update_check_status_sync(check_id: str, status: str, error_message: str = No
                 if status == "completed":
                     check.completed_at = datetime.utcnow()
 
+                for notification in notifications or []:
+                    session.add(notification)
+
                 session.commit()
                 logger.info(f"Updated check {check_id} status to {status}")
 
@@ -179,8 +185,16 @@ def refund_check_credit_sync(check_id: str, user_id: str) -> bool:
         logger.error(f"Failed to refund credit for check {check_id}: {e}")
         return False
 
-def save_check_results_sync(check_id: str, results: Dict[str, Any]):
-    """Save pipeline results to database (synchronous for Celery)"""
+def save_check_results_sync(
+    check_id: str,
+    results: Dict[str, Any],
+    notifications: Optional[List[Any]] = None
+):
+    """
+    Save pipeline results to database (synchronous for Celery).
+
+    Optional NotificationOutbox rows are committed in the same transaction.
+    """
     try:
         from app.core.database import sync_session
         from app.models import Check, Claim, Evidence, RawEvidence
@@ -260,6 +274,8 @@ def save_check_results_sync(check_id: str, results: Dict[str, Any]):
                     confidence=claim_data.get("confidence", 0),
                     rationale=claim_data.get("rationale", ""),
                     position=claim_data.get("position", 0),
+                    # Claims copied forward keep their evidence age across re-checks
+                    evidence_retrieved_at=parse_date(claim_data.get("evidence_retrieved_at")),
                     # Context preservation fields (Context Improvement)
                     subject_context=claim_data.get("subject_context"),
                     key_entities=claim_data.get("key_entities", []) if claim_data.get("key_entities") else None,
@@ -348,6 +364,9 @@ def save_check_results_sync(check_id: str, results: Dict[str, Any]):
 
                 logger.info(f"Saved {len(raw_evidence_data)} raw evidence items (Full Sources List)")
 
+            for notification in notifications or []:
+                session.add(notification)
+
             session.commit()
             logger.info(f"Successfully saved results for check {check_id} with {len(claims_data)} claims")
 
@@ -361,462 +380,629 @@ async def save_check_results(check_id: str, results: Dict[str, Any]):
     """Save pipeline results to database (async version for compatibility)"""
     return save_check_results_sync(check_id, results)
 
-@celery_app.task(base=PipelineTask, bind=True, max_retries=2, default_retry_delay=60)
-def process_check(self, check_id: str, user_id: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
+def _record_stage(stage_timings: Dict[str, float], stage: str, stage_start: datetime) -> None:
+    """Store a stage's duration in stage_timings and the stage latency histogram"""
+    stage_end = datetime.utcnow()
+    elapsed = (stage_end - stage_start).total_seconds()
+    stage_timings[stage] = elapsed
+    PIPELINE_STAGE_SECONDS.labels(stage=stage).observe(elapsed)
+    record_completed_span(f"stage.{stage}", stage_start, stage_end)
+
+
+def new_pipeline_context(check_id: str, user_id: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Main pipeline task that processes a fact-check request.
-    Full pipeline with real LLM, search, embeddings, and caching!
-    Enhanced with circuit breakers and retry logic.
+    State handed from one pipeline stage to the next.
+
+    Kept JSON-serialisable so the staged pipeline (app.workers.stages) can
+    persist it in Redis between tasks; process_check passes it in-process.
     """
-    start_time = datetime.utcnow()
-    stage_timings = {}
-    
+    return {
+        "check_id": check_id,
+        "user_id": user_id,
+        "input_data": input_data,
+        "start_time": datetime.utcnow().isoformat(),
+        "stage_timings": {},
+    }
+
+
+@traced("pipeline.ingest_extract")
+def run_ingest_extract_stage(task: Task, ctx: Dict[str, Any]) -> None:
+    """Stages 1-2.2: ingest, article classification, claim extraction, semantic cache lookup"""
+    check_id = ctx["check_id"]
+    input_data = ctx["input_data"]
+    stage_timings = ctx["stage_timings"]
+    # DISABLED: Cache service causing event loop issues in Celery - set to None for now
+    cache_service = None
+
+    print(f"[PIPELINE DEBUG] About to start Stage 1: Ingest for check {check_id}", flush=True)
+    logger.info(f"About to start Stage 1: Ingest for check {check_id}")
+
+    # Stage 1: Ingest (REAL IMPLEMENTATION WITH CIRCUIT BREAKER)
+    task.update_state(state="PROGRESS", meta={"stage": "ingest", "progress": 10})
+    print(f"[PIPELINE DEBUG] Task state updated to PROGRESS for check {check_id}", flush=True)
+    logger.info(f"Task state updated to PROGRESS for check {check_id}")
+    stage_start = datetime.utcnow()
+
     try:
-        print(f"[PIPELINE] process_check started for {check_id}", flush=True)
-        # Set processing status (using sync version to avoid event loop issues)
-        update_check_status_sync(check_id, "processing")
-        print(f"[PIPELINE] Status updated to processing", flush=True)
+        logger.info(f"Ingesting content for check {check_id}, input_type: {input_data.get('input_type')}")
+        logger.info(f"Input content length: {len(input_data.get('content') or '')}")
+        content = asyncio.run(ingest_content_async(input_data))
+        if not content.get("success"):
+            raise Exception(f"Ingest failed: {content.get('error', 'Unknown error')}")
+        logger.info(f"Ingested content length: {len(content.get('content') or '')}")
+    except Exception as e:
+        logger.error(f"Ingest stage failed: {e}")
+        if task.request.retries < task.max_retries:
+            raise task.retry(countdown=60, exc=e)
+        raise Exception(f"Ingest stage failed after retries: {e}")
 
-        # DISABLED: Cache service causing event loop issues in Celery - set to None for now
-        cache_service = None
+    _record_stage(stage_timings, "ingest", stage_start)
 
-        # DISABLED: Checking cached results (cache_service is None)
-        # cached_result = asyncio.run(cache_service.get_cached_pipeline_result(check_id))
-        # if cached_result:
-        #     logger.info(f"Returning cached result for check {check_id}")
-        #     return cached_result
+    # Stage 2: Extract claims (REAL LLM IMPLEMENTATION WITH CACHING)
+    task.update_state(state="PROGRESS", meta={"stage": "extract", "progress": 25})
+    stage_start = datetime.utcnow()
 
-        print(f"[PIPELINE DEBUG] About to start Stage 1: Ingest for check {check_id}", flush=True)
-        logger.info(f"About to start Stage 1: Ingest for check {check_id}")
+    extract_content = content.get("content", "")
+    extract_metadata = content.get("metadata", {})
 
-        # Stage 1: Ingest (REAL IMPLEMENTATION WITH CIRCUIT BREAKER)
-        self.update_state(state="PROGRESS", meta={"stage": "ingest", "progress": 10})
-        print(f"[PIPELINE DEBUG] Task state updated to PROGRESS for check {check_id}", flush=True)
-        logger.info(f"Task state updated to PROGRESS for check {check_id}")
-        stage_start = datetime.utcnow()
-        
+    # Run article classification FIRST (at pipeline level) - ensures fallback claims get it too
+    article_classification = None
+    if settings.ENABLE_ARTICLE_CLASSIFICATION:
         try:
-            logger.info(f"Ingesting content for check {check_id}, input_type: {input_data.get('input_type')}")
-            logger.info(f"Input content length: {len(input_data.get('content') or '')}")
-            content = asyncio.run(ingest_content_async(input_data))
-            if not content.get("success"):
-                raise Exception(f"Ingest failed: {content.get('error', 'Unknown error')}")
-            logger.info(f"Ingested content length: {len(content.get('content') or '')}")
+            article_classification = asyncio.run(classify_article(
+                title=extract_metadata.get("title", "") if extract_metadata else "",
+                url=extract_metadata.get("url", "") if extract_metadata else "",
+                content=extract_content[:2000]  # First 2000 chars for classification
+            ))
+            logger.info(
+                f"[PIPELINE] Article classified: {article_classification.primary_domain} "
+                f"(confidence: {article_classification.confidence:.2f})"
+            )
         except Exception as e:
-            logger.error(f"Ingest stage failed: {e}")
-            if self.request.retries < self.max_retries:
-                raise self.retry(countdown=60, exc=e)
-            raise Exception(f"Ingest stage failed after retries: {e}")
-        
-        stage_timings["ingest"] = (datetime.utcnow() - stage_start).total_seconds()
-            
-        # Stage 2: Extract claims (REAL LLM IMPLEMENTATION WITH CACHING)
-        self.update_state(state="PROGRESS", meta={"stage": "extract", "progress": 25})
+            logger.warning(f"Article classification failed, continuing without: {e}")
+        _record_stage(stage_timings, "classify", stage_start)
         stage_start = datetime.utcnow()
 
-        extract_content = content.get("content", "")
-        extract_metadata = content.get("metadata", {})
-
-        # Run article classification FIRST (at pipeline level) - ensures fallback claims get it too
-        article_classification = None
-        if settings.ENABLE_ARTICLE_CLASSIFICATION:
-            try:
-                article_classification = asyncio.run(classify_article(
-                    title=extract_metadata.get("title", "") if extract_metadata else "",
-                    url=extract_metadata.get("url", "") if extract_metadata else "",
-                    content=extract_content[:2000]  # First 2000 chars for classification
-                ))
-                logger.info(
-                    f"[PIPELINE] Article classified: {article_classification.primary_domain} "
-                    f"(confidence: {article_classification.confidence:.2f})"
-                )
-            except Exception as e:
-                logger.warning(f"Article classification failed, continuing without: {e}")
+    try:
+        logger.info(f"Extracting claims from content of length: {len(extract_content)}")
+        logger.info(f"First 100 chars of content: {extract_content[:100]}")
+        claims = asyncio.run(extract_claims_with_cache(
+            extract_content,
+            extract_metadata,
+            cache_service
+        ))
+        logger.info(f"Extracted {len(claims)} claims")
+        if not claims:
+            raise Exception("No claims extracted from content")
+    except Exception as e:
+        logger.error(f"Extract stage failed: {e}")
+        # Try fallback extraction
+        claims = extract_claims_fallback(extract_content)
+        logger.info(f"Fallback extraction returned {len(claims)} claims")
+        if not claims:
+            logger.error(f"Both primary and fallback extraction failed for content: {extract_content[:200]}")
+            raise Exception(f"Extract stage failed completely: {e}")
+
+    # Attach article classification to ALL claims (main or fallback)
+    # This ensures API routing works correctly regardless of extraction method
+    if article_classification:
+        for claim in claims:
+            claim["article_classification"] = article_classification.to_dict()
+        logger.info(f"[PIPELINE] Attached {article_classification.primary_domain} classification to {len(claims)} claims")
+
+    _record_stage(stage_timings, "extract", stage_start)
 
+    # Stage 2.1: Incremental re-check (earlier check of the same URL or pasted text)
+    # Unchanged, still-fresh claims are copied forward with their evidence
+    cached_results = {}
+    reused_raw_evidence = []
+    incremental_stats = None
+    if settings.ENABLE_INCREMENTAL_RECHECK:
+        stage_start = datetime.utcnow()
         try:
-            logger.info(f"Extracting claims from content of length: {len(extract_content)}")
-            logger.info(f"First 100 chars of content: {extract_content[:100]}")
-            claims = asyncio.run(extract_claims_with_cache(
-                extract_content,
-                extract_metadata,
-                cache_service
-            ))
-            logger.info(f"Extracted {len(claims)} claims")
-            if not claims:
-                raise Exception("No claims extracted from content")
+            from app.services.incremental_check import IncrementalRecheck, load_previous_check, recheck_key
+            key = recheck_key(input_data.get("input_type"), ctx["user_id"], input_data.get("url"), input_data.get("content"))
+            previous = load_previous_check(check_id, key) if key else None
+            if previous:
+                cached_results, reused_raw_evidence, incremental_stats = IncrementalRecheck().reuse(
+                    previous, claims, extract_content
+                )
+                logger.info(f"[INCREMENTAL] {incremental_stats}")
         except Exception as e:
-            logger.error(f"Extract stage failed: {e}")
-            # Try fallback extraction
-            claims = extract_claims_fallback(extract_content)
-            logger.info(f"Fallback extraction returned {len(claims)} claims")
-            if not claims:
-                logger.error(f"Both primary and fallback extraction failed for content: {extract_content[:200]}")
-                raise Exception(f"Extract stage failed completely: {e}")
-
-        # Attach article classification to ALL claims (main or fallback)
-        # This ensures API routing works correctly regardless of extraction method
-        if article_classification:
-            for claim in claims:
-                claim["article_classification"] = article_classification.to_dict()
-            logger.info(f"[PIPELINE] Attached {article_classification.primary_domain} classification to {len(claims)} claims")
-        
-        stage_timings["extract"] = (datetime.utcnow() - stage_start).total_seconds()
+            logger.warning(f"Incremental re-check lookup failed (non-critical): {e}")
+        _record_stage(stage_timings, "incremental", stage_start)
 
-        # Stage 2.5: Fact-check lookup (if enabled)
-        factcheck_evidence = {}
-        if settings.ENABLE_FACTCHECK_API:
-            self.update_state(state="PROGRESS", meta={"stage": "factcheck", "progress": 35})
-            stage_start = datetime.utcnow()
-            try:
-                factcheck_evidence = asyncio.run(search_factchecks_for_claims(claims))
-                logger.info(f"Found {sum(len(v) for v in factcheck_evidence.values())} fact-checks")
-            except Exception as e:
-                logger.warning(f"Fact-check lookup failed (non-critical): {e}")
-            stage_timings["factcheck"] = (datetime.utcnow() - stage_start).total_seconds()
-
-        # Stage 3: Retrieve evidence (REAL IMPLEMENTATION WITH CACHING)
-        self.update_state(state="PROGRESS", meta={"stage": "retrieve", "progress": 40})
+    # Stage 2.2: Semantic claim-verdict cache (near-duplicate claims from earlier checks)
+    # Hits skip fact-check lookup, retrieval, verification and judgment entirely
+    if settings.ENABLE_SEMANTIC_CLAIM_CACHE:
         stage_start = datetime.utcnow()
+        try:
+            from app.services.claim_cache import get_semantic_claim_cache
+            uncached = [c for c in claims if str(c.get("position", 0)) not in cached_results]
+            cached_results.update(asyncio.run(get_semantic_claim_cache().lookup_claims(uncached)))
+        except Exception as e:
+            logger.warning(f"Semantic claim cache lookup failed (non-critical): {e}")
+        _record_stage(stage_timings, "semantic_cache", stage_start)
+
+    pending_claims = [c for c in claims if str(c.get("position", 0)) not in cached_results]
+
+    ctx.update(
+        content=content,
+        article_classification=article_classification.to_dict() if article_classification else None,
+        claims=claims,
+        cached_results=cached_results,
+        reused_raw_evidence=reused_raw_evidence,
+        incremental_stats=incremental_stats,
+        pending_claims=pending_claims,
+    )
+
+
+@traced("pipeline.retrieve")
+def run_retrieve_stage(task: Task, ctx: Dict[str, Any]) -> None:
+    """Stages 2.5-3.7: fact-check lookup, evidence retrieval, fact-check parsing, global domain capping"""
+    content = ctx["content"]
+    pending_claims = ctx["pending_claims"]
+    stage_timings = ctx["stage_timings"]
+    cache_service = None
+
+    if not pending_claims:
+        # Every claim was copied from an earlier check or the semantic cache
+        ctx.update(factcheck_evidence={}, evidence={}, raw_evidence_data=[], raw_sources_count=0)
+        return
+
+    # Stage 2.5: Fact-check lookup (if enabled)
+    factcheck_evidence = {}
+    if settings.ENABLE_FACTCHECK_API:
+        task.update_state(state="PROGRESS", meta={"stage": "factcheck", "progress": 35})
+        stage_start = datetime.utcnow()
+        try:
+            factcheck_evidence = asyncio.run(search_factchecks_for_claims(pending_claims))
+            logger.info(f"Found {sum(len(v) for v in factcheck_evidence.values())} fact-checks")
+        except Exception as e:
+            logger.warning(f"Fact-check lookup failed (non-critical): {e}")
+        _record_stage(stage_timings, "factcheck", stage_start)
+
+    # Stage 3: Retrieve evidence (REAL IMPLEMENTATION WITH CACHING)
+    task.update_state(state="PROGRESS", meta={"stage": "retrieve", "progress": 40})
+    stage_start = datetime.utcnow()
 
-        # Raw evidence for Full Sources List Pro feature
-        raw_evidence_data = []
-        raw_sources_count = 0
+    # Raw evidence for Full Sources List Pro feature
+    raw_evidence_data = []
+    raw_sources_count = 0
 
+    try:
+        # Extract source URL for self-citation filtering
+        source_url = content.get("metadata", {}).get("url")
+        retrieval_result = asyncio.run(retrieve_evidence_with_cache(
+            pending_claims, cache_service, factcheck_evidence, source_url=source_url, check_id=ctx["check_id"]
+        ))
+
+        # Extract evidence and raw evidence from new structure
+        if isinstance(retrieval_result, dict) and "evidence_by_claim" in retrieval_result:
+            evidence = retrieval_result["evidence_by_claim"]
+            raw_evidence_data = retrieval_result.get("raw_evidence", [])
+            raw_sources_count = retrieval_result.get("raw_sources_count", 0)
+            logger.info(f"[RAW_EVIDENCE] Captured {raw_sources_count} raw sources for Full Sources List")
+        else:
+            # Backward compatibility
+            evidence = retrieval_result
+    except Exception as e:
+        logger.error(f"Retrieve stage failed: {e}")
+        # Try fallback evidence (development only)
+        if settings.ENVIRONMENT == "development":
+            logger.warning("Using mock evidence fallback (development only)")
+            evidence = retrieve_evidence(pending_claims, factcheck_evidence)
+        else:
+            # Production: fail the check properly with clear error
+            logger.critical(f"Evidence retrieval failed in {settings.ENVIRONMENT} environment, cannot continue")
+            raise Exception(f"Evidence retrieval failed: {e}")
+
+    _record_stage(stage_timings, "retrieve", stage_start)
+
+    # Stage 3.5: Parse fact-check evidence (CONDITIONAL IMPLEMENTATION)
+    if settings.ENABLE_FACTCHECK_PARSING:
+        task.update_state(state="PROGRESS", meta={"stage": "factcheck_parse", "progress": 50})
+        stage_start = datetime.utcnow()
         try:
-            # Extract source URL for self-citation filtering
-            source_url = content.get("metadata", {}).get("url")
-            retrieval_result = asyncio.run(retrieve_evidence_with_cache(claims, cache_service, factcheck_evidence, source_url=source_url))
+            from app.services.factcheck_parser import get_factcheck_parser
+            parser = get_factcheck_parser()
+            evidence = asyncio.run(parser.parse_factcheck_evidence(pending_claims, evidence))
+
+            # Count parsed fact-checks
+            parsed_count = sum(
+                1 for ev_list in evidence.values()
+                for ev in ev_list
+                if ev.get('factcheck_parse_success')
+            )
+            logger.info(f"Fact-check parsing: {parsed_count} articles parsed successfully")
 
-            # Extract evidence and raw evidence from new structure
-            if isinstance(retrieval_result, dict) and "evidence_by_claim" in retrieval_result:
-                evidence = retrieval_result["evidence_by_claim"]
-                raw_evidence_data = retrieval_result.get("raw_evidence", [])
-                raw_sources_count = retrieval_result.get("raw_sources_count", 0)
-                logger.info(f"[RAW_EVIDENCE] Captured {raw_sources_count} raw sources for Full Sources List")
-            else:
-                # Backward compatibility
-                evidence = retrieval_result
         except Exception as e:
-            logger.error(f"Retrieve stage failed: {e}")
-            # Try fallback evidence (development only)
-            if settings.ENVIRONMENT == "development":
-                logger.warning("Using mock evidence fallback (development only)")
-                evidence = retrieve_evidence(claims, factcheck_evidence)
-            else:
-                # Production: fail the check properly with clear error
-                logger.critical(f"Evidence retrieval failed in {settings.ENVIRONMENT} environment, cannot continue")
-                raise Exception(f"Evidence retrieval failed: {e}")
-
-        stage_timings["retrieve"] = (datetime.utcnow() - stage_start).total_seconds()
-
-        # Stage 3.5: Parse fact-check evidence (CONDITIONAL IMPLEMENTATION)
-        if settings.ENABLE_FACTCHECK_PARSING:
-            self.update_state(state="PROGRESS", meta={"stage": "factcheck_parse", "progress": 50})
-            stage_start = datetime.utcnow()
-            try:
-                from app.services.factcheck_parser import get_factcheck_parser
-                parser = get_factcheck_parser()
-                evidence = asyncio.run(parser.parse_factcheck_evidence(claims, evidence))
-
-                # Count parsed fact-checks
-                parsed_count = sum(
-                    1 for ev_list in evidence.values()
-                    for ev in ev_list
-                    if ev.get('factcheck_parse_success')
-                )
-                logger.info(f"Fact-check parsing: {parsed_count} articles parsed successfully")
-
-            except Exception as e:
-                logger.warning(f"Fact-check parsing failed (non-critical): {e}")
-                # Continue with unparsed evidence - safe fallback
-
-            stage_timings["factcheck_parse"] = (datetime.utcnow() - stage_start).total_seconds()
-
-        # Stage 3.7: Global Domain Capping (cross-claim diversity enforcement)
-        if settings.ENABLE_GLOBAL_DOMAIN_CAPPING and evidence:
-            stage_start = datetime.utcnow()
-            try:
-                from app.utils.domain_capping import DomainCapper
-                global_capper = DomainCapper()
-                evidence = global_capper.apply_global_caps(
-                    evidence,
-                    global_max_per_domain=settings.GLOBAL_MAX_PER_DOMAIN,
-                    global_max_ratio=settings.GLOBAL_MAX_DOMAIN_RATIO
-                )
-                logger.info("[GLOBAL CAP] Applied global domain diversity enforcement")
-            except Exception as e:
-                logger.warning(f"Global domain capping failed (non-critical): {e}")
-                # Continue with uncapped evidence - safe fallback
+            logger.warning(f"Fact-check parsing failed (non-critical): {e}")
+            # Continue with unparsed evidence - safe fallback
 
-            stage_timings["global_domain_cap"] = (datetime.utcnow() - stage_start).total_seconds()
+        _record_stage(stage_timings, "factcheck_parse", stage_start)
 
-        # Stage 4: Verify with NLI (REAL IMPLEMENTATION WITH TIMEOUT)
-        self.update_state(state="PROGRESS", meta={"stage": "verify", "progress": 60})
+    # Stage 3.7: Global Domain Capping (cross-claim diversity enforcement)
+    if settings.ENABLE_GLOBAL_DOMAIN_CAPPING and evidence:
         stage_start = datetime.utcnow()
-
         try:
-            # Add timeout for NLI stage
-            verifications = asyncio.run(
-                asyncio.wait_for(
-                    verify_claims_with_nli(claims, evidence, cache_service),
-                    timeout=settings.VERIFICATION_TIMEOUT_SECONDS * len(claims)
-                )
+            from app.utils.domain_capping import DomainCapper
+            global_capper = DomainCapper()
+            evidence = global_capper.apply_global_caps(
+                evidence,
+                global_max_per_domain=settings.GLOBAL_MAX_PER_DOMAIN,
+                global_max_ratio=settings.GLOBAL_MAX_DOMAIN_RATIO
             )
-        except asyncio.TimeoutError:
-            logger.warning(f"Verify stage timed out")
-            if settings.ENVIRONMENT == "development":
-                logger.warning("Using mock verification fallback (development only)")
-                verifications = verify_claims(claims, evidence)
-            else:
-                logger.critical(f"NLI verification timed out in {settings.ENVIRONMENT} environment")
-                raise Exception("NLI verification timed out")
+            logger.info("[GLOBAL CAP] Applied global domain diversity enforcement")
         except Exception as e:
-            logger.error(f"Verify stage failed: {e}")
-            if settings.ENVIRONMENT == "development":
-                logger.warning("Using mock verification fallback (development only)")
-                verifications = verify_claims(claims, evidence)
-            else:
-                logger.critical(f"NLI verification failed in {settings.ENVIRONMENT} environment")
-                raise Exception(f"NLI verification failed: {e}")
-        
-        stage_timings["verify"] = (datetime.utcnow() - stage_start).total_seconds()
-        
-        # Stage 5: Judge and finalize (REAL IMPLEMENTATION WITH TIMEOUT)
-        self.update_state(state="PROGRESS", meta={"stage": "judge", "progress": 80})
-        stage_start = datetime.utcnow()
+            logger.warning(f"Global domain capping failed (non-critical): {e}")
+            # Continue with uncapped evidence - safe fallback
+
+        _record_stage(stage_timings, "global_domain_cap", stage_start)
+
+    ctx.update(
+        factcheck_evidence=factcheck_evidence,
+        evidence=evidence,
+        raw_evidence_data=raw_evidence_data,
+        raw_sources_count=raw_sources_count,
+    )
 
-        try:
-            # Add timeout for judge stage
-            # Adjust timeout: 15s per claim with 120s max cap to prevent exceeding pipeline timeout
-            judge_timeout = min(15 * len(claims), 120)
-            logger.info(f"Judge stage timeout set to {judge_timeout}s for {len(claims)} claims")
 
-            # Extract article excerpt for context-aware judgment
-            article_excerpt = content.get("content", "")[:5000]
+@traced("pipeline.verify")
+def run_verify_stage(task: Task, ctx: Dict[str, Any]) -> None:
+    """Stage 4: NLI verification (the CPU-bound stage)"""
+    pending_claims = ctx["pending_claims"]
+    evidence = ctx["evidence"]
+    stage_timings = ctx["stage_timings"]
+    cache_service = None
 
+    if not pending_claims:
+        ctx["verifications"] = {}
+        return
+
+    # Stage 4: Verify with NLI (REAL IMPLEMENTATION WITH TIMEOUT)
+    task.update_state(state="PROGRESS", meta={"stage": "verify", "progress": 60})
+    stage_start = datetime.utcnow()
+
+    try:
+        # Add timeout for NLI stage
+        verifications = asyncio.run(
+            asyncio.wait_for(
+                verify_claims_with_nli(pending_claims, evidence, cache_service),
+                timeout=settings.VERIFICATION_TIMEOUT_SECONDS * max(len(pending_claims), 1)
+            )
+        )
+    except asyncio.TimeoutError:
+        logger.warning(f"Verify stage timed out")
+        if settings.ENVIRONMENT == "development":
+            logger.warning("Using mock verification fallback (development only)")
+            verifications = verify_claims(pending_claims, evidence)
+        else:
+            logger.critical(f"NLI verification timed out in {settings.ENVIRONMENT} environment")
+            raise Exception("NLI verification timed out")
+    except Exception as e:
+        logger.error(f"Verify stage failed: {e}")
+        if settings.ENVIRONMENT == "development":
+            logger.warning("Using mock verification fallback (development only)")
+            verifications = verify_claims(pending_claims, evidence)
+        else:
+            logger.critical(f"NLI verification failed in {settings.ENVIRONMENT} environment")
+            raise Exception(f"NLI verification failed: {e}")
+
+    _record_stage(stage_timings, "verify", stage_start)
+
+    ctx["verifications"] = verifications
+
+
+@traced("pipeline.judge")
+def run_judge_stage(task: Task, ctx: Dict[str, Any]) -> Dict[str, Any]:
+    """Stages 5-6.5: judgment, query answering, explainability, assessment; saves results"""
+    check_id = ctx["check_id"]
+    user_id = ctx["user_id"]
+    input_data = ctx["input_data"]
+    start_time = datetime.fromisoformat(ctx["start_time"])
+    stage_timings = ctx["stage_timings"]
+    content = ctx["content"]
+    claims = ctx["claims"]
+    cached_results = ctx["cached_results"]
+    pending_claims = ctx["pending_claims"]
+    evidence = ctx["evidence"]
+    raw_evidence_data = ctx["raw_evidence_data"]
+    raw_sources_count = ctx["raw_sources_count"]
+    verifications = ctx["verifications"]
+    cache_service = None
+
+    # Stage 5: Judge and finalize (REAL IMPLEMENTATION WITH TIMEOUT)
+    task.update_state(state="PROGRESS", meta={"stage": "judge", "progress": 80})
+    stage_start = datetime.utcnow()
+
+    try:
+        # Add timeout for judge stage
+        # Adjust timeout: 15s per claim with 120s max cap to prevent exceeding pipeline timeout
+        judge_timeout = min(15 * max(len(pending_claims), 1), 120)
+        logger.info(f"Judge stage timeout set to {judge_timeout}s for {len(pending_claims)} claims")
+
+        # Extract article excerpt for context-aware judgment
+        article_excerpt = content.get("content", "")[:5000]
+
+        results = []
+        if pending_claims:
             results = asyncio.run(
                 asyncio.wait_for(
-                    judge_claims_with_llm(claims, verifications, evidence, article_context=article_excerpt),
+                    judge_claims_with_llm(pending_claims, verifications, evidence, article_context=article_excerpt),
                     timeout=judge_timeout
                 )
             )
-        except asyncio.TimeoutError:
-            logger.warning(f"Judge stage timed out")
-            if settings.ENVIRONMENT == "development":
-                logger.warning("Using mock judgment fallback (development only)")
-                results = judge_claims(claims, verifications, evidence)
-            else:
-                logger.critical(f"LLM judgment timed out in {settings.ENVIRONMENT} environment")
-                raise Exception("LLM judgment timed out")
-        except Exception as e:
-            logger.error(f"Judge stage failed: {e}")
-            if settings.ENVIRONMENT == "development":
-                logger.warning("Using mock judgment fallback (development only)")
-                results = judge_claims(claims, verifications, evidence)
-            else:
-                logger.critical(f"LLM judgment failed in {settings.ENVIRONMENT} environment")
-                raise Exception(f"LLM judgment failed: {e}")
-        
-        stage_timings["judge"] = (datetime.utcnow() - stage_start).total_seconds()
-
-        # Stage 5.5: Query Answering (OPTIONAL - if user_query exists)
-        query_response_data = None
-        if input_data.get("user_query") and settings.ENABLE_SEARCH_CLARITY:
-            self.update_state(state="PROGRESS", meta={"stage": "query", "progress": 85})
-            stage_start = datetime.utcnow()
-
-            try:
-                from app.pipeline.query_answer import get_query_answerer
-
-                user_query = input_data.get("user_query")
-                logger.info(f"Answering user query: {user_query}")
-
-                # Call async function using asyncio.run (same pattern as ingest stage)
-                async def run_query_answering():
-                    query_answerer = await get_query_answerer()
-                    return await query_answerer.answer_query(
-                        user_query=user_query,
-                        claims=claims,
-                        evidence_by_claim=evidence,
-                        original_text=content.get("content", "")[:1000]  # First 1000 chars for context
-                    )
-
-                query_result = asyncio.run(run_query_answering())
-
-                # Store query response
-                query_response_data = {
-                    "answer": query_result["answer"],
-                    "confidence": query_result["confidence"],
-                    "source_ids": query_result["source_ids"],  # Already full objects
-                    "related_claims": query_result["related_claims"],
-                    "found_answer": query_result["found_answer"]
-                }
+    except asyncio.TimeoutError:
+        logger.warning(f"Judge stage timed out")
+        if settings.ENVIRONMENT == "development":
+            logger.warning("Using mock judgment fallback (development only)")
+            results = judge_claims(pending_claims, verifications, evidence)
+        else:
+            logger.critical(f"LLM judgment timed out in {settings.ENVIRONMENT} environment")
+            raise Exception("LLM judgment timed out")
+    except Exception as e:
+        logger.error(f"Judge stage failed: {e}")
+        if settings.ENVIRONMENT == "development":
+            logger.warning("Using mock judgment fallback (development only)")
+            results = judge_claims(pending_claims, verifications, evidence)
+        else:
+            logger.critical(f"LLM judgment failed in {settings.ENVIRONMENT} environment")
+            raise Exception(f"LLM judgment failed: {e}")
 
-                logger.info(f"Query answered: confidence={query_result['confidence']}%, found_answer={query_result['found_answer']}")
+    _record_stage(stage_timings, "judge", stage_start)
 
-            except Exception as e:
-                logger.error(f"Query answering failed (non-critical): {e}", exc_info=True)
-                query_response_data = None
+    # Store fresh verdicts for future checks
+    if settings.ENABLE_SEMANTIC_CLAIM_CACHE:
+        try:
+            from app.services.claim_cache import get_semantic_claim_cache
+            asyncio.run(get_semantic_claim_cache().store_results(pending_claims, results))
+        except Exception as e:
+            logger.warning(f"Semantic claim cache store failed (non-critical): {e}")
 
-            stage_timings["query"] = (datetime.utcnow() - stage_start).total_seconds()
+    # Merge claims copied from an earlier check or the semantic cache back in
+    if cached_results:
+        for position, cached_result in cached_results.items():
+            results.append(cached_result)
+            evidence[position] = cached_result.get("evidence", [])
+        results.sort(key=lambda x: x.get("position", 0))
 
-        # Stage 6: Enhanced Explainability (Phase 2, Week 6.5-7.5)
-        if settings.ENABLE_ENHANCED_EXPLAINABILITY:
-            from app.utils.explainability import ExplainabilityEnhancer
-            explainer = ExplainabilityEnhancer()
+        reused_raw_evidence = ctx.get("reused_raw_evidence") or []
+        raw_evidence_data = raw_evidence_data + reused_raw_evidence
+        raw_sources_count += len(reused_raw_evidence)
 
-            # Add explainability to each claim
-            for i, result in enumerate(results):
-                position = result.get("position", i)
-                claim_evidence = evidence.get(position, [])
-                claim_verifications = verifications.get(position, [])
+    # Stage 5.5: Query Answering (OPTIONAL - if user_query exists)
+    query_response_data = None
+    if input_data.get("user_query") and settings.ENABLE_SEARCH_CLARITY:
+        task.update_state(state="PROGRESS", meta={"stage": "query", "progress": 85})
+        stage_start = datetime.utcnow()
 
-                # Create verification signals summary
-                verification_signals = {
-                    "supporting_count": sum(1 for v in claim_verifications if v.get("label") == "SUPPORTS"),
-                    "contradicting_count": sum(1 for v in claim_verifications if v.get("label") == "CONTRADICTS"),
-                    "neutral_count": sum(1 for v in claim_verifications if v.get("label") == "NEUTRAL")
-                }
+        try:
+            from app.pipeline.query_answer import get_query_answerer
+
+            user_query = input_data.get("user_query")
+            logger.info(f"Answering user query: {user_query}")
+
+            # Call async function using asyncio.run (same pattern as ingest stage)
+            async def run_query_answering():
+                query_answerer = await get_query_answerer()
+                return await query_answerer.answer_query(
+                    user_query=user_query,
+                    claims=claims,
+                    evidence_by_claim=evidence,
+                    original_text=content.get("content", "")[:1000]  # First 1000 chars for context
+                )
 
-                # Add uncertainty explanation if verdict is uncertain or abstention
-                abstention_verdicts = ['insufficient_evidence', 'conflicting_expert_opinion',
-                                      'outdated_claim', 'needs_primary_source', 'lacks_context']
-                if result.get("verdict", "").lower() in ["uncertain", "unclear"] or result.get("verdict") in abstention_verdicts:
-                    uncertainty_explanation = explainer.create_uncertainty_explanation(
-                        result.get("verdict", ""),
-                        verification_signals,
-                        claim_evidence
-                    )
-                    results[i]["uncertainty_explanation"] = uncertainty_explanation
+            query_result = asyncio.run(run_query_answering())
 
-                # Add confidence breakdown
-                confidence_breakdown = explainer.create_confidence_breakdown(
-                    result,
-                    claim_evidence,
-                    verification_signals
-                )
-                results[i]["confidence_breakdown"] = confidence_breakdown
-
-            # Create overall decision trail for the check
-            decision_trail = {
-                "total_claims": len(claims),
-                "claims_processed": len(results),
-                "stage_timings": stage_timings,
-                "features_enabled": {
-                    "domain_capping": settings.ENABLE_DOMAIN_CAPPING,
-                    "global_domain_capping": settings.ENABLE_GLOBAL_DOMAIN_CAPPING,
-                    "deduplication": settings.ENABLE_DEDUPLICATION,
-                    "temporal_context": settings.ENABLE_TEMPORAL_CONTEXT,
-                    "factcheck_api": settings.ENABLE_FACTCHECK_API,
-                    "claim_classification": settings.ENABLE_CLAIM_CLASSIFICATION
-                }
+            # Store query response
+            query_response_data = {
+                "answer": query_result["answer"],
+                "confidence": query_result["confidence"],
+                "source_ids": query_result["source_ids"],  # Already full objects
+                "related_claims": query_result["related_claims"],
+                "found_answer": query_result["found_answer"]
             }
 
-            logger.info(f"Added explainability for {len(results)} claims")
+            logger.info(f"Query answered: confidence={query_result['confidence']}%, found_answer={query_result['found_answer']}")
 
-        # Stage 6.5: Generate Overall Assessment (Summary + Credibility Score)
-        self.update_state(state="PROGRESS", meta={"stage": "summary", "progress": 90})
-        stage_start = datetime.utcnow()
-
-        try:
-            logger.info(f"Generating overall assessment for {len(results)} claims")
-            assessment = asyncio.run(generate_overall_assessment(
-                results,
-                input_data.get('url') or input_data.get('content', '')[:100],  # Pass URL or content preview
-                evidence_by_claim=evidence  # Pass evidence for confidence weighting
-            ))
-            logger.info(f"Overall assessment generated: credibility_score={assessment['credibility_score']}")
         except Exception as e:
-            logger.error(f"Assessment generation failed, using fallback: {e}")
-            # Fallback assessment
-            total = len(results)
-            supported = sum(1 for c in results if c.get('verdict') == 'supported')
-            contradicted = sum(1 for c in results if c.get('verdict') == 'contradicted')
-            # Include abstention verdicts in uncertain count
+            logger.error(f"Query answering failed (non-critical): {e}", exc_info=True)
+            query_response_data = None
+
+        _record_stage(stage_timings, "query", stage_start)
+
+    # Stage 6: Enhanced Explainability (Phase 2, Week 6.5-7.5)
+    if settings.ENABLE_ENHANCED_EXPLAINABILITY:
+        from app.utils.explainability import ExplainabilityEnhancer
+        explainer = ExplainabilityEnhancer()
+
+        # Add explainability to each claim
+        for i, result in enumerate(results):
+            position = result.get("position", i)
+            claim_evidence = evidence.get(position, [])
+            claim_verifications = verifications.get(position, [])
+
+            # Create verification signals summary
+            verification_signals = {
+                "supporting_count": sum(1 for v in claim_verifications if v.get("label") == "SUPPORTS"),
+                "contradicting_count": sum(1 for v in claim_verifications if v.get("label") == "CONTRADICTS"),
+                "neutral_count": sum(1 for v in claim_verifications if v.get("label") == "NEUTRAL")
+            }
+
+            # Add uncertainty explanation if verdict is uncertain or abstention
             abstention_verdicts = ['insufficient_evidence', 'conflicting_expert_opinion',
                                   'outdated_claim', 'needs_primary_source', 'lacks_context']
-            uncertain = sum(1 for c in results if c.get('verdict') == 'uncertain' or
-                           c.get('verdict') in abstention_verdicts)
-            assessment = {
-                "summary": f"Analysis of {total} claims found {supported} supported, {contradicted} contradicted, and {uncertain} uncertain.",
-                "credibility_score": int((supported * 100 + uncertain * 50) / total) if total > 0 else 50,
-                "claims_supported": supported,
-                "claims_contradicted": contradicted,
-                "claims_uncertain": uncertain
-            }
+            if result.get("verdict", "").lower() in ["uncertain", "unclear"] or result.get("verdict") in abstention_verdicts:
+                uncertainty_explanation = explainer.create_uncertainty_explanation(
+                    result.get("verdict", ""),
+                    verification_signals,
+                    claim_evidence
+                )
+                results[i]["uncertainty_explanation"] = uncertainty_explanation
 
-        stage_timings["summary"] = (datetime.utcnow() - stage_start).total_seconds()
-
-        # Phase 5: Aggregate API statistics across all claims
-        api_stats = aggregate_api_stats(claims, evidence)
-
-        # Calculate processing time
-        processing_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-
-        # Prepare final result with enhanced metrics
-        final_result = {
-            "check_id": check_id,
-            "status": "completed",
-            "claims": results,
-            "overall_summary": assessment["summary"],
-            "credibility_score": assessment["credibility_score"],
-            "claims_supported": assessment["claims_supported"],
-            "claims_contradicted": assessment["claims_contradicted"],
-            "claims_uncertain": assessment["claims_uncertain"],
-            "processing_time_ms": processing_time_ms,
-            "ingest_metadata": content.get("metadata", {}),
-            "query_response": query_response_data,  # Search Clarity
-            "api_stats": api_stats,  # Phase 5: Government API Integration
-            "article_excerpt": content.get("content", "")[:5000],  # First 5000 chars for judge context
-            # Article classification for domain stats
-            "article_classification": article_classification.to_dict() if article_classification else None,
-            # Full Sources List Pro feature
-            "raw_evidence": raw_evidence_data,
-            "raw_sources_count": raw_sources_count,
-            "pipeline_stats": {
-                "claims_extracted": len(claims),
-                "evidence_sources": sum(len(ev) for ev in evidence.values()),
-                "raw_sources_reviewed": raw_sources_count,  # NEW: Total sources reviewed
-                "cache_hits": getattr(cache_service, '_cache_hits', 0),
-                "stage_timings": stage_timings,
-                "total_stage_time": sum(stage_timings.values()),
-                "pipeline_version": "week4_optimized"
-            },
-            "performance_metrics": {
-                "under_10s_target": processing_time_ms < 10000,
-                "avg_time_per_claim": processing_time_ms / max(len(claims), 1),
-                "efficiency_score": min(100, (10000 / max(processing_time_ms, 1000)) * 100)
+            # Add confidence breakdown
+            confidence_breakdown = explainer.create_confidence_breakdown(
+                result,
+                claim_evidence,
+                verification_signals
+            )
+            results[i]["confidence_breakdown"] = confidence_breakdown
+
+        # Create overall decision trail for the check
+        decision_trail = {
+            "total_claims": len(claims),
+            "claims_processed": len(results),
+            "stage_timings": stage_timings,
+            "features_enabled": {
+                "domain_capping": settings.ENABLE_DOMAIN_CAPPING,
+                "global_domain_capping": settings.ENABLE_GLOBAL_DOMAIN_CAPPING,
+                "deduplication": settings.ENABLE_DEDUPLICATION,
+                "temporal_context": settings.ENABLE_TEMPORAL_CONTEXT,
+                "factcheck_api": settings.ENABLE_FACTCHECK_API,
+                "claim_classification": settings.ENABLE_CLAIM_CLASSIFICATION
             }
         }
 
-        # DISABLED: Cache the complete pipeline result (cache_service is None)
-        # asyncio.run(cache_service.cache_pipeline_result(check_id, final_result))
+        logger.info(f"Added explainability for {len(results)} claims")
 
-        # Save all results to database (claims, evidence, and check status)
-        try:
-            save_check_results_sync(check_id, final_result)
+    # Stage 6.5: Generate Overall Assessment (Summary + Credibility Score)
+    task.update_state(state="PROGRESS", meta={"stage": "summary", "progress": 90})
+    stage_start = datetime.utcnow()
 
-            # Send check completion email notification
-            try:
-                email_notification_service.send_check_completed_email_sync(
-                    user_id=user_id,
-                    check_id=check_id,
-                    claims_count=len(results),
-                    supported=assessment["claims_supported"],
-                    contradicted=assessment["claims_contradicted"],
-                    uncertain=assessment["claims_uncertain"],
-                    credibility_score=assessment["credibility_score"]
-                )
-            except Exception as email_error:
-                # Email notification failure should not crash the pipeline
-                logger.warning(f"Failed to send check completion email: {email_error}")
+    try:
+        logger.info(f"Generating overall assessment for {len(results)} claims")
+        assessment = asyncio.run(generate_overall_assessment(
+            results,
+            input_data.get('url') or input_data.get('content', '')[:100],  # Pass URL or content preview
+            evidence_by_claim=evidence  # Pass evidence for confidence weighting
+        ))
+        logger.info(f"Overall assessment generated: credibility_score={assessment['credibility_score']}")
+    except Exception as e:
+        logger.error(f"Assessment generation failed, using fallback: {e}")
+        # Fallback assessment
+        total = len(results)
+        supported = sum(1 for c in results if c.get('verdict') == 'supported')
+        contradicted = sum(1 for c in results if c.get('verdict') == 'contradicted')
+        # Include abstention verdicts in uncertain count
+        abstention_verdicts = ['insufficient_evidence', 'conflicting_expert_opinion',
+                              'outdated_claim', 'needs_primary_source', 'lacks_context']
+        uncertain = sum(1 for c in results if c.get('verdict') == 'uncertain' or
+                       c.get('verdict') in abstention_verdicts)
+        assessment = {
+            "summary": f"Analysis of {total} claims found {supported} supported, {contradicted} contradicted, and {uncertain} uncertain.",
+            "credibility_score": int((supported * 100 + uncertain * 50) / total) if total > 0 else 50,
+            "claims_supported": supported,
+            "claims_contradicted": contradicted,
+            "claims_uncertain": uncertain
+        }
 
-        except Exception as db_error:
-            logger.error(f"Failed to save check results to database for check {check_id}: {db_error}")
-            import traceback
-            logger.error(f"Full database error traceback: {traceback.format_exc()}")
+    _record_stage(stage_timings, "summary", stage_start)
+
+    # Phase 5: Aggregate API statistics across all claims
+    api_stats = aggregate_api_stats(claims, evidence)
+
+    # Calculate processing time
+    processing_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
+    PIPELINE_CHECK_SECONDS.observe(processing_time_ms / 1000)
+    PIPELINE_CHECKS_TOTAL.labels(status="completed").inc()
+
+    # Prepare final result with enhanced metrics
+    final_result = {
+        "check_id": check_id,
+        "status": "completed",
+        "claims": results,
+        "overall_summary": assessment["summary"],
+        "credibility_score": assessment["credibility_score"],
+        "claims_supported": assessment["claims_supported"],
+        "claims_contradicted": assessment["claims_contradicted"],
+        "claims_uncertain": assessment["claims_uncertain"],
+        "processing_time_ms": processing_time_ms,
+        "ingest_metadata": content.get("metadata", {}),
+        "query_response": query_response_data,  # Search Clarity
+        "api_stats": api_stats,  # Phase 5: Government API Integration
+        "article_excerpt": content.get("content", "")[:5000],  # First 5000 chars for judge context
+        # Article classification for domain stats
+        "article_classification": ctx["article_classification"],
+        # Full Sources List Pro feature
+        "raw_evidence": raw_evidence_data,
+        "raw_sources_count": raw_sources_count,
+        "pipeline_stats": {
+            "claims_extracted": len(claims),
+            "evidence_sources": sum(len(ev) for ev in evidence.values()),
+            "raw_sources_reviewed": raw_sources_count,  # NEW: Total sources reviewed
+            "cache_hits": getattr(cache_service, '_cache_hits', 0),
+            "semantic_cache_hits": sum(1 for r in cached_results.values() if r.get("semantic_cache")),
+            "incremental": ctx.get("incremental_stats"),
+            "stage_timings": stage_timings,
+            "total_stage_time": sum(stage_timings.values()),
+            "pipeline_version": "week4_optimized"
+        },
+        "performance_metrics": {
+            "under_10s_target": processing_time_ms < 10000,
+            "avg_time_per_claim": processing_time_ms / max(len(claims), 1),
+            "efficiency_score": min(100, (10000 / max(processing_time_ms, 1000)) * 100)
+        }
+    }
 
-        return final_result
+    # DISABLED: Cache the complete pipeline result (cache_service is None)
+    # asyncio.run(cache_service.cache_pipeline_result(check_id, final_result))
+
+    # Save all results to database (claims, evidence, and check status)
+    try:
+        # Completion email is queued in the same transaction and delivered
+        # by the notifications queue
+        notifications = check_completed_intents(
+            user_id=user_id,
+            check_id=check_id,
+            claims_count=len(results),
+            supported=assessment["claims_supported"],
+            contradicted=assessment["claims_contradicted"],
+            uncertain=assessment["claims_uncertain"],
+            credibility_score=assessment["credibility_score"]
+        )
+        save_start = datetime.utcnow()
+        save_check_results_sync(check_id, final_result, notifications=notifications)
+        PIPELINE_STAGE_SECONDS.labels(stage="save").observe((datetime.utcnow() - save_start).total_seconds())
+        schedule_notification_delivery()
+
+    except Exception as db_error:
+        logger.error(f"Failed to save check results to database for check {check_id}: {db_error}")
+        import traceback
+        logger.error(f"Full database error traceback: {traceback.format_exc()}")
+
+    return final_result
+
+
+@celery_app.task(base=PipelineTask, bind=True, max_retries=2, default_retry_delay=60)
+def process_check(self, check_id: str, user_id: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Main pipeline task that processes a fact-check request.
+    Full pipeline with real LLM, search, embeddings, and caching!
+    Enhanced with circuit breakers and retry logic.
+
+    Runs every stage in one worker. With ENABLE_STAGED_PIPELINE the same
+    stages run as a chain of tasks on the I/O and CPU queues instead
+    (see app.workers.stages.dispatch_check).
+    """
+    ctx = new_pipeline_context(check_id, user_id, input_data)
+
+    try:
+        print(f"[PIPELINE] process_check started for {check_id}", flush=True)
+        # Set processing status (using sync version to avoid event loop issues)
+        update_check_status_sync(check_id, "processing")
+        print(f"[PIPELINE] Status updated to processing", flush=True)
+
+        # DISABLED: Checking cached results (cache_service is None)
+        # cached_result = asyncio.run(cache_service.get_cached_pipeline_result(check_id))
+        # if cached_result:
+        #     logger.info(f"Returning cached result for check {check_id}")
+        #     return cached_result
+
+        run_ingest_extract_stage(self, ctx)
+        run_retrieve_stage(self, ctx)
+        run_verify_stage(self, ctx)
+        return run_judge_stage(self, ctx)
 
     except Exception as e:
         logger.error(f"Pipeline failed for check {check_id}: {e}")
@@ -1010,8 +1196,10 @@ For example: "However, Claim 3 contradicts multiple fact-checking sources."
 
     try:
         # Use OpenAI API (same pattern as judge.py)
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
+        async with httpx.AsyncClient(timeout=30, transport=build_transport()) as client:
+            response = await llm_post(
+                client,
+                "summary",
                 "https://api.openai.com/v1/chat/completions",
                 headers={
                     "Authorization": f"Bearer {settings.OPENAI_API_KEY}",
@@ -1126,18 +1314,31 @@ async def extract_claims_with_cache(content: str, metadata: Dict[str, Any], cach
         return extract_claims_fallback(content)
 
 async def search_factchecks_for_claims(claims: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-    """Search for existing fact-checks for claims"""
-    from app.services.factcheck_api import FactCheckAPI
+    """Search for existing fact-checks for claims (concurrent, identical claims coalesced)"""
+    from app.services.factcheck_api import get_factcheck_api
 
-    factcheck_api = FactCheckAPI()
+    factcheck_api = get_factcheck_api()
     factcheck_evidence = {}
+    semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_FACTCHECK_LOOKUPS)
+
+    async def search_one(claim_text: str) -> List[Dict[str, Any]]:
+        async with semaphore:
+            return await factcheck_api.search_fact_checks(claim_text)
+
+    unique_texts = list(dict.fromkeys(claim.get("text", "") for claim in claims))
+    results = await asyncio.gather(*(search_one(text) for text in unique_texts), return_exceptions=True)
+
+    fact_checks_by_text = {}
+    for text, result in zip(unique_texts, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Fact-check lookup failed for claim: {text[:50]}: {result}")
+            continue
+        fact_checks_by_text[text] = result
 
     for claim in claims:
         claim_text = claim.get("text", "")
         position = str(claim.get("position", 0))
-
-        # Search for fact-checks
-        fact_checks = await factcheck_api.search_fact_checks(claim_text)
+        fact_checks = fact_checks_by_text.get(claim_text)
 
         if fact_checks:
             # Convert to evidence format
@@ -1155,7 +1356,8 @@ async def retrieve_evidence_with_cache(
     claims: List[Dict[str, Any]],
     cache_service,
     factcheck_evidence: Dict = None,
-    source_url: Optional[str] = None
+    source_url: Optional[str] = None,
+    check_id: Optional[str] = None
 ) -> Dict[str, Any]:
     """Retrieve evidence using real search and embeddings with caching.
 
@@ -1193,7 +1395,8 @@ async def retrieve_evidence_with_cache(
             logger.info(f"Retrieving evidence for {len(uncached_claims)} uncached claims")
             retrieval_result = await retriever.retrieve_evidence_for_claims(
                 uncached_claims,
-                exclude_source_url=source_url
+                exclude_source_url=source_url,
+                check_id=check_id
             )
 
             # Extract evidence and raw evidence from new structure
@@ -0,0 +1,197 @@
+"""
+Staged pipeline tasks (ENABLE_STAGED_PIPELINE).
+
+The stages of process_check run as a Celery chain keyed by check_id:
+
+    ingest_extract (io) -> retrieve (io) -> verify (cpu) -> judge (io)
+
+I/O stages (HTTP fetches, search, LLM calls) go to PIPELINE_IO_QUEUE and run
+on more processes than cores, since they mostly wait; NLI verification goes
+to PIPELINE_CPU_QUEUE with one model-holding process per core. The context
+passed between stages lives in Redis (PipelineStateStore), so chain
+signatures only carry check_id/user_id.
+
+Both queues use the prefork pool. Each stage drives its coroutines with
+asyncio.run, and several services keep loop-bound state in process-wide
+singletons (HTTP clients, in-flight request maps), so a thread pool would
+have concurrent tasks sharing those across event loops.
+
+Workers:
+    celery -A app.workers worker -Q pipeline_io --pool=prefork --concurrency=<2 x cores> -n io@%h
+    celery -A app.workers worker -Q pipeline_cpu --pool=prefork --concurrency=<cores> -n cpu@%h
+
+Progress: each stage repoints check-task:{check_id} at its own task id, so the
+SSE stream follows the chain. Intermediate stages don't store a SUCCESS
+result (the stream would report the check as finished) but do store errors.
+"""
+
+import json
+import logging
+from typing import Dict, Any, Optional
+
+import redis
+from celery import chain
+
+from app.core.config import settings
+from app.workers import celery_app
+from app.workers.pipeline import (
+    PipelineTask,
+    new_pipeline_context,
+    run_ingest_extract_stage,
+    run_retrieve_stage,
+    run_verify_stage,
+    run_judge_stage,
+    update_check_status_sync,
+    process_check,
+)
+
+logger = logging.getLogger(__name__)
+
+# Matches the expiry used when checks.py stores the mapping
+TASK_MAPPING_TTL_SECONDS = 300
+
+
+def _json_default(value: Any) -> Any:
+    """Serialise numpy scalars and other stragglers in stage outputs"""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+class PipelineStateStore:
+    """Redis-backed stage context, one key per check"""
+
+    KEY_PREFIX = "tru8:pipeline:"
+
+    def __init__(self, redis_client=None, ttl_seconds: Optional[int] = None):
+        self._redis = redis_client
+        self.ttl_seconds = ttl_seconds or settings.PIPELINE_STATE_TTL_SECONDS
+
+    @property
+    def redis(self):
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        return self._redis
+
+    def _key(self, check_id: str) -> str:
+        return f"{self.KEY_PREFIX}{check_id}"
+
+    def save(self, ctx: Dict[str, Any]) -> None:
+        self.redis.set(
+            self._key(ctx["check_id"]),
+            json.dumps(ctx, default=_json_default),
+            ex=self.ttl_seconds
+        )
+
+    def load(self, check_id: str) -> Dict[str, Any]:
+        data = self.redis.get(self._key(check_id))
+        if data is None:
+            raise Exception(f"Pipeline state for check {check_id} is missing or expired")
+        return json.loads(data)
+
+    def delete(self, check_id: str) -> None:
+        try:
+            self.redis.delete(self._key(check_id))
+        except Exception as e:
+            logger.warning(f"Failed to delete pipeline state for check {check_id}: {e}")
+
+
+# Singleton instance
+_state_store: Optional[PipelineStateStore] = None
+
+
+def get_pipeline_state_store() -> PipelineStateStore:
+    """Get singleton PipelineStateStore instance"""
+    global _state_store
+    if _state_store is None:
+        _state_store = PipelineStateStore()
+    return _state_store
+
+
+def _track_stage(task, check_id: str) -> None:
+    """Point the SSE progress mapping at the running stage task"""
+    try:
+        get_pipeline_state_store().redis.set(
+            f"check-task:{check_id}", task.request.id, ex=TASK_MAPPING_TTL_SECONDS
+        )
+    except Exception as e:
+        logger.warning(f"Failed to update task mapping for check {check_id}: {e}")
+
+
+@celery_app.task(
+    base=PipelineTask, bind=True, max_retries=2, default_retry_delay=60,
+    ignore_result=True, store_errors_even_if_ignored=True,
+    name="app.workers.stages.ingest_extract"
+)
+def ingest_extract_stage(self, check_id: str, user_id: str, input_data: Dict[str, Any]) -> None:
+    """Stage task: ingest + claim extraction (I/O queue)"""
+    _track_stage(self, check_id)
+    update_check_status_sync(check_id, "processing")
+    ctx = new_pipeline_context(check_id, user_id, input_data)
+    run_ingest_extract_stage(self, ctx)
+    get_pipeline_state_store().save(ctx)
+
+
+@celery_app.task(
+    base=PipelineTask, bind=True,
+    ignore_result=True, store_errors_even_if_ignored=True,
+    name="app.workers.stages.retrieve"
+)
+def retrieve_stage(self, check_id: str, user_id: str) -> None:
+    """Stage task: fact-check lookup + evidence retrieval (I/O queue)"""
+    _track_stage(self, check_id)
+    store = get_pipeline_state_store()
+    ctx = store.load(check_id)
+    run_retrieve_stage(self, ctx)
+    store.save(ctx)
+
+
+@celery_app.task(
+    base=PipelineTask, bind=True,
+    ignore_result=True, store_errors_even_if_ignored=True,
+    name="app.workers.stages.verify"
+)
+def verify_stage(self, check_id: str, user_id: str) -> None:
+    """Stage task: NLI verification (CPU queue)"""
+    _track_stage(self, check_id)
+    store = get_pipeline_state_store()
+    ctx = store.load(check_id)
+    run_verify_stage(self, ctx)
+    store.save(ctx)
+
+
+@celery_app.task(base=PipelineTask, bind=True, name="app.workers.stages.judge")
+def judge_stage(self, check_id: str, user_id: str) -> Dict[str, Any]:
+    """Stage task: judgment, assessment and save (I/O queue). Its result is the check result."""
+    _track_stage(self, check_id)
+    store = get_pipeline_state_store()
+    final_result = run_judge_stage(self, store.load(check_id))
+    store.delete(check_id)
+    return final_result
+
+
+def build_check_chain(check_id: str, user_id: str, input_data: Dict[str, Any]):
+    """Immutable signatures so no stage receives the previous stage's return value"""
+    return chain(
+        ingest_extract_stage.si(check_id=check_id, user_id=user_id, input_data=input_data),
+        retrieve_stage.si(check_id=check_id, user_id=user_id),
+        verify_stage.si(check_id=check_id, user_id=user_id),
+        judge_stage.si(check_id=check_id, user_id=user_id),
+    )
+
+
+def dispatch_check(check_id: str, user_id: str, input_data: Dict[str, Any]):
+    """
+    Start processing a check.
+
+    Returns the AsyncResult of the first task to run, which is what the
+    check-task:{check_id} progress mapping should point at.
+    """
+    if not settings.ENABLE_STAGED_PIPELINE:
+        return process_check.delay(check_id=check_id, user_id=user_id, input_data=input_data)
+
+    result = build_check_chain(check_id, user_id, input_data).apply_async()
+    # apply_async returns the last task's result; walk back to the first stage
+    while result.parent is not None:
+        result = result.parent
+    return result
@@ -10,8 +10,10 @@ from app.core.config import settings
 from app.core.database import init_db
 from app.api.v1 import checks, users, auth, health, payments, feedback
 from app.core.logging import setup_logging
+from app.core.tracing import setup_tracing
 
 setup_logging()
+setup_tracing("tru8-api")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -58,6 +60,10 @@ if settings.SENTRY_DSN:
     sentry_sdk.init(dsn=settings.SENTRY_DSN, environment=settings.ENVIRONMENT)
     app.add_middleware(SentryAsgiMiddleware)
 
+if settings.ENABLE_TRACING:
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    FastAPIInstrumentor.instrument_app(app, excluded_urls="metrics,api/v1/health")
+
 # Metrics endpoint
 metrics_app = make_asgi_app()
 app.mount("/metrics", metrics_app)
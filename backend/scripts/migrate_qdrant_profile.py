@@ -0,0 +1,73 @@
+"""
+Migrate the Qdrant evidence collection to a storage profile.
+
+New collections are created with QDRANT_EVIDENCE_PROFILE; existing ones keep
+their layout until this script is run. The update is applied in place:
+Qdrant re-optimises segments in the background (collection status "yellow")
+and keeps serving searches meanwhile. Choose a profile with
+tests/performance/qdrant_profile_benchmark.py first.
+
+Usage:
+    python scripts/migrate_qdrant_profile.py --dry-run
+    python scripts/migrate_qdrant_profile.py --profile quantized
+    python scripts/migrate_qdrant_profile.py --profile quantized --wait
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.services.vector_store import COLLECTION_PROFILES, VectorStore, get_collection_profile
+
+
+async def migrate(profile_name: str, dry_run: bool, wait: bool) -> int:
+    vector_store = VectorStore()
+    try:
+        await vector_store.initialize()
+        profile = get_collection_profile(profile_name)
+        changes = await vector_store.apply_collection_profile(profile, dry_run=dry_run)
+
+        if not changes:
+            print(f"{vector_store.collection_name} already matches profile '{profile.name}'")
+            return 0
+
+        verb = "Would apply" if dry_run else "Applied"
+        print(f"{verb} profile '{profile.name}' to {vector_store.collection_name}:")
+        for change in changes:
+            print(f"  {change}")
+
+        if wait and not dry_run:
+            print("Waiting for segment optimisation...")
+            while True:
+                info = await vector_store.get_collection_info()
+                if str(info.get("status", "")).lower().endswith("green"):
+                    break
+                await asyncio.sleep(5)
+            print(f"Done: {info.get('points_count')} points, {info.get('segments_count')} segments")
+        return 0
+    finally:
+        await vector_store.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate the evidence collection to a Qdrant storage profile")
+    parser.add_argument(
+        "--profile",
+        choices=sorted(COLLECTION_PROFILES),
+        default=settings.QDRANT_EVIDENCE_PROFILE,
+        help="Target profile (default: QDRANT_EVIDENCE_PROFILE)"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only list the changes")
+    parser.add_argument("--wait", action="store_true", help="Wait until Qdrant finishes re-optimising")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(migrate(args.profile, args.dry_run, args.wait)))
+
+
+if __name__ == "__main__":
+    main()
@@ -88,6 +88,18 @@ cleanup() {
         kill $CELERY_PID 2>/dev/null || true
         echo "✓ Celery worker stopped"
     fi
+    if [ ! -z "$NOTIFY_PID" ]; then
+        kill $NOTIFY_PID 2>/dev/null || true
+        echo "✓ Notification worker stopped"
+    fi
+    if [ ! -z "$INFERENCE_PID" ]; then
+        kill $INFERENCE_PID 2>/dev/null || true
+        echo "✓ Inference server stopped"
+    fi
+    if [ ! -z "$STAGE_IO_PID" ]; then
+        kill $STAGE_IO_PID $STAGE_CPU_PID 2>/dev/null || true
+        echo "✓ Staged pipeline workers stopped"
+    fi
     echo "✓ FastAPI server stopped"
     exit 0
 }
@@ -95,6 +107,13 @@ cleanup() {
 # Set up signal handling
 trap cleanup SIGINT SIGTERM
 
+# Shared model server: workers with INFERENCE_MODE=remote don't load their own models
+if [ "$INFERENCE_MODE" = "remote" ]; then
+    echo "Starting inference server..."
+    uvicorn app.services.inference_server:app --uds "${INFERENCE_SERVER_UDS:-/tmp/tru8-inference.sock}" --log-level info > inference-server.log 2>&1 &
+    INFERENCE_PID=$!
+fi
+
 # Start Celery worker in background
 echo "Starting Celery worker..."
 # CRITICAL: Limit to 2 workers to prevent memory exhaustion (defaults to CPU count)
@@ -103,6 +122,20 @@ celery -A app.workers worker --concurrency=2 --loglevel=info --logfile=celery.lo
 CELERY_PID=$!
 echo "[Memory Safe] Using only 2 Celery workers"
 
+# Lightweight worker for push/email delivery (no ML models loaded)
+celery -A app.workers worker -Q notifications --pool=threads --concurrency=4 -n notifications@%h --loglevel=info --logfile=celery-notifications.log &
+NOTIFY_PID=$!
+
+# Staged pipeline: I/O stages on two processes per core (prefork - stages share
+# loop-bound async clients, so no thread pool), NLI on one process per core
+if [ "$ENABLE_STAGED_PIPELINE" = "true" ]; then
+    celery -A app.workers worker -Q pipeline_io --pool=prefork --concurrency=$((2 * $(nproc))) -n io@%h --loglevel=info --logfile=celery-io.log &
+    STAGE_IO_PID=$!
+    celery -A app.workers worker -Q pipeline_cpu --pool=prefork --concurrency=$(nproc) -n cpu@%h --loglevel=info --logfile=celery-cpu.log &
+    STAGE_CPU_PID=$!
+    echo "Staged pipeline workers started (pipeline_io, pipeline_cpu)"
+fi
+
 # Wait a moment for worker to start
 sleep 2
 
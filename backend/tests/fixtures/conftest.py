@@ -25,6 +25,7 @@ from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
+from fixtures.fake_redis import FakeRedis
 
 # Import mock libraries
 import sys
@@ -259,37 +260,13 @@ def mock_nli_model():
 @pytest.fixture
 def mock_redis_client():
     """
-    Mock Redis client for caching
+    In-memory Redis client for caching
 
     Created: 2025-11-03
-    Returns: Mock Redis client
+    Returns: FakeRedis (strings, hashes, sets, NX/EX, pipelines; see fixtures/fake_redis.py)
     Usage: def test_caching(mock_redis_client): ...
     """
-    mock_redis = Mock()
-
-    # In-memory cache for testing
-    cache_store = {}
-
-    def mock_get(key):
-        return cache_store.get(key)
-
-    def mock_set(key, value, ex=None):
-        cache_store[key] = value
-        return True
-
-    def mock_delete(key):
-        cache_store.pop(key, None)
-        return True
-
-    def mock_exists(key):
-        return key in cache_store
-
-    mock_redis.get = Mock(side_effect=mock_get)
-    mock_redis.set = Mock(side_effect=mock_set)
-    mock_redis.delete = Mock(side_effect=mock_delete)
-    mock_redis.exists = Mock(side_effect=mock_exists)
-
-    return mock_redis
+    return FakeRedis()
 
 
 # ==================== SAMPLE DATA FIXTURES ====================
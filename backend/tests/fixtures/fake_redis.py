@@ -0,0 +1,188 @@
+"""
+In-memory Redis stand-ins for unit tests
+
+FakeRedis mimics redis.Redis(decode_responses=True) for the commands the
+services use: strings (SET NX/EX, SETEX, INCR), hashes, sets, key expiry and
+pipelines. AsyncFakeRedis exposes the same state with redis.asyncio's
+awaitable methods.
+
+Expiry is recorded in `ttls` but never enforced; tests age entries by editing
+`data`/`hashes` directly. `commands` counts round trips (a pipeline counts once).
+"""
+
+from typing import Any, Dict, List, Optional, Set
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.Redis(decode_responses=True)"""
+
+    def __init__(self):
+        self.data: Dict[str, str] = {}
+        self.hashes: Dict[str, Dict[str, str]] = {}
+        self.sets: Dict[str, Set[str]] = {}
+        self.ttls: Dict[str, Optional[int]] = {}
+        self.commands = 0
+
+    # ---- strings ----
+
+    def get(self, key):
+        self.commands += 1
+        return self.data.get(key)
+
+    def mget(self, *keys):
+        self.commands += 1
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, nx=False, ex=None):
+        self.commands += 1
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value)
+        self.ttls[key] = ex
+        return True
+
+    def setex(self, key, ttl, value):
+        return self.set(key, value, ex=ttl)
+
+    def incr(self, key):
+        self.commands += 1
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    # ---- keys ----
+
+    def delete(self, *keys):
+        self.commands += 1
+        removed = 0
+        for key in keys:
+            for store in (self.data, self.hashes, self.sets):
+                if store.pop(key, None) is not None:
+                    removed += 1
+            self.ttls.pop(key, None)
+        return removed
+
+    def exists(self, *keys):
+        self.commands += 1
+        return sum(key in self.data or key in self.hashes or key in self.sets for key in keys)
+
+    def expire(self, key, ttl):
+        self.commands += 1
+        self.ttls[key] = ttl
+        return True
+
+    def keys(self, pattern="*"):
+        import fnmatch
+        self.commands += 1
+        names = set(self.data) | set(self.hashes) | set(self.sets)
+        return [name for name in names if fnmatch.fnmatchcase(name, pattern)]
+
+    # ---- hashes ----
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        self.commands += 1
+        fields = self.hashes.setdefault(key, {})
+        updates = dict(mapping or {})
+        if field is not None:
+            updates[field] = value
+        fields.update({k: str(v) for k, v in updates.items()})
+        return len(updates)
+
+    def hget(self, key, field):
+        self.commands += 1
+        return self.hashes.get(key, {}).get(field)
+
+    def hgetall(self, key):
+        self.commands += 1
+        return dict(self.hashes.get(key, {}))
+
+    def hmget(self, key, fields):
+        self.commands += 1
+        return [self.hashes.get(key, {}).get(field) for field in fields]
+
+    def hdel(self, key, *fields):
+        self.commands += 1
+        return sum(self.hashes.get(key, {}).pop(field, None) is not None for field in fields)
+
+    def hincrbyfloat(self, key, field, amount):
+        self.commands += 1
+        fields = self.hashes.setdefault(key, {})
+        fields[field] = str(float(fields.get(field, 0)) + amount)
+        return float(fields[field])
+
+    # ---- sets ----
+
+    def sadd(self, key, *members):
+        self.commands += 1
+        members_set = self.sets.setdefault(key, set())
+        added = len(set(members) - members_set)
+        members_set.update(members)
+        return added
+
+    def smembers(self, key):
+        self.commands += 1
+        return set(self.sets.get(key, set()))
+
+    def srem(self, key, *members):
+        self.commands += 1
+        members_set = self.sets.get(key, set())
+        removed = len(members_set & set(members))
+        members_set.difference_update(members)
+        return removed
+
+    # ---- connection ----
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def ping(self):
+        return True
+
+    def close(self):
+        pass
+
+
+class FakePipeline:
+    """Queues commands and runs them against the FakeRedis on execute()"""
+
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.queued: List[tuple] = []
+
+    def __getattr__(self, name):
+        command = getattr(self.redis, name)
+
+        def queue(*args, **kwargs):
+            self.queued.append((command, args, kwargs))
+            return self
+        return queue
+
+    def execute(self) -> List[Any]:
+        before = self.redis.commands
+        results = [command(*args, **kwargs) for command, args, kwargs in self.queued]
+        self.redis.commands = before + 1
+        self.queued = []
+        return results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.queued = []
+
+
+class AsyncFakeRedis:
+    """redis.asyncio counterpart of FakeRedis (same commands, awaitable)"""
+
+    def __init__(self, redis: Optional[FakeRedis] = None):
+        self.sync = redis or FakeRedis()
+
+    @property
+    def data(self) -> Dict[str, str]:
+        return self.sync.data
+
+    def __getattr__(self, name):
+        command = getattr(self.sync, name)
+
+        async def call(*args, **kwargs):
+            return command(*args, **kwargs)
+        return call
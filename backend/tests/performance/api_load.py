@@ -0,0 +1,716 @@
+"""
+API load-test scenarios for check submission and SSE progress streams.
+
+Serves the real FastAPI app (main.app) with uvicorn on a local port and
+drives it with an async httpx client of virtual users. Each user submits
+checks (POST /api/v1/checks) and optionally follows them on
+GET /api/v1/checks/{id}/progress until the completed event. The database
+and Redis are used for real. Celery is not: dispatch_check and
+AsyncResult are answered by FakePipelineBackend, which walks a check
+through the pipeline stages over --pipeline-seconds.
+
+Auth modes (--auth):
+    stub   get_current_user / get_current_user_sse overridden; the bearer
+           token is the user id (no JWT or Clerk cost)
+    jwt    real RS256 verification against a local key; email and name are
+           in the token, so no Clerk lookup
+    clerk  as jwt, but without email/name so every request makes the Clerk
+           user lookup, answered locally after --clerk-latency-ms
+
+Per scenario the report records submit and SSE latency percentiles, SSE
+completion lag (time between the fake task finishing and the client seeing
+"completed"), open server connections, busy threadpool workers, event-loop
+lag on the server loop and Redis commands/sec (server-wide INFO counter).
+Each scenario has budgets; a failed budget makes the exit status 1:
+
+    python -m tests.performance.api_load list
+    python -m tests.performance.api_load run --scenario sse_fanout --auth clerk --output load/sse.json
+    python -m tests.performance.api_load run --users 300 --budget "sse.connect_p95_ms<=500"
+
+Notes:
+    - Users and checks created by a run have ids starting "load-<run id>-"
+      and are deleted afterwards unless --keep-data is given.
+    - A virtual user switches to a fresh identity every FREE_TIER_CHECKS
+      checks so the monthly free-tier limit never rejects a submission.
+    - The server has its own thread and event loop, so client-side work
+      does not show up as server loop lag.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import socket
+import sys
+import threading
+import time
+import uuid
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from unittest.mock import patch
+
+import httpx
+
+from tests.performance.pipeline_benchmark import _git_commit
+
+logger = logging.getLogger(__name__)
+
+AUTH_MODES = ("stub", "jwt", "clerk")
+
+# Matches the free tier limit in create_check
+FREE_TIER_CHECKS = 3
+
+# (stage, progress) reported by the fake task, spread evenly over the run
+PIPELINE_STAGES = (
+    ("ingest", 10), ("extract", 25), ("retrieve", 40),
+    ("verify", 60), ("judge", 80), ("summary", 90),
+)
+
+SAMPLE_CLAIM = "The Eiffel Tower was completed in 1889 for the World's Fair in Paris."
+
+
+# ========== SCENARIOS ==========
+
+@dataclass
+class Scenario:
+    """
+    A load shape and its budgets. Budgets map a dotted report path to
+    {"max": value} or {"min": value}; a missing value fails the budget.
+    """
+    name: str
+    description: str
+    users: int
+    checks_per_user: int = 1
+    stream_progress: bool = True
+    pipeline_seconds: float = 5.0
+    ramp_seconds: float = 0.0
+    think_seconds: float = 0.0
+    budgets: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "submit_burst": Scenario(
+        name="submit_burst",
+        description="Concurrent submissions only (auth, user upsert, usage query, dispatch)",
+        users=50,
+        checks_per_user=3,
+        stream_progress=False,
+        budgets={
+            "submit.p95_ms": {"max": 750},
+            "submit.error_rate": {"max": 0.01},
+            "loop_lag.p99_ms": {"max": 100},
+        },
+    ),
+    "sse_fanout": Scenario(
+        name="sse_fanout",
+        description="Many progress streams held open at once",
+        users=150,
+        pipeline_seconds=15.0,
+        ramp_seconds=5.0,
+        budgets={
+            "sse.connect_p95_ms": {"max": 1000},
+            "sse.completed_ratio": {"min": 0.99},
+            "sse.completion_lag_p95_ms": {"max": 2000},
+            "sse.peak_open_ratio": {"min": 0.95},
+            "loop_lag.p99_ms": {"max": 100},
+        },
+    ),
+    "submit_and_stream": Scenario(
+        name="submit_and_stream",
+        description="Web client flow: submit, follow progress to completion, repeat",
+        users=30,
+        checks_per_user=3,
+        pipeline_seconds=5.0,
+        ramp_seconds=2.0,
+        think_seconds=1.0,
+        budgets={
+            "submit.p95_ms": {"max": 1000},
+            "submit.error_rate": {"max": 0.01},
+            "sse.connect_p95_ms": {"max": 1000},
+            "sse.completed_ratio": {"min": 0.99},
+            "sse.completion_lag_p95_ms": {"max": 2000},
+            "loop_lag.p99_ms": {"max": 100},
+        },
+    ),
+}
+
+
+def parse_budget(item: str) -> Tuple[str, Dict[str, float]]:
+    """'sse.connect_p95_ms<=500' -> ('sse.connect_p95_ms', {'max': 500.0})"""
+    for operator, kind in (("<=", "max"), (">=", "min")):
+        if operator in item:
+            metric, _, value = item.partition(operator)
+            return metric.strip(), {kind: float(value)}
+    raise ValueError(f"Budget must look like metric<=value or metric>=value: {item}")
+
+
+def lookup(report: Dict[str, Any], path: str) -> Optional[float]:
+    value: Any = report
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value if isinstance(value, (int, float)) else None
+
+
+def evaluate_budgets(report: Dict[str, Any], budgets: Dict[str, Dict[str, float]]) -> List[Dict[str, Any]]:
+    results = []
+    for metric, limit in budgets.items():
+        value = lookup(report, metric)
+        passed = value is not None
+        if passed and "max" in limit:
+            passed = value <= limit["max"]
+        if passed and "min" in limit:
+            passed = value >= limit["min"]
+        results.append({"metric": metric, "limit": limit, "value": value, "passed": passed})
+    return results
+
+
+# ========== FAKE CELERY BACKEND ==========
+
+class FakeAsyncResult:
+    """The parts of celery.result.AsyncResult the API reads"""
+
+    def __init__(self, backend: "FakePipelineBackend", task_id: str):
+        self.backend = backend
+        self.id = task_id
+
+    @property
+    def state(self) -> str:
+        return self.backend.snapshot(self.id)[0]
+
+    @property
+    def info(self) -> Optional[Dict[str, Any]]:
+        return self.backend.snapshot(self.id)[1]
+
+
+class FakePipelineBackend:
+    """
+    Stands in for the Celery app and dispatch_check. A dispatched task is
+    PENDING briefly, reports each PIPELINE_STAGES entry in turn and is
+    SUCCESS once pipeline_seconds have passed.
+    """
+
+    def __init__(self, pipeline_seconds: float = 5.0):
+        self.pipeline_seconds = pipeline_seconds
+        self.queue_seconds = min(0.5, pipeline_seconds * 0.1)
+        self._dispatched: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def dispatch_check(self, check_id: str, user_id: str, input_data: Dict[str, Any]) -> FakeAsyncResult:
+        task_id = str(uuid.uuid4())
+        with self._lock:
+            self._dispatched[task_id] = time.monotonic()
+        return FakeAsyncResult(self, task_id)
+
+    def AsyncResult(self, task_id: str) -> FakeAsyncResult:
+        return FakeAsyncResult(self, task_id)
+
+    def completes_at(self, task_id: str) -> Optional[float]:
+        started = self._dispatched.get(task_id)
+        return None if started is None else started + self.pipeline_seconds
+
+    def snapshot(self, task_id: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        started = self._dispatched.get(task_id)
+        if started is None:
+            return "PENDING", None
+        elapsed = time.monotonic() - started
+        if elapsed >= self.pipeline_seconds:
+            return "SUCCESS", {"status": "completed"}
+        if elapsed < self.queue_seconds:
+            return "PENDING", None
+        position = (elapsed - self.queue_seconds) / (self.pipeline_seconds - self.queue_seconds)
+        stage, progress = PIPELINE_STAGES[min(int(position * len(PIPELINE_STAGES)), len(PIPELINE_STAGES) - 1)]
+        return "PROGRESS", {"stage": stage, "progress": progress}
+
+    @property
+    def dispatched(self) -> int:
+        return len(self._dispatched)
+
+
+# ========== AUTH ==========
+
+class LoadTestAuth:
+    """Credentials for virtual users and the patches that make them valid"""
+
+    def __init__(self, mode: str = "stub", clerk_latency_ms: float = 150.0):
+        if mode not in AUTH_MODES:
+            raise ValueError(f"Unknown auth mode: {mode} (expected one of {', '.join(AUTH_MODES)})")
+        self.mode = mode
+        self.clerk_latency = clerk_latency_ms / 1000
+        self.clerk_lookups = 0
+        self._private_key = None
+        self._tokens: Dict[str, str] = {}
+
+    @staticmethod
+    def profile(user_id: str) -> Dict[str, str]:
+        return {"id": user_id, "email": f"{user_id}@loadtest.invalid", "name": "Load Test"}
+
+    def token(self, user_id: str) -> str:
+        if self.mode == "stub":
+            return user_id
+        if user_id not in self._tokens:
+            import jwt
+            from app.core.config import settings
+
+            now = int(time.time())
+            claims = {"sub": user_id, "iss": f"https://{settings.CLERK_JWT_ISSUER}", "iat": now, "exp": now + 3600}
+            if self.mode == "jwt":
+                profile = self.profile(user_id)
+                claims.update(email=profile["email"], name=profile["name"])
+            self._tokens[user_id] = jwt.encode(claims, self._private_key, algorithm="RS256")
+        return self._tokens[user_id]
+
+    def install(self, stack: ExitStack, app) -> None:
+        from fastapi import Query, Request
+
+        from app.core import auth
+
+        if self.mode == "stub":
+            async def stub_user(request: Request) -> dict:
+                return self.profile(request.headers.get("Authorization", "")[len("Bearer "):])
+
+            async def stub_user_sse(request: Request, token: Optional[str] = Query(None)) -> dict:
+                return self.profile(token or request.headers.get("Authorization", "")[len("Bearer "):])
+
+            app.dependency_overrides[auth.get_current_user] = stub_user
+            app.dependency_overrides[auth.get_current_user_sse] = stub_user_sse
+            stack.callback(app.dependency_overrides.pop, auth.get_current_user, None)
+            stack.callback(app.dependency_overrides.pop, auth.get_current_user_sse, None)
+            return
+
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        self._private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        signing_key = SimpleNamespace(key=self._private_key.public_key())
+        stack.enter_context(patch.object(
+            auth, "jwks_client", SimpleNamespace(get_signing_key_from_jwt=lambda token: signing_key),
+        ))
+
+        if self.mode == "clerk":
+            original = httpx.AsyncHTTPTransport.handle_async_request
+            owner = self
+
+            async def handle_async_request(transport, request):
+                if request.url.host != "api.clerk.com":
+                    return await original(transport, request)
+                owner.clerk_lookups += 1
+                await asyncio.sleep(owner.clerk_latency)
+                user_id = request.url.path.rsplit("/", 1)[-1]
+                profile = owner.profile(user_id)
+                return httpx.Response(200, json={
+                    "id": user_id,
+                    "email_addresses": [{"email_address": profile["email"]}],
+                    "first_name": "Load",
+                    "last_name": "Test",
+                })
+
+            stack.enter_context(patch.object(httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request))
+
+
+# ========== SERVER ==========
+
+class ServerMonitor:
+    """Samples loop lag, open connections and busy threadpool workers on the server loop"""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.thread_limit: Optional[int] = None
+        self.reset()
+
+    def reset(self) -> None:
+        self.lag_ms: List[float] = []
+        self.connections: List[int] = []
+        self.threads_busy: List[int] = []
+
+    async def run(self, server) -> None:
+        import anyio.to_thread
+
+        loop = asyncio.get_running_loop()
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        self.thread_limit = int(limiter.total_tokens)
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lag_ms.append(max(0.0, (loop.time() - start - self.interval) * 1000))
+            self.connections.append(len(server.server_state.connections))
+            self.threads_busy.append(int(limiter.borrowed_tokens))
+
+
+class LoadTestServer:
+    """uvicorn serving the app on a free local port, in its own thread and loop"""
+
+    def __init__(self, app, monitor: ServerMonitor):
+        import uvicorn
+
+        self.monitor = monitor
+        self.server = uvicorn.Server(uvicorn.Config(
+            app, lifespan="on", log_level="warning", access_log=False, timeout_keep_alive=30,
+        ))
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        self.port = self._socket.getsockname()[1]
+        self._thread = threading.Thread(target=self._run, name="load-test-server", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def _run(self) -> None:
+        asyncio.run(self._serve())
+
+    async def _serve(self) -> None:
+        sampler = asyncio.create_task(self.monitor.run(self.server))
+        try:
+            await self.server.serve(sockets=[self._socket])
+        finally:
+            sampler.cancel()
+
+    def start(self, timeout: float = 60.0) -> None:
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self.server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                raise RuntimeError("Load test server failed to start")
+            time.sleep(0.05)
+
+    def stop(self) -> None:
+        self.server.should_exit = True
+        self._thread.join(timeout=30)
+
+
+@contextmanager
+def load_test_app(backend: FakePipelineBackend, auth: LoadTestAuth) -> Iterator[LoadTestServer]:
+    """Start the API with the fake Celery backend and auth installed"""
+    from app.api.v1 import checks
+    from main import app
+
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(checks, "dispatch_check", backend.dispatch_check))
+        stack.enter_context(patch.object(checks, "celery_app", backend))
+        auth.install(stack, app)
+
+        server = LoadTestServer(app, ServerMonitor())
+        server.start()
+        stack.callback(server.stop)
+        yield server
+
+
+# ========== MEASUREMENT ==========
+
+def _percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"p50": None, "p95": None, "p99": None, "max": None}
+    ordered = sorted(values)
+
+    def pick(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * q))], 1)
+
+    return {"p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "max": round(ordered[-1], 1)}
+
+
+def _redis_commands() -> Optional[int]:
+    try:
+        import redis
+        from app.core.config import settings
+
+        client = redis.Redis.from_url(settings.REDIS_URL)
+        try:
+            return int(client.info("stats")["total_commands_processed"])
+        finally:
+            client.close()
+    except Exception as e:
+        logger.warning(f"Redis INFO unavailable: {e}")
+        return None
+
+
+@dataclass
+class _Samples:
+    submit_ms: List[float] = field(default_factory=list)
+    submit_status: Dict[str, int] = field(default_factory=dict)
+    connect_ms: List[float] = field(default_factory=list)
+    completion_lag_ms: List[float] = field(default_factory=list)
+    streams: int = 0
+    stream_outcomes: Dict[str, int] = field(default_factory=dict)
+    events: int = 0
+    open_streams: int = 0
+    peak_open: int = 0
+
+
+class ScenarioRunner:
+    """Virtual users for one scenario against a running server"""
+
+    def __init__(self, scenario: Scenario, server: LoadTestServer, backend: FakePipelineBackend,
+                 auth: LoadTestAuth, run_id: str):
+        self.scenario = scenario
+        self.server = server
+        self.backend = backend
+        self.auth = auth
+        self.run_id = run_id
+        self.samples = _Samples()
+
+    def identity(self, user: int, check: int) -> str:
+        return f"load-{self.run_id}-{self.scenario.name}-{user}-{check // FREE_TIER_CHECKS}"
+
+    async def submit(self, client: httpx.AsyncClient, user_id: str) -> Tuple[Optional[str], Optional[str]]:
+        start = time.perf_counter()
+        try:
+            response = await client.post(
+                "/api/v1/checks",
+                json={"input_type": "text", "content": SAMPLE_CLAIM},
+                headers={"Authorization": f"Bearer {self.auth.token(user_id)}"},
+            )
+            status = str(response.status_code)
+        except httpx.HTTPError as e:
+            response, status = None, type(e).__name__
+        self.samples.submit_ms.append((time.perf_counter() - start) * 1000)
+        self.samples.submit_status[status] = self.samples.submit_status.get(status, 0) + 1
+        if response is None or response.status_code != 201:
+            return None, None
+        body = response.json()
+        return body["check"]["id"], body["taskId"]
+
+    async def stream(self, client: httpx.AsyncClient, user_id: str, check_id: str, task_id: str) -> None:
+        samples = self.samples
+        samples.streams += 1
+        samples.open_streams += 1
+        samples.peak_open = max(samples.peak_open, samples.open_streams)
+        outcome = "disconnected"
+        start = time.perf_counter()
+        try:
+            async with client.stream(
+                "GET", f"/api/v1/checks/{check_id}/progress",
+                params={"token": self.auth.token(user_id)},
+                headers={"Accept": "text/event-stream", "Cache-Control": "no-cache"},
+            ) as response:
+                if response.status_code != 200:
+                    outcome = f"http_{response.status_code}"
+                    return
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    event = json.loads(line[len("data: "):])
+                    samples.events += 1
+                    if event.get("type") == "connected":
+                        samples.connect_ms.append((time.perf_counter() - start) * 1000)
+                    elif event.get("type") in ("completed", "error", "timeout"):
+                        outcome = event["type"]
+                        completes_at = self.backend.completes_at(task_id)
+                        if outcome == "completed" and completes_at is not None:
+                            samples.completion_lag_ms.append(max(0.0, (time.monotonic() - completes_at) * 1000))
+                        break
+        except httpx.HTTPError as e:
+            outcome = type(e).__name__
+        finally:
+            samples.open_streams -= 1
+            samples.stream_outcomes[outcome] = samples.stream_outcomes.get(outcome, 0) + 1
+
+    async def virtual_user(self, client: httpx.AsyncClient, user: int) -> None:
+        scenario = self.scenario
+        if scenario.ramp_seconds and scenario.users > 1:
+            await asyncio.sleep(scenario.ramp_seconds * user / (scenario.users - 1))
+        for n in range(scenario.checks_per_user):
+            user_id = self.identity(user, n)
+            check_id, task_id = await self.submit(client, user_id)
+            if check_id and scenario.stream_progress:
+                await self.stream(client, user_id, check_id, task_id)
+            if scenario.think_seconds:
+                await asyncio.sleep(scenario.think_seconds)
+
+    async def run(self) -> float:
+        scenario = self.scenario
+        limits = httpx.Limits(max_connections=scenario.users * 2, max_keepalive_connections=scenario.users * 2)
+        timeout = httpx.Timeout(30.0, read=scenario.pipeline_seconds + 60.0)
+        start = time.perf_counter()
+        async with httpx.AsyncClient(base_url=self.server.base_url, limits=limits, timeout=timeout) as client:
+            await asyncio.gather(*(self.virtual_user(client, user) for user in range(scenario.users)))
+        return time.perf_counter() - start
+
+    def report(self, duration: float, redis_commands: Optional[int]) -> Dict[str, Any]:
+        samples = self.samples
+        monitor = self.server.monitor
+        submitted = sum(samples.submit_status.values())
+        submit_errors = submitted - samples.submit_status.get("201", 0)
+        completed = samples.stream_outcomes.get("completed", 0)
+        submit_latency = _percentiles(samples.submit_ms)
+        connect = _percentiles(samples.connect_ms)
+        completion_lag = _percentiles(samples.completion_lag_ms)
+        lag = _percentiles(monitor.lag_ms)
+
+        return {
+            "scenario": self.scenario.name,
+            "config": {key: value for key, value in asdict(self.scenario).items() if key != "budgets"},
+            "duration_seconds": round(duration, 2),
+            "submit": {
+                "count": submitted,
+                "errors": submit_errors,
+                "error_rate": round(submit_errors / submitted, 4) if submitted else None,
+                "status_codes": samples.submit_status,
+                "throughput_per_sec": round(submitted / duration, 2) if duration else None,
+                **{f"{name}_ms": value for name, value in submit_latency.items()},
+            },
+            "sse": {
+                "streams": samples.streams,
+                "outcomes": samples.stream_outcomes,
+                "completed_ratio": round(completed / samples.streams, 4) if samples.streams else None,
+                "events": samples.events,
+                "peak_open": samples.peak_open,
+                "peak_open_ratio": round(samples.peak_open / self.scenario.users, 4),
+                **{f"connect_{name}_ms": value for name, value in connect.items()},
+                **{f"completion_lag_{name}_ms": value for name, value in completion_lag.items()},
+            },
+            "connections": {
+                "max_open": max(monitor.connections, default=0),
+                "mean_open": round(sum(monitor.connections) / len(monitor.connections), 1) if monitor.connections else 0,
+            },
+            "threadpool": {
+                "limit": monitor.thread_limit,
+                "max_busy": max(monitor.threads_busy, default=0),
+            },
+            "loop_lag": {f"{name}_ms": value for name, value in lag.items()},
+            "redis": {
+                "commands": redis_commands,
+                "ops_per_sec": round(redis_commands / duration, 1) if redis_commands is not None and duration else None,
+            },
+            "auth": {"mode": self.auth.mode, "clerk_lookups": self.auth.clerk_lookups},
+        }
+
+
+def run_scenario(scenario: Scenario, server: LoadTestServer, backend: FakePipelineBackend,
+                 auth: LoadTestAuth, run_id: str) -> Dict[str, Any]:
+    backend.pipeline_seconds = scenario.pipeline_seconds
+    backend.queue_seconds = min(0.5, scenario.pipeline_seconds * 0.1)
+    auth.clerk_lookups = 0
+    runner = ScenarioRunner(scenario, server, backend, auth, run_id)
+
+    redis_before = _redis_commands()
+    server.monitor.reset()
+    duration = asyncio.run(runner.run())
+    redis_after = _redis_commands()
+
+    commands = redis_after - redis_before if redis_before is not None and redis_after is not None else None
+    result = runner.report(duration, commands)
+    result["budgets"] = evaluate_budgets(result, scenario.budgets)
+    result["passed"] = all(budget["passed"] for budget in result["budgets"])
+    return result
+
+
+def cleanup(run_id: str) -> None:
+    """Delete the users and checks a run created"""
+    from sqlalchemy import delete
+
+    from app.core.database import sync_session
+    from app.models import Check, User
+
+    prefix = f"load-{run_id}-%"
+    with sync_session() as session:
+        session.execute(delete(Check).where(Check.user_id.like(prefix)))
+        session.execute(delete(User).where(User.id.like(prefix)))
+        session.commit()
+
+
+def run_load_test(scenarios: Sequence[Scenario], auth_mode: str = "stub", clerk_latency_ms: float = 150.0,
+                  keep_data: bool = False) -> Dict[str, Any]:
+    """Run scenarios one after another against a single server"""
+    run_id = uuid.uuid4().hex[:8]
+    backend = FakePipelineBackend()
+    auth = LoadTestAuth(auth_mode, clerk_latency_ms=clerk_latency_ms)
+    results = []
+    try:
+        with load_test_app(backend, auth) as server:
+            for scenario in scenarios:
+                logger.warning(f"Running scenario {scenario.name} ({scenario.users} users)")
+                results.append(run_scenario(scenario, server, backend, auth, run_id))
+    finally:
+        if not keep_data:
+            try:
+                cleanup(run_id)
+            except Exception as e:
+                logger.warning(f"Load test cleanup failed for run {run_id}: {e}")
+
+    return {
+        "meta": {
+            "generated_at": datetime.utcnow().isoformat(),
+            "run_id": run_id,
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "auth": auth_mode,
+            "clerk_latency_ms": clerk_latency_ms if auth_mode == "clerk" else None,
+        },
+        "scenarios": results,
+        "passed": all(result["passed"] for result in results),
+    }
+
+
+def summarize(report: Dict[str, Any]) -> List[str]:
+    lines = []
+    for result in report["scenarios"]:
+        lines.append(f"{result['scenario']}: {'PASS' if result['passed'] else 'FAIL'}")
+        for budget in result["budgets"]:
+            limit = " ".join(f"{kind} {value:g}" for kind, value in budget["limit"].items())
+            lines.append(f"  {'ok  ' if budget['passed'] else 'FAIL'} {budget['metric']:<28} {budget['value']!s:>10} ({limit})")
+    return lines
+
+
+# ========== CLI ==========
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="API load-test scenarios")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="List scenarios and their budgets")
+
+    run = commands.add_parser("run", help="Run scenarios against a local API server")
+    run.add_argument("--scenario", nargs="+", choices=sorted(SCENARIOS), help="Scenarios to run (default: all)")
+    run.add_argument("--auth", choices=AUTH_MODES, default="stub")
+    run.add_argument("--clerk-latency-ms", type=float, default=150.0, help="Simulated Clerk user lookup latency")
+    run.add_argument("--users", type=int, help="Override virtual users for every scenario")
+    run.add_argument("--pipeline-seconds", type=float, help="Override fake pipeline duration")
+    run.add_argument("--budget", action="append", default=[], metavar="METRIC<=VALUE",
+                     help="Add or replace a budget (e.g. submit.p95_ms<=500)")
+    run.add_argument("--keep-data", action="store_true", help="Keep the users and checks the run created")
+    run.add_argument("--output", help="Write the JSON report here (default: stdout)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for scenario in SCENARIOS.values():
+            print(f"{scenario.name}: {scenario.description} ({scenario.users} users)")
+            for metric, limit in scenario.budgets.items():
+                print(f"  {metric} {limit}")
+        return 0
+
+    budgets = dict(parse_budget(item) for item in args.budget)
+    scenarios = []
+    for name in args.scenario or SCENARIOS:
+        scenario = replace(SCENARIOS[name], budgets={**SCENARIOS[name].budgets, **budgets})
+        if args.users:
+            scenario = replace(scenario, users=args.users)
+        if args.pipeline_seconds:
+            scenario = replace(scenario, pipeline_seconds=args.pipeline_seconds)
+        scenarios.append(scenario)
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    report = run_load_test(scenarios, auth_mode=args.auth, clerk_latency_ms=args.clerk_latency_ms, keep_data=args.keep_data)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(output, encoding="utf-8")
+        print(f"Load test report written to {args.output}")
+    else:
+        print(output)
+    print("\n".join(summarize(report)), file=sys.stderr)
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,691 @@
+"""
+Offline pipeline benchmark.
+
+Replays recorded fixtures (tests/performance/fixtures/pipeline/*.json) through
+the real process_check stages (run_ingest_extract_stage, run_retrieve_stage,
+run_verify_stage, run_judge_stage). Outbound HTTP is answered from the fixture
+routes: search responses, fetched pages, adapter JSON and LLM completions.
+Local services are still used for real: Redis, the database, models (NLI,
+embeddings) and anything on localhost (inference server, Qdrant).
+
+For every concurrency level the report records per-stage wall and CPU time,
+peak RSS, Redis/DB/HTTP round trips and check throughput. Results are written
+as JSON so two runs can be compared:
+
+    python -m tests.performance.pipeline_benchmark run --concurrency 1 4 8 --output bench/before.json
+    python -m tests.performance.pipeline_benchmark run --set ENABLE_QUERY_PLANNING=false --output bench/after.json
+    python -m tests.performance.pipeline_benchmark compare bench/before.json bench/after.json
+
+Notes:
+    - Per-stage CPU time is process CPU over the stage, so it is exact at
+      concurrency 1 and overlaps between checks at higher levels.
+    - Peak RSS is reset per level on Linux (/proc/self/clear_refs); elsewhere
+      it is the process high-water mark.
+    - Notification delivery (a broker publish) is not run; the result save is.
+    - Search provider spacing (2.5s in production) is set by --search-spacing.
+    - With --set HTTP_TRANSPORT_MODE=replay --set HTTP_CASSETTE_DIR=<dir>,
+      clients that use app.core.http_transport replay recorded cassettes
+      (with their recorded latency) and fixture routes serve the rest.
+"""
+
+import argparse
+import asyncio
+import contextvars
+import fnmatch
+import functools
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "pipeline"
+
+STAGE_NAMES = ("ingest_extract", "retrieve", "verify", "judge")
+
+# Hosts that are never stubbed (local services are part of what we measure)
+DEFAULT_PASSTHROUGH_HOSTS = {"localhost", "127.0.0.1", "::1", "huggingface.co", "cdn-lfs.huggingface.co"}
+
+# Offline stand-ins so providers that check for a key still run
+OFFLINE_API_KEYS = ("BRAVE_API_KEY", "OPENAI_API_KEY", "GOOGLE_FACTCHECK_API_KEY")
+
+
+# ========== FIXTURES ==========
+
+@dataclass
+class FixtureRoute:
+    """
+    One canned response. host/path use fnmatch patterns and body_contains
+    (a string or list of strings) must all appear in the request body.
+    Routes of every loaded fixture are tried in order and the first match
+    wins, so LLM routes should quote something specific to their fixture.
+    """
+    host: str = "*"
+    path: str = "*"
+    method: str = "*"
+    body_contains: Union[str, List[str], None] = None
+    status: int = 200
+    json_body: Any = None
+    text: Optional[str] = None
+    completion: Any = None  # OpenAI chat completion message content (str or JSON object)
+    headers: Dict[str, str] = field(default_factory=dict)
+    latency_ms: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FixtureRoute":
+        data = dict(data)
+        if "json" in data:
+            data["json_body"] = data.pop("json")
+        return cls(**data)
+
+    def matches(self, method: str, host: str, path: str, body: str) -> bool:
+        if self.method != "*" and self.method.upper() != method.upper():
+            return False
+        if not fnmatch.fnmatch(host, self.host) or not fnmatch.fnmatch(path, self.path):
+            return False
+        needles = [self.body_contains] if isinstance(self.body_contains, str) else self.body_contains or []
+        return all(needle in body for needle in needles)
+
+    def render(self) -> Tuple[int, Dict[str, str], bytes]:
+        headers = dict(self.headers)
+        if self.completion is not None:
+            content = self.completion if isinstance(self.completion, str) else json.dumps(self.completion)
+            payload = {
+                "id": "chatcmpl-offline",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o-mini-2024-07-18",
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            }
+            headers.setdefault("content-type", "application/json")
+            return self.status, headers, json.dumps(payload).encode()
+        if self.json_body is not None:
+            headers.setdefault("content-type", "application/json")
+            return self.status, headers, json.dumps(self.json_body).encode()
+        headers.setdefault("content-type", "text/html; charset=utf-8")
+        return self.status, headers, (self.text or "").encode()
+
+
+@dataclass
+class PipelineFixture:
+    name: str
+    input: Dict[str, Any]
+    routes: List[FixtureRoute]
+    settings: Dict[str, Any] = field(default_factory=dict)
+    description: str = ""
+
+
+def load_fixtures(paths: Optional[Sequence[str]] = None) -> List[PipelineFixture]:
+    """Load fixture files (default: every JSON file in FIXTURE_DIR)"""
+    files = [Path(p) for p in paths] if paths else sorted(FIXTURE_DIR.glob("*.json"))
+    if not files:
+        raise FileNotFoundError(f"No pipeline fixtures found in {FIXTURE_DIR}")
+
+    fixtures = []
+    for path in files:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        fixtures.append(PipelineFixture(
+            name=data.get("name", path.stem),
+            description=data.get("description", ""),
+            input=data["input"],
+            routes=[FixtureRoute.from_dict(route) for route in data.get("routes", [])],
+            settings=data.get("settings", {}),
+        ))
+    return fixtures
+
+
+# ========== ROUND-TRIP ACCOUNTING ==========
+
+# Counter of the check stage running in the current context. Work handed to
+# bare executor threads (run_in_executor) has no context and is counted as
+# unattributed.
+_current_counter: contextvars.ContextVar[Optional[Counter]] = contextvars.ContextVar(
+    "benchmark_stage_counter", default=None
+)
+
+
+class RoundTripRecorder:
+    """Counts Redis commands, DB statements and HTTP requests per stage"""
+
+    def __init__(self):
+        self.unattributed: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, kind: str) -> None:
+        counter = _current_counter.get()
+        with self._lock:
+            (counter if counter is not None else self.unattributed)[kind] += 1
+
+    @contextmanager
+    def stage(self) -> Iterator[Counter]:
+        counter: Counter = Counter()
+        token = _current_counter.set(counter)
+        try:
+            yield counter
+        finally:
+            _current_counter.reset(token)
+
+    def install(self, stack: ExitStack) -> None:
+        self._install_redis(stack)
+        self._install_sqlalchemy(stack)
+
+    def _install_redis(self, stack: ExitStack) -> None:
+        try:
+            import redis
+            import redis.asyncio
+        except ImportError:
+            return
+
+        recorder = self
+
+        def count_sync(original):
+            @functools.wraps(original)
+            def wrapper(*args, **kwargs):
+                recorder.add("redis")
+                return original(*args, **kwargs)
+            return wrapper
+
+        def count_async(original):
+            @functools.wraps(original)
+            async def wrapper(*args, **kwargs):
+                recorder.add("redis")
+                return await original(*args, **kwargs)
+            return wrapper
+
+        # A pipeline is one round trip however many commands it buffers
+        stack.enter_context(patch.object(redis.Redis, "execute_command", count_sync(redis.Redis.execute_command)))
+        stack.enter_context(patch.object(redis.client.Pipeline, "execute", count_sync(redis.client.Pipeline.execute)))
+        stack.enter_context(patch.object(
+            redis.asyncio.Redis, "execute_command", count_async(redis.asyncio.Redis.execute_command)
+        ))
+        stack.enter_context(patch.object(
+            redis.asyncio.client.Pipeline, "execute", count_async(redis.asyncio.client.Pipeline.execute)
+        ))
+
+    def _install_sqlalchemy(self, stack: ExitStack) -> None:
+        try:
+            from sqlalchemy import event
+            from sqlalchemy.engine import Engine
+        except ImportError:
+            return
+
+        def on_execute(*args, **kwargs):
+            self.add("db")
+
+        event.listen(Engine, "before_cursor_execute", on_execute)
+        stack.callback(event.remove, Engine, "before_cursor_execute", on_execute)
+
+
+# ========== OFFLINE HTTP ==========
+
+class FixtureRouter:
+    """Serves outbound HTTP from fixture routes at the transport level"""
+
+    def __init__(self, routes: Sequence[FixtureRoute], recorder: RoundTripRecorder,
+                 latency_scale: float = 1.0, passthrough_hosts: Optional[set] = None):
+        self.routes = list(routes)
+        self.recorder = recorder
+        self.latency_scale = latency_scale
+        self.passthrough_hosts = set(passthrough_hosts or DEFAULT_PASSTHROUGH_HOSTS)
+        self.unmatched: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def is_passthrough(self, host: str) -> bool:
+        return host in self.passthrough_hosts
+
+    def resolve(self, method: str, url: str, body: bytes) -> Tuple[int, Dict[str, str], bytes, float]:
+        """Status, headers, body and injected latency (seconds) for a request"""
+        parts = urlsplit(url)
+        host, path = parts.hostname or "", parts.path or "/"
+        text = body.decode("utf-8", errors="replace") if body else ""
+
+        self.recorder.add("http")
+        for route in self.routes:
+            if route.matches(method, host, path, text):
+                status, headers, content = route.render()
+                return status, headers, content, route.latency_ms * self.latency_scale / 1000
+
+        self.recorder.add("http_unmatched")
+        with self._lock:
+            self.unmatched[f"{method} {host}{path}"] += 1
+        return 404, {"content-type": "text/plain"}, b"no fixture route", 0.0
+
+    def install(self, stack: ExitStack) -> None:
+        """Patch the default httpx transports and the requests adapter"""
+        import httpx
+        import requests
+        from requests.structures import CaseInsensitiveDict
+
+        router = self
+        original_sync = httpx.HTTPTransport.handle_request
+        original_async = httpx.AsyncHTTPTransport.handle_async_request
+        original_send = requests.adapters.HTTPAdapter.send
+
+        def handle_request(transport, request):
+            if router.is_passthrough(request.url.host):
+                return original_sync(transport, request)
+            status, headers, content, delay = router.resolve(request.method, str(request.url), request.read())
+            if delay:
+                time.sleep(delay)
+            return httpx.Response(status, headers=headers, content=content)
+
+        async def handle_async_request(transport, request):
+            if router.is_passthrough(request.url.host):
+                return await original_async(transport, request)
+            status, headers, content, delay = router.resolve(request.method, str(request.url), await request.aread())
+            if delay:
+                await asyncio.sleep(delay)
+            return httpx.Response(status, headers=headers, content=content)
+
+        def send(adapter, request, **kwargs):
+            host = urlsplit(request.url).hostname or ""
+            if router.is_passthrough(host):
+                return original_send(adapter, request, **kwargs)
+            body = request.body or b""
+            if isinstance(body, str):
+                body = body.encode()
+            status, headers, content, delay = router.resolve(request.method, request.url, body)
+            if delay:
+                time.sleep(delay)
+            response = requests.Response()
+            response.status_code = status
+            response.headers = CaseInsensitiveDict(headers)
+            response._content = content
+            response.encoding = "utf-8"
+            response.url = request.url
+            response.request = request
+            response.reason = "OK" if status < 400 else "Fixture"
+            return response
+
+        stack.enter_context(patch.object(httpx.HTTPTransport, "handle_request", handle_request))
+        stack.enter_context(patch.object(httpx.AsyncHTTPTransport, "handle_async_request", handle_async_request))
+        stack.enter_context(patch.object(requests.adapters.HTTPAdapter, "send", send))
+
+
+# ========== PIPELINE RUN ==========
+
+class BenchmarkTask:
+    """Stands in for the bound Celery task the stages receive"""
+    max_retries = 0
+
+    def __init__(self, check_id: str):
+        self.request = SimpleNamespace(id=f"bench-task-{check_id}", retries=0)
+
+    def update_state(self, state=None, meta=None):
+        pass
+
+    def retry(self, exc=None, **kwargs):
+        return exc or RuntimeError("retry requested")
+
+
+def _stage_functions():
+    from app.workers.pipeline import (
+        run_ingest_extract_stage, run_retrieve_stage, run_verify_stage, run_judge_stage,
+    )
+    return dict(zip(STAGE_NAMES, (run_ingest_extract_stage, run_retrieve_stage, run_verify_stage, run_judge_stage)))
+
+
+def run_check(fixture: PipelineFixture, recorder: RoundTripRecorder) -> Dict[str, Any]:
+    """Run one fixture through every stage and return its measurements"""
+    from app.workers.pipeline import new_pipeline_context
+
+    check_id = f"bench-{uuid.uuid4()}"
+    task = BenchmarkTask(check_id)
+    ctx = new_pipeline_context(check_id, "benchmark-user", fixture.input)
+    stages: Dict[str, Dict[str, Any]] = {}
+    error = None
+
+    check_start = time.perf_counter()
+    for name, stage_fn in _stage_functions().items():
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        with recorder.stage() as counter:
+            try:
+                stage_fn(task, ctx)
+            except Exception as e:
+                error = f"{name}: {e}"
+        stages[name] = {
+            "wall": time.perf_counter() - wall_start,
+            "cpu": time.process_time() - cpu_start,
+            **counter,
+        }
+        if error:
+            break
+
+    return {
+        "fixture": fixture.name,
+        "ok": error is None,
+        "error": error,
+        "wall": time.perf_counter() - check_start,
+        "stages": stages,
+        "sub_stages": dict(ctx.get("stage_timings", {})),
+    }
+
+
+def _distribution(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(values)
+    return {
+        "mean": round(statistics.fmean(ordered), 4),
+        "p50": round(ordered[len(ordered) // 2], 4),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+        "max": round(ordered[-1], 4),
+    }
+
+
+def _reset_peak_rss() -> None:
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss_mb() -> float:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+    except ImportError:
+        return 0.0
+
+
+def run_level(fixtures: List[PipelineFixture], concurrency: int, checks: int,
+              recorder: RoundTripRecorder, router: FixtureRouter) -> Dict[str, Any]:
+    """Run `checks` checks (cycling through fixtures) on `concurrency` threads"""
+    plan = [fixtures[i % len(fixtures)] for i in range(checks)]
+    unattributed_before = Counter(recorder.unattributed)
+    unmatched_before = sum(router.unmatched.values())
+
+    _reset_peak_rss()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bench") as pool:
+        results = list(pool.map(lambda fixture: run_check(fixture, recorder), plan))
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    completed = [r for r in results if r["ok"]]
+    stages = {}
+    for name in STAGE_NAMES:
+        rows = [r["stages"][name] for r in results if name in r["stages"]]
+        stages[name] = {
+            "wall": _distribution([row["wall"] for row in rows]),
+            "cpu": _distribution([row["cpu"] for row in rows]),
+            **{
+                f"{kind}_per_check": round(statistics.fmean([row.get(kind, 0) for row in rows]), 2) if rows else 0.0
+                for kind in ("redis", "db", "http")
+            },
+        }
+
+    sub_stage_names = sorted({name for r in completed for name in r["sub_stages"]})
+    totals = Counter()
+    for r in results:
+        for row in r["stages"].values():
+            totals.update({kind: row.get(kind, 0) for kind in ("redis", "db", "http", "http_unmatched")})
+
+    return {
+        "concurrency": concurrency,
+        "checks": checks,
+        "failed": len(results) - len(completed),
+        "wall_seconds": round(wall, 3),
+        "cpu_seconds": round(cpu, 3),
+        "cpu_utilisation": round(cpu / wall, 3) if wall else 0.0,
+        "throughput_checks_per_sec": round(len(completed) / wall, 4) if wall else 0.0,
+        "peak_rss_mb": _peak_rss_mb(),
+        "latency": _distribution([r["wall"] for r in completed]),
+        "stages": stages,
+        "sub_stages": {
+            name: _distribution([r["sub_stages"][name] for r in completed if name in r["sub_stages"]])
+            for name in sub_stage_names
+        },
+        "round_trips": {
+            **dict(totals),
+            "unattributed": dict(recorder.unattributed - unattributed_before),
+        },
+        "unmatched_requests": sum(router.unmatched.values()) - unmatched_before,
+        "errors": [r["error"] for r in results if r["error"]][:10],
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def _settings_overrides(fixtures: List[PipelineFixture], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    from app.core.config import settings
+
+    merged: Dict[str, Any] = {}
+    for fixture in fixtures:
+        for key, value in fixture.settings.items():
+            if key in merged and merged[key] != value:
+                raise ValueError(f"Fixtures disagree on setting {key}: {merged[key]!r} vs {value!r}")
+            merged[key] = value
+    merged.update(overrides)
+    for key in OFFLINE_API_KEYS:
+        if key not in merged and not getattr(settings, key, ""):
+            merged[key] = "offline-benchmark"
+    return merged
+
+
+@contextmanager
+def offline_pipeline(fixtures: List[PipelineFixture], overrides: Optional[Dict[str, Any]] = None,
+                     latency_scale: float = 1.0, search_spacing: float = 0.0) -> Iterator[Tuple[RoundTripRecorder, FixtureRouter, Dict[str, Any]]]:
+    """Install offline HTTP, round-trip counters and setting overrides"""
+    from app.core.config import settings
+    from app.services import search
+    from app.workers import pipeline
+
+    recorder = RoundTripRecorder()
+    router = FixtureRouter(
+        [route for fixture in fixtures for route in fixture.routes],
+        recorder,
+        latency_scale=latency_scale,
+        passthrough_hosts=DEFAULT_PASSTHROUGH_HOSTS | _local_service_hosts(settings),
+    )
+    applied = _settings_overrides(fixtures, overrides or {})
+
+    def with_spacing(original):
+        @functools.wraps(original)
+        def init(provider, *args, **kwargs):
+            original(provider, *args, **kwargs)
+            provider.request_spacing = search_spacing
+        return init
+
+    with ExitStack() as stack:
+        for key, value in applied.items():
+            stack.enter_context(patch.object(settings, key, value))
+        for provider_cls in (search.BraveSearchProvider, search.SerpAPIProvider):
+            stack.enter_context(patch.object(provider_cls, "__init__", with_spacing(provider_cls.__init__)))
+        stack.enter_context(patch.object(pipeline, "schedule_notification_delivery", lambda: None))
+        search.warmup_search_providers()
+        recorder.install(stack)
+        router.install(stack)
+        yield recorder, router, applied
+
+
+def _local_service_hosts(settings) -> set:
+    hosts = set()
+    for name in ("QDRANT_URL", "INFERENCE_SERVER_URL", "REDIS_URL", "DATABASE_URL"):
+        value = getattr(settings, name, None)
+        if value:
+            host = urlsplit(str(value)).hostname
+            if host:
+                hosts.add(host)
+    return hosts
+
+
+def _cassette_stats() -> Optional[Dict[str, int]]:
+    from app.core.config import settings
+    from app.core.http_transport import get_cassette_store
+
+    if settings.HTTP_TRANSPORT_MODE == "live":
+        return None
+    return get_cassette_store().stats()
+
+
+def run_benchmark(fixtures: List[PipelineFixture], levels: Sequence[int], rounds: int = 2, warmup: int = 1,
+                  overrides: Optional[Dict[str, Any]] = None, latency_scale: float = 1.0,
+                  search_spacing: float = 0.0) -> Dict[str, Any]:
+    """Run every concurrency level and return the JSON-serialisable report"""
+    with offline_pipeline(fixtures, overrides, latency_scale, search_spacing) as (recorder, router, applied):
+        # Model loading and first-use imports stay out of the measured levels
+        for i in range(warmup):
+            result = run_check(fixtures[i % len(fixtures)], recorder)
+            if not result["ok"]:
+                logger.warning(f"Warm-up check failed: {result['error']}")
+
+        report_levels = []
+        for concurrency in levels:
+            checks = max(concurrency * rounds, len(fixtures))
+            logger.info(f"Benchmark level: concurrency={concurrency}, checks={checks}")
+            report_levels.append(run_level(fixtures, concurrency, checks, recorder, router))
+
+        return {
+            "benchmark": "pipeline",
+            "created_at": datetime.utcnow().isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "fixtures": [fixture.name for fixture in fixtures],
+            "settings": {key: (value if key not in OFFLINE_API_KEYS else "***") for key, value in applied.items()},
+            "latency_scale": latency_scale,
+            "search_spacing": search_spacing,
+            "levels": report_levels,
+            "unmatched_requests": dict(router.unmatched.most_common(20)),
+            "cassettes": _cassette_stats(),
+        }
+
+
+# ========== COMPARISON ==========
+
+def _change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def compare_reports(before: Dict[str, Any], after: Dict[str, Any]) -> List[str]:
+    """Human-readable before/after lines for the concurrency levels both runs share"""
+    lines = [f"before: {before.get('git_commit')} {before.get('created_at')}",
+             f"after:  {after.get('git_commit')} {after.get('created_at')}"]
+    after_levels = {level["concurrency"]: level for level in after["levels"]}
+
+    for old in before["levels"]:
+        new = after_levels.get(old["concurrency"])
+        if new is None:
+            continue
+        lines.append(f"\nconcurrency {old['concurrency']}")
+        rows = [
+            ("throughput checks/s", old["throughput_checks_per_sec"], new["throughput_checks_per_sec"]),
+            ("latency p50 s", old["latency"]["p50"], new["latency"]["p50"]),
+            ("latency p95 s", old["latency"]["p95"], new["latency"]["p95"]),
+            ("cpu s", old["cpu_seconds"], new["cpu_seconds"]),
+            ("peak rss MB", old["peak_rss_mb"], new["peak_rss_mb"]),
+        ]
+        for stage in STAGE_NAMES:
+            old_stage, new_stage = old["stages"].get(stage), new["stages"].get(stage)
+            if not old_stage or not new_stage:
+                continue
+            rows.append((f"{stage} wall mean s", old_stage["wall"]["mean"], new_stage["wall"]["mean"]))
+            rows.append((f"{stage} cpu mean s", old_stage["cpu"]["mean"], new_stage["cpu"]["mean"]))
+            for kind in ("redis", "db", "http"):
+                rows.append((f"{stage} {kind}/check", old_stage[f"{kind}_per_check"], new_stage[f"{kind}_per_check"]))
+        for label, old_value, new_value in rows:
+            lines.append(f"  {label:<32} {old_value:>10} -> {new_value:<10} {_change(old_value, new_value)}")
+    return lines
+
+
+# ========== CLI ==========
+
+def _parse_override(item: str) -> Tuple[str, Any]:
+    key, _, raw = item.partition("=")
+    try:
+        return key, json.loads(raw)
+    except json.JSONDecodeError:
+        return key, raw
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline pipeline benchmark")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Replay fixtures through the pipeline stages")
+    run.add_argument("--fixtures", nargs="*", help="Fixture files (default: all in fixtures/pipeline)")
+    run.add_argument("--concurrency", nargs="+", type=int, default=[1, 4, 8])
+    run.add_argument("--rounds", type=int, default=2, help="Checks per level = concurrency * rounds")
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--latency-scale", type=float, default=1.0, help="Multiplier on fixture latency_ms (0 disables)")
+    run.add_argument("--search-spacing", type=float, default=0.0, help="Seconds between search provider requests")
+    run.add_argument("--set", action="append", default=[], metavar="KEY=VALUE", help="Override a setting (JSON value)")
+    run.add_argument("--output", help="Write the JSON report here (default: stdout)")
+
+    compare = commands.add_parser("compare", help="Compare two JSON reports")
+    compare.add_argument("before")
+    compare.add_argument("after")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        before = json.loads(Path(args.before).read_text(encoding="utf-8"))
+        after = json.loads(Path(args.after).read_text(encoding="utf-8"))
+        print("\n".join(compare_reports(before, after)))
+        return 0
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    report = run_benchmark(
+        load_fixtures(args.fixtures),
+        levels=args.concurrency,
+        rounds=args.rounds,
+        warmup=args.warmup,
+        overrides=dict(_parse_override(item) for item in args.set),
+        latency_scale=args.latency_scale,
+        search_spacing=args.search_spacing,
+    )
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(output, encoding="utf-8")
+        print(f"Benchmark report written to {args.output}")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
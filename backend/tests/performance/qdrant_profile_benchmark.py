@@ -0,0 +1,238 @@
+"""
+Recall/latency benchmark of Qdrant evidence collection profiles.
+
+Loads the same vectors into one scratch collection per profile
+(app.services.vector_store.COLLECTION_PROFILES) on a local Qdrant, computes
+exact nearest neighbours on the full-precision collection and reports, per
+profile and query-time hnsw_ef, recall@k and search latency. Vectors are
+either synthetic clustered 384-d unit vectors or copied from an existing
+collection:
+
+    python -m tests.performance.qdrant_profile_benchmark --points 200000 --ef 32 64 128 256
+    python -m tests.performance.qdrant_profile_benchmark --source-collection tru8_evidence --output bench/qdrant.json
+
+Notes:
+    - RAM figures are estimates from the layout (vectors, int8 copies, HNSW
+      links), not measured process memory.
+    - Queries are perturbed copies of stored vectors, so every query has
+      close neighbours, as evidence lookups do.
+    - Scratch collections are named bench_profile_<name> and dropped at the
+      end unless --keep is given.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.http import models as rest
+
+from app.services.vector_store import COLLECTION_PROFILES, CollectionProfile
+from tests.performance.pipeline_benchmark import _git_commit
+
+logger = logging.getLogger(__name__)
+
+DIMENSION = 384  # MiniLM-L6-v2
+HNSW_M = 16
+
+
+def synthetic_vectors(count: int, dimension: int = DIMENSION, clusters: int = 500, seed: int = 7) -> np.ndarray:
+    """Unit vectors around random topic centres (near-duplicate snippets cluster like this)"""
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, dimension)).astype(np.float32)
+    vectors = centres[rng.integers(0, clusters, count)] + 0.35 * rng.standard_normal((count, dimension)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def collection_vectors(client: QdrantClient, collection: str, limit: int) -> np.ndarray:
+    vectors, offset = [], None
+    while len(vectors) < limit:
+        points, offset = client.scroll(collection, limit=min(1000, limit - len(vectors)), offset=offset,
+                                       with_payload=False, with_vectors=True)
+        vectors.extend(point.vector for point in points)
+        if offset is None:
+            break
+    return np.asarray(vectors, dtype=np.float32)
+
+
+def query_vectors(vectors: np.ndarray, count: int, noise: float = 0.1, seed: int = 11) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    queries = vectors[rng.integers(0, len(vectors), count)] + noise * rng.standard_normal((count, vectors.shape[1])).astype(np.float32)
+    return queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+
+def estimated_ram_mb(profile: CollectionProfile, count: int, dimension: int) -> float:
+    ram = 0 if profile.vectors_on_disk else count * dimension * 4
+    if profile.quantization and profile.quantized_in_ram:
+        ram += count * dimension
+    if not profile.hnsw_on_disk:
+        ram += count * HNSW_M * 2 * 4  # Level-0 links dominate
+    return round(ram / 1024 / 1024, 1)
+
+
+def load_collection(client: QdrantClient, name: str, profile: CollectionProfile, vectors: np.ndarray,
+                    batch_size: int = 1000, timeout: float = 1800) -> float:
+    """Create and fill a scratch collection; returns seconds until indexing finished"""
+    client.recreate_collection(
+        collection_name=name,
+        vectors_config=profile.vectors_config(vectors.shape[1]),
+        optimizers_config=profile.optimizers_config(),
+        hnsw_config=profile.hnsw_config(),
+        quantization_config=profile.quantization_config(),
+    )
+    start = time.perf_counter()
+    for i in range(0, len(vectors), batch_size):
+        client.upsert(name, points=rest.Batch(
+            ids=list(range(i, min(i + batch_size, len(vectors)))),
+            vectors=vectors[i:i + batch_size].tolist(),
+        ), wait=False)
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        info = client.get_collection(name)
+        if info.status == rest.CollectionStatus.GREEN and (info.points_count or 0) >= len(vectors):
+            break
+        time.sleep(1)
+    else:
+        logger.warning(f"{name} still optimising after {timeout}s; results include unindexed segments")
+    return time.perf_counter() - start
+
+
+def exact_neighbours(client: QdrantClient, name: str, queries: np.ndarray, k: int) -> List[set]:
+    return [
+        {point.id for point in client.search(name, query_vector=query.tolist(), limit=k,
+                                             search_params=rest.SearchParams(exact=True))}
+        for query in queries
+    ]
+
+
+def measure(client: QdrantClient, name: str, profile: CollectionProfile, queries: np.ndarray,
+            truth: List[set], k: int, hnsw_ef: int) -> Dict[str, Any]:
+    params = profile.search_params(hnsw_ef)
+    latencies, recalls = [], []
+    for query, expected in zip(queries, truth):
+        start = time.perf_counter()
+        found = client.search(name, query_vector=query.tolist(), limit=k, search_params=params)
+        latencies.append((time.perf_counter() - start) * 1000)
+        recalls.append(len({point.id for point in found} & expected) / k)
+
+    ordered = sorted(latencies)
+    return {
+        "hnsw_ef": hnsw_ef,
+        "recall_at_k": round(statistics.fmean(recalls), 4),
+        "min_recall": round(min(recalls), 4),
+        "latency_ms": {
+            "mean": round(statistics.fmean(ordered), 2),
+            "p50": round(ordered[len(ordered) // 2], 2),
+            "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+            "p99": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 2),
+        },
+    }
+
+
+def run_benchmark(url: str, profiles: Sequence[str], points: int, queries: int, k: int, ef_values: Sequence[int],
+                  source_collection: Optional[str] = None, keep: bool = False) -> Dict[str, Any]:
+    client = QdrantClient(url=url, timeout=120)
+    vectors = collection_vectors(client, source_collection, points) if source_collection else synthetic_vectors(points)
+    probe = query_vectors(vectors, queries)
+
+    truth_name = "bench_profile_truth"
+    results = []
+    try:
+        # Exact neighbours do not depend on the layout; compute them once on the float32 copy
+        load_collection(client, truth_name, COLLECTION_PROFILES["memory"], vectors)
+        truth = exact_neighbours(client, truth_name, probe, k)
+
+        for profile_name in profiles:
+            profile = COLLECTION_PROFILES[profile_name]
+            name = f"bench_profile_{profile_name}"
+            logger.warning(f"Loading {len(vectors)} vectors into {name}")
+            index_seconds = load_collection(client, name, profile, vectors)
+            info = client.get_collection(name)
+            results.append({
+                "profile": profile_name,
+                "layout": {
+                    "quantization": profile.quantization,
+                    "vectors_on_disk": profile.vectors_on_disk,
+                    "hnsw_on_disk": profile.hnsw_on_disk,
+                    "memmap_threshold_kb": profile.memmap_threshold_kb,
+                    "oversampling": profile.oversampling if profile.quantization else None,
+                },
+                "index_seconds": round(index_seconds, 1),
+                "segments": info.segments_count,
+                "estimated_ram_mb": estimated_ram_mb(profile, len(vectors), vectors.shape[1]),
+                "searches": [measure(client, name, profile, probe, truth, k, ef) for ef in ef_values],
+            })
+            if not keep:
+                client.delete_collection(name)
+    finally:
+        if not keep:
+            client.delete_collection(truth_name)
+        client.close()
+
+    return {
+        "meta": {
+            "generated_at": datetime.utcnow().isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "qdrant_url": url,
+            "points": len(vectors),
+            "queries": queries,
+            "k": k,
+            "source": source_collection or "synthetic",
+        },
+        "profiles": results,
+    }
+
+
+def summarize(report: Dict[str, Any]) -> List[str]:
+    lines = [f"{'profile':<10} {'ef':>5} {'recall@k':>9} {'p50 ms':>8} {'p95 ms':>8} {'RAM MB (est)':>13}"]
+    for result in report["profiles"]:
+        for search in result["searches"]:
+            lines.append(
+                f"{result['profile']:<10} {search['hnsw_ef']:>5} {search['recall_at_k']:>9.4f} "
+                f"{search['latency_ms']['p50']:>8.2f} {search['latency_ms']['p95']:>8.2f} {result['estimated_ram_mb']:>13.1f}"
+            )
+    return lines
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Qdrant collection profile recall/latency benchmark")
+    parser.add_argument("--url", default="http://localhost:6333", help="Local Qdrant (scratch collections are created here)")
+    parser.add_argument("--profiles", nargs="+", choices=sorted(COLLECTION_PROFILES), default=list(COLLECTION_PROFILES))
+    parser.add_argument("--points", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--ef", nargs="+", type=int, default=[32, 64, 128, 256], help="Query-time hnsw_ef values")
+    parser.add_argument("--source-collection", help="Copy vectors from this collection instead of synthetic ones")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch collections")
+    parser.add_argument("--output", help="Write the JSON report here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    report = run_benchmark(args.url, args.profiles, args.points, args.queries, args.k, args.ef,
+                           source_collection=args.source_collection, keep=args.keep)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(output, encoding="utf-8")
+        print(f"Benchmark report written to {args.output}")
+    else:
+        print(output)
+    print("\n".join(summarize(report)), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
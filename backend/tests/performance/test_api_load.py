@@ -0,0 +1,99 @@
+"""
+API load-test scenarios: fake Celery backend, budgets and a small live run.
+
+Full scenarios are run from the command line
+(see tests/performance/api_load.py).
+"""
+
+import json
+import time
+from dataclasses import replace
+
+import pytest
+
+from tests.performance.api_load import (
+    SCENARIOS,
+    FakePipelineBackend,
+    evaluate_budgets,
+    parse_budget,
+    run_load_test,
+)
+
+
+class TestFakePipelineBackend:
+    """Test the Celery stand-in the progress stream polls"""
+
+    def test_task_walks_through_stages(self, monkeypatch):
+        """Test: A task goes PENDING -> PROGRESS (rising) -> SUCCESS over pipeline_seconds"""
+        backend = FakePipelineBackend(pipeline_seconds=10.0)
+        clock = [100.0]
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+
+        task = backend.dispatch_check(check_id="c1", user_id="u1", input_data={})
+        assert backend.AsyncResult(task.id).state == "PENDING"
+
+        progress = []
+        for elapsed in (1.0, 3.0, 5.0, 7.0, 9.5):
+            clock[0] = 100.0 + elapsed
+            assert task.state == "PROGRESS"
+            progress.append(task.info["progress"])
+        assert progress == sorted(progress) and progress[0] < progress[-1]
+
+        clock[0] = 110.0
+        assert task.state == "SUCCESS"
+        assert backend.completes_at(task.id) == 110.0
+
+    def test_unknown_task_is_pending(self):
+        """Test: Tasks the backend never dispatched stay PENDING"""
+        backend = FakePipelineBackend()
+        assert backend.AsyncResult("missing").state == "PENDING"
+        assert backend.completes_at("missing") is None
+
+
+class TestBudgets:
+    """Test pass/fail budget evaluation"""
+
+    def test_max_min_and_missing(self):
+        """Test: max and min limits compare against the report; missing values fail"""
+        report = {"submit": {"p95_ms": 420.0}, "sse": {"completed_ratio": 0.9, "connect_p95_ms": None}}
+        results = evaluate_budgets(report, {
+            "submit.p95_ms": {"max": 500},
+            "sse.completed_ratio": {"min": 0.99},
+            "sse.connect_p95_ms": {"max": 1000},
+        })
+
+        assert [result["passed"] for result in results] == [True, False, False]
+
+    def test_parse_budget(self):
+        """Test: CLI budgets accept <= and >= forms"""
+        assert parse_budget("submit.p95_ms<=500") == ("submit.p95_ms", {"max": 500.0})
+        assert parse_budget("sse.completed_ratio >= 0.95") == ("sse.completed_ratio", {"min": 0.95})
+        with pytest.raises(ValueError):
+            parse_budget("submit.p95_ms=500")
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.requires_db
+@pytest.mark.requires_redis
+class TestApiLoadRun:
+    """Run a reduced scenario against the real app"""
+
+    @pytest.mark.parametrize("auth_mode", ["stub", "clerk"])
+    def test_submit_and_stream_smoke(self, auth_mode):
+        """Test: Submissions succeed, streams complete and every metric is reported"""
+        scenario = replace(
+            SCENARIOS["submit_and_stream"],
+            users=4, checks_per_user=1, pipeline_seconds=2.0, ramp_seconds=0.0, think_seconds=0.0,
+        )
+        report = run_load_test([scenario], auth_mode=auth_mode, clerk_latency_ms=20)
+
+        result = report["scenarios"][0]
+        assert result["submit"]["status_codes"] == {"201": 4}
+        assert result["sse"]["outcomes"] == {"completed": 4}
+        assert result["connections"]["max_open"] >= 1
+        assert result["loop_lag"]["p99_ms"] is not None
+        assert result["redis"]["ops_per_sec"] > 0
+        if auth_mode == "clerk":
+            assert result["auth"]["clerk_lookups"] == 8
+        json.dumps(report)
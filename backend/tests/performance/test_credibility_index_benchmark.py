@@ -0,0 +1,63 @@
+"""
+Throughput benchmark for source credibility tier matching.
+
+Compares the compiled tier index against the original linear two-pass scan
+over a large synthetic URL corpus built from source_credibility.json
+(listed domains, subdomains under wildcard suffixes, path sections and
+unknown domains).
+"""
+import pytest
+import random
+import time
+
+from app.services.source_credibility import SourceCredibilityService
+
+
+CORPUS_SIZE = 50000
+
+
+class TestCredibilityIndexBenchmark:
+    """Measure tier lookups per second (uncached)"""
+
+    @pytest.fixture
+    def service(self):
+        return SourceCredibilityService()
+
+    @pytest.fixture
+    def url_corpus(self, service):
+        """(domain, path) pairs resembling evidence URLs"""
+        rng = random.Random(42)
+        domains = []
+        for tier_config in service.config.values():
+            for pattern in tier_config.get('domains', []):
+                domain = pattern.split('/')[0].lower()
+                if domain.startswith('*.'):
+                    domain = f"institution{rng.randint(0, 999)}" + domain[1:]
+                domains.append(domain)
+        domains += [f"unknown-site-{i}.com" for i in range(len(domains))]
+
+        sections = ['', '/news', '/sport', '/sport/football', '/business', '/football', '/politics', '/science']
+        return [
+            (rng.choice(domains), rng.choice(sections) + f"/article-{rng.randint(0, 99999)}")
+            for _ in range(CORPUS_SIZE)
+        ]
+
+    def _measure(self, match, corpus):
+        start = time.perf_counter()
+        results = [match(domain, path)['tier'] for domain, path in corpus]
+        elapsed = time.perf_counter() - start
+        return results, elapsed
+
+    @pytest.mark.performance
+    def test_compiled_index_throughput(self, service, url_corpus):
+        """Compiled index should be much faster and return identical tiers"""
+        compiled_tiers, compiled_time = self._measure(service._match_domain_to_tier, url_corpus)
+        linear_tiers, linear_time = self._measure(service._match_domain_to_tier_linear, url_corpus)
+
+        print(f"\n=== Credibility Tier Matching ({len(url_corpus)} URLs) ===")
+        print(f"Compiled: {len(url_corpus) / compiled_time:,.0f} lookups/s ({compiled_time * 1000:.1f}ms)")
+        print(f"Linear:   {len(url_corpus) / linear_time:,.0f} lookups/s ({linear_time * 1000:.1f}ms)")
+        print(f"Speedup:  {linear_time / compiled_time:.1f}x")
+
+        assert compiled_tiers == linear_tiers
+        assert compiled_time < linear_time
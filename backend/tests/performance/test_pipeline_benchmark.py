@@ -0,0 +1,126 @@
+"""
+Offline pipeline benchmark: fixture routing and an end-to-end smoke run.
+
+Full runs with several concurrency levels are made from the command line
+(see tests/performance/pipeline_benchmark.py).
+"""
+
+import json
+from contextlib import ExitStack
+
+import httpx
+import pytest
+import requests
+
+from tests.performance.pipeline_benchmark import (
+    STAGE_NAMES,
+    FixtureRoute,
+    FixtureRouter,
+    RoundTripRecorder,
+    compare_reports,
+    load_fixtures,
+    run_benchmark,
+)
+
+
+@pytest.fixture
+def recorder():
+    return RoundTripRecorder()
+
+
+@pytest.fixture
+def router(recorder):
+    routes = [
+        FixtureRoute(host="api.openai.com", body_contains=["CLAIM TO JUDGE", "Earth"], completion={"verdict": "supported"}),
+        FixtureRoute(host="api.search.brave.com", path="/res/v1/web/search", json_body={"web": {"results": []}}),
+        FixtureRoute(host="*.example.com", method="GET", text="<html>page</html>"),
+    ]
+    router = FixtureRouter(routes, recorder, latency_scale=0)
+    with ExitStack() as stack:
+        router.install(stack)
+        yield router
+
+
+class TestFixtureRouter:
+    """Test offline HTTP replay at the transport level"""
+
+    @pytest.mark.asyncio
+    async def test_async_client_served_from_fixture(self, router, recorder):
+        """Test: httpx.AsyncClient requests never leave the process"""
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                "https://api.openai.com/v1/chat/completions",
+                json={"messages": [{"content": "CLAIM TO JUDGE: The Earth is round"}]},
+            )
+
+        content = response.json()["choices"][0]["message"]["content"]
+        assert json.loads(content) == {"verdict": "supported"}
+        assert recorder.unattributed["http"] == 1
+
+    def test_sync_clients_served_from_fixture(self, router):
+        """Test: httpx.Client (adapters) and requests (ingest) are both routed"""
+        with httpx.Client() as client:
+            assert client.get("https://api.search.brave.com/res/v1/web/search").json() == {"web": {"results": []}}
+        assert requests.get("https://news.example.com/story").text == "<html>page</html>"
+
+    def test_unmatched_request_returns_404(self, router, recorder):
+        """Test: Requests without a route get a 404 and are reported"""
+        with httpx.Client() as client:
+            response = client.get("https://api.unknown.org/data")
+
+        assert response.status_code == 404
+        assert router.unmatched == {"GET api.unknown.org/data": 1}
+        assert recorder.unattributed["http_unmatched"] == 1
+
+    def test_counts_attributed_to_current_stage(self, router, recorder):
+        """Test: Round trips inside a stage land on that stage's counter"""
+        with recorder.stage() as counter:
+            with httpx.Client() as client:
+                client.get("https://www.example.com/a")
+                client.get("https://www.example.com/b")
+
+        assert counter["http"] == 2
+        assert recorder.unattributed["http"] == 0
+
+
+class TestReportComparison:
+    """Test before/after report comparison"""
+
+    def test_compare_shared_levels(self):
+        """Test: Shared concurrency levels are compared with percentage change"""
+        stage = {"wall": {"mean": 1.0}, "cpu": {"mean": 0.5}, "redis_per_check": 4, "db_per_check": 1, "http_per_check": 10}
+        level = {
+            "concurrency": 1, "throughput_checks_per_sec": 0.5, "latency": {"p50": 2.0, "p95": 3.0},
+            "cpu_seconds": 1.0, "peak_rss_mb": 900.0, "stages": {"retrieve": stage},
+        }
+        faster = json.loads(json.dumps(level))
+        faster["throughput_checks_per_sec"] = 1.0
+        faster["stages"]["retrieve"]["redis_per_check"] = 2
+
+        lines = compare_reports({"levels": [level]}, {"levels": [faster, {**level, "concurrency": 8}]})
+        text = "\n".join(lines)
+
+        assert "concurrency 1" in text
+        assert "concurrency 8" not in text
+        assert "+100.0%" in text
+        assert "-50.0%" in text
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.requires_ml_models
+@pytest.mark.requires_redis
+class TestPipelineBenchmarkRun:
+    """Replay the recorded fixtures through the real stages"""
+
+    def test_single_level_smoke(self):
+        """Test: Every fixture completes offline and the report covers all stages"""
+        fixtures = load_fixtures()
+        report = run_benchmark(fixtures, levels=[1], rounds=1, warmup=0, latency_scale=0)
+
+        level = report["levels"][0]
+        assert level["failed"] == 0, level["errors"]
+        assert set(level["stages"]) == set(STAGE_NAMES)
+        assert level["throughput_checks_per_sec"] > 0
+        assert level["peak_rss_mb"] > 0
+        json.dumps(report)
@@ -0,0 +1,85 @@
+"""
+Tests for chunked (map-reduce) claim extraction on long documents.
+"""
+
+import pytest
+from unittest.mock import patch, AsyncMock
+
+from app.pipeline.extract import ClaimExtractor, split_into_chunks
+
+
+def _paragraph(word: str, count: int) -> str:
+    return " ".join([word] * count) + "."
+
+
+class TestSplitIntoChunks:
+    """Test paragraph-boundary chunking with overlap"""
+
+    def test_short_content_single_chunk(self):
+        content = "First paragraph here.\n\nSecond paragraph here."
+        assert split_into_chunks(content, chunk_words=100, overlap_words=10) == [content]
+
+    def test_chunks_respect_paragraph_boundaries(self):
+        paragraphs = [_paragraph(f"p{i}", 40) for i in range(5)]
+        chunks = split_into_chunks("\n\n".join(paragraphs), chunk_words=100, overlap_words=0)
+
+        assert len(chunks) == 3
+        for chunk in chunks:
+            for part in chunk.split("\n\n"):
+                assert part in paragraphs
+
+    def test_overlap_repeats_trailing_paragraph(self):
+        paragraphs = [_paragraph(f"p{i}", 40) for i in range(4)]
+        chunks = split_into_chunks("\n\n".join(paragraphs), chunk_words=100, overlap_words=50)
+
+        # Last paragraph of each chunk starts the next one
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current.split("\n\n")[0] == previous.split("\n\n")[-1]
+
+    def test_oversized_paragraph_split_on_sentences(self):
+        paragraph = " ".join(_paragraph(f"s{i}", 30) for i in range(6))
+        chunks = split_into_chunks(paragraph, chunk_words=70, overlap_words=0)
+
+        assert len(chunks) > 1
+        assert all(len(chunk.split()) <= 70 for chunk in chunks)
+
+
+class TestChunkedExtraction:
+    """Test the reduce step: merge, dedup, cap and re-number"""
+
+    @pytest.fixture
+    def claim_extractor(self):
+        extractor = ClaimExtractor()
+        extractor.openai_api_key = "test-key"
+        extractor.max_claims = 3
+        return extractor
+
+    @pytest.mark.asyncio
+    async def test_merges_dedups_caps_and_renumbers(self, claim_extractor):
+        chunk_claims = [
+            [{"text": "Tesla delivered 1.3 million vehicles in 2022", "confidence": 90, "position": 0}],
+            [{"text": "Tesla delivered 1.3 million vehicles in 2022.", "confidence": 95, "position": 0},
+             {"text": "Tesla opened a factory in Berlin in 2022", "confidence": 60, "position": 1}],
+            [{"text": "Tesla reported revenue of $81 billion in 2022", "confidence": 85, "position": 0},
+             {"text": "Elon Musk became CEO of Tesla in 2008", "confidence": 80, "position": 1}],
+        ]
+        responses = [{"success": True, "claims": claims, "metadata": {}} for claims in chunk_claims]
+
+        content = "\n\n".join(_paragraph(f"p{i}", 40) for i in range(3))
+        with patch.object(claim_extractor, "_extract_with_openai", AsyncMock(side_effect=responses)), \
+             patch("app.pipeline.extract.split_into_chunks", return_value=["a", "b", "c"]), \
+             patch("app.services.embeddings.get_embedding_service", AsyncMock(side_effect=RuntimeError("offline"))), \
+             patch("app.pipeline.extract.settings.ENABLE_ARTICLE_CLASSIFICATION", False):
+            result = await claim_extractor._extract_chunked(content, {"title": "Tesla"})
+
+        assert result["success"]
+        texts = [c["text"] for c in result["claims"]]
+        # Overlap duplicate merged, lowest-confidence claim dropped by the global cap
+        assert texts == [
+            "Tesla delivered 1.3 million vehicles in 2022",
+            "Tesla reported revenue of $81 billion in 2022",
+            "Elon Musk became CEO of Tesla in 2008",
+        ]
+        assert [c["position"] for c in result["claims"]] == [0, 1, 2]
+        assert result["claims"][0]["confidence"] == 95
+        assert result["metadata"]["chunks_succeeded"] == 3
@@ -0,0 +1,183 @@
+"""
+Unit tests for adapter latency tracking: adaptive timeouts, hedged GETs,
+claim deadlines and the circuit breaker's slow-call signal.
+"""
+
+import itertools
+import time
+
+import httpx
+import pytest
+
+from app.services.adapter_latency import LatencyTracker, adapter_deadline, get_latency_tracker
+from app.services.circuit_breaker import CircuitBreaker, CircuitState
+from app.services.government_api_client import GovernmentAPIClient
+
+_names = itertools.count()
+
+
+class ScriptedAdapter(GovernmentAPIClient):
+    """Adapter whose HTTP layer is replaced by a scripted _send"""
+
+    def __init__(self, latencies, **kwargs):
+        super().__init__(api_name=f"Scripted-{next(_names)}", base_url="https://scripted.example", **kwargs)
+        self.latencies = list(latencies)
+        self.sent = []
+
+    def search(self, query, domain, jurisdiction, entities=None):
+        return []
+
+    def _transform_response(self, raw_response):
+        return []
+
+    def _send(self, url, params, method, timeout):
+        call = len(self.sent)
+        self.sent.append(timeout)
+        latency = self.latencies[min(call, len(self.latencies) - 1)]
+        if latency > timeout:
+            time.sleep(timeout)
+            self.latency.record(timeout)
+            raise httpx.TimeoutException("scripted timeout")
+        time.sleep(latency)
+        return {"call": call}
+
+
+def warm(adapter, seconds, count=30):
+    for _ in range(count):
+        adapter.latency.record(seconds)
+
+
+class TestLatencyTracker:
+    """Test quantiles and derived timeouts"""
+
+    def test_no_adaptation_without_history(self):
+        """Test: Too few samples leave the configured timeout and disable hedging"""
+        tracker = LatencyTracker("Sparse", min_samples=20)
+        for _ in range(5):
+            tracker.record(0.1)
+        assert tracker.timeout_for(10) == 10
+        assert tracker.hedge_delay() is None
+
+    def test_timeout_follows_p99_within_bounds(self):
+        """Test: Timeout is p99 x multiplier, floored at the minimum and capped at the ceiling"""
+        tracker = LatencyTracker("Fast", min_samples=20)
+        for i in range(100):
+            tracker.record(0.2 if i < 95 else 3.0)
+        assert tracker.timeout_for(10) == pytest.approx(4.5)
+        assert tracker.timeout_for(4) == 4
+
+        quick = LatencyTracker("Quick", min_samples=20)
+        for _ in range(50):
+            quick.record(0.05)
+        assert quick.timeout_for(10) == 2.0
+
+    def test_trackers_shared_per_adapter(self):
+        """Test: Adapter instances with the same name share latency history"""
+        assert get_latency_tracker("Shared") is get_latency_tracker("Shared")
+
+
+class TestHedgedRequests:
+    """Test duplicate GETs after the p90 delay"""
+
+    def test_slow_primary_answered_by_hedge(self):
+        """Test: A GET slower than p90 gets a duplicate and the faster response is returned"""
+        adapter = ScriptedAdapter([1.0, 0.01], timeout=5, max_retries=1)
+        warm(adapter, 0.05)
+
+        start = time.monotonic()
+        assert adapter._make_request("data") == {"call": 1}
+        assert time.monotonic() - start < 0.5
+        assert len(adapter.sent) == 2
+
+    def test_fast_primary_not_hedged(self):
+        """Test: A GET answered within p90 sends one request"""
+        adapter = ScriptedAdapter([0.01], timeout=5, max_retries=1)
+        warm(adapter, 0.2)
+
+        assert adapter._make_request("data") == {"call": 0}
+        assert len(adapter.sent) == 1
+
+    def test_busy_executor_sends_primary_inline(self, monkeypatch):
+        """Test: Queueing in a saturated hedge executor does not trigger a duplicate"""
+        from concurrent.futures import ThreadPoolExecutor
+        from app.services import government_api_client
+
+        busy = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(government_api_client, "_hedge_executor", busy)
+        busy.submit(time.sleep, 0.5)
+
+        adapter = ScriptedAdapter([0.2], timeout=5, max_retries=1)
+        warm(adapter, 0.05)
+
+        assert adapter._make_request("data") == {"call": 0}
+        assert len(adapter.sent) == 1
+        busy.shutdown()
+
+    def test_hedging_can_be_disabled_per_adapter(self):
+        """Test: Quota-limited adapters never duplicate requests"""
+        adapter = ScriptedAdapter([0.3], timeout=5, max_retries=1, hedge_requests=False)
+        warm(adapter, 0.05)
+
+        assert adapter._make_request("data") == {"call": 0}
+        assert len(adapter.sent) == 1
+
+
+class TestClaimDeadline:
+    """Test the per-claim deadline budget"""
+
+    def test_retries_stop_at_deadline(self):
+        """Test: Attempt timeouts shrink to the remaining budget and no backoff starts past it"""
+        adapter = ScriptedAdapter([10.0], timeout=5, max_retries=3, hedge_requests=False)
+
+        start = time.monotonic()
+        with adapter_deadline(0.3), pytest.raises(httpx.TimeoutException):
+            adapter._make_request("data")
+        assert time.monotonic() - start < 1.0
+        assert len(adapter.sent) == 1 and adapter.sent[0] <= 0.3
+
+    def test_expired_deadline_skips_request(self):
+        """Test: Nothing is sent once the claim deadline has passed"""
+        adapter = ScriptedAdapter([0.01])
+        with adapter_deadline(0):
+            assert adapter._make_request("data") is None
+        assert adapter.sent == []
+
+
+class TestSlowCallCircuit:
+    """Test the circuit breaker's latency signal"""
+
+    def test_opens_on_slow_call_rate(self):
+        """Test: Successful but slow calls open the circuit"""
+        breaker = CircuitBreaker("Sluggish", slow_call_seconds=0.01, slow_call_min_calls=3, slow_call_rate_threshold=0.6)
+        for _ in range(3):
+            breaker.call(time.sleep, 0.02)
+        assert breaker.state == CircuitState.OPEN
+
+    def test_fast_calls_keep_circuit_closed(self):
+        """Test: A minority of slow calls does not open the circuit"""
+        breaker = CircuitBreaker("Mostly fast", slow_call_seconds=0.01, slow_call_min_calls=3, slow_call_rate_threshold=0.6)
+        breaker.call(time.sleep, 0.02)
+        for _ in range(4):
+            breaker.call(lambda: None)
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.get_state()["slow_call_rate"] == 0.2
+
+    def test_attempts_slower_than_usual_p99_are_slow(self):
+        """Test: Calls whose attempts exceed the API's usual p99 count as slow below the fixed ceiling"""
+        breaker = CircuitBreaker("Degraded", slow_call_seconds=8.0, slow_call_min_calls=3, slow_call_rate_threshold=0.6)
+        for _ in range(3):
+            breaker.call(lambda: breaker.record_attempt(0.5, baseline=0.2))
+        assert breaker.state == CircuitState.OPEN
+
+    def test_backoff_not_counted_as_latency(self):
+        """Test: Only the recorded attempt is judged, not time spent between attempts"""
+        breaker = CircuitBreaker("Retrying", slow_call_seconds=0.01, slow_call_min_calls=3, slow_call_rate_threshold=0.6)
+
+        def retried_call():
+            time.sleep(0.02)  # backoff before the successful attempt
+            breaker.record_attempt(0.001, baseline=0.005)
+
+        for _ in range(3):
+            breaker.call(retried_call)
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.get_state()["slow_call_rate"] == 0.0
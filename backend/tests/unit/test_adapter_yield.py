@@ -0,0 +1,159 @@
+"""
+Unit tests for per-domain adapter yield tracking and yield-based adapter selection.
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services.adapter_yield import AdapterYield, AdapterYieldStore, evidence_providers, select_adapters
+from fixtures.fake_redis import FakeRedis
+
+
+def adapter(name):
+    return SimpleNamespace(api_name=name)
+
+
+def names(adapters):
+    return [a.api_name for a in adapters]
+
+
+def history(calls=100, kept=0.0, ms=500.0):
+    """Yield for an adapter with `calls` calls, per-call kept items and mean latency"""
+    return AdapterYield(calls=calls, returned=calls * kept, kept=calls * kept, ms=calls * ms)
+
+
+class NeverExplore(random.Random):
+    def random(self):
+        return 1.0
+
+
+class TestSelectAdapters:
+    """Test ranking by expected value per millisecond"""
+
+    def test_ranks_by_value_per_ms(self):
+        """Test: A fast adapter with modest yield outranks a slow one with slightly more"""
+        stats = {"Fast": history(kept=0.5, ms=200), "Slow": history(kept=0.6, ms=2000)}
+        selected, skipped = select_adapters([adapter("Slow"), adapter("Fast")], stats, 12, NeverExplore())
+        assert names(selected) == ["Fast", "Slow"]
+        assert skipped == []
+
+    def test_skips_low_yield_and_slow_adapters(self, monkeypatch):
+        """Test: Adapters that rarely contribute, or exceed the deadline on average, are skipped"""
+        monkeypatch.setattr(settings, "ADAPTER_SELECTION_MIN_VALUE", 0.05)
+        stats = {
+            "Useful": history(kept=0.5),
+            "Noise": history(kept=0.0),
+            "Glacial": history(kept=1.0, ms=15000),
+        }
+        selected, skipped = select_adapters([adapter(n) for n in stats], stats, 12, NeverExplore())
+        assert names(selected) == ["Useful"]
+        assert {s["name"]: s["reason"] for s in skipped} == {"Noise": "low yield", "Glacial": "too slow for deadline"}
+
+    def test_budget_limits_expected_time(self, monkeypatch):
+        """Test: Selection stops adding adapters once their expected time exceeds the budget"""
+        monkeypatch.setattr(settings, "ADAPTER_SELECTION_BUDGET_MS", 2500)
+        stats = {name: history(kept=0.5, ms=1000 + i) for i, name in enumerate(["A", "B", "C"])}
+        selected, skipped = select_adapters([adapter(n) for n in stats], stats, 12, NeverExplore())
+        assert names(selected) == ["A", "B"]
+        assert skipped == [{"name": "C", "reason": "over budget"}]
+
+    def test_cold_adapters_always_queried(self):
+        """Test: Adapters without enough history in the domain are sampled regardless of others"""
+        stats = {"Known": history(kept=0.5), "New": AdapterYield(calls=3, ms=30000)}
+        selected, _ = select_adapters([adapter("New"), adapter("Known")], stats, 12, NeverExplore())
+        assert set(names(selected)) == {"Known", "New"}
+
+    def test_exploration_revisits_skipped_adapters(self, monkeypatch):
+        """Test: A skipped adapter is occasionally queried so its estimate can recover"""
+        monkeypatch.setattr(settings, "ADAPTER_SELECTION_EXPLORATION", 0.5)
+        stats = {"Noise": history(kept=0.0), "Useful": history(kept=0.5)}
+        picks = sum(
+            "Noise" in names(select_adapters([adapter("Noise"), adapter("Useful")], stats, 12, random.Random(seed))[0])
+            for seed in range(200)
+        )
+        assert 60 < picks < 140
+
+
+class TestAdapterYieldStore:
+    """Test recording and decay of shared counters"""
+
+    def test_records_returned_and_kept(self):
+        """Test: Calls, returned and kept evidence accumulate per domain and adapter"""
+        store = AdapterYieldStore(FakeRedis())
+        store.record_calls("Economics", [("ONS", 4, 300.0), ("FRED", 0, 900.0)])
+        store.record_kept("Economics", ["ONS", "ONS"])
+
+        stats = store.get_stats("Economics")
+        assert stats["ONS"] == AdapterYield(calls=1, returned=4, kept=2, ms=300)
+        assert stats["FRED"].mean_ms == 900
+        assert store.get_stats("Health") == {}
+
+    def test_counters_decay_after_window(self, monkeypatch):
+        """Test: Reaching the window halves an adapter's counters"""
+        monkeypatch.setattr(settings, "ADAPTER_YIELD_WINDOW", 4)
+        store = AdapterYieldStore(FakeRedis())
+        store.record_calls("Science", [("GBIF", 2, 100.0)] * 4)
+
+        stats = store.get_stats("Science")
+        assert stats["GBIF"] == AdapterYield(calls=2, returned=4, ms=200)
+
+    def test_evidence_providers(self):
+        """Test: Providers are read from top-level or snippet metadata; web evidence is ignored"""
+        evidence = [
+            {"external_source_provider": "ONS"},
+            {"metadata": {"external_source_provider": "FRED"}},
+            {"url": "https://example.com"},
+        ]
+        assert evidence_providers(evidence) == ["ONS", "FRED"]
+
+    def test_redis_outage_backs_off(self):
+        """Test: After a Redis error the store stops calling Redis and selection sees no history"""
+        class DownRedis:
+            calls = 0
+
+            def __getattr__(self, name):
+                def fail(*args, **kwargs):
+                    DownRedis.calls += 1
+                    raise ConnectionError("Redis unavailable")
+                return fail
+
+        store = AdapterYieldStore(DownRedis())
+        assert store.get_stats("Economics") == {}
+        store.record_calls("Economics", [("ONS", 1, 100.0)])
+        store.record_kept("Economics", ["ONS"])
+        assert DownRedis.calls == 1
+
+
+class TestRetrieverAdapterSelection:
+    """Test API retrieval when selection leaves no adapter to query"""
+
+    @pytest.mark.asyncio
+    async def test_all_adapters_skipped(self, monkeypatch):
+        """Test: If every adapter is skipped no calls are made, and the skips are still reported"""
+        from app.pipeline import retrieve
+        from app.utils import claim_keyword_router
+
+        monkeypatch.setattr(settings, "ENABLE_API_RETRIEVAL", True)
+        monkeypatch.setattr(settings, "ENABLE_ADAPTER_SELECTION", True)
+        monkeypatch.setattr(settings, "ADAPTER_SELECTION_EXPLORATION", 0.0)
+        stats = {"Noise": history(kept=0.0), "Glacial": history(kept=1.0, ms=60000)}
+        monkeypatch.setattr(retrieve, "get_adapter_yield_store", lambda: SimpleNamespace(get_stats=lambda domain: stats))
+        monkeypatch.setattr(claim_keyword_router, "get_keyword_router",
+                            lambda: SimpleNamespace(get_additional_adapters=lambda *args: []))
+
+        retriever = retrieve.EvidenceRetriever.__new__(retrieve.EvidenceRetriever)
+        retriever.enable_api_retrieval = True
+        retriever.api_registry = SimpleNamespace(
+            adapters=[adapter("Noise"), adapter("Glacial")],
+            get_adapters_for_domain=lambda domain, jurisdiction: [adapter("Noise"), adapter("Glacial")],
+        )
+        claim = {"article_classification": {"primary_domain": "Economics", "jurisdiction": "UK", "confidence": 0.9}}
+
+        result = await retriever._retrieve_from_government_apis("Inflation fell to 2%", claim)
+
+        assert result["evidence"] == []
+        assert result["api_stats"]["total_api_calls"] == 0
+        assert {s["name"] for s in result["api_stats"]["skipped"]} == {"Noise", "Glacial"}
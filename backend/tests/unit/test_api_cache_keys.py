@@ -0,0 +1,104 @@
+"""
+Unit tests for government API cache key normalisation.
+"""
+
+import pytest
+
+from app.services import government_api_client
+from app.services.api_adapters import AlphaVantageAdapter, GBIFAdapter, WeatherAPIAdapter
+from app.utils.api_cache_keys import keyword_cache_key, lemmatize, query_keywords
+
+
+class DictCache:
+    """In-memory stand-in for SyncCacheService's API response methods"""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get_cached_api_response_sync(self, api_name, query):
+        return self.entries.get((api_name, query))
+
+    def cache_api_response_sync(self, api_name, query, response, ttl):
+        self.entries[(api_name, query)] = response
+        return True
+
+    def get_api_entry_sync(self, api_name, query):
+        results = self.entries.get((api_name, query))
+        return None if results is None else {"results": results, "soft_expires_at": float("inf")}
+
+    def cache_api_entry_sync(self, api_name, query, results, soft_ttl, hard_ttl):
+        return self.cache_api_response_sync(api_name, query, results, hard_ttl)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = DictCache()
+    monkeypatch.setattr(government_api_client, "get_sync_cache_service", lambda: cache)
+    return cache
+
+
+class TestKeywordCacheKey:
+    """Test the default keyword-based key"""
+
+    def test_rephrasings_share_key(self):
+        """Test: Casing, punctuation, stopwords, inflection and word order do not change the key"""
+        a = keyword_cache_key("Unemployment in the UK rose to 4.2% in 2024", "UK")
+        b = keyword_cache_key("UK unemployment rises to 4.2% (2024)", "UK")
+        assert a == b
+
+    def test_different_figures_differ(self):
+        """Test: Numbers are kept, so different statistics get different entries"""
+        assert keyword_cache_key("UK unemployment 4.2%", "UK") != keyword_cache_key("UK unemployment 5.1%", "UK")
+
+    def test_jurisdiction_and_entities(self):
+        """Test: Jurisdiction is part of the key; entity order is not"""
+        entities = [{"text": "Bank of England", "label": "ORG"}, {"text": "UK", "label": "GPE"}]
+        assert keyword_cache_key("Interest rates", "UK", entities) == keyword_cache_key("Interest rates", "UK", entities[::-1])
+        assert keyword_cache_key("Interest rates", "UK") != keyword_cache_key("Interest rates", "US")
+
+    def test_lemmatize(self):
+        """Test: Common inflections fold together; protected words are left alone"""
+        assert lemmatize("rising") == lemmatize("rises") == lemmatize("rose")
+        assert lemmatize("countries") == "country"
+        assert lemmatize("stopped") == lemmatize("stops")
+        assert lemmatize("species") == "species"
+        assert query_keywords("The 1,000 homes") == ["1000", "hom"]
+
+    def test_lemmatize_trailing_e_consistent(self):
+        """Test: -s, -ed and -ing forms of e-final and short irregular verbs share one stem"""
+        for forms in (("use", "uses", "used", "using"), ("rate", "rates", "rated", "rating"),
+                      ("age", "ages", "aged", "aging"), ("go", "goes", "going", "went"), ("do", "does", "done")):
+            assert len({lemmatize(form) for form in forms}) == 1, forms
+        assert lemmatize("goes") == "go" and lemmatize("does") == "do"
+        assert lemmatize("needed") == lemmatize("needs") == "need"
+
+
+class TestAdapterCacheKeys:
+    """Test adapters that cache on a resolved identifier"""
+
+    def test_alpha_vantage_keys_on_ticker(self, cache):
+        """Test: Differently worded stock claims about one ticker share an entry"""
+        adapter = AlphaVantageAdapter()
+        a = adapter.cache_key("Apple stock price hit $200", "Finance", "Global")
+        b = adapter.cache_key("AAPL shares are trading at a record", "Finance", "Global")
+        assert a == b == "quote:AAPL"
+        assert adapter.cache_key("Oil price hit $90 a barrel", "Finance", "Global").startswith("global|")
+
+    def test_weather_keys_on_location(self, cache):
+        """Test: Current conditions are keyed by location and lookup type"""
+        adapter = WeatherAPIAdapter()
+        entities = [{"text": "London", "label": "GPE"}]
+        assert adapter.cache_key("It is raining in London", "Weather", "UK", entities) == "current:london"
+        assert adapter.cache_key("London forecast: snow tomorrow", "Weather", "UK", entities) == "forecast:london"
+
+    def test_search_with_cache_hits_on_rephrasing(self, cache, monkeypatch):
+        """Test: A rephrased claim is served from the entry stored for the first wording"""
+        adapter = GBIFAdapter()
+        calls = []
+        monkeypatch.setattr(adapter, "search", lambda *args, **kwargs: calls.append(args) or [{"title": "Lynx"}])
+
+        adapter.search_with_cache("Lynx populations are growing in Spain", "Science", "Global")
+        results = adapter.search_with_cache("lynx population grows in Spain!", "Science", "Global")
+
+        assert results == [{"title": "Lynx"}]
+        assert len(calls) == 1
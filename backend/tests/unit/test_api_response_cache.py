@@ -0,0 +1,158 @@
+"""
+Unit tests for adapter response caching: negative entries, stale-while-revalidate and TTL jitter.
+"""
+
+import json
+
+import pytest
+
+from app.services import government_api_client
+from app.services.cache import SyncCacheService
+from app.services.government_api_client import GovernmentAPIClient, _jittered_ttl
+from fixtures.fake_redis import FakeRedis
+
+
+class QueuedExecutor:
+    """Collects submitted refreshes so tests decide when they run"""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn):
+        self.pending.append(fn)
+
+    def run_all(self):
+        while self.pending:
+            self.pending.pop(0)()
+
+
+class CountingAdapter(GovernmentAPIClient):
+    """Adapter returning a scripted answer and counting searches"""
+
+    def __init__(self, **kwargs):
+        super().__init__(api_name="Counting", base_url="https://counting.example", cache_ttl=600, **kwargs)
+        self.answer = [{"title": "v1"}]
+        self.fail = False
+        self.calls = 0
+
+    def search(self, query, domain, jurisdiction, entities=None):
+        self.calls += 1
+        if self.fail:
+            self._record_request_failure()
+            return []
+        return list(self.answer)
+
+    def _transform_response(self, raw_response):
+        return []
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = SyncCacheService()
+    cache.redis = FakeRedis()
+    monkeypatch.setattr(government_api_client, "get_sync_cache_service", lambda: cache)
+    return cache
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    executor = QueuedExecutor()
+    monkeypatch.setattr(government_api_client, "_get_refresh_executor", lambda: executor)
+    return executor
+
+
+def expire_soft(cache):
+    """Move every cached entry past its soft TTL"""
+    for key, value in cache.redis.data.items():
+        if key.startswith("tru8:api_response:"):
+            entry = json.loads(value)
+            entry["soft_expires_at"] = 0
+            cache.redis.data[key] = json.dumps(entry)
+
+
+def response_ttl(cache):
+    """Longest TTL set on a cached response (ignores metric counters)"""
+    return max(ttl for key, ttl in cache.redis.ttls.items() if key.startswith("tru8:api_response:"))
+
+
+class TestNegativeCaching:
+    """Test caching of empty answers"""
+
+    def test_empty_answer_cached_with_shorter_ttl(self, cache, executor):
+        """Test: An empty answer is served from cache, for no longer than negative_cache_ttl"""
+        adapter = CountingAdapter(negative_cache_ttl=60)
+        adapter.answer = []
+
+        assert adapter.search_with_cache("Nothing to find", "Science", "UK") == []
+        assert adapter.search_with_cache("Nothing to find", "Science", "UK") == []
+
+        assert adapter.calls == 1
+        assert response_ttl(cache) <= 120
+
+    def test_failed_request_not_cached(self, cache, executor):
+        """Test: An empty answer caused by an upstream failure is retried next time"""
+        adapter = CountingAdapter()
+        adapter.fail = True
+        adapter.search_with_cache("Outage", "Science", "UK")
+
+        adapter.fail = False
+        assert adapter.search_with_cache("Outage", "Science", "UK") == [{"title": "v1"}]
+        assert adapter.calls == 2
+
+
+class TestStaleWhileRevalidate:
+    """Test serving stale entries while refreshing in the background"""
+
+    def test_stale_entry_served_and_refreshed_once(self, cache, executor):
+        """Test: Past the soft TTL the old answer is returned and a single refresh runs"""
+        adapter = CountingAdapter()
+        adapter.search_with_cache("GDP growth", "Finance", "UK")
+        expire_soft(cache)
+        adapter.answer = [{"title": "v2"}]
+
+        assert adapter.search_with_cache("GDP growth", "Finance", "UK") == [{"title": "v1"}]
+        assert adapter.search_with_cache("GDP growth", "Finance", "UK") == [{"title": "v1"}]
+        assert len(executor.pending) == 1
+
+        executor.run_all()
+        assert adapter.search_with_cache("GDP growth", "Finance", "UK") == [{"title": "v2"}]
+        assert adapter.calls == 2
+
+    def test_failed_refresh_keeps_stale_entry(self, cache, executor):
+        """Test: A failed refresh leaves the stale answer in place and allows another attempt"""
+        adapter = CountingAdapter()
+        adapter.search_with_cache("GDP growth", "Finance", "UK")
+        expire_soft(cache)
+
+        adapter.fail = True
+        adapter.search_with_cache("GDP growth", "Finance", "UK")
+        executor.run_all()
+
+        assert adapter.search_with_cache("GDP growth", "Finance", "UK") == [{"title": "v1"}]
+        assert len(executor.pending) == 1
+
+    def test_hard_ttl_includes_stale_window(self, cache, executor):
+        """Test: Entries are kept in Redis for the soft TTL plus stale_ttl"""
+        adapter = CountingAdapter(stale_ttl=300)
+        adapter.search_with_cache("GDP growth", "Finance", "UK")
+
+        ttl = response_ttl(cache)
+        assert 540 + 300 <= ttl <= 600 + 300
+
+    def test_legacy_entries_are_fresh(self, cache, executor):
+        """Test: Plain-list entries written before envelopes existed are served as fresh"""
+        adapter = CountingAdapter()
+        cache.cache_api_response_sync("Counting", adapter.cache_key("GDP growth", "Finance", "UK"), [{"title": "old"}])
+
+        assert adapter.search_with_cache("GDP growth", "Finance", "UK") == [{"title": "old"}]
+        assert adapter.calls == 0 and executor.pending == []
+
+
+class TestJitter:
+    """Test TTL jitter"""
+
+    def test_jitter_only_shortens(self):
+        """Test: Jittered TTLs vary but never exceed the configured TTL"""
+        ttls = {_jittered_ttl(1000) for _ in range(200)}
+        assert len(ttls) > 1
+        assert min(ttls) >= 900 and max(ttls) <= 1000
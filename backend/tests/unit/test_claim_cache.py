@@ -0,0 +1,74 @@
+import time
+import pytest
+from app.services.claim_cache import (
+    SemanticClaimCache,
+    extract_numbers,
+    has_negation,
+    normalize_claim_text,
+)
+
+
+class TestSemanticClaimCacheGuards:
+    """Test reuse guards for the semantic claim-verdict cache"""
+
+    @pytest.fixture
+    def cache(self):
+        return SemanticClaimCache()
+
+    def _candidate(self, cache, claim_text, age_seconds=0):
+        return {
+            "claim_text": claim_text,
+            "cached_at_ts": time.time() - age_seconds,
+            **cache._claim_signature(claim_text),
+        }
+
+    def test_rephrased_claim_is_compatible(self, cache):
+        """Test: Same facts in different wording can reuse a verdict"""
+        candidate = self._candidate(cache, "The Eiffel Tower is 330 metres tall")
+        signature = cache._claim_signature("The Eiffel Tower stands 330 metres high")
+        assert cache.is_compatible(signature, candidate)
+
+    def test_different_numbers_not_compatible(self, cache):
+        """Test: Claims differing only in numbers never share a verdict"""
+        candidate = self._candidate(cache, "Unemployment was 4% in 2020")
+        signature = cache._claim_signature("Unemployment was 5% in 2020")
+        assert not cache.is_compatible(signature, candidate)
+
+    def test_negation_mismatch_not_compatible(self, cache):
+        """Test: Negated claim does not reuse the affirmative verdict"""
+        candidate = self._candidate(cache, "Vaccines cause autism")
+        signature = cache._claim_signature("Vaccines do not cause autism")
+        assert not cache.is_compatible(signature, candidate)
+
+    def test_stale_entry_not_compatible(self, cache):
+        """Test: Entries older than the freshness window are ignored"""
+        candidate = self._candidate(cache, "Shakespeare wrote Hamlet", age_seconds=cache.max_age_seconds + 60)
+        signature = cache._claim_signature("Hamlet was written by Shakespeare")
+        assert not cache.is_compatible(signature, candidate)
+
+    def test_time_sensitive_claim_uses_short_window(self, cache):
+        """Test: Time-sensitive claims expire faster than timeless ones"""
+        claim = "The president is currently in office"
+        age = cache.time_sensitive_max_age_seconds + 60
+        assert age < cache.max_age_seconds
+        candidate = self._candidate(cache, claim, age_seconds=age)
+        assert not cache.is_compatible(cache._claim_signature(claim), candidate)
+
+    def test_point_id_stable_across_formatting(self, cache):
+        """Test: Formatting differences map to the same point ID"""
+        assert cache._point_id("The Earth orbits the Sun!") == cache._point_id("  the earth orbits the sun ")
+
+
+class TestClaimCacheHelpers:
+    """Test text helpers used for cache signatures"""
+
+    def test_extract_numbers_normalises_separators(self):
+        assert extract_numbers("Population of 1,200,000 in 2021") == ["1200000", "2021"]
+
+    def test_has_negation(self):
+        assert has_negation("The bill wasn't passed")
+        assert has_negation("There is no evidence")
+        assert not has_negation("The bill was passed")
+
+    def test_normalize_claim_text(self):
+        assert normalize_claim_text("Hello,   World!") == "hello world"
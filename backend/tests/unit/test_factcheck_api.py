@@ -97,3 +97,101 @@ class TestFactCheckAPI:
         assert result['publisher'] == 'FactCheck.org'
         assert result['rating'] == 'False'
         assert result['normalized_verdict'] == 'CONTRADICTED'
+
+
+class FakeSharedCache:
+    """In-memory stand-in for SyncCacheService"""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def get_cached_api_response_sync(self, api_name, query):
+        return self.store.get((api_name, query))
+
+    def cache_api_response_sync(self, api_name, query, response, ttl=86400):
+        self.store[(api_name, query)] = response
+        self.ttls[(api_name, query)] = ttl
+        return True
+
+
+class TestFactCheckAPICaching:
+    """Test Redis-backed caching, negative caching and request coalescing"""
+
+    @pytest.fixture
+    def api(self):
+        api = FactCheckAPI()
+        api.api_key = "test-key"
+        api._shared_cache = FakeSharedCache()
+        return api
+
+    @pytest.mark.asyncio
+    async def test_identical_claims_coalesced(self, api):
+        """Test: Concurrent lookups for the same claim share one request"""
+        import asyncio
+
+        calls = []
+
+        async def fake_lookup(claim_text, language, cache_key):
+            calls.append(claim_text)
+            await asyncio.sleep(0.01)
+            return [{"rating": "False"}]
+
+        with patch.object(api, "_lookup", side_effect=fake_lookup):
+            results = await asyncio.gather(
+                api.search_fact_checks("Vaccines contain microchips"),
+                api.search_fact_checks("vaccines  contain microchips"),
+            )
+
+        assert len(calls) == 1
+        assert results[0] == results[1] == [{"rating": "False"}]
+        assert api._get_inflight() == {}
+
+    @pytest.mark.asyncio
+    async def test_empty_results_use_negative_ttl(self, api):
+        """Test: 'No fact-checks found' is cached with the shorter TTL"""
+        await api._store_cached("claim:en", [])
+        await api._store_cached("other:en", [{"rating": "True"}])
+
+        ttls = api._shared_cache.ttls
+        assert ttls[("factcheck_api", "claim:en")] == int(api.negative_cache_ttl.total_seconds())
+        assert ttls[("factcheck_api", "other:en")] == int(api.cache_ttl.total_seconds())
+        assert api._get_memory_cached("claim:en") == []
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_skips_http(self, api):
+        """Test: Redis cache hit is served without calling the API"""
+        api._shared_cache.store[("factcheck_api", "some claim:en")] = [{"rating": "True"}]
+
+        with patch.object(api, "_get_client", side_effect=AssertionError("should not call API")):
+            results = await api.search_fact_checks("Some claim")
+
+        assert results == [{"rating": "True"}]
+        assert "some claim:en" in api.cache
+
+    def test_client_per_event_loop(self, api):
+        """Test: Each event loop gets its own client; clients of closed loops are closed"""
+        import asyncio
+
+        async def get_client():
+            return api._get_client()
+
+        first_loop = asyncio.new_event_loop()
+        first = first_loop.run_until_complete(get_client())
+        assert first_loop.run_until_complete(get_client()) is first
+        first_loop.close()
+
+        second_loop = asyncio.new_event_loop()
+        try:
+            async def replace():
+                client = api._get_client()
+                await asyncio.sleep(0)
+                return client
+
+            second = second_loop.run_until_complete(replace())
+            assert second is not first
+            assert first.is_closed
+            assert list(api._clients.values()) == [second]
+            second_loop.run_until_complete(api.close())
+        finally:
+            second_loop.close()
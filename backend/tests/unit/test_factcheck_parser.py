@@ -4,6 +4,9 @@ Unit tests for Fact-Check Parser
 Tests the parsing logic for Snopes and PolitiFact articles.
 """
 
+import asyncio
+
+import httpx
 import pytest
 from bs4 import BeautifulSoup
 from app.services.factcheck_parser import (
@@ -257,6 +260,33 @@ class TestFactCheckParser:
         assert not parser._is_factcheck_domain("https://www.nytimes.com/article")
         assert not parser._is_factcheck_domain("https://www.bbc.co.uk/news")
 
+    def test_client_per_event_loop(self):
+        """Test: Each event loop gets its own client; clients of closed loops are closed"""
+        parser = FactCheckParser()
+
+        async def get_client():
+            return parser._get_client()
+
+        first_loop = asyncio.new_event_loop()
+        first = first_loop.run_until_complete(get_client())
+        assert first_loop.run_until_complete(get_client()) is first
+        first_loop.close()
+
+        second_loop = asyncio.new_event_loop()
+        try:
+            async def replace():
+                client = parser._get_client()
+                await asyncio.sleep(0)
+                return client
+
+            second = second_loop.run_until_complete(replace())
+            assert second is not first
+            assert first.is_closed
+            assert list(parser._clients.values()) == [second]
+            second_loop.run_until_complete(parser.close())
+        finally:
+            second_loop.close()
+
     @pytest.mark.asyncio
     async def test_parse_factcheck_evidence_no_evidence(self):
         """Test handling of empty evidence list"""
@@ -287,5 +317,110 @@ class TestFactCheckParser:
         assert "factcheck_parse_success" not in result["0"][0]
 
 
+SNOPES_HTML = """
+<html>
+    <div class="claim_cont">The rendering of Trump's ballroom is fake</div>
+    <div class="rating_title_wrap">True</div>
+</html>
+"""
+
+
+class NoSharedCache:
+    """Redis stand-in that never hits"""
+
+    def get_cached_api_response_sync(self, api_name, query):
+        return None
+
+    def cache_api_response_sync(self, api_name, query, response, ttl=86400):
+        return True
+
+
+@pytest.fixture
+def fetching_parser(monkeypatch):
+    """Parser whose pooled client serves SNOPES_HTML and records concurrency"""
+    parser = FactCheckParser()
+    parser._shared_cache = NoSharedCache()
+    stats = {"requests": [], "in_flight": 0, "max_in_flight": 0, "fail": set()}
+
+    async def handler(request):
+        stats["requests"].append(str(request.url))
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        await asyncio.sleep(0.01)
+        stats["in_flight"] -= 1
+        if request.url.path in stats["fail"]:
+            return httpx.Response(503)
+        return httpx.Response(200, text=SNOPES_HTML)
+
+    clients = []
+
+    def get_client():
+        if not clients:
+            clients.append(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        return clients[0]
+
+    async def similarity(our_claim, their_claim):
+        return 0.9
+
+    monkeypatch.setattr(parser, "_get_client", get_client)
+    monkeypatch.setattr(parser, "_calculate_claim_similarity", similarity)
+    parser.stats = stats
+    return parser
+
+
+class TestConcurrentPageFetching:
+    """Test check-wide deduplicated, concurrent fact-check page fetching"""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_urls_fetched_once(self, fetching_parser, monkeypatch):
+        """Test: Each distinct page is fetched once per check, within the concurrency limit"""
+        monkeypatch.setattr("app.services.factcheck_parser.settings.MAX_CONCURRENT_FACTCHECK_PARSES", 2)
+        claims = [{"text": f"Claim {i}", "position": i} for i in range(3)]
+        evidence = {
+            str(i): [
+                {"url": "https://www.snopes.com/fact-check/ballroom/?utm_source=x", "is_factcheck": True},
+                {"url": f"https://www.snopes.com/fact-check/page-{i}", "is_factcheck": True},
+                {"url": "https://www.nytimes.com/article"},
+            ]
+            for i in range(3)
+        }
+
+        result = await fetching_parser.parse_factcheck_evidence(claims, evidence)
+
+        assert len(fetching_parser.stats["requests"]) == 4
+        assert fetching_parser.stats["max_in_flight"] <= 2
+        for position in ("0", "1", "2"):
+            assert [ev.get("factcheck_parse_success") for ev in result[position]] == [True, True, None]
+            assert result[position][0]["factcheck_rating"] == "True"
+
+    @pytest.mark.asyncio
+    async def test_parsed_pages_cached_by_url(self, fetching_parser):
+        """Test: A later check citing the same page reuses the parsed result"""
+        claims = [{"text": "Claim", "position": 0}]
+
+        await fetching_parser.parse_factcheck_evidence(
+            claims, {"0": [{"url": "https://www.snopes.com/fact-check/ballroom", "is_factcheck": True}]}
+        )
+        result = await fetching_parser.parse_factcheck_evidence(
+            claims, {"0": [{"url": "http://snopes.com/fact-check/ballroom/", "is_factcheck": True}]}
+        )
+
+        assert len(fetching_parser.stats["requests"]) == 1
+        assert result["0"][0]["factcheck_target_claim"] == "The rendering of Trump's ballroom is fake"
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_not_cached(self, fetching_parser):
+        """Test: Fetch failures mark the evidence unparsed and are retried next time"""
+        fetching_parser.stats["fail"].add("/fact-check/down")
+        claims = [{"text": "Claim", "position": 0}]
+        evidence = {"0": [{"url": "https://www.snopes.com/fact-check/down", "is_factcheck": True}]}
+
+        result = await fetching_parser.parse_factcheck_evidence(claims, evidence)
+        assert result["0"][0]["factcheck_parse_success"] is False
+
+        await fetching_parser.parse_factcheck_evidence(claims, evidence)
+        assert len(fetching_parser.stats["requests"]) == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
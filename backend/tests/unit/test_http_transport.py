@@ -0,0 +1,155 @@
+"""
+Unit tests for the record/replay HTTP transport (cassettes).
+"""
+
+import gzip
+import json
+import time
+
+import httpx
+import pytest
+
+from app.core import http_transport
+from app.core.http_transport import (
+    CassetteMissError,
+    CassetteStore,
+    RecordingTransport,
+    ReplayTransport,
+    build_transport,
+    request_key,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CassetteStore(str(tmp_path / "cassettes"), max_responses=3)
+
+
+@pytest.fixture
+def upstream():
+    """Fake provider that answers with a running counter"""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"n": len(calls)}, headers={"x-internal": "dropped"})
+
+    transport = httpx.MockTransport(handler)
+    transport.calls = calls
+    return transport
+
+
+class TestRequestKey:
+    """Test cassette key normalisation"""
+
+    def test_credentials_and_param_order_ignored(self):
+        """Test: API keys are stripped and query parameters sorted before hashing"""
+        a = request_key("GET", httpx.URL("https://api.example.com/v1?q=claim&api_key=secret1&n=5"), b"")
+        b = request_key("GET", httpx.URL("https://api.example.com/v1?n=5&q=claim&api_key=other"), b"")
+        assert a == b
+
+    def test_dates_masked_and_json_canonicalised(self):
+        """Test: Prompts that embed today's date map to the same key"""
+        a = request_key("POST", httpx.URL("https://llm/v1"), json.dumps({"b": 1, "a": "TODAY'S DATE: 2025-01-10"}).encode())
+        b = request_key("POST", httpx.URL("https://llm/v1"), json.dumps({"a": "TODAY'S DATE: 2026-03-02", "b": 1}).encode())
+        assert a == b
+
+    def test_different_bodies_differ(self):
+        """Test: Different request bodies get different keys"""
+        url = httpx.URL("https://llm/v1")
+        assert request_key("POST", url, b'{"claim": "a"}') != request_key("POST", url, b'{"claim": "b"}')
+
+
+class TestRecordReplay:
+    """Test recording exchanges and replaying them offline"""
+
+    def test_sync_round_trip(self, store, upstream):
+        """Test: A recorded exchange replays without reaching the provider"""
+        with httpx.Client(transport=RecordingTransport(store, inner=upstream)) as client:
+            recorded = client.get("https://api.example.com/search?q=earth&key=secret")
+
+        with httpx.Client(transport=ReplayTransport(store, latency_scale=0)) as client:
+            replayed = client.get("https://api.example.com/search?q=earth&key=different")
+
+        assert replayed.status_code == 200
+        assert replayed.json() == recorded.json() == {"n": 1}
+        assert "x-internal" not in replayed.headers
+        assert len(upstream.calls) == 1
+        assert store.stats() == {"hits": 1, "misses": 0, "recorded": 1}
+
+    @pytest.mark.asyncio
+    async def test_async_round_trip(self, store, upstream):
+        """Test: AsyncClient requests record and replay the same way"""
+        async with httpx.AsyncClient(transport=RecordingTransport(store, inner=upstream)) as client:
+            await client.post("https://api.openai.com/v1/chat/completions", json={"model": "gpt", "messages": []})
+
+        async with httpx.AsyncClient(transport=ReplayTransport(store, latency_scale=0)) as client:
+            response = await client.post("https://api.openai.com/v1/chat/completions", json={"messages": [], "model": "gpt"})
+
+        assert response.json() == {"n": 1}
+
+    def test_cassettes_are_compressed_and_redacted(self, store, upstream, tmp_path):
+        """Test: Cassette files are gzip JSON without credentials"""
+        with httpx.Client(transport=RecordingTransport(store, inner=upstream)) as client:
+            client.get("https://api.example.com/search?q=earth&api_key=secret")
+
+        files = list((tmp_path / "cassettes" / "api.example.com").rglob("*.json.gz"))
+        assert len(files) == 1
+        raw = gzip.decompress(files[0].read_bytes()).decode()
+        assert "secret" not in raw
+        assert json.loads(raw)["request"]["url"] == "https://api.example.com/search?q=earth"
+
+    def test_repeated_recordings_rotate(self, store, upstream):
+        """Test: A request recorded several times replays its responses in turn"""
+        with httpx.Client(transport=RecordingTransport(store, inner=upstream)) as client:
+            for _ in range(2):
+                client.get("https://api.example.com/rates")
+
+        with httpx.Client(transport=ReplayTransport(store, latency_scale=0)) as client:
+            values = [client.get("https://api.example.com/rates").json()["n"] for _ in range(3)]
+
+        assert values == [1, 2, 1]
+
+    def test_missing_cassette_is_transport_error(self, store):
+        """Test: Unrecorded requests fail like a network error"""
+        with httpx.Client(transport=ReplayTransport(store, latency_scale=0)) as client:
+            with pytest.raises(httpx.TransportError) as exc_info:
+                client.get("https://api.example.com/never-recorded")
+
+        assert isinstance(exc_info.value, CassetteMissError)
+        assert store.misses == 1
+
+    def test_recorded_latency_injected(self, store, tmp_path):
+        """Test: Replay waits for the recorded latency times the scale"""
+        key = request_key("GET", httpx.URL("https://slow.example.com/"), b"")
+        store.record("slow.example.com", key, {"method": "GET", "url": "https://slow.example.com/"}, {
+            "status": 200, "headers": {}, "body": "", "latency_ms": 100.0,
+        })
+
+        with httpx.Client(transport=ReplayTransport(store, latency_scale=0.5, jitter=0)) as client:
+            start = time.perf_counter()
+            client.get("https://slow.example.com/")
+            elapsed = time.perf_counter() - start
+
+        assert 0.045 <= elapsed < 0.5
+
+
+class TestBuildTransport:
+    """Test transport selection by HTTP_TRANSPORT_MODE"""
+
+    def test_modes(self, monkeypatch, tmp_path):
+        """Test: live uses the httpx default, record/replay use the cassette store"""
+        monkeypatch.setattr(http_transport.settings, "HTTP_CASSETTE_DIR", str(tmp_path))
+
+        monkeypatch.setattr(http_transport.settings, "HTTP_TRANSPORT_MODE", "live")
+        assert build_transport() is None
+
+        monkeypatch.setattr(http_transport.settings, "HTTP_TRANSPORT_MODE", "record")
+        assert isinstance(build_transport(), RecordingTransport)
+
+        monkeypatch.setattr(http_transport.settings, "HTTP_TRANSPORT_MODE", "replay")
+        assert isinstance(build_transport(), ReplayTransport)
+
+        monkeypatch.setattr(http_transport.settings, "HTTP_TRANSPORT_MODE", "offline")
+        with pytest.raises(ValueError):
+            build_transport()
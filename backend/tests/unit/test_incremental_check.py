@@ -0,0 +1,151 @@
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from app.services.incremental_check import IncrementalRecheck, claim_snapshot, recheck_key
+from app.utils.date_utils import parse_date
+
+ARTICLE = "Flooding closed the M5 on Tuesday. The Met Office said 120mm of rain fell in 24 hours."
+
+
+def previous_check(claims, article=ARTICLE, age_seconds=0):
+    """Snapshot as returned by load_previous_check"""
+    return {
+        "check_id": "prev-check",
+        "article_excerpt": article[:5000],
+        "claims": [
+            {
+                "text": text,
+                "position": position,
+                "verdict": "supported",
+                "confidence": 80,
+                "rationale": "Matches Met Office data",
+                "retrieved_at_ts": time.time() - age_seconds,
+                "evidence": [{"url": f"https://example.com/{position}", "external_source_provider": None}],
+            }
+            for position, text in enumerate(claims)
+        ],
+        "raw_evidence": {"0": [{"url": "https://example.com/raw", "claim_position": 0, "is_included": True}]},
+    }
+
+
+def claims(*texts):
+    return [{"text": text, "position": position} for position, text in enumerate(texts)]
+
+
+class TestRecheckKey:
+    """Test identity of re-checked inputs"""
+
+    def test_url_key_ignores_tracking(self):
+        """Test: The same page shared through different links maps to one key"""
+        a = recheck_key("url", "user-1", "https://www.bbc.co.uk/news/123?utm_source=x", None)
+        b = recheck_key("url", "user-2", "http://bbc.co.uk/news/123/", None)
+        assert a == b == "url:bbc.co.uk/news/123"
+
+    def test_text_key_is_per_user(self):
+        """Test: Pasted text only matches the same user's earlier checks"""
+        a = recheck_key("text", "user-1", None, "Flooding closed the  M5!")
+        assert a == recheck_key("text", "user-1", None, "flooding closed the m5")
+        assert a != recheck_key("text", "user-2", None, "Flooding closed the M5!")
+        assert recheck_key("image", "user-1", None, None) is None
+
+
+class TestIncrementalReuse:
+    """Test which claims are copied forward"""
+
+    @pytest.fixture
+    def recheck(self):
+        return IncrementalRecheck()
+
+    def test_unchanged_claims_copied_forward(self, recheck):
+        """Test: Reworded claims from an unchanged article reuse verdict, evidence and raw sources"""
+        previous = previous_check(["The Met Office said 120mm of rain fell in 24 hours"])
+        new_claims = claims("The Met Office says 120mm of rain fell within 24 hours")
+
+        hits, raw_evidence, stats = recheck.reuse(previous, new_claims, ARTICLE)
+
+        result = hits["0"]
+        assert result["verdict"] == "supported"
+        assert result["text"] == new_claims[0]["text"]
+        assert result["evidence"] == previous["claims"][0]["evidence"]
+        assert result["incremental"]["reused_from_check"] == "prev-check"
+        assert raw_evidence == [{
+            "url": "https://example.com/raw", "claim_position": 0, "is_included": True,
+            "claim_text": new_claims[0]["text"],
+        }]
+        assert stats["article_changed"] is False
+        assert stats["claims_reused"] == 1 and stats["claims_rechecked"] == 0
+
+    def test_changed_figures_rechecked(self, recheck):
+        """Test: An updated number in a live story is treated as a new claim"""
+        previous = previous_check(["The Met Office said 120mm of rain fell in 24 hours"])
+        hits, _, _ = recheck.reuse(previous, claims("The Met Office said 150mm of rain fell in 24 hours"), ARTICLE)
+        assert hits == {}
+
+    def test_changed_article_requires_near_verbatim_claims(self, recheck):
+        """Test: Once the article changes, only claims that are essentially unchanged are reused"""
+        previous = previous_check([
+            "Flooding closed the M5 on Tuesday",
+            "The Met Office said 120mm of rain fell in 24 hours",
+        ])
+        updated = ARTICLE + " The Environment Agency issued 40 flood warnings."
+        new_claims = claims(
+            "Flooding closed the M5 on Tuesday",
+            "According to the Met Office 120mm of rain fell over 24 hours",
+            "The Environment Agency issued 40 flood warnings",
+        )
+
+        hits, _, stats = recheck.reuse(previous, new_claims, updated)
+
+        assert set(hits) == {"0"}
+        assert stats["article_changed"] is True
+        assert stats["claims_rechecked"] == 2
+
+    def test_stale_time_sensitive_claim_rechecked(self, recheck):
+        """Test: Time-sensitive claims with evidence older than their window are retrieved again"""
+        age = recheck.time_sensitive_max_age_seconds + 60
+        assert age < recheck.max_age_seconds
+        previous = previous_check(["The M5 is currently closed", "Shakespeare wrote Hamlet"], age_seconds=age)
+
+        hits, _, stats = recheck.reuse(previous, claims("The M5 is currently closed", "Shakespeare wrote Hamlet"), ARTICLE)
+
+        assert set(hits) == {"1"}
+        assert stats["claims_stale"] == 1
+
+    def test_prior_claim_reused_once(self, recheck):
+        """Test: Two new claims cannot both be matched to the same prior claim"""
+        previous = previous_check(["Flooding closed the M5 on Tuesday"])
+        hits, _, _ = recheck.reuse(previous, claims("Flooding closed the M5 on Tuesday", "Flooding closed the M5 on Tuesday"), ARTICLE)
+        assert len(hits) == 1
+
+    def test_evidence_age_survives_chained_rechecks(self, recheck):
+        """Test: A claim copied forward twice still ages from its original retrieval"""
+        text = "The M5 is currently closed"
+        first_retrieved = time.time() - recheck.time_sensitive_max_age_seconds + 600
+        previous = previous_check([text])
+        previous["claims"][0]["retrieved_at_ts"] = first_retrieved
+
+        # First re-check: within the window, copied forward
+        hits, _, _ = recheck.reuse(previous, claims(text), ARTICLE)
+        result = hits["0"]
+
+        # Saved as save_check_results_sync does: new rows stamped now
+        saved_at = datetime.utcnow()
+        row = SimpleNamespace(
+            text=result["text"], position=0, verdict=result["verdict"], confidence=result["confidence"],
+            rationale=result["rationale"], current_verified_data=None, rhetorical_context=None,
+            has_rhetorical_context=False, rhetorical_style=None, created_at=saved_at,
+            evidence_retrieved_at=parse_date(result["evidence_retrieved_at"]),
+        )
+        evidence = [SimpleNamespace(**{field: None for field in [
+            "source", "url", "title", "snippet", "relevance_score", "credibility_score", "nli_stance",
+            "nli_confidence", "nli_entailment", "nli_contradiction", "external_source_provider",
+        ]}, published_date=None, api_metadata=None, created_at=saved_at)]
+        snapshot = claim_snapshot(row, evidence)
+        assert snapshot["retrieved_at_ts"] == pytest.approx(first_retrieved, abs=1)
+
+        # Second re-check after the original evidence has gone stale
+        hits, _, stats = recheck.reuse({**previous, "claims": [snapshot]}, claims(text), ARTICLE, now=time.time() + 1200)
+        assert hits == {}
+        assert stats["claims_stale"] == 1
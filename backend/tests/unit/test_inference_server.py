@@ -0,0 +1,130 @@
+"""
+Unit tests for the shared inference server (dynamic batching) and its client.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.services.inference_client import InferenceClient
+from app.services.inference_server import DynamicBatcher
+
+
+class RecordingModel:
+    """Stand-in batch function that records the batches it receives"""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, items):
+        self.batches.append(list(items))
+        return [f"out:{item}" for item in items]
+
+
+class TestDynamicBatcher:
+    """Test request coalescing under a latency deadline"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_batch(self):
+        """Test: Requests arriving within the wait window run as one model batch"""
+        model = RecordingModel()
+        batcher = DynamicBatcher("test", model, max_batch_size=32, max_wait_ms=50)
+
+        results = await asyncio.gather(
+            batcher.submit(["a", "b"]),
+            batcher.submit(["c"]),
+            batcher.submit(["d", "e"]),
+        )
+        await batcher.close()
+
+        assert results == [["out:a", "out:b"], ["out:c"], ["out:d", "out:e"]]
+        assert model.batches == [["a", "b", "c", "d", "e"]]
+        assert batcher.stats()["avg_batch_size"] == 5
+
+    @pytest.mark.asyncio
+    async def test_batches_capped_at_max_size(self):
+        """Test: Large requests are split into max_batch_size chunks, order preserved"""
+        model = RecordingModel()
+        batcher = DynamicBatcher("test", model, max_batch_size=2, max_wait_ms=50)
+
+        results = await batcher.submit(["a", "b", "c", "d", "e"])
+        await batcher.close()
+
+        assert results == ["out:a", "out:b", "out:c", "out:d", "out:e"]
+        assert model.batches == [["a", "b"], ["c", "d"], ["e"]]
+
+    @pytest.mark.asyncio
+    async def test_lone_request_not_held_past_deadline(self):
+        """Test: A single request runs once the wait deadline passes"""
+        model = RecordingModel()
+        batcher = DynamicBatcher("test", model, max_batch_size=32, max_wait_ms=5)
+
+        results = await asyncio.wait_for(batcher.submit(["a"]), timeout=1.0)
+        await batcher.close()
+
+        assert results == ["out:a"]
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates_to_all_callers(self):
+        """Test: A model error fails every request in the batch and the batcher keeps serving"""
+        calls = []
+
+        def flaky(items):
+            calls.append(items)
+            if len(calls) == 1:
+                raise RuntimeError("CUDA out of memory")
+            return items
+
+        batcher = DynamicBatcher("test", flaky, max_batch_size=32, max_wait_ms=20)
+
+        first = await asyncio.gather(batcher.submit(["a"]), batcher.submit(["b"]), return_exceptions=True)
+        second = await batcher.submit(["c"])
+        await batcher.close()
+
+        assert all(isinstance(result, RuntimeError) for result in first)
+        assert second == ["c"]
+
+
+class TestInferenceClient:
+    """Test request/response mapping of the client"""
+
+    @pytest.fixture
+    def requests(self):
+        return []
+
+    @pytest.fixture
+    def client(self, requests):
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            requests.append((request.url.path, body))
+            if request.url.path == "/nli":
+                return httpx.Response(200, json={"scores": [[0.8, 0.1, 0.1] for _ in body["pairs"]]})
+            if request.url.path == "/embed":
+                return httpx.Response(200, json={"embeddings": [[1.0, 0.0] for _ in body["texts"]]})
+            return httpx.Response(200, json={"scores": [0.5 for _ in body["pairs"]]})
+
+        return InferenceClient(base_url="http://inference", uds="", transport=httpx.MockTransport(handler))
+
+    @pytest.mark.asyncio
+    async def test_nli_pairs_premise_with_hypothesis(self, client, requests):
+        """Test: NLI sends [premise, hypothesis] pairs and returns score tuples"""
+        scores = await client.nli(["evidence"], ["claim"])
+
+        assert requests == [("/nli", {"pairs": [["evidence", "claim"]]})]
+        assert scores == [(0.8, 0.1, 0.1)]
+
+    @pytest.mark.asyncio
+    async def test_embed_and_rerank(self, client, requests):
+        """Test: Embedding and rerank endpoints map one result per input"""
+        assert await client.embed(["a", "b"]) == [[1.0, 0.0], [1.0, 0.0]]
+        assert await client.rerank([("claim", "passage")]) == [0.5]
+        assert [path for path, _ in requests] == ["/embed", "/rerank"]
+
+    @pytest.mark.asyncio
+    async def test_empty_inputs_skip_request(self, client, requests):
+        """Test: Empty batches never reach the server"""
+        assert await client.nli([], []) == []
+        assert await client.embed([]) == []
+        assert requests == []
@@ -0,0 +1,84 @@
+"""
+Unit tests for pipeline Prometheus metrics helpers.
+"""
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.metrics import llm_post
+
+
+def sample(name, labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None):
+        self.status_code = status_code
+        self._body = body or {}
+
+    def json(self):
+        return self._body
+
+
+class FakeClient:
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+        self.calls = []
+
+    async def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        if self.error:
+            raise self.error
+        return self.response
+
+
+class TestLLMPost:
+    """Test LLM call latency and token accounting"""
+
+    @pytest.mark.asyncio
+    async def test_openai_usage_recorded(self):
+        """Test: Prompt/completion tokens and latency are recorded per caller and model"""
+        labels = {"caller": "test_openai", "model": "gpt-test"}
+        before_prompt = sample("tru8_llm_tokens_total", {**labels, "kind": "prompt"})
+        before_calls = sample("tru8_llm_call_seconds_count", {**labels, "status": "ok"})
+
+        client = FakeClient(FakeResponse(body={"usage": {"prompt_tokens": 120, "completion_tokens": 30}}))
+        response = await llm_post(client, "test_openai", "https://llm", json={"model": "gpt-test"}, headers={})
+
+        assert response is client.response
+        assert client.calls == [("https://llm", {"json": {"model": "gpt-test"}, "headers": {}})]
+        assert sample("tru8_llm_tokens_total", {**labels, "kind": "prompt"}) == before_prompt + 120
+        assert sample("tru8_llm_tokens_total", {**labels, "kind": "completion"}) >= 30
+        assert sample("tru8_llm_call_seconds_count", {**labels, "status": "ok"}) == before_calls + 1
+
+    @pytest.mark.asyncio
+    async def test_gemini_usage_metadata(self):
+        """Test: Gemini usageMetadata is read with an explicit model label"""
+        labels = {"caller": "test_gemini", "model": "gemini-test", "kind": "completion"}
+        before = sample("tru8_llm_tokens_total", labels)
+
+        client = FakeClient(FakeResponse(body={"usageMetadata": {"promptTokenCount": 10, "candidatesTokenCount": 5}}))
+        await llm_post(client, "test_gemini", "https://gemini", model="gemini-test", json={})
+
+        assert sample("tru8_llm_tokens_total", labels) == before + 5
+
+    @pytest.mark.asyncio
+    async def test_http_error_status_label(self):
+        """Test: Non-200 responses are labelled by status code and record no tokens"""
+        client = FakeClient(FakeResponse(status_code=429, body={"usage": {"prompt_tokens": 99}}))
+        await llm_post(client, "test_429", "https://llm", json={"model": "gpt-test"})
+
+        assert sample("tru8_llm_call_seconds_count", {"caller": "test_429", "model": "gpt-test", "status": "429"}) == 1
+        assert sample("tru8_llm_tokens_total", {"caller": "test_429", "model": "gpt-test", "kind": "prompt"}) == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_recorded_and_reraised(self):
+        """Test: Transport errors are counted and propagate to the caller"""
+        client = FakeClient(error=TimeoutError("read timeout"))
+
+        with pytest.raises(TimeoutError):
+            await llm_post(client, "test_error", "https://llm", json={"model": "gpt-test"})
+
+        assert sample("tru8_llm_call_seconds_count", {"caller": "test_error", "model": "gpt-test", "status": "error"}) == 1
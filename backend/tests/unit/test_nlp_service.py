@@ -0,0 +1,70 @@
+"""
+Unit tests for the shared spaCy NLP service (batched, cached parsing).
+"""
+
+import pytest
+from app.services.nlp import NLPService
+
+
+class FakeNLP:
+    """Stand-in for a spaCy Language object that records calls"""
+
+    pipe_names = ["tok2vec", "tagger", "ner"]
+
+    def __init__(self):
+        self.pipe_calls = []
+        self.single_calls = []
+
+    def pipe(self, texts, batch_size=64):
+        self.pipe_calls.append(list(texts))
+        return [f"doc:{t}" for t in texts]
+
+    def __call__(self, text):
+        self.single_calls.append(text)
+        return f"doc:{text}"
+
+
+class TestNLPService:
+    """Test batched parsing and doc cache"""
+
+    @pytest.fixture
+    def service(self):
+        service = NLPService(max_cached_docs=3)
+        service.nlp = FakeNLP()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_parse_batch_uses_single_pipe_call(self, service):
+        docs = await service.parse_batch(["a", "b", "a", ""])
+
+        assert docs == ["doc:a", "doc:b", "doc:a", None]
+        assert service.nlp.pipe_calls == [["a", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_cached_docs_not_reparsed(self, service):
+        await service.parse_batch(["a", "b"])
+        await service.parse_batch(["a", "c"])
+
+        assert service.nlp.pipe_calls == [["a", "b"], ["c"]]
+        assert service.get_doc("b") == "doc:b"
+        assert service.nlp.single_calls == []
+
+    def test_get_doc_parses_on_miss(self, service):
+        assert service.get_doc("x") == "doc:x"
+        assert service.get_doc("x") == "doc:x"
+        assert service.nlp.single_calls == ["x"]
+
+    def test_cache_evicts_least_recently_used(self, service):
+        for text in ["a", "b", "c"]:
+            service.get_doc(text)
+        service.get_doc("a")  # refresh "a"
+        service.get_doc("d")  # evicts "b"
+
+        service.get_doc("b")
+        assert service.nlp.single_calls == ["a", "b", "c", "d", "b"]
+
+    def test_unavailable_model_returns_none(self):
+        service = NLPService()
+        service._load_failed = True
+        assert service.get_doc("text") is None
+        assert not service.available
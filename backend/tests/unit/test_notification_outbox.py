@@ -0,0 +1,167 @@
+"""
+Unit tests for the notification outbox dispatcher (batched push, retries).
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app.services.notification_outbox import (
+    NotificationDispatcher,
+    check_failed_intents,
+    check_completed_intents,
+)
+
+
+class FakeTicket:
+    def __init__(self, ok=True, error=None):
+        self.ok = ok
+        self.details = {"error": error} if error else None
+        self.message = error
+
+    def is_success(self):
+        return self.ok
+
+
+class FakePushClient:
+    def __init__(self, tickets=None, error=None):
+        self.tickets = tickets
+        self.error = error
+        self.batches = []
+
+    def publish_multiple(self, messages):
+        self.batches.append(messages)
+        if self.error:
+            raise self.error
+        return self.tickets or [FakeTicket() for _ in messages]
+
+
+class FakeEmailService:
+    def __init__(self, result=True, error=None):
+        self.result = result
+        self.error = error
+        self.calls = []
+
+    def send_check_failed_email_sync(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.error:
+            raise self.error
+        return self.result
+
+    def send_check_completed_email_sync(self, **kwargs):
+        return self.send_check_failed_email_sync(**kwargs)
+
+
+class FakeSession:
+    """Returns the given users for the push token lookup"""
+
+    def __init__(self, users):
+        self.users = users
+
+    def execute(self, stmt):
+        users = self.users
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: users))
+
+
+def _user(user_id, token="ExponentPushToken[abc]", enabled=True):
+    return SimpleNamespace(id=user_id, push_token=token, push_notifications_enabled=enabled)
+
+
+class TestNotificationDispatcher:
+    """Test push batching, email delivery and retry policy"""
+
+    @pytest.fixture
+    def now(self):
+        return datetime(2026, 1, 1, 12, 0, 0)
+
+    def _push_rows(self, *user_ids):
+        return [check_failed_intents(user_id, f"check-{user_id}", "boom")[0] for user_id in user_ids]
+
+    def test_push_rows_sent_in_one_batch(self, now):
+        """Test: All push rows go through a single publish_multiple call"""
+        client = FakePushClient()
+        dispatcher = NotificationDispatcher(push_client=client, email_service=FakeEmailService())
+        rows = self._push_rows("u1", "u2", "u3")
+
+        dispatcher._deliver_push(FakeSession([_user("u1"), _user("u2"), _user("u3")]), rows, now)
+
+        assert len(client.batches) == 1
+        assert len(client.batches[0]) == 3
+        assert all(row.status == "sent" and row.sent_at == now for row in rows)
+
+    def test_push_skipped_without_token(self, now):
+        """Test: Users without a token or with push disabled are skipped"""
+        client = FakePushClient()
+        dispatcher = NotificationDispatcher(push_client=client, email_service=FakeEmailService())
+        rows = self._push_rows("u1", "u2")
+
+        dispatcher._deliver_push(FakeSession([_user("u1", token=None), _user("u2", enabled=False)]), rows, now)
+
+        assert client.batches == []
+        assert [row.status for row in rows] == ["skipped", "skipped"]
+
+    def test_dead_token_not_retried(self, now):
+        """Test: DeviceNotRegistered tickets are skipped, other errors retried"""
+        client = FakePushClient(tickets=[FakeTicket(ok=False, error="DeviceNotRegistered"),
+                                         FakeTicket(ok=False, error="MessageRateExceeded")])
+        dispatcher = NotificationDispatcher(push_client=client, email_service=FakeEmailService())
+        rows = self._push_rows("u1", "u2")
+
+        dispatcher._deliver_push(FakeSession([_user("u1"), _user("u2")]), rows, now)
+
+        assert rows[0].status == "skipped"
+        assert rows[1].status == "pending"
+        assert rows[1].next_attempt_at > now
+
+    def test_batch_error_schedules_backoff(self, now):
+        """Test: Expo server error retries every row with exponential backoff"""
+        dispatcher = NotificationDispatcher(
+            push_client=FakePushClient(error=RuntimeError("expo down")),
+            email_service=FakeEmailService()
+        )
+        dispatcher.retry_base_seconds = 30
+        row = self._push_rows("u1")[0]
+
+        dispatcher._deliver_push(FakeSession([_user("u1")]), [row], now)
+        assert row.status == "pending"
+        assert row.attempts == 1
+        assert row.next_attempt_at == now + timedelta(seconds=30)
+
+        dispatcher._deliver_push(FakeSession([_user("u1")]), [row], now)
+        assert row.next_attempt_at == now + timedelta(seconds=60)
+
+    def test_gives_up_after_max_attempts(self, now):
+        """Test: Email is marked failed once attempts are exhausted"""
+        dispatcher = NotificationDispatcher(
+            push_client=FakePushClient(),
+            email_service=FakeEmailService(error=RuntimeError("resend down"))
+        )
+        dispatcher.max_attempts = 2
+        row = check_failed_intents("u1", "check-1", "boom")[1]
+
+        dispatcher._deliver_email(row, now)
+        assert row.status == "pending"
+        dispatcher._deliver_email(row, now)
+        assert row.status == "failed"
+        assert row.last_error == "resend down"
+
+    def test_completed_email_payload_passed_through(self, now):
+        """Test: Completion email receives the stored summary"""
+        email = FakeEmailService()
+        dispatcher = NotificationDispatcher(push_client=FakePushClient(), email_service=email)
+        row = check_completed_intents("u1", "check-1", 3, 2, 1, 0, 80)[0]
+
+        dispatcher._deliver_email(row, now)
+
+        assert row.status == "sent"
+        assert email.calls[0]["claims_count"] == 3
+        assert email.calls[0]["raise_on_error"] is True
+
+    def test_sweep_delivers_until_nothing_due(self, now, monkeypatch):
+        """Test: The beat sweep drains due batches and totals their outcomes"""
+        dispatcher = NotificationDispatcher(push_client=FakePushClient(), email_service=FakeEmailService())
+        batches = [{"sent": 100}, {"sent": 3, "pending": 1}, {}]
+        monkeypatch.setattr(dispatcher, "deliver_due", lambda session, now=None: batches.pop(0))
+
+        assert dispatcher.sweep(FakeSession([]), now) == {"sent": 103, "pending": 1}
+        assert batches == []
@@ -0,0 +1,146 @@
+"""
+Unit tests for Stripe webhook deduplication and processing.
+"""
+
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException
+
+from app.api.v1 import payments
+from fixtures.fake_redis import AsyncFakeRedis
+
+
+@asynccontextmanager
+async def fake_session():
+    yield object()
+
+
+class TestStripeWebhookProcessing:
+    """Test event-ID dedupe and event application"""
+
+    @pytest.fixture
+    def fake_redis(self):
+        redis = AsyncFakeRedis()
+        with patch.object(payments, "_get_redis", return_value=redis):
+            yield redis
+
+    @pytest.mark.asyncio
+    async def test_duplicate_event_rejected(self, fake_redis):
+        """Test: Same event ID is only claimed once"""
+        assert await payments.claim_stripe_event("evt_1") is True
+        assert await payments.claim_stripe_event("evt_1") is False
+        assert await payments.claim_stripe_event("evt_2") is True
+
+    @pytest.mark.asyncio
+    async def test_dedupe_fails_open_without_redis(self):
+        """Test: Redis outage does not drop events"""
+        broken = AsyncFakeRedis()
+        broken.set = AsyncMock(side_effect=ConnectionError("redis down"))
+        with patch.object(payments, "_get_redis", return_value=broken):
+            assert await payments.claim_stripe_event("evt_1") is True
+
+    @pytest.mark.asyncio
+    async def test_processed_event_marked(self, fake_redis):
+        """Test: Successful processing marks the event processed"""
+        event = {"id": "evt_ok", "type": "invoice.paid", "data": {"object": {}}}
+        await payments.claim_stripe_event("evt_ok")
+
+        with patch.object(payments, "async_session", fake_session), \
+             patch.object(payments, "apply_stripe_event", AsyncMock()) as apply:
+            await payments.process_stripe_event(event)
+
+        apply.assert_awaited_once()
+        assert fake_redis.data["tru8:stripe_event:evt_ok"] == "processed"
+
+    @pytest.mark.asyncio
+    async def test_failed_event_released_for_redelivery(self, fake_redis):
+        """Test: A failed event can be claimed again on redelivery"""
+        event = {"id": "evt_fail", "type": "invoice.paid", "data": {"object": {}}}
+        await payments.claim_stripe_event("evt_fail")
+
+        with patch.object(payments, "async_session", fake_session), \
+             patch.object(payments, "apply_stripe_event", AsyncMock(side_effect=RuntimeError("db down"))):
+            await payments.process_stripe_event(event)
+
+        assert await payments.claim_stripe_event("evt_fail") is True
+
+    @pytest.mark.asyncio
+    async def test_claim_kept_while_worker_retries(self, fake_redis):
+        """Test: A failure that will be retried keeps the event claimed"""
+        event = {"id": "evt_retry", "type": "invoice.paid", "data": {"object": {}}}
+        await payments.claim_stripe_event("evt_retry")
+
+        with patch.object(payments, "async_session", fake_session), \
+             patch.object(payments, "apply_stripe_event", AsyncMock(side_effect=RuntimeError("db down"))):
+            assert await payments.process_stripe_event(event, release_on_failure=False) is False
+
+        assert fake_redis.data["tru8:stripe_event:evt_retry"] == "processing"
+
+    @pytest.mark.asyncio
+    async def test_applied_event_not_reapplied(self, fake_redis):
+        """Test: A broker redelivery of an applied event is a no-op"""
+        event = {"id": "evt_done", "type": "invoice.paid", "data": {"object": {}}}
+        fake_redis.data["tru8:stripe_event:evt_done"] = "processed"
+
+        with patch.object(payments, "apply_stripe_event", AsyncMock()) as apply:
+            assert await payments.process_stripe_event(event) is True
+        apply.assert_not_awaited()
+
+
+class FakeRequest:
+    headers = {"stripe-signature": "sig"}
+
+    async def body(self):
+        return b"{}"
+
+
+class TestStripeWebhookEndpoint:
+    """Test that events are acknowledged once durably queued"""
+
+    @pytest.fixture
+    def fake_redis(self):
+        redis = AsyncFakeRedis()
+        with patch.object(payments, "_get_redis", return_value=redis):
+            yield redis
+
+    def _deliver(self, event):
+        with patch.object(payments.stripe.Webhook, "construct_event", return_value=event):
+            return payments.stripe_webhook(FakeRequest())
+
+    @pytest.mark.asyncio
+    async def test_event_queued_and_acknowledged(self, fake_redis):
+        """Test: A new event is handed to the payments queue without applying it inline"""
+        event = {"id": "evt_new", "type": "invoice.paid", "data": {"object": {}}}
+
+        with patch.object(payments, "enqueue_stripe_event", return_value=True) as enqueue, \
+             patch.object(payments, "apply_stripe_event", AsyncMock()) as apply:
+            assert await self._deliver(event) == {"status": "queued"}
+
+        enqueue.assert_called_once_with(event)
+        apply.assert_not_awaited()
+        assert fake_redis.data["tru8:stripe_event:evt_new"] == "processing"
+
+    @pytest.mark.asyncio
+    async def test_queue_failure_not_acknowledged(self, fake_redis):
+        """Test: If the event cannot be queued, 500 asks Stripe to redeliver and the redelivery is accepted"""
+        event = {"id": "evt_retry", "type": "invoice.paid", "data": {"object": {}}}
+
+        with patch.object(payments, "enqueue_stripe_event", return_value=False):
+            with pytest.raises(HTTPException) as exc:
+                await self._deliver(event)
+        assert exc.value.status_code == 500
+
+        with patch.object(payments, "enqueue_stripe_event", return_value=True):
+            assert await self._deliver(event) == {"status": "queued"}
+
+    @pytest.mark.asyncio
+    async def test_duplicate_acknowledged(self, fake_redis):
+        """Test: A redelivery of a queued or applied event is a no-op 200"""
+        event = {"id": "evt_dup", "type": "invoice.paid", "data": {"object": {}}}
+        await payments.claim_stripe_event("evt_dup")
+
+        with patch.object(payments, "enqueue_stripe_event") as enqueue:
+            assert await self._deliver(event) == {"status": "duplicate"}
+        enqueue.assert_not_called()
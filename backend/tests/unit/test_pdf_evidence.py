@@ -0,0 +1,132 @@
+"""
+Unit tests for lazy, cached PDF evidence extraction.
+"""
+
+import io
+import sys
+import types
+import pytest
+
+from app.services.pdf_evidence import PDFEvidenceExtractor, CachedPDF
+
+
+class FakePage:
+    def __init__(self, text, opened):
+        self.text = text
+        self.opened = opened
+
+    def extract_text(self):
+        self.opened.append(self.text)
+        return self.text
+
+    def close(self):
+        pass
+
+
+class FakePDF:
+    def __init__(self, texts, opened):
+        self.pages = [FakePage(text, opened) for text in texts]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+@pytest.fixture
+def fake_pdfplumber(monkeypatch):
+    """Install a fake pdfplumber module that records extracted pages"""
+    state = {"texts": [], "extracted": []}
+    module = types.ModuleType("pdfplumber")
+    module.open = lambda f: FakePDF(state["texts"], state["extracted"])
+    monkeypatch.setitem(sys.modules, "pdfplumber", module)
+    return state
+
+
+class TestPDFEvidenceExtractor:
+    """Test early termination and per-URL page cache"""
+
+    @pytest.fixture
+    def extractor(self):
+        extractor = PDFEvidenceExtractor()
+        extractor.early_stop_relevance = 0.8
+        return extractor
+
+    def _document(self):
+        return CachedPDF("https://example.gov/report.pdf", io.BytesIO(b""), {"total_pages": 5})
+
+    def test_stops_early_on_strong_matches(self, extractor, fake_pdfplumber):
+        fake_pdfplumber["texts"] = [
+            "Introduction to the report.",
+            "Unemployment rate fell to 4 percent in 2023.",
+            "Appendix tables.",
+            "More appendix tables.",
+        ]
+        document = self._document()
+
+        matches = extractor._search_pdf_for_claim(document, "Unemployment rate fell to 4 percent in 2023", 1)
+
+        assert [m["page_number"] for m in matches] == [2]
+        assert len(fake_pdfplumber["extracted"]) == 2  # pages 3-4 never extracted
+        assert document.next_page == 2
+        assert not document.fully_scanned
+
+    def test_later_claims_reuse_extracted_pages(self, extractor, fake_pdfplumber):
+        fake_pdfplumber["texts"] = [
+            "Inflation rates rose sharply during 2022.",
+            "Housing completions declined.",
+        ]
+        document = self._document()
+        extractor._search_pdf_for_claim(document, "Housing completions declined", 1)
+        fake_pdfplumber["extracted"].clear()
+
+        matches = extractor._search_pdf_for_claim(document, "Inflation rate rose sharply", 1)
+
+        # Page 1 found through the keyword index, no re-extraction
+        assert matches[0]["page_number"] == 1
+        assert fake_pdfplumber["extracted"] == []
+
+    def test_fully_scanned_document_not_reopened(self, extractor, fake_pdfplumber):
+        fake_pdfplumber["texts"] = ["Nothing relevant here."]
+        document = self._document()
+
+        assert extractor._search_pdf_for_claim(document, "Unrelated claim about wages", 1) == []
+        assert document.fully_scanned
+
+        fake_pdfplumber["extracted"].clear()
+        extractor._search_pdf_for_claim(document, "Another claim about wages", 1)
+        assert fake_pdfplumber["extracted"] == []
+
+    def test_concurrent_loops_share_one_cached_document(self, extractor, monkeypatch):
+        """Test: Downloads racing on separate event loops and threads leave one cached copy"""
+        import asyncio
+        import threading
+        import time
+
+        files = []
+
+        async def fake_download(url):
+            await asyncio.sleep(0.05)
+            files.append(io.BytesIO(b""))
+            return files[-1]
+
+        monkeypatch.setattr(extractor, "_download_pdf", fake_download)
+        monkeypatch.setattr(extractor, "_extract_pdf_metadata", lambda f: {"title": "Report", "total_pages": 1})
+        url = "https://example.gov/report.pdf"
+        documents = []
+
+        def load():
+            documents.append(asyncio.run(extractor._get_document(url)))
+
+        threads = [threading.Thread(target=load) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.01)
+        for thread in threads:
+            thread.join()
+
+        assert len(files) == 2
+        assert documents[0] is documents[1]
+        assert list(extractor._documents.values()) == [documents[0]]
+        assert sum(f.closed for f in files) == 1
@@ -0,0 +1,91 @@
+"""
+Unit tests for the staged pipeline (stage state store and chain dispatch).
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.workers import stages
+from app.workers.stages import PipelineStateStore, build_check_chain, dispatch_check
+from fixtures.fake_redis import FakeRedis
+
+
+class TestPipelineStateStore:
+    """Test Redis-backed stage context"""
+
+    @pytest.fixture
+    def store(self):
+        return PipelineStateStore(redis_client=FakeRedis(), ttl_seconds=60)
+
+    def test_round_trip_preserves_context(self, store):
+        """Test: Saved context loads back unchanged, keyed by check_id"""
+        ctx = {
+            "check_id": "check-1",
+            "claims": [{"text": "claim", "position": 0}],
+            "evidence": {"0": [{"url": "https://example.com"}]},
+            "stage_timings": {"ingest": 1.5},
+        }
+        store.save(ctx)
+
+        assert store.load("check-1") == ctx
+        assert store.redis.ttls["tru8:pipeline:check-1"] == 60
+
+    def test_non_json_values_are_coerced(self, store):
+        """Test: Numpy-style scalars are stored via .item()"""
+        class Scalar:
+            def item(self):
+                return 0.75
+
+        store.save({"check_id": "check-2", "score": Scalar()})
+        assert store.load("check-2")["score"] == 0.75
+
+    def test_missing_state_raises(self, store):
+        """Test: A stage started without state fails the check instead of running empty"""
+        with pytest.raises(Exception, match="missing or expired"):
+            store.load("unknown")
+
+    def test_delete(self, store):
+        """Test: State is removed after the final stage"""
+        store.save({"check_id": "check-3"})
+        store.delete("check-3")
+        assert store.redis.get("tru8:pipeline:check-3") is None
+
+
+class TestDispatchCheck:
+    """Test chain construction and dispatch"""
+
+    def test_chain_stage_order_and_immutability(self):
+        """Test: Four immutable stage signatures carry the check id"""
+        workflow = build_check_chain("check-1", "user-1", {"input_type": "text"})
+
+        names = [sig.task for sig in workflow.tasks]
+        assert names == [
+            "app.workers.stages.ingest_extract",
+            "app.workers.stages.retrieve",
+            "app.workers.stages.verify",
+            "app.workers.stages.judge",
+        ]
+        assert all(sig.immutable for sig in workflow.tasks)
+        assert all(sig.kwargs["check_id"] == "check-1" for sig in workflow.tasks)
+        assert workflow.tasks[0].kwargs["input_data"] == {"input_type": "text"}
+
+    def test_flag_off_uses_monolithic_task(self):
+        """Test: Without ENABLE_STAGED_PIPELINE, process_check is dispatched"""
+        with patch.object(stages.settings, "ENABLE_STAGED_PIPELINE", False), \
+                patch.object(stages.process_check, "delay") as delay:
+            dispatch_check("check-1", "user-1", {})
+
+        delay.assert_called_once_with(check_id="check-1", user_id="user-1", input_data={})
+
+    def test_flag_on_returns_first_stage_result(self):
+        """Test: Progress mapping points at the first stage, not the last"""
+        first = MagicMock(parent=None)
+        last = MagicMock(parent=MagicMock(parent=first))
+        workflow = MagicMock()
+        workflow.apply_async.return_value = last
+
+        with patch.object(stages.settings, "ENABLE_STAGED_PIPELINE", True), \
+                patch.object(stages, "build_check_chain", return_value=workflow):
+            result = dispatch_check("check-1", "user-1", {})
+
+        assert result is first
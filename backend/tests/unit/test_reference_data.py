@@ -0,0 +1,147 @@
+"""
+Unit tests for adapter reference-data snapshots.
+"""
+
+import json
+import time
+
+import pytest
+
+from app.services import government_api_client
+from app.services.government_api_client import GovernmentAPIClient
+from app.services.reference_data import ReferenceDataStore, ReferenceResource
+from fixtures.fake_redis import FakeRedis
+
+
+class TableAdapter(GovernmentAPIClient):
+    """Adapter whose API returns a numbered table, counting requests"""
+
+    def __init__(self):
+        super().__init__(api_name="Tables", base_url="https://tables.example")
+        self.requests = []
+        self.fail = False
+
+    def search(self, query, domain, jurisdiction, entities=None):
+        return []
+
+    def _transform_response(self, raw_response):
+        return []
+
+    def _make_request(self, endpoint, params=None, method="GET"):
+        self.requests.append((endpoint, params))
+        return None if self.fail else {"table": len(self.requests)}
+
+
+def resource(key="standings:PL", refresh_seconds=600):
+    return ReferenceResource(adapter="Tables", key=key, endpoint=f"/{key}", refresh_seconds=refresh_seconds)
+
+
+def age_snapshot(store, resource_id, seconds):
+    """Pretend a snapshot was fetched `seconds` earlier, locally and in Redis"""
+    key = store._snapshot_key(resource_id)
+    stored = json.loads(store.redis.data[key])
+    stored["fetched_at"] -= seconds
+    store.redis.data[key] = json.dumps(stored)
+    store.redis.hashes[store._fetched_key][resource_id] = str(stored["fetched_at"])
+    store._local[resource_id].fetched_at = stored["fetched_at"]
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = ReferenceDataStore(redis_client=FakeRedis())
+    monkeypatch.setattr(government_api_client, "get_reference_store", lambda: store)
+    return store
+
+
+@pytest.fixture
+def adapter(store):
+    return TableAdapter()
+
+
+class TestGetReference:
+    """Test adapter reads through reference snapshots"""
+
+    def test_resource_fetched_once_across_claims(self, adapter):
+        """Test: Different claims needing the same table share one fetch"""
+        first = adapter.get_reference("standings:PL", "/competitions/PL/standings")
+        second = adapter.get_reference("standings:PL", "/competitions/PL/standings")
+
+        assert first == second == {"table": 1}
+        assert adapter.requests == [("/competitions/PL/standings", None)]
+
+    def test_shared_snapshot_used_by_other_workers(self, adapter, store):
+        """Test: A new process reads the snapshot from Redis instead of the API"""
+        adapter.get_reference("teams", "/teams", params={"limit": 500})
+
+        other_worker = ReferenceDataStore(redis_client=store.redis)
+        snapshot = other_worker.get(resource("teams", refresh_seconds=3600))
+        assert snapshot.data == {"table": 1}
+
+    def test_stale_snapshot_served_without_fetch(self, adapter, store):
+        """Test: Past the refresh interval the snapshot is still served; refresh is left to beat"""
+        adapter.get_reference("standings:PL", "/standings", refresh_seconds=600)
+        age_snapshot(store, "Tables|standings:PL", 900)
+
+        assert adapter.get_reference("standings:PL", "/standings", refresh_seconds=600) == {"table": 1}
+        assert len(adapter.requests) == 1
+
+    def test_expired_snapshot_refetched_or_kept_on_failure(self, adapter, store):
+        """Test: Past the stale limit the API is called inline; on failure the old snapshot is kept"""
+        adapter.get_reference("standings:PL", "/standings", refresh_seconds=600)
+        age_snapshot(store, "Tables|standings:PL", 600 * 10)
+
+        adapter.fail = True
+        assert adapter.get_reference("standings:PL", "/standings", refresh_seconds=600) == {"table": 1}
+
+        adapter.fail = False
+        assert adapter.get_reference("standings:PL", "/standings", refresh_seconds=600) == {"table": 3}
+
+
+class TestRefreshDue:
+    """Test the background refresh pass"""
+
+    def test_refreshes_due_and_drops_idle(self, store):
+        """Test: Due snapshots are refetched; snapshots nobody read recently are dropped"""
+        store.put(resource("standings:PL"), {"table": "old"})
+        store.put(resource("standings:SA"), {"table": "old"})
+        store.put(resource("scorers:PL"), {"table": "fresh"})
+        age_snapshot(store, "Tables|standings:PL", 700)
+        age_snapshot(store, "Tables|standings:SA", 700)
+        store.redis.hashes[store._read_key]["Tables|standings:SA"] = str(time.time() - 72 * 3600)
+
+        fetched = []
+        stats = store.refresh_due(lambda res: fetched.append(res.key) or {"table": "new"})
+
+        assert fetched == ["standings:PL"]
+        assert stats == {"refreshed": 1, "failed": 0, "dropped": 1, "deferred": 0}
+        assert store.get(resource("standings:PL")).data == {"table": "new"}
+        assert store.get(resource("standings:SA")) is None
+
+    def test_refresh_cap_takes_most_overdue(self, store):
+        """Test: Per-run cap refreshes the most overdue resources first and keeps failures"""
+        for key, age in (("a", 700), ("b", 3000), ("c", 1500)):
+            store.put(resource(key), {"table": "old"})
+            age_snapshot(store, f"Tables|{key}", age)
+
+        fetched = []
+        stats = store.refresh_due(lambda res: fetched.append(res.key) or None, max_refreshes=2)
+
+        assert fetched == ["b", "c"]
+        assert stats == {"refreshed": 0, "failed": 2, "dropped": 0, "deferred": 1}
+        assert store.get(resource("b")).data == {"table": "old"}
+
+
+class TestONSCatalogueMatching:
+    """Test local matching of claims against the ONS dataset catalogue"""
+
+    def test_matches_whole_words_only(self, store):
+        """Test: Query words match inflected title words but not words containing them"""
+        from app.services.api_adapters import ONSAdapter
+
+        catalogue = [
+            {"title": "How councils generate revenue"},
+            {"title": "Labour market", "description": "The unemployment rate by region"},
+            {"title": "Unemployment rates"},
+        ]
+        matched = ONSAdapter()._match_datasets(catalogue, "UK unemployment rate in 2024")
+        assert [item["title"] for item in matched] == ["Unemployment rates", "Labour market"]
@@ -0,0 +1,132 @@
+"""
+Unit tests for Redis-backed circuit breaker state shared across workers.
+"""
+
+import pytest
+
+from app.services.circuit_breaker import (
+    CircuitBreakerError,
+    CircuitBreakerRegistry,
+    CircuitState,
+    SharedCircuitBreaker,
+)
+from fixtures.fake_redis import FakeRedis
+
+
+class DownRedis:
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise ConnectionError("Redis unavailable")
+        return fail
+
+
+def worker(redis, **kwargs):
+    """A breaker as another process would create it"""
+    options = dict(failure_threshold=3, recovery_timeout=60, success_threshold=1, cache_seconds=0)
+    options.update(kwargs)
+    return SharedCircuitBreaker("ONS", redis, **options)
+
+
+def fail():
+    raise RuntimeError("upstream down")
+
+
+def call_failing(breaker, times):
+    for _ in range(times):
+        with pytest.raises(RuntimeError):
+            breaker.call(fail)
+
+
+def age_trip(redis, seconds):
+    """Pretend the circuit was opened `seconds` ago"""
+    key = "tru8:circuit:ONS:tripped"
+    redis.data[key] = str(float(redis.data[key]) - seconds)
+
+
+class TestSharedState:
+    """Test state transitions visible across workers"""
+
+    def test_failures_from_all_workers_open_circuit(self):
+        """Test: Failures count fleet-wide and the open circuit rejects calls in every worker"""
+        redis = FakeRedis()
+        a, b = worker(redis), worker(redis)
+
+        call_failing(a, 2)
+        call_failing(b, 1)
+
+        calls = []
+        with pytest.raises(CircuitBreakerError):
+            a.call(calls.append, "request")
+        assert calls == []
+        assert a.get_state()["state"] == "open"
+
+    def test_one_probe_across_fleet(self):
+        """Test: After the recovery timeout only one worker runs the test call"""
+        redis = FakeRedis()
+        a, b = worker(redis), worker(redis)
+        call_failing(a, 3)
+        age_trip(redis, 120)
+
+        def probe():
+            with pytest.raises(CircuitBreakerError, match="another worker"):
+                b.call(lambda: "second probe")
+            return "ok"
+
+        assert a.call(probe) == "ok"
+        assert b.call(lambda: "after recovery") == "after recovery"
+        assert b.state == CircuitState.CLOSED
+
+    def test_failed_probe_reopens_for_everyone(self):
+        """Test: A failed recovery test restarts the open period in all workers"""
+        redis = FakeRedis()
+        a, b = worker(redis), worker(redis)
+        call_failing(a, 3)
+        age_trip(redis, 120)
+
+        call_failing(b, 1)
+
+        with pytest.raises(CircuitBreakerError, match="OPEN"):
+            a.call(lambda: "request")
+        assert "tru8:circuit:ONS:probe" not in redis.data
+
+    def test_closed_path_served_from_local_cache(self):
+        """Test: Within cache_seconds a closed circuit makes no Redis calls"""
+        redis = FakeRedis()
+        breaker = worker(redis, cache_seconds=60)
+        breaker.call(lambda: None)
+        before = redis.commands
+
+        for _ in range(20):
+            breaker.call(lambda: None)
+        assert redis.commands == before
+
+
+class TestSharedRegistry:
+    """Test the registry view of shared state"""
+
+    def test_lists_breakers_from_other_processes(self):
+        """Test: get_all_states reports breakers created by other workers"""
+        redis = FakeRedis()
+        call_failing(worker(redis), 3)
+
+        api_process = CircuitBreakerRegistry(redis_client=redis, cache_seconds=0)
+        states = api_process.get_all_states()
+
+        assert states["ONS"]["state"] == "open"
+        assert states["ONS"]["shared"] is True
+
+    def test_redis_outage_falls_back_to_local_state(self):
+        """Test: Without Redis the breaker keeps working on process-local state"""
+        breaker = worker(DownRedis())
+        assert breaker.call(lambda: "ok") == "ok"
+
+        call_failing(breaker, 3)
+        with pytest.raises(CircuitBreakerError):
+            breaker.call(lambda: "ok")
+        assert breaker.get_state()["shared"] is False
+
+    def test_local_registry_unchanged(self):
+        """Test: Without a Redis client the registry hands out process-local breakers"""
+        breaker = CircuitBreakerRegistry().get_breaker("ONS")
+        assert not isinstance(breaker, SharedCircuitBreaker)
+        assert breaker.state == CircuitState.CLOSED
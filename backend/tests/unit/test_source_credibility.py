@@ -437,5 +437,44 @@ class TestSourceCredibilityService:
         assert news_result['tier'] == 'news_tier1'
 
 
+class TestCompiledTierIndex:
+    """Compiled index must reproduce the linear two-pass precedence"""
+
+    def setup_method(self):
+        self.service = SourceCredibilityService()
+
+    def _corpus(self):
+        domains = {'unknown-site.com', 'edu.example.com', 'gov.uk'}
+        for tier_config in self.service.config.values():
+            for pattern in tier_config.get('domains', []):
+                domain = pattern.split('/')[0].lower()
+                if domain.startswith('*.'):
+                    domain = 'example' + domain[1:]
+                domains.add(domain)
+        paths = ['', '/news', '/sport', '/sport/football', '/sports/nfl', '/sportsday', '/football/a', '/politics/a']
+        return [(domain, path) for domain in sorted(domains) for path in paths]
+
+    def test_matches_linear_scan(self):
+        """Every (domain, path) pair resolves to the same tier and reasoning"""
+        for domain, path in self._corpus():
+            compiled = self.service._match_domain_to_tier(domain, path)
+            linear = self.service._match_domain_to_tier_linear(domain, path)
+            assert compiled == linear, f"Mismatch for {domain}{path}"
+
+    def test_first_tier_wins_within_pass(self):
+        """Earlier tiers win, and path patterns beat domain patterns"""
+        service = SourceCredibilityService()
+        service.config = {
+            'first': {'credibility': 0.9, 'domains': ['*.example.org']},
+            'second': {'credibility': 0.5, 'domains': ['news.example.org', 'news.example.org/sport/*']},
+            'general': {'credibility': 0.6, 'description': 'Default'},
+        }
+        service.clear_cache()  # Recompiles the index
+
+        assert service._match_domain_to_tier('news.example.org', '/politics')['tier'] == 'first'
+        assert service._match_domain_to_tier('news.example.org', '/sport/tennis')['tier'] == 'second'
+        assert service._match_domain_to_tier('other.com', '/')['tier'] == 'general'
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
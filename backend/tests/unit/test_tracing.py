@@ -0,0 +1,109 @@
+"""
+Unit tests for tracing helpers and Celery trace-context propagation.
+"""
+
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from app.core import tracing
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    """Route tracing helpers to an in-memory exporter (the global provider is left alone)"""
+    memory = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(memory))
+    monkeypatch.setattr(tracing, "get_tracer", lambda: provider.get_tracer("test"))
+    return memory
+
+
+def by_name(exporter):
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+class TestCeleryPropagation:
+    """Test trace context crossing the Celery message boundary"""
+
+    def test_task_span_continues_publisher_trace(self, exporter):
+        """Test: Headers injected at publish are picked up as the task span's parent"""
+        headers = {}
+        with tracing.start_span("create_check"):
+            tracing._inject_headers(headers=headers)
+
+        assert "traceparent" in headers
+
+        # Worker side: Celery exposes message headers as request attributes
+        request = SimpleNamespace(kwargs={"check_id": "check-1"}, **headers)
+        task = SimpleNamespace(name="app.workers.pipeline.process_check", request=request)
+        tracing._start_task_span(task_id="task-1", task=task)
+        with tracing.start_span("stage.retrieve"):
+            pass
+        tracing._end_task_span(task_id="task-1", state="SUCCESS")
+
+        spans = by_name(exporter)
+        root = spans["create_check"]
+        task_span = spans["celery.task app.workers.pipeline.process_check"]
+        stage = spans["stage.retrieve"]
+
+        assert task_span.context.trace_id == root.context.trace_id
+        assert task_span.parent.span_id == root.context.span_id
+        assert stage.parent.span_id == task_span.context.span_id
+        assert task_span.attributes["check.id"] == "check-1"
+        assert task_span.attributes["celery.state"] == "SUCCESS"
+
+    def test_task_failure_marks_span_error(self, exporter):
+        """Test: Task failures are recorded on the task span"""
+        task = SimpleNamespace(name="judge", request=SimpleNamespace(kwargs={}))
+        tracing._start_task_span(task_id="task-2", task=task)
+        tracing._record_task_failure(task_id="task-2", exception=RuntimeError("boom"))
+        tracing._end_task_span(task_id="task-2", state="FAILURE")
+
+        span = by_name(exporter)["celery.task judge"]
+        assert not span.status.is_ok
+        assert span.events[0].name == "exception"
+
+
+class TestSpanHelpers:
+    """Test span helper functions"""
+
+    def test_completed_span_uses_recorded_times(self, exporter):
+        """Test: Naive UTC stage timestamps become the span's start and end"""
+        started = datetime(2024, 1, 1, 12, 0, 0)
+        tracing.record_completed_span("stage.verify", started, started + timedelta(seconds=2))
+
+        span = by_name(exporter)["stage.verify"]
+        assert span.end_time - span.start_time == 2_000_000_000
+        assert span.start_time == 1704110400 * 1_000_000_000
+
+    def test_traced_decorator_and_exceptions(self, exporter):
+        """Test: traced() wraps the call and records exceptions before re-raising"""
+        @tracing.traced("pipeline.judge")
+        def failing():
+            raise ValueError("bad verdict")
+
+        with pytest.raises(ValueError):
+            failing()
+
+        span = by_name(exporter)["pipeline.judge"]
+        assert not span.status.is_ok
+
+    def test_file_exporter_writes_json_lines(self, exporter, tmp_path):
+        """Test: The file exporter appends one JSON object per span"""
+        with tracing.start_span("llm judge", **{"llm.model": "gpt-test", "unset": None}):
+            pass
+
+        path = tmp_path / "traces.jsonl"
+        tracing.JsonLinesSpanExporter(str(path)).export(exporter.get_finished_spans())
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        assert record["name"] == "llm judge"
+        assert record["attributes"] == {"llm.model": "gpt-test"}
@@ -0,0 +1,244 @@
+"""
+Unit tests for VectorStore: content-addressed evidence storage and collection profiles.
+
+Evidence tests use qdrant-client's in-memory mode, so filters and payload updates
+behave like a real collection.
+"""
+
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models as rest
+
+from app.services.vector_store import VectorStore, evidence_point_id, get_collection_profile
+from app.utils.url_utils import normalize_url
+
+
+class FakeLockRedis:
+    """In-memory stand-in for the redis.asyncio calls behind evidence point locks"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def eval(self, script, numkeys, *args):
+        keys, token = args[:numkeys], args[numkeys]
+        for key in keys:
+            if self.data.get(key) == token:
+                del self.data[key]
+
+
+@pytest.fixture
+async def store():
+    vector_store = VectorStore()
+    vector_store._lock_redis = FakeLockRedis()
+    vector_store.client = AsyncQdrantClient(location=":memory:")
+    await vector_store._ensure_collection_exists()
+    vector_store._initialized = True
+    yield vector_store
+    await vector_store.cleanup()
+
+
+def snippet(text="Global temperatures rose 1.1C since pre-industrial times.",
+            url="https://www.example.org/climate?utm_source=feed", **refs):
+    vector = np.random.default_rng(abs(hash(text)) % 2**32).random(384).astype(np.float32)
+    return {"text": text, "url": url, "source": "Example", "title": "Climate", "embedding": vector, **refs}
+
+
+async def payload(store, point_id):
+    points = await store.client.retrieve(store.collection_name, ids=[point_id], with_payload=True)
+    return points[0].payload
+
+
+class TestEvidencePointId:
+    """Test content addressing of evidence snippets"""
+
+    def test_same_snippet_same_id(self):
+        """Test: Tracking parameters, scheme, www and whitespace do not change the ID"""
+        a = evidence_point_id("https://www.example.org/climate/?utm_source=feed#top", "Global  temperatures rose.")
+        b = evidence_point_id("http://example.org/climate", "global temperatures rose.")
+        assert a == b
+
+    def test_different_text_or_page_differs(self):
+        """Test: Another snippet or another page is another point"""
+        base = evidence_point_id("https://example.org/a", "Snippet one")
+        assert base != evidence_point_id("https://example.org/a", "Snippet two")
+        assert base != evidence_point_id("https://example.org/b", "Snippet one")
+
+    def test_normalize_url_keeps_meaningful_params(self):
+        """Test: Non-tracking query parameters survive, sorted"""
+        assert normalize_url("https://Example.org/search?q=tax&fbclid=x&page=2") == "example.org/search?page=2&q=tax"
+
+
+class TestStoreEvidenceEmbeddings:
+    """Test deduplicated upserts with merged references"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_snippet_merges_references(self, store):
+        """Test: The same snippet for two checks is one point referencing both"""
+        first = await store.store_evidence_embeddings([snippet(check_id="check-1", claim_id="check-1:0")])
+        second = await store.store_evidence_embeddings([snippet(check_id="check-2", claim_id="check-2:3")])
+
+        assert first == second
+        count = await store.client.count(store.collection_name)
+        assert count.count == 1
+
+        stored = await payload(store, first[0])
+        assert stored["check_id"] == ["check-1", "check-2"]
+        assert stored["claim_id"] == ["check-1:0", "check-2:3"]
+        assert stored["seen_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_stores_keep_all_references(self, store, monkeypatch):
+        """Test: Overlapping stores of one snippet are serialised, so neither loses its reference"""
+        import asyncio
+
+        retrieve = store.client.retrieve
+
+        async def slow_retrieve(*args, **kwargs):
+            points = await retrieve(*args, **kwargs)
+            await asyncio.sleep(0.01)
+            return points
+
+        monkeypatch.setattr(store.client, "retrieve", slow_retrieve)
+        await store.store_evidence_embeddings([snippet(check_id="check-1")])
+
+        ids = await asyncio.gather(*(
+            store.store_evidence_embeddings([snippet(check_id=check_id)]) for check_id in ("check-2", "check-3")
+        ))
+
+        stored = await payload(store, ids[0][0])
+        assert sorted(stored["check_id"]) == ["check-1", "check-2", "check-3"]
+        assert stored["seen_count"] == 3
+        assert store._lock_redis.data == {}
+
+    @pytest.mark.asyncio
+    async def test_only_new_snippets_embedded(self, store):
+        """Test: embed_texts is called for snippets not yet in the collection"""
+        await store.store_evidence_embeddings([snippet(text="Known snippet", check_id="check-1")])
+        embedded = []
+
+        async def embed_texts(texts):
+            embedded.extend(texts)
+            return [np.ones(384, dtype=np.float32) for _ in texts]
+
+        items = [{k: v for k, v in snippet(text=text, check_id="check-2").items() if k != "embedding"}
+                 for text in ("Known snippet", "New snippet", "New snippet")]
+        ids = await store.store_evidence_embeddings(items, embed_texts=embed_texts)
+
+        assert embedded == ["New snippet"]
+        assert len(ids) == 3 and ids[1] == ids[2]
+
+    @pytest.mark.asyncio
+    async def test_claim_filter_matches_reference_list(self, store):
+        """Test: search_evidence_for_claim still filters by claim reference"""
+        item = snippet(check_id="check-1", claim_id="check-1:0")
+        await store.store_evidence_embeddings([item])
+        await store.store_evidence_embeddings([snippet(check_id="check-2", claim_id="check-2:0")])
+
+        results = await store.search_evidence_for_claim(item["embedding"], claim_id="check-1:0")
+        assert len(results) == 1
+        assert await store.search_evidence_for_claim(item["embedding"], claim_id="other") == []
+
+
+class TestEvidenceRetention:
+    """Test check deletion and compaction"""
+
+    @pytest.mark.asyncio
+    async def test_delete_check_keeps_shared_points(self, store):
+        """Test: Deleting a check drops its own points and unlinks shared ones"""
+        shared = await store.store_evidence_embeddings([snippet(check_id="check-1")])
+        await store.store_evidence_embeddings([snippet(check_id="check-2")])
+        await store.store_evidence_embeddings([snippet(text="Only in check 1", check_id="check-1")])
+
+        assert await store.delete_evidence_for_check("check-1")
+
+        count = await store.client.count(store.collection_name)
+        assert count.count == 1
+        assert (await payload(store, shared[0]))["check_id"] == ["check-2"]
+
+    @pytest.mark.asyncio
+    async def test_compaction_expires_stale_and_legacy_points(self, store, monkeypatch):
+        """Test: Points unseen past the retention window and pre-dedup points are removed"""
+        await store.store_evidence_embeddings([snippet(text="Fresh", check_id="check-1")])
+
+        real_time = time.time
+        monkeypatch.setattr(time, "time", lambda: real_time() - 40 * 86400)
+        await store.store_evidence_embeddings([snippet(text="Stale", check_id="check-1")])
+        monkeypatch.setattr(time, "time", real_time)
+
+        # Legacy point: random ID, no last_seen_ts
+        from qdrant_client.models import PointStruct
+        await store.client.upsert(store.collection_name, points=[
+            PointStruct(id="0f0e0d0c-0000-4000-8000-000000000000", vector=[0.1] * 384, payload={"text": "Legacy"}),
+        ])
+
+        removed = await store.compact_evidence(retention_days=30)
+
+        assert removed == 2
+        points, _ = await store.client.scroll(store.collection_name, with_payload=True)
+        assert [point.payload["text"] for point in points] == ["Fresh"]
+
+
+class FakeProfileClient:
+    """Reports a collection in the original float32/in-RAM layout and records updates"""
+
+    def __init__(self):
+        self.updates = []
+
+    async def get_collection(self, collection_name):
+        return SimpleNamespace(config=SimpleNamespace(
+            params=SimpleNamespace(vectors=SimpleNamespace(on_disk=None)),
+            hnsw_config=SimpleNamespace(on_disk=None),
+            optimizer_config=SimpleNamespace(memmap_threshold=None),
+            quantization_config=None,
+        ))
+
+    async def update_collection(self, **kwargs):
+        self.updates.append(kwargs)
+        return True
+
+
+class TestCollectionProfile:
+    """Test Qdrant storage profiles and in-place migration"""
+
+    def test_search_params(self):
+        """Test: Quantised profiles rescore with oversampling; memory profile uses server defaults"""
+        params = get_collection_profile("quantized").search_params(hnsw_ef=64)
+        assert params.hnsw_ef == 64
+        assert params.quantization.rescore is True
+        assert params.quantization.oversampling == 2.0
+
+        assert get_collection_profile("memory").search_params() is None
+
+    def test_unknown_profile(self):
+        """Test: Unknown profile names are rejected"""
+        with pytest.raises(ValueError):
+            get_collection_profile("tiny")
+
+    @pytest.mark.asyncio
+    async def test_apply_profile_migrates_in_place(self):
+        """Test: Dry runs only list changes; applying updates the collection once"""
+        vector_store = VectorStore()
+        vector_store.client = FakeProfileClient()
+        vector_store._initialized = True
+        quantized = get_collection_profile("quantized")
+
+        changes = await vector_store.apply_collection_profile(quantized, dry_run=True)
+        assert "quantization: False -> True" in changes
+        assert "vectors_on_disk: False -> True" in changes
+        assert vector_store.client.updates == []
+
+        await vector_store.apply_collection_profile(quantized)
+        update = vector_store.client.updates[0]
+        assert update["vectors_config"][""].on_disk is True
+        assert update["quantization_config"].scalar.type == rest.ScalarType.INT8
+        assert vector_store.profile == quantized